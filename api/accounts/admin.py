@@ -1,5 +1,6 @@
 from django.contrib import admin
 
-from accounts.models import CustomUser
+from accounts.models import CustomUser, ExpoPushTicket
 
 admin.site.register(CustomUser)
+admin.site.register(ExpoPushTicket)
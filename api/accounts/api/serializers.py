@@ -3,6 +3,7 @@
 
 from dj_rest_auth.models import TokenModel
 from dj_rest_auth.registration.serializers import RegisterSerializer
+from django.conf import settings
 from django.contrib.auth import get_user_model
 from django.db import transaction
 from django.utils.translation import gettext_lazy as _
@@ -10,6 +11,9 @@ from phonenumber_field.serializerfields import PhoneNumberField
 from rest_framework import serializers
 from rest_framework.validators import UniqueValidator
 
+from bills.tasks.participants import (
+    transfer_unregistered_participants_data_in_background,
+)
 from financials.data.logos import bank_logo_index
 from financials.models import TransferRecipient, UserCard
 
@@ -39,6 +43,15 @@ class CustomRegisterSerializer(RegisterSerializer):
         user.first_name = self.data.get("first_name")
         user.last_name = self.data.get("last_name")
         user.save()
+
+        if user.phone:
+            user_phones = [(user.id, str(user.phone))]
+            transaction.on_commit(
+                lambda: transfer_unregistered_participants_data_in_background.delay(
+                    user_phones
+                )
+            )
+
         return user
 
 
@@ -105,11 +118,13 @@ class CustomUserDetailsSerializer(serializers.ModelSerializer):
             "phone",
             "profile_image_url",
             "profile_image_hash",
+            "profile_image_status",
             "username",
             "uuid",
         )
         read_only_fields = (
             "date_joined",
+            "profile_image_status",
             "uuid",
         )
 
@@ -129,6 +144,34 @@ class CustomTokenSerializer(serializers.ModelSerializer):
 class ProfileImageSerializer(serializers.Serializer):
     profile_image = serializers.ImageField(allow_empty_file=False)
 
+    def validate_profile_image(self, profile_image):
+        if profile_image.size > settings.PROFILE_IMAGE_MAX_SIZE:
+            raise serializers.ValidationError(
+                _("Profile images must be at most %(size)d MB.")
+                % {"size": settings.PROFILE_IMAGE_MAX_SIZE // (1024 * 1024)}
+            )
+
+        return profile_image
+
+
+class ProfileImageStatusSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = CustomUser
+        fields = (
+            "profile_image_url",
+            "profile_image_hash",
+            "profile_image_status",
+        )
+        read_only_fields = fields
+
+
+class RegisteredContactsQuerySerializer(serializers.Serializer):
+    phone_numbers = serializers.ListField(
+        child=serializers.CharField(max_length=30),
+        default=list,
+        max_length=settings.CONTACT_MATCH_MAX_PHONE_NUMBERS,
+    )
+
 
 class RegisteredContactsSerializer(serializers.ModelSerializer):
     class Meta:
@@ -1,5 +1,3 @@
-import asyncio
-
 from allauth.socialaccount.providers.apple.views import (
     AppleOAuth2Adapter,
     AppleOAuth2Client,
@@ -8,8 +6,9 @@ from allauth.socialaccount.providers.google.views import GoogleOAuth2Adapter
 from allauth.socialaccount.providers.oauth2.client import OAuth2Client
 from dj_rest_auth.registration.views import SocialLoginView
 from django.contrib.auth import get_user_model
+from django.db import transaction
 from django.db.models import Q
-from drf_spectacular.utils import OpenApiResponse, extend_schema
+from drf_spectacular.utils import extend_schema
 from environs import Env
 from rest_framework import status
 from rest_framework.permissions import IsAuthenticated
@@ -19,9 +18,18 @@ from rest_framework.views import APIView
 from accounts.api.serializers import (
     ExpoPushTokenSerializer,
     ProfileImageSerializer,
+    ProfileImageStatusSerializer,
+    RegisteredContactsQuerySerializer,
     RegisteredContactsSerializer,
 )
 from accounts.models import CustomUser
+from accounts.tasks.profile_images import process_profile_image_in_background
+from accounts.utils.contacts import (
+    get_or_set_registered_contact_ids,
+    get_registered_contacts,
+    normalize_phone_numbers,
+)
+from accounts.utils.profile_images import stage_profile_image
 from bills.models import BillAction
 from core.utils.responses import format_exception
 from financials.utils.subscriptions import (
@@ -29,6 +37,7 @@ from financials.utils.subscriptions import (
     get_action_ids_to_be_ignored,
 )
 from libraries.notifications.base import send_push_messages
+from libraries.paystack.base import run_async_requests
 from libraries.paystack.subscription_requests import SubscriptionRequests
 
 env = Env()
@@ -59,16 +68,19 @@ class AppleLogin(SocialLoginView):
 class ProfileImageUploadAPIView(APIView):
     """API view for updating the profile image of a logged-in user.
 
+    The image is processed in the background, and the user's profileImageStatus is
+    "pending" until it is done.
+
     Accepts PATCH requests.
     """
 
     permission_classes = (IsAuthenticated,)
     serializer_class = ProfileImageSerializer
 
-    @extend_schema(request=None, responses={204: OpenApiResponse()})
+    @extend_schema(request=None, responses={202: ProfileImageStatusSerializer})
     def patch(self, request):
-        """Updates the requesting user's profile image if the request was
-        valid."""
+        """Stages the requesting user's new profile image for processing if the
+        request was valid."""
 
         serializer = self.serializer_class(data=request.data, partial=True)
         serializer.is_valid(raise_exception=True)
@@ -83,9 +95,15 @@ class ProfileImageUploadAPIView(APIView):
 
         user = request.user
 
-        user.update_profile_image(profile_image)
+        staged_key = stage_profile_image(user, profile_image)
+        transaction.on_commit(
+            lambda: process_profile_image_in_background.delay(user.id, staged_key)
+        )
 
-        return Response(status=status.HTTP_204_NO_CONTENT)
+        return Response(
+            ProfileImageStatusSerializer(user).data,
+            status=status.HTTP_202_ACCEPTED,
+        )
 
 
 class RegisteredContactsListAPIView(APIView):
@@ -98,19 +116,23 @@ class RegisteredContactsListAPIView(APIView):
     permission_classes = (IsAuthenticated,)
     serializer_class = RegisteredContactsSerializer
 
+    @extend_schema(
+        request=RegisteredContactsQuerySerializer,
+        responses=RegisteredContactsSerializer(many=True),
+    )
     def post(self, request):
-        phone_numbers = request.data.get("phone_numbers", [])
-        queryset = CustomUser.objects.only(
-            "first_name",
-            "last_name",
-            "phone",
-            "profile_image_url",
-            "profile_image_hash",
-            "username",
-            "uuid",
-        ).filter(phone__in=phone_numbers)
-
-        serializer = self.serializer_class(queryset, many=True)
+        query_serializer = RegisteredContactsQuerySerializer(data=request.data)
+        query_serializer.is_valid(raise_exception=True)
+
+        phone_numbers = normalize_phone_numbers(
+            query_serializer.validated_data["phone_numbers"]
+        )
+
+        serializer = self.serializer_class(
+            get_registered_contacts(get_or_set_registered_contact_ids(phone_numbers)),
+            many=True,
+        )
+
         return Response(serializer.data)
 
 
@@ -160,9 +182,11 @@ class MultiplePushNotificationsAPIView(APIView):
 
         # Send multiple push notifications
         if push_parameters_list:
-            response = send_push_messages(push_parameters_list)
+            result = send_push_messages(push_parameters_list)
+
+            CustomUser.clear_expo_push_tokens(result.unregistered_tokens)
 
-            if response:
+            if result.tickets:
                 return Response({"message": "Push notifications sent successfully"})
 
         return Response({"message": "Invalid request"}, status=400)
@@ -206,7 +230,9 @@ class CloseAccountAPIView(APIView):
         )
 
         # Cancel any one time bills
-        user_one_time_actions.update(status=BillAction.StatusChoices.CANCELLED)
+        BillAction.update_statuses(
+            user_one_time_actions, BillAction.StatusChoices.CANCELLED
+        )
 
         user_subscription_actions = user.actions.filter(
             status=BillAction.StatusChoices.ONGOING,
@@ -216,7 +242,7 @@ class CloseAccountAPIView(APIView):
             user_subscription_actions
         )
 
-        disable_subscriptions_responses = asyncio.run(
+        disable_subscriptions_responses = run_async_requests(
             SubscriptionRequests.disable_multiple(disable_subscriptions_payloads)
         )
 
@@ -226,8 +252,9 @@ class CloseAccountAPIView(APIView):
         )
 
         # Cancel only actions associated with subscriptions that have been disabled.
-        user_subscription_actions.filter(~Q(id__in=action_ids_to_be_ignored)).update(
-            status=BillAction.StatusChoices.CANCELLED
+        BillAction.update_statuses(
+            user_subscription_actions.filter(~Q(id__in=action_ids_to_be_ignored)),
+            BillAction.StatusChoices.CANCELLED,
         )
 
         if action_ids_to_be_ignored:
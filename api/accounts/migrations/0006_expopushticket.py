@@ -0,0 +1,34 @@
+# Generated by Django 4.1.7 on 2026-10-18 06:38
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("accounts", "0005_alter_customuser_expo_push_token_and_more"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ExpoPushTicket",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("ticket_id", models.CharField(max_length=100, unique=True)),
+                ("expo_push_token", models.CharField(max_length=70)),
+                ("created", models.DateTimeField(auto_now_add=True, db_index=True)),
+            ],
+            options={
+                "verbose_name": "Expo push ticket",
+                "verbose_name_plural": "Expo push tickets",
+            },
+        ),
+    ]
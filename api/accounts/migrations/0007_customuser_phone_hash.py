@@ -0,0 +1,39 @@
+# Generated by Django 4.1.7 on 2026-10-18 07:17
+
+from django.db import migrations, models
+
+from core.utils.phones import hash_phone_number, normalize_phone_number
+
+
+def hash_phone_numbers(apps, schema_editor):
+    """Hash the phone numbers of existing users."""
+
+    CustomUser = apps.get_model("accounts", "CustomUser")
+    users = []
+
+    for user in CustomUser.objects.exclude(phone=None).only("id", "phone"):
+        phone = normalize_phone_number(user.phone)
+
+        if phone:
+            user.phone_hash = hash_phone_number(phone)
+            users.append(user)
+
+    CustomUser.objects.bulk_update(users, ["phone_hash"], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("accounts", "0006_expopushticket"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="customuser",
+            name="phone_hash",
+            field=models.BigIntegerField(
+                blank=True, db_index=True, editable=False, null=True
+            ),
+        ),
+        migrations.RunPython(hash_phone_numbers, migrations.RunPython.noop),
+    ]
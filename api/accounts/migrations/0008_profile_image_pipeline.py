@@ -0,0 +1,38 @@
+# Generated by Django 4.1.7 on 2026-10-18 07:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("accounts", "0007_customuser_phone_hash"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="customuser",
+            name="profile_image_status",
+            field=models.CharField(
+                choices=[
+                    ("pending", "Pending"),
+                    ("ready", "Ready"),
+                    ("failed", "Failed"),
+                ],
+                default="ready",
+                help_text="Whether the last uploaded profile image is still being processed, or failed to be",
+                max_length=50,
+            ),
+        ),
+        migrations.AddField(
+            model_name="customuser",
+            name="staged_profile_image",
+            field=models.CharField(
+                blank=True,
+                editable=False,
+                help_text="Storage name of the uploaded profile image being processed",
+                max_length=255,
+                null=True,
+            ),
+        ),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 4.1.7 on 2026-10-18 07:50
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("accounts", "0008_profile_image_pipeline"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="customuser",
+            name="staged_profile_image",
+            field=models.CharField(
+                blank=True,
+                editable=False,
+                help_text="Cache key of the uploaded profile image being processed",
+                max_length=255,
+                null=True,
+            ),
+        ),
+    ]
@@ -2,12 +2,8 @@
 # https://simpleisbetterthancomplex.com/article/2021/07/08/what-you-should-know-about-the-django-user-model.html
 # https://github.com/fusionbox/django-authtools/blob/master/authtools/models.py
 
-import time
 import uuid
 
-import blurhash
-from cloudinary.uploader import upload
-from cloudinary.utils import cloudinary_url
 from django.contrib.auth.base_user import AbstractBaseUser
 from django.contrib.auth.models import BaseUserManager, PermissionsMixin
 from django.contrib.auth.validators import ASCIIUsernameValidator
@@ -18,9 +14,20 @@ from django.db.models.functions import Lower
 from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 from phonenumber_field.modelfields import PhoneNumberField
-from PIL import Image
 
-from core.utils.images import convert_image_to_byte_array
+from core.utils.phones import (
+    hash_phone_number,
+    invalidate_registered_phones,
+    normalize_phone_number,
+)
+
+# Fields of a user shown to the other members of their bills.
+SHARED_PROFILE_FIELDS = (
+    "first_name",
+    "last_name",
+    "profile_image_hash",
+    "profile_image_url",
+)
 
 
 class CustomUserManager(BaseUserManager):
@@ -64,6 +71,11 @@ class CustomUser(AbstractBaseUser, PermissionsMixin):
     # This includes bills, paystack subs and paystack plans.
     # TODO These should be joined with models.SET_NULL and not any other strategy.
 
+    class ProfileImageStatusChoices(models.TextChoices):
+        PENDING = "pending", "Pending"
+        READY = "ready", "Ready"
+        FAILED = "failed", "Failed"
+
     username_validator = ASCIIUsernameValidator()
 
     username = models.CharField(
@@ -105,6 +117,13 @@ class CustomUser(AbstractBaseUser, PermissionsMixin):
             "unique": _("A user with that phone number already exists."),
         },
     )
+    # A compact, indexed hash of the phone number, for matching contacts.
+    phone_hash = models.BigIntegerField(
+        null=True,
+        blank=True,
+        editable=False,
+        db_index=True,
+    )
     is_staff = models.BooleanField(
         _("staff status"),
         default=False,
@@ -124,6 +143,22 @@ class CustomUser(AbstractBaseUser, PermissionsMixin):
     )
     profile_image_url = models.URLField(null=True, blank=True)
     profile_image_hash = models.CharField(max_length=35, null=True, blank=True)
+    profile_image_status = models.CharField(
+        help_text=(
+            "Whether the last uploaded profile image is still being processed, or"
+            " failed to be"
+        ),
+        max_length=50,
+        choices=ProfileImageStatusChoices.choices,
+        default=ProfileImageStatusChoices.READY,
+    )
+    staged_profile_image = models.CharField(
+        help_text="Cache key of the uploaded profile image being processed",
+        max_length=255,
+        null=True,
+        blank=True,
+        editable=False,
+    )
     uuid = models.UUIDField(
         unique=True,
         editable=False,
@@ -183,6 +218,69 @@ class CustomUser(AbstractBaseUser, PermissionsMixin):
         self.email = self.__class__.objects.normalize_email(self.email)
         self.username = self.username.lower()
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        user = super().from_db(db, field_names, values)
+        user._loaded_shared_profile = user.get_shared_profile()
+
+        return user
+
+    def get_shared_profile(self) -> dict:
+        """Return the loaded values of the fields shown to the members of the user's
+        bills, e.g. in their cached bill lists."""
+
+        deferred_fields = self.get_deferred_fields()
+
+        return {
+            field_name: getattr(self, field_name)
+            for field_name in SHARED_PROFILE_FIELDS
+            if field_name not in deferred_fields
+        }
+
+    def has_shared_profile_changed(self) -> bool:
+        """Check whether any of the fields shown to the members of the user's bills
+        changed since the user was loaded (or last saved).
+
+        Always False for users that were not loaded from the database.
+        """
+
+        loaded_shared_profile = getattr(self, "_loaded_shared_profile", None)
+
+        if loaded_shared_profile is None:
+            return False
+
+        return any(
+            field_name not in loaded_shared_profile
+            or loaded_shared_profile[field_name] != value
+            for field_name, value in self.get_shared_profile().items()
+        )
+
+    def save(self, *args, **kwargs):
+        """Keep phone_hash in sync with the phone number, and change the version of
+        the registered phone numbers when it changes.
+
+        QuerySet.update() bypasses this, so phone numbers must not be updated in
+        bulk.
+        """
+
+        update_fields = kwargs.get("update_fields")
+
+        if update_fields is None or "phone" in update_fields:
+            phone = normalize_phone_number(self.phone) if self.phone else None
+            phone_hash = hash_phone_number(phone) if phone else None
+
+            if phone_hash != self.phone_hash:
+                self.phone_hash = phone_hash
+                invalidate_registered_phones()
+
+                if update_fields is not None:
+                    kwargs["update_fields"] = {*update_fields, "phone_hash"}
+
+        super().save(*args, **kwargs)
+
+        # Compared against by the post_save receivers of the next save.
+        self._loaded_shared_profile = self.get_shared_profile()
+
     @property
     def full_name(self) -> str:
         """Return the first_name plus the last_name, with a space in between."""
@@ -239,50 +337,55 @@ class CustomUser(AbstractBaseUser, PermissionsMixin):
         )
         return list(recipient_codes)
 
-    def activate_user(self):
-        """Activate a user, usually after login."""
-
-        self.is_active = True
-        self.save()
-
-    def update_profile_image(self, profile_image):
-        """Update the user's profile image, generate a blurhash, and store the
-        URL and hash.
+    @classmethod
+    def clear_expo_push_tokens(cls, expo_push_tokens):
+        """Clear push tokens that Expo reports as no longer registered, in bulk.
 
         Args:
-            profile_image: A file object containing the new profile image.
-        """
+            expo_push_tokens (Iterable[str]): The tokens to clear.
 
-        image = Image.open(profile_image)
-
-        image.thumbnail((500, 500))
-        image_bytes = convert_image_to_byte_array(image)
+        Returns:
+            int: The number of users whose token was cleared.
+        """
 
-        hash = blurhash.encode(image, x_components=4, y_components=3)
+        expo_push_tokens = list(expo_push_tokens)
 
-        image_public_id = f"{self.last_name}_{self.uuid}_avatar"
-        FOLDER_NAME = "profile_images"
+        if not expo_push_tokens:
+            return 0
 
-        upload(
-            image_bytes,
-            public_id=image_public_id,
-            use_filename=True,
-            unique_filename=False,
-            folder=FOLDER_NAME,
-            overwrite=True,
+        return cls.objects.filter(expo_push_token__in=expo_push_tokens).update(
+            expo_push_token=None
         )
 
-        url, options = cloudinary_url(
-            f"{FOLDER_NAME}/{image_public_id}",
-            width=300,
-            height=300,
-            crop="fill",
-            version=int(time.time()),
-        )
+    def activate_user(self):
+        """Activate a user, usually after login."""
 
-        self.profile_image_hash = hash
-        self.profile_image_url = url
+        self.is_active = True
         self.save()
 
-        # Close the file object
-        profile_image.close()
+
+class ExpoPushTicket(models.Model):
+    """A push message accepted by Expo, kept until its delivery receipt is checked.
+
+    Receipts are the only place Expo reports some unregistered devices, so the
+    token a ticket was sent to is stored with it.
+    """
+
+    ticket_id = models.CharField(
+        max_length=100,
+        unique=True,
+    )
+    expo_push_token = models.CharField(
+        max_length=70,
+    )
+    created = models.DateTimeField(
+        auto_now_add=True,
+        db_index=True,
+    )
+
+    class Meta:
+        verbose_name = "Expo push ticket"
+        verbose_name_plural = "Expo push tickets"
+
+    def __str__(self) -> str:
+        return f"ticket: {self.ticket_id}"
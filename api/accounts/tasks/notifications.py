@@ -1,21 +1,117 @@
+from datetime import timedelta
+
 from celery import shared_task
 from celery.utils.log import get_task_logger
+from django.utils import timezone
 
-from libraries.notifications.base import send_push_messages
+from accounts.models import CustomUser, ExpoPushTicket
+from libraries.notifications.base import (
+    EXPO_RECEIPT_CHUNK_SIZE,
+    get_unregistered_push_ticket_ids,
+    send_push_messages,
+)
 
 logger = get_task_logger(__name__)
 
+# Constants in seconds
+MAX_RETRIES = 3
+INITIAL_RETRY_DELAY = 30
+
+# Expo recommends waiting about 15 minutes before checking receipts, and deletes
+# them after 24 hours.
+RECEIPT_CHECK_DELAY = timedelta(minutes=15)
+RECEIPT_EXPIRY = timedelta(hours=24)
+
+
+def calculate_backoff_delay(retry_count):
+    """
+    Calculate the exponential backoff delay for retrying a failed operation.
+
+    Args:
+        retry_count (int): The current retry count.
+
+    Returns:
+        int: The backoff delay in seconds.
+    """
+
+    return INITIAL_RETRY_DELAY * (2**retry_count)
+
 
 @shared_task
-def send_push_messages_in_background(push_parameters_list):
+def send_push_messages_in_background(push_parameters_list, retry_count=0):
     """
     Celery task for sending push messages in the background.
 
+    Messages that fail for transient reasons are sent again by rescheduling this
+    task with a countdown, so no worker is kept waiting between attempts. Tokens
+    Expo reports as unregistered are cleared, and the tickets of accepted messages
+    are stored so their receipts can be checked by check_push_receipts.
+
     Args:
         push_parameters_list (list): A list of dictionaries containing push parameters
                                      for each message. Each dictionary could/should have
                                      'token', 'message', 'extra', 'title', and
                                      'subtitle' keys.
+        retry_count (int): How many times these messages have been retried.
     """
 
-    send_push_messages(push_parameters_list)
+    result = send_push_messages(push_parameters_list)
+
+    CustomUser.clear_expo_push_tokens(result.unregistered_tokens)
+
+    ExpoPushTicket.objects.bulk_create(
+        [
+            ExpoPushTicket(ticket_id=ticket.id, expo_push_token=ticket.push_message.to)
+            for ticket in result.tickets
+            if ticket.id
+        ],
+        ignore_conflicts=True,
+    )
+
+    if result.retryable_push_parameters:
+        if retry_count < MAX_RETRIES:
+            send_push_messages_in_background.apply_async(
+                args=(result.retryable_push_parameters, retry_count + 1),
+                countdown=calculate_backoff_delay(retry_count),
+            )
+        else:
+            logger.error(
+                f"Giving up on {len(result.retryable_push_parameters)} push messages"
+                f" after {MAX_RETRIES} retries."
+            )
+
+
+@shared_task
+def check_push_receipts():
+    """Check the receipts of sent push messages and clear unregistered tokens.
+
+    Run periodically. Tickets are deleted once checked, or once Expo no longer
+    keeps their receipts.
+    """
+
+    now = timezone.now()
+
+    ExpoPushTicket.objects.filter(created__lt=now - RECEIPT_EXPIRY).delete()
+
+    tickets = list(
+        ExpoPushTicket.objects.filter(created__lte=now - RECEIPT_CHECK_DELAY)
+        .order_by("created")
+        .values_list("id", "ticket_id", "expo_push_token")[
+            : EXPO_RECEIPT_CHUNK_SIZE * 10
+        ]
+    )
+
+    if not tickets:
+        return
+
+    unregistered_ticket_ids = get_unregistered_push_ticket_ids(
+        [ticket_id for _, ticket_id, _ in tickets]
+    )
+
+    CustomUser.clear_expo_push_tokens(
+        expo_push_token
+        for _, ticket_id, expo_push_token in tickets
+        if ticket_id in unregistered_ticket_ids
+    )
+
+    ExpoPushTicket.objects.filter(id__in=[pk for pk, _, _ in tickets]).delete()
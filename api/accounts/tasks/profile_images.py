@@ -0,0 +1,44 @@
+from celery import shared_task
+from celery.utils.log import get_task_logger
+
+from accounts.tasks.notifications import calculate_backoff_delay
+from accounts.utils.profile_images import (
+    fail_staged_profile_image,
+    process_staged_profile_image,
+)
+
+logger = get_task_logger(__name__)
+
+MAX_RETRIES = 3
+
+
+@shared_task
+def process_profile_image_in_background(user_id, staged_key, retry_count=0):
+    """
+    Celery task for processing a user's uploaded profile image in the background.
+
+    Failed attempts, e.g. when Cloudinary is unavailable, are retried by
+    rescheduling this task with a countdown. The user's profile image is marked as
+    failed once the retries run out.
+
+    Args:
+        user_id (int): The ID of the user.
+        staged_key (str): The cache key of the staged image.
+        retry_count (int): How many times the image has been retried.
+    """
+
+    try:
+        process_staged_profile_image(user_id, staged_key)
+
+    except Exception:
+        if retry_count < MAX_RETRIES:
+            process_profile_image_in_background.apply_async(
+                args=(user_id, staged_key, retry_count + 1),
+                countdown=calculate_backoff_delay(retry_count),
+            )
+        else:
+            logger.exception(
+                f"Giving up on profile image {staged_key} after {MAX_RETRIES}"
+                " retries."
+            )
+            fail_staged_profile_image(user_id, staged_key)
@@ -0,0 +1,91 @@
+from django.contrib.auth import get_user_model
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from accounts.utils import contacts
+from accounts.utils.contacts import (
+    match_registered_contact_ids,
+    normalize_phone_numbers,
+)
+
+User = get_user_model()
+
+
+class RegisteredContactsTests(TestCase):
+    def setUp(self) -> None:
+        self.user = User.objects.create_user(
+            phone="08010191010",
+            email="user@email.com",
+            username="user",
+            password="testpass123",
+        )
+        self.contact = User.objects.create_user(
+            phone="+2348010191011",
+            email="contact@email.com",
+            username="contact",
+            password="testpass123",
+        )
+
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def get_registered_contacts(self, phone_numbers):
+        return self.client.post(
+            reverse("registered-contacts-list"),
+            {"phone_numbers": phone_numbers},
+            format="json",
+        )
+
+    def test_phone_numbers_are_normalized(self) -> None:
+        self.assertEqual(
+            normalize_phone_numbers(["08010191011", "+2348010191011", "not a phone"]),
+            ["+2348010191011"],
+        )
+
+        response = self.get_registered_contacts(["08010191011", "0801 019 1012"])
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            [contact["username"] for contact in response.json()], ["contact"]
+        )
+
+    @override_settings(CONTACT_MATCH_PREFILTER=True)
+    def test_prefilter_skips_unregistered_numbers(self) -> None:
+        with self.captureOnCommitCallbacks(execute=True):
+            self.contact.phone = "+2348010191012"
+            self.contact.save(update_fields=["phone"])
+
+        self.assertEqual(match_registered_contact_ids(["+2348010191011"]), [])
+        self.assertIn(self.contact.phone_hash, contacts.get_registered_phone_hashes())
+
+        with self.assertNumQueries(0):
+            self.assertEqual(match_registered_contact_ids(["+2348010191099"]), [])
+
+    def test_matches_are_cached_until_a_phone_number_changes(self) -> None:
+        phone_numbers = ["08010191011", "08010191012"]
+        self.assertEqual(len(self.get_registered_contacts(phone_numbers).json()), 1)
+
+        # Only the contacts themselves are loaded.
+        with self.assertNumQueries(1):
+            response = self.get_registered_contacts(phone_numbers)
+            self.assertEqual(len(response.json()), 1)
+
+        # Profile changes are shown while the matches are cached.
+        self.contact.first_name = "Renamed"
+        self.contact.save(update_fields=["first_name"])
+
+        self.assertEqual(
+            self.get_registered_contacts(phone_numbers).json()[0]["firstName"],
+            "Renamed",
+        )
+
+        with self.captureOnCommitCallbacks(execute=True):
+            User.objects.create_user(
+                phone="08010191012",
+                email="new@email.com",
+                username="new",
+                password="testpass123",
+            )
+
+        self.assertEqual(len(self.get_registered_contacts(phone_numbers).json()), 2)
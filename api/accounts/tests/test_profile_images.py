@@ -0,0 +1,135 @@
+import io
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from PIL import Image
+from rest_framework.test import APIClient
+
+from accounts.tasks.profile_images import process_profile_image_in_background
+
+User = get_user_model()
+
+
+def upload_to_cloudinary(image_file, **options):
+    return {"public_id": f"{options['folder']}/{options['public_id']}", "version": 1}
+
+
+@mock.patch("accounts.utils.profile_images.upload", side_effect=upload_to_cloudinary)
+class ProfileImagePipelineTests(TestCase):
+    def setUp(self) -> None:
+        self.user = User.objects.create_user(
+            phone="08010191010",
+            email="user@email.com",
+            username="user",
+            password="testpass123",
+        )
+
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def tearDown(self) -> None:
+        cache.clear()
+
+    def patch_profile_image(self):
+        image_bytes = io.BytesIO()
+        Image.new("RGB", (800, 600), color=(200, 40, 40)).save(image_bytes, "JPEG")
+
+        return self.client.patch(
+            reverse("profile-image-upload"),
+            {
+                "profile_image": SimpleUploadedFile(
+                    "avatar.jpg", image_bytes.getvalue(), "image/jpeg"
+                )
+            },
+            format="multipart",
+        )
+
+    def upload_profile_image(self):
+        with mock.patch.object(process_profile_image_in_background, "delay") as delay:
+            with self.captureOnCommitCallbacks(execute=True):
+                response = self.patch_profile_image()
+
+        self.assertEqual(response.status_code, 202)
+        self.assertEqual(response.json()["profileImageStatus"], "pending")
+
+        return delay.call_args.args
+
+    def test_staged_image_is_processed_in_the_background(self, upload) -> None:
+        user_id, staged_key = self.upload_profile_image()
+
+        self.assertEqual(upload.call_count, 0)
+
+        process_profile_image_in_background(user_id, staged_key)
+
+        self.user.refresh_from_db()
+        self.assertEqual(upload.call_count, 1)
+        self.assertEqual(self.user.profile_image_status, "ready")
+        self.assertTrue(self.user.profile_image_hash)
+        self.assertIn("profile_images", self.user.profile_image_url)
+        self.assertIsNone(self.user.staged_profile_image)
+        self.assertIsNone(cache.get(staged_key))
+
+    def test_superseded_image_is_discarded(self, upload) -> None:
+        superseded_args = self.upload_profile_image()
+        latest_args = self.upload_profile_image()
+
+        process_profile_image_in_background(*superseded_args)
+
+        self.user.refresh_from_db()
+        self.assertEqual(upload.call_count, 0)
+        self.assertEqual(self.user.profile_image_status, "pending")
+        self.assertIsNone(cache.get(superseded_args[1]))
+
+        process_profile_image_in_background(*latest_args)
+
+        self.user.refresh_from_db()
+        self.assertEqual(self.user.profile_image_status, "ready")
+
+    @mock.patch("accounts.utils.profile_images.destroy")
+    def test_image_superseded_while_uploading_is_deleted(self, destroy, upload) -> None:
+        superseded_args = self.upload_profile_image()
+
+        def upload_superseded_image(image_file, **options):
+            # A newer image is uploaded and processed meanwhile.
+            upload.side_effect = upload_to_cloudinary
+            process_profile_image_in_background(*self.upload_profile_image())
+
+            return upload_to_cloudinary(image_file, **options)
+
+        upload.side_effect = upload_superseded_image
+        process_profile_image_in_background(*superseded_args)
+
+        superseded_public_id, latest_public_id = (
+            upload_to_cloudinary(None, **call.kwargs)["public_id"]
+            for call in upload.call_args_list
+        )
+        self.assertNotEqual(superseded_public_id, latest_public_id)
+        destroy.assert_called_once_with(superseded_public_id, invalidate=True)
+
+        self.user.refresh_from_db()
+        self.assertEqual(self.user.profile_image_status, "ready")
+        self.assertIn(latest_public_id, self.user.profile_image_url)
+
+    def test_expired_staged_image_fails(self, upload) -> None:
+        user_id, staged_key = self.upload_profile_image()
+        cache.delete(staged_key)
+
+        process_profile_image_in_background(user_id, staged_key)
+
+        self.user.refresh_from_db()
+        self.assertEqual(upload.call_count, 0)
+        self.assertEqual(self.user.profile_image_status, "failed")
+        self.assertIsNone(self.user.staged_profile_image)
+
+    @override_settings(PROFILE_IMAGE_MAX_SIZE=1024)
+    def test_oversized_image_is_rejected(self, upload) -> None:
+        response = self.patch_profile_image()
+
+        self.assertEqual(response.status_code, 400)
+
+        self.user.refresh_from_db()
+        self.assertEqual(self.user.profile_image_status, "ready")
@@ -0,0 +1,183 @@
+import hashlib
+
+from django.conf import settings
+from django.core.cache import cache
+
+from accounts.models import CustomUser
+from core.utils.phones import (
+    get_registered_phones_version,
+    hash_phone_number,
+    normalize_phone_number,
+)
+
+# Number of phone hashes looked up per query.
+CONTACT_MATCH_CHUNK_SIZE = 500
+
+REGISTERED_CONTACT_FIELDS = (
+    "first_name",
+    "last_name",
+    "phone",
+    "phone_hash",
+    "profile_image_url",
+    "profile_image_hash",
+    "username",
+    "uuid",
+)
+
+# The hashes of every registered phone number, loaded per process when the
+# CONTACT_MATCH_PREFILTER setting is on, with the version they were loaded at.
+registered_phone_hashes = {"version": None, "hashes": frozenset()}
+
+
+def normalize_phone_numbers(phone_numbers) -> list:
+    """Normalize phone numbers to E.164, dropping invalid numbers and duplicates.
+
+    Args:
+        phone_numbers (Iterable[str]): The phone numbers, e.g. from an address book.
+
+    Returns:
+        list[str]: The sorted, distinct, valid phone numbers in E.164.
+    """
+
+    normalized_phone_numbers = {
+        normalize_phone_number(phone_number) for phone_number in phone_numbers
+    }
+    normalized_phone_numbers.discard(None)
+
+    return sorted(normalized_phone_numbers)
+
+
+def get_registered_phone_hashes() -> frozenset:
+    """Get the hashes of every registered phone number, reloading them when the
+    version of the registered phone numbers has changed.
+
+    Returns:
+        frozenset[int]: The hashes.
+    """
+
+    version = get_registered_phones_version()
+
+    if registered_phone_hashes["version"] != version:
+        registered_phone_hashes["hashes"] = frozenset(
+            CustomUser.objects.exclude(phone_hash=None)
+            .values_list("phone_hash", flat=True)
+            .iterator(chunk_size=10000)
+        )
+        registered_phone_hashes["version"] = version
+
+    return registered_phone_hashes["hashes"]
+
+
+def match_registered_contact_ids(phone_numbers) -> list:
+    """Find the ids of the users registered with the given phone numbers, looking
+    their hashes up on the indexed phone_hash column in chunks of
+    CONTACT_MATCH_CHUNK_SIZE.
+
+    With the CONTACT_MATCH_PREFILTER setting on, numbers that are not registered
+    are dropped in memory before any query is made.
+
+    Args:
+        phone_numbers (list[str]): Phone numbers normalized with
+            normalize_phone_numbers().
+
+    Returns:
+        list[int]: The ids of the registered users, in ascending order.
+    """
+
+    phone_hashes = sorted({hash_phone_number(number) for number in phone_numbers})
+
+    if settings.CONTACT_MATCH_PREFILTER:
+        registered_hashes = get_registered_phone_hashes()
+        phone_hashes = [
+            phone_hash for phone_hash in phone_hashes if phone_hash in registered_hashes
+        ]
+
+    chunk_size = CONTACT_MATCH_CHUNK_SIZE
+    users = []
+
+    for start in range(0, len(phone_hashes), chunk_size):
+        users.extend(
+            CustomUser.objects.filter(
+                phone_hash__in=phone_hashes[start : start + chunk_size]  # noqa E203
+            ).values_list("id", "phone")
+        )
+
+    # Hashes may collide, so matches are confirmed against the numbers themselves.
+    phone_numbers = set(phone_numbers)
+
+    return sorted(
+        user_id
+        for user_id, phone in users
+        if normalize_phone_number(phone) in phone_numbers
+    )
+
+
+def get_registered_contacts(user_ids) -> list:
+    """Load the registered contacts matched by match_registered_contact_ids(), in
+    chunks of CONTACT_MATCH_CHUNK_SIZE.
+
+    Args:
+        user_ids (list[int]): The ids of the users.
+
+    Returns:
+        list[CustomUser]: The users, with only REGISTERED_CONTACT_FIELDS loaded.
+    """
+
+    chunk_size = CONTACT_MATCH_CHUNK_SIZE
+    users = []
+
+    for start in range(0, len(user_ids), chunk_size):
+        users.extend(
+            CustomUser.objects.only(*REGISTERED_CONTACT_FIELDS)
+            .filter(id__in=user_ids[start : start + chunk_size])  # noqa E203
+            .order_by("id")
+        )
+
+    return users
+
+
+def get_registered_contacts_cache_key(phone_numbers) -> str:
+    """Build the key under which the ids of the registered contacts among some phone
+    numbers are cached, from a hash of the numbers and the version of the registered
+    phone numbers, so an unchanged address book is matched once until a user
+    registers or changes their number.
+
+    Args:
+        phone_numbers (list[str]): Phone numbers normalized with
+            normalize_phone_numbers().
+
+    Returns:
+        str: The cache key.
+    """
+
+    content_hash = hashlib.sha256("\n".join(phone_numbers).encode("utf-8")).hexdigest()
+
+    return f"registered-contacts:{get_registered_phones_version()}:{content_hash}"
+
+
+def get_or_set_registered_contact_ids(phone_numbers) -> list:
+    """Return the ids of the registered contacts among some phone numbers from the
+    cache, matching and caching them on a miss.
+
+    Only the ids are cached, as the matches only change with phone numbers, while
+    the contacts' names and profile images are loaded fresh on every request.
+
+    Args:
+        phone_numbers (list[str]): Phone numbers normalized with
+            normalize_phone_numbers().
+
+    Returns:
+        list[int]: The ids of the registered users, in ascending order.
+    """
+
+    if not settings.CONTACT_MATCH_CACHE_TIMEOUT:
+        return match_registered_contact_ids(phone_numbers)
+
+    cache_key = get_registered_contacts_cache_key(phone_numbers)
+    user_ids = cache.get(cache_key)
+
+    if user_ids is None:
+        user_ids = match_registered_contact_ids(phone_numbers)
+        cache.set(cache_key, user_ids, timeout=settings.CONTACT_MATCH_CACHE_TIMEOUT)
+
+    return user_ids
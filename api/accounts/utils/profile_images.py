@@ -0,0 +1,182 @@
+import hashlib
+import io
+import uuid
+
+import blurhash
+from cloudinary.uploader import destroy, upload
+from cloudinary.utils import cloudinary_url
+from django.conf import settings
+from django.core.cache import cache
+from PIL import Image
+
+from accounts.models import CustomUser
+from bills.utils.cache import invalidate_users_bill_members_caches
+
+PROFILE_IMAGES_FOLDER = "profile_images"
+
+# Side, in pixels, of the image the blurhash is computed from. Blurhashes only keep
+# a few components of the image, so a tiny copy gives the same hash as the full one.
+BLURHASH_IMAGE_SIZE = 32
+
+
+def stage_profile_image(user, profile_image) -> str:
+    """Stage an uploaded profile image for processing in the background, and mark
+    the user's profile image as pending.
+
+    Images are staged in the cache, which the web and worker processes share, for
+    STAGED_PROFILE_IMAGE_TIMEOUT seconds.
+
+    Args:
+        user (CustomUser): The user.
+        profile_image (UploadedFile): The uploaded image.
+
+    Returns:
+        str: The cache key of the staged image.
+    """
+
+    staged_key = f"staged-profile-image:{user.uuid}:{uuid.uuid4().hex}"
+    cache.set(
+        staged_key,
+        profile_image.read(),
+        timeout=settings.STAGED_PROFILE_IMAGE_TIMEOUT,
+    )
+
+    # A newer upload replaces one still being processed, whose result is then
+    # discarded.
+    user.staged_profile_image = staged_key
+    user.profile_image_status = CustomUser.ProfileImageStatusChoices.PENDING
+    user.save(update_fields=["staged_profile_image", "profile_image_status"])
+
+    return staged_key
+
+
+def compute_profile_image_blurhash(image_file) -> str:
+    """Compute the blurhash of an image from a copy downscaled to
+    BLURHASH_IMAGE_SIZE pixels.
+
+    Args:
+        image_file (File): The image.
+
+    Returns:
+        str: The blurhash.
+    """
+
+    with Image.open(image_file) as image:
+        # Lets JPEGs be decoded at a fraction of their size.
+        image.draft("RGB", (BLURHASH_IMAGE_SIZE, BLURHASH_IMAGE_SIZE))
+        image.thumbnail((BLURHASH_IMAGE_SIZE, BLURHASH_IMAGE_SIZE))
+
+        return blurhash.encode(image.convert("RGB"), x_components=4, y_components=3)
+
+
+def upload_profile_image(user, image_file, upload_id) -> tuple:
+    """Upload a profile image to Cloudinary, streaming the file as it was uploaded
+    and letting Cloudinary scale it down.
+
+    Each upload has its own public ID, so an upload that finishes after a newer one
+    cannot overwrite it.
+
+    Args:
+        user (CustomUser): The user.
+        image_file (File): The image.
+        upload_id (str): Identifies the upload, e.g. the key it was staged under.
+
+    Returns:
+        tuple[str, str]: The URL of the image, cropped to 300x300 pixels, and its
+            public ID.
+    """
+
+    upload_hash = hashlib.sha256(upload_id.encode("utf-8")).hexdigest()[:16]
+
+    response = upload(
+        image_file,
+        public_id=f"{user.last_name}_{user.uuid}_{upload_hash}_avatar",
+        use_filename=True,
+        unique_filename=False,
+        folder=PROFILE_IMAGES_FOLDER,
+        overwrite=True,
+        transformation=[{"width": 500, "height": 500, "crop": "limit"}],
+    )
+
+    url, options = cloudinary_url(
+        response["public_id"],
+        width=300,
+        height=300,
+        crop="fill",
+        version=response["version"],
+    )
+
+    return url, response["public_id"]
+
+
+def process_staged_profile_image(user_id, staged_key) -> bool:
+    """Compute the blurhash of a staged profile image, upload it, and store both on
+    the user, unless a newer image has been uploaded since.
+
+    The staged image is deleted once processed or superseded, and kept if
+    processing fails so it can be retried. An upload superseded while it was being
+    uploaded is deleted from Cloudinary. The user's profile image is marked as
+    failed if the staged image expired before it could be processed.
+
+    Args:
+        user_id (int): The ID of the user.
+        staged_key (str): The cache key of the staged image.
+
+    Returns:
+        bool: Whether the user's profile image was updated.
+    """
+
+    pending_users = CustomUser.objects.filter(
+        id=user_id, staged_profile_image=staged_key
+    )
+    user = pending_users.only("last_name", "uuid").first()
+
+    if user is None:
+        cache.delete(staged_key)
+        return False
+
+    image_bytes = cache.get(staged_key)
+
+    if image_bytes is None:
+        fail_staged_profile_image(user_id, staged_key)
+        return False
+
+    with io.BytesIO(image_bytes) as image_file:
+        profile_image_hash = compute_profile_image_blurhash(image_file)
+        image_file.seek(0)
+        profile_image_url, image_public_id = upload_profile_image(
+            user, image_file, staged_key
+        )
+
+    updated_count = pending_users.update(
+        profile_image_hash=profile_image_hash,
+        profile_image_url=profile_image_url,
+        profile_image_status=CustomUser.ProfileImageStatusChoices.READY,
+        staged_profile_image=None,
+    )
+    cache.delete(staged_key)
+
+    if updated_count:
+        # update() bypasses the post_save receiver that does this on save().
+        invalidate_users_bill_members_caches(user)
+    else:
+        # A newer image was uploaded while this one was, and replaces it.
+        destroy(image_public_id, invalidate=True)
+
+    return bool(updated_count)
+
+
+def fail_staged_profile_image(user_id, staged_key) -> None:
+    """Mark a user's profile image as failed, unless a newer image has been uploaded
+    since, and delete the staged image.
+
+    Args:
+        user_id (int): The ID of the user.
+        staged_key (str): The cache key of the staged image.
+    """
+
+    CustomUser.objects.filter(id=user_id, staged_profile_image=staged_key).update(
+        profile_image_status=CustomUser.ProfileImageStatusChoices.FAILED,
+        staged_profile_image=None,
+    )
+    cache.delete(staged_key)
@@ -0,0 +1,5 @@
+"""Standalone performance benchmarks.
+
+Run any of them from the api directory, e.g.
+`poetry run python -m benchmarks.paystack_transport`.
+"""
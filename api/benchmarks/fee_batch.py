@@ -0,0 +1,82 @@
+"""Benchmark the batch fee calculation against per-amount Decimal calculations.
+
+Times calculate_all_transaction_fees called once per contribution (as bill
+creation used to) and calculate_all_transaction_fees_in_batch over the same
+contributions, for batches the size of a very large bill.
+
+Usage:
+    poetry run python -m benchmarks.fee_batch [--participants 10000] [--repeat 5]
+"""
+
+import argparse
+import random
+import time
+from decimal import Decimal
+
+from bills.utils.fees import (
+    calculate_all_transaction_fees,
+    calculate_all_transaction_fees_in_batch,
+)
+
+
+def calculate_one_by_one(contributions):
+    fees = []
+
+    for contribution in contributions:
+        contribution_fees = calculate_all_transaction_fees(contribution)
+        contribution_fees["total_payment_due"] = (
+            contribution + contribution_fees["total_fee"]
+        )
+        fees.append(contribution_fees)
+
+    return fees
+
+
+def measure(label, function, contributions, repeat):
+    timings = []
+
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function(contributions)
+        timings.append(time.perf_counter() - start)
+
+    best = min(timings)
+    print(
+        f"{label:<26} {best * 1000:>9.1f} ms/batch"
+        f" {best / len(contributions) * 1e6:>8.2f} µs/contribution"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--participants", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    arguments = parser.parse_args()
+
+    generator = random.Random(0)
+    batches = {
+        "distinct contributions": [
+            Decimal(generator.randint(100 * 10_000, 200_000 * 10_000)).scaleb(-4)
+            for _ in range(arguments.participants)
+        ],
+        "evenly split bill": [Decimal("1500.0000")] * arguments.participants,
+    }
+
+    for batch_name, contributions in batches.items():
+        print(f"{batch_name} ({len(contributions)} participants)")
+        measure(
+            "  one by one (Decimal)",
+            calculate_one_by_one,
+            contributions,
+            arguments.repeat,
+        )
+        measure(
+            "  batch (integer units)",
+            calculate_all_transaction_fees_in_batch,
+            contributions,
+            arguments.repeat,
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+"""Benchmark aggregate queries and serialization of DecimalField and MoneyField
+amounts.
+
+Creates two scratch tables with the same rows, one storing amounts in a
+DECIMAL(19, 4) column and one in a MoneyField (BIGINT minor units), and times a
+total, a grouped total (like BillTransaction.get_daily_contributions), a range
+filter and the serialization of every row with a ModelSerializer. The tables are
+dropped afterwards.
+
+Usage:
+    DATABASE_URL=sqlite:////tmp/benchmark.db poetry run python -m \\
+        benchmarks.money_field [--rows 100000] [--repeat 5]
+"""
+
+import argparse
+import os
+import random
+import time
+from decimal import Decimal
+
+import django
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "core.settings")
+django.setup()
+
+from django.db import connection, models  # noqa: E402
+from django.db.models import Count, Sum  # noqa: E402
+from rest_framework import serializers  # noqa: E402
+
+from core.fields import MoneyField  # noqa: E402
+
+
+class DecimalAmount(models.Model):
+    bucket = models.PositiveIntegerField()
+    amount = models.DecimalField(max_digits=19, decimal_places=4)
+
+    class Meta:
+        app_label = "benchmarks"
+        db_table = "benchmarks_decimal_amount"
+
+
+class MoneyAmount(models.Model):
+    bucket = models.PositiveIntegerField()
+    amount = MoneyField()
+
+    class Meta:
+        app_label = "benchmarks"
+        db_table = "benchmarks_money_amount"
+
+
+def get_serializer_class(amount_model):
+    class AmountSerializer(serializers.ModelSerializer):
+        class Meta:
+            model = amount_model
+            fields = ("bucket", "amount")
+
+    return AmountSerializer
+
+
+def get_operations(amount_model):
+    serializer_class = get_serializer_class(amount_model)
+    queryset = amount_model.objects.all()
+
+    return {
+        "total": lambda: queryset.aggregate(total=Sum("amount")),
+        "grouped totals": lambda: list(
+            queryset.values("bucket")
+            .annotate(total=Sum("amount"), count=Count("id"))
+            .order_by("bucket")
+        ),
+        "range filter": lambda: queryset.filter(
+            amount__gte=Decimal("5000"), amount__lt=Decimal("50000")
+        ).count(),
+        "serialize rows": lambda: serializer_class(queryset, many=True).data,
+    }
+
+
+def measure(function, repeat):
+    timings = []
+
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - start)
+
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    arguments = parser.parse_args()
+
+    generator = random.Random(0)
+    rows = [
+        (generator.randrange(365), Decimal(generator.randint(1, 10**9)).scaleb(-4))
+        for _ in range(arguments.rows)
+    ]
+
+    with connection.schema_editor() as schema_editor:
+        schema_editor.create_model(DecimalAmount)
+        schema_editor.create_model(MoneyAmount)
+
+    try:
+        timings = {}
+
+        for amount_model in (DecimalAmount, MoneyAmount):
+            amount_model.objects.bulk_create(
+                [amount_model(bucket=bucket, amount=amount) for bucket, amount in rows],
+                batch_size=5000,
+            )
+            timings[amount_model] = {
+                name: measure(operation, arguments.repeat)
+                for name, operation in get_operations(amount_model).items()
+            }
+
+            # Both fields must give the same results.
+            assert get_operations(amount_model)["total"]()["total"] == sum(
+                amount for _, amount in rows
+            )
+
+        print(f"{connection.vendor}, {arguments.rows} rows")
+        print(f"{'':<18} {'DecimalField':>14} {'MoneyField':>14}")
+
+        for name in timings[DecimalAmount]:
+            print(
+                f"{name:<18} {timings[DecimalAmount][name] * 1000:>11.1f} ms"
+                f" {timings[MoneyAmount][name] * 1000:>11.1f} ms"
+            )
+
+    finally:
+        with connection.schema_editor() as schema_editor:
+            schema_editor.delete_model(DecimalAmount)
+            schema_editor.delete_model(MoneyAmount)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+"""Benchmark Paystack calls per second with and without pooled connections.
+
+A local stub server stands in for Paystack, so the numbers reflect connection
+setup and client overhead only (no TLS, no network latency). Real-world gains are
+larger since every avoided handshake against api.paystack.co also saves TLS.
+
+Usage:
+    poetry run python -m benchmarks.paystack_transport [--calls 500]
+"""
+
+import argparse
+import asyncio
+import json
+import socket
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import aiohttp
+import requests
+
+from libraries.paystack.base import PaystackRequest
+
+RESPONSE_BODY = json.dumps({"status": True, "message": "ok", "data": {}}).encode()
+
+
+class StubPaystackHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # Allows keep-alive connections.
+
+    def setup(self):
+        super().setup()
+        # Headers and body go out in separate writes; without this, Nagle's
+        # algorithm stalls every keep-alive response on a delayed ACK.
+        self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+    def _respond(self):
+        content_length = int(self.headers.get("Content-Length") or 0)
+        if content_length:
+            self.rfile.read(content_length)
+
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(RESPONSE_BODY)))
+        self.end_headers()
+        self.wfile.write(RESPONSE_BODY)
+
+    do_GET = _respond
+    do_POST = _respond
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_stub_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubPaystackHandler)
+    server.daemon_threads = True
+
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    return server, f"http://127.0.0.1:{server.server_address[1]}/"
+
+
+def measure(label, calls, function):
+    start = time.perf_counter()
+    function()
+    elapsed = time.perf_counter() - start
+
+    print(f"{label:<40} {calls / elapsed:>10.1f} calls/s")
+
+
+def run_sync_benchmarks(base_url, calls):
+    def unpooled():
+        for _ in range(calls):
+            requests.get(base_url + "plan").json()
+
+    paystack_requests = PaystackRequest(api_base_url=base_url, headers={})
+
+    def pooled():
+        for _ in range(calls):
+            paystack_requests.get("plan")
+
+    measure("sync, new connection per call", calls, unpooled)
+    measure("sync, pooled requests.Session", calls, pooled)
+
+    paystack_requests.close()
+
+
+def run_async_benchmarks(base_url, calls, concurrency):
+    async def unpooled_call():
+        async with aiohttp.ClientSession() as session:
+            async with session.get(base_url + "plan") as response:
+                return await response.json()
+
+    paystack_requests = PaystackRequest(
+        api_base_url=base_url,
+        headers={},
+        pool_size=concurrency,
+    )
+
+    async def in_batches(call):
+        for _ in range(0, calls, concurrency):
+            await asyncio.gather(*[call() for _ in range(concurrency)])
+
+    async def pooled():
+        try:
+            await in_batches(lambda: paystack_requests.get_async("plan"))
+        finally:
+            await paystack_requests.close_async()
+
+    measure(
+        "async, new ClientSession per call",
+        calls,
+        lambda: asyncio.run(in_batches(unpooled_call)),
+    )
+    measure("async, pooled ClientSession", calls, lambda: asyncio.run(pooled()))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=20)
+    arguments = parser.parse_args()
+
+    server, base_url = start_stub_server()
+
+    try:
+        run_sync_benchmarks(base_url, arguments.calls)
+        run_async_benchmarks(base_url, arguments.calls, arguments.concurrency)
+    finally:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
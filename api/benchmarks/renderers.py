@@ -0,0 +1,126 @@
+"""Benchmark core.renderers.CamelCaseJSONRenderer against
+djangorestframework_camel_case's CamelCaseJSONRenderer.
+
+Renders the bank list served by the banks endpoint, and a page of bills shaped
+like BillListSerializer's data, with both renderers, checks that they render the
+same JSON, and times them. The core renderer's two stages, camelizing the keys and
+encoding with orjson, are also timed on their own.
+
+Usage:
+    poetry run python -m benchmarks.renderers [--bills 1000] [--repeat 20]
+"""
+
+import argparse
+import json
+import os
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+
+import django
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "core.settings")
+django.setup()
+
+import orjson  # noqa: E402
+from djangorestframework_camel_case.render import (  # noqa: E402
+    CamelCaseJSONRenderer as LibraryCamelCaseJSONRenderer,
+)
+
+from core.renderers import ORJSON_OPTIONS, CamelCaseJSONRenderer, camelize  # noqa: E402
+from financials.data.banks import all_banks  # noqa: E402
+
+
+def get_bill_list_data(bill_count):
+    created = datetime(2023, 5, 1, tzinfo=timezone.utc)
+
+    return [
+        {
+            "created": (created + timedelta(hours=index)).isoformat(),
+            "interval": "Monthly",
+            "is_creator": index % 2 == 0,
+            "is_creditor": index % 3 == 0,
+            "is_recurring": True,
+            "modified": (created + timedelta(hours=index)).isoformat(),
+            "name": f"Bill {index}",
+            "status_info": {
+                "most_common_status": "completed",
+                "most_common_status_count": 4,
+                "are_all_statuses_same": False,
+            },
+            "total_participants": 6,
+            "participants": [
+                {
+                    "full_name": f"Participant {index}-{participant}",
+                    "profile_image_url": "https://res.cloudinary.com/avatar.jpg",
+                    "profile_image_hash": "LEHV6nWB2yk8pyo0adR*.7kCMdnj",
+                }
+                for participant in range(5)
+            ],
+            "unregistered_participants": [{"name": f"Unregistered {index}"}],
+            "uuid": uuid.UUID(int=index),
+        }
+        for index in range(bill_count)
+    ]
+
+
+def measure(function, repeat):
+    timings = []
+
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - start)
+
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--bills", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=20)
+    arguments = parser.parse_args()
+
+    payloads = {
+        "bank list": all_banks,
+        "bill list": get_bill_list_data(arguments.bills),
+    }
+    library_renderer = LibraryCamelCaseJSONRenderer()
+    renderer = CamelCaseJSONRenderer()
+
+    encoder = renderer.encoder_class()
+
+    print(
+        f"{'':<12} {'library':>12} {'core':>12} {'':>6}"
+        f" {'camelize':>12} {'orjson':>12}"
+    )
+
+    for name, data in payloads.items():
+        # Both renderers must render the same data.
+        assert json.loads(renderer.render(data)) == json.loads(
+            library_renderer.render(data)
+        )
+
+        camelized_data = camelize(data)
+
+        library_timing = measure(
+            lambda: library_renderer.render(data), arguments.repeat
+        )
+        timing = measure(lambda: renderer.render(data), arguments.repeat)
+        camelize_timing = measure(lambda: camelize(data), arguments.repeat)
+        encode_timing = measure(
+            lambda: orjson.dumps(
+                camelized_data, default=encoder.default, option=ORJSON_OPTIONS
+            ),
+            arguments.repeat,
+        )
+
+        print(
+            f"{name:<12} {library_timing * 1000:>9.2f} ms {timing * 1000:>9.2f} ms"
+            f" ({library_timing / timing:>3.1f}x)"
+            f" {camelize_timing * 1000:>9.2f} ms {encode_timing * 1000:>9.2f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+"""Benchmark the cost of routing a transfer webhook event to its handler.
+
+Compares the reason-prefix matching the webhook handler used to do (rebuilding
+the label strings and running four startswith checks per event) with a lookup in
+TRANSFER_EVENT_HANDLERS. Only in-process dispatch is measured: the reference
+lookup that yields the payment type is one query on a unique, indexed column and
+replaces the regex parsing the handlers used to do afterwards.
+
+Usage:
+    poetry run python -m benchmarks.webhook_dispatch [--events 200000]
+"""
+
+import argparse
+import os
+import time
+import uuid
+
+import django
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "core.settings")
+django.setup()
+
+from financials.models import PaystackTransaction  # noqa: E402
+from financials.utils.paystack_webhook import (  # noqa: E402
+    TRANSFER_EVENT_HANDLERS,
+)
+
+TransactionChoices = PaystackTransaction.TransactionChoices
+
+EVENTS = ("transfer.success", "transfer.failed", "transfer.reversed")
+
+SAMPLE_REASONS = {
+    TransactionChoices.CARD_ADDITION: (
+        f"Refund for card creation for user:{uuid.uuid4()}"
+    ),
+    TransactionChoices.ONE_TIME_CONTRIBUTION: (
+        f"One-time contribution transfer for action with ID: {uuid.uuid4()} from A to"
+        " B, on bill: Netflix. Paystack transaction id: 2620540701."
+    ),
+    TransactionChoices.SUBSCRIPTION_CONTRIBUTION: (
+        f"Subscription contribution transfer for action with ID: {uuid.uuid4()} from"
+        " A to B, on bill: Netflix. Paystack transaction id: 2620540701."
+    ),
+    TransactionChoices.ARREAR_CONTRIBUTION: (
+        f"Arrear contribution transfer for arrear with ID: {uuid.uuid4()} from A to"
+        " B, on bill: Netflix. Paystack transaction id: 2620540701."
+    ),
+}
+
+
+def route_by_reason(event, reason):
+    """The per-event classification previously done in the webhook handler."""
+
+    one_time_contribution_label = TransactionChoices.ONE_TIME_CONTRIBUTION.label
+    subscription_contribution_label = TransactionChoices.SUBSCRIPTION_CONTRIBUTION.label
+    arrear_contribution_label = TransactionChoices.ARREAR_CONTRIBUTION.label
+
+    if event in EVENTS:
+        is_card_addition_refund = reason.startswith("Refund for card creation")
+        is_one_time_contribution_transfer = reason.startswith(
+            f"{one_time_contribution_label} transfer for action"
+        )
+        is_subscription_contribution_transfer = reason.startswith(
+            f"{subscription_contribution_label} transfer for action"
+        )
+        is_arrear_contribution_transfer = reason.startswith(
+            f"{arrear_contribution_label} transfer for arrear"
+        )
+
+        if is_card_addition_refund:
+            return TransactionChoices.CARD_ADDITION
+        if is_one_time_contribution_transfer:
+            return TransactionChoices.ONE_TIME_CONTRIBUTION
+        if is_subscription_contribution_transfer:
+            return TransactionChoices.SUBSCRIPTION_CONTRIBUTION
+        if is_arrear_contribution_transfer:
+            return TransactionChoices.ARREAR_CONTRIBUTION
+
+    return None
+
+
+def route_by_registry(event, payment_type):
+    return TRANSFER_EVENT_HANDLERS.get((event, payment_type))
+
+
+def measure(label, samples, function):
+    start = time.perf_counter()
+
+    for first, second in samples:
+        function(first, second)
+
+    elapsed = time.perf_counter() - start
+
+    print(f"{label:<30} {elapsed / len(samples) * 1e9:>10.1f} ns/event")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--events", type=int, default=200_000)
+    arguments = parser.parse_args()
+
+    payment_types = list(SAMPLE_REASONS)
+    keys = [
+        (EVENTS[index % len(EVENTS)], payment_types[index % len(payment_types)])
+        for index in range(arguments.events)
+    ]
+
+    measure(
+        "reason prefix matching",
+        [(event, SAMPLE_REASONS[payment_type]) for event, payment_type in keys],
+        route_by_reason,
+    )
+    measure("handler registry lookup", keys, route_by_registry)
+
+
+if __name__ == "__main__":
+    main()
@@ -4,6 +4,8 @@ from bills.models import (
     Bill,
     BillAction,
     BillArrear,
+    BillNotificationEvent,
+    BillStatusSummary,
     BillTransaction,
     BillUnregisteredParticipant,
 )
@@ -13,3 +15,5 @@ admin.site.register(BillUnregisteredParticipant)
 admin.site.register(BillAction)
 admin.site.register(BillTransaction)
 admin.site.register(BillArrear)
+admin.site.register(BillNotificationEvent)
+admin.site.register(BillStatusSummary)
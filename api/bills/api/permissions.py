@@ -1,5 +1,13 @@
 from rest_framework.permissions import BasePermission
 
+from bills.utils.membership import (
+    is_bill_creator,
+    is_bill_creditor,
+    is_bill_member,
+    is_bill_member_by_uuid,
+    is_bill_participant,
+)
+
 # -------------------------------------
 # Bill Permissions
 # -------------------------------------
@@ -22,7 +30,7 @@ class IsParticipant(BasePermission):
     def has_object_permission(self, request, view, obj) -> bool:
         """Check if the user is a participant of the bill."""
 
-        return request.user in obj.participants.all()
+        return is_bill_participant(request, obj)
 
 
 class IsCreditor(BasePermission):
@@ -42,7 +50,7 @@ class IsCreditor(BasePermission):
     def has_object_permission(self, request, view, obj) -> bool:
         """Check if the user is the creditor of the bill."""
 
-        return request.user == obj.creditor
+        return is_bill_creditor(request, obj)
 
 
 class IsCreator(BasePermission):
@@ -62,7 +70,7 @@ class IsCreator(BasePermission):
     def has_object_permission(self, request, view, obj) -> bool:
         """Check if the user is the creator of the bill."""
 
-        return request.user == obj.creator
+        return is_bill_creator(request, obj)
 
 
 class IsCreditorOrCreator(BasePermission):
@@ -79,7 +87,7 @@ class IsCreditorOrCreator(BasePermission):
     def has_object_permission(self, request, view, obj):
         """Check if the user is the creditor or creator of the bill."""
 
-        return request.user == obj.creditor or request.user == obj.creator
+        return is_bill_creditor(request, obj) or is_bill_creator(request, obj)
 
 
 class IsParticipantOrCreditor(BasePermission):
@@ -89,17 +97,27 @@ class IsParticipantOrCreditor(BasePermission):
     message = "You need to be a participant or the creditor of this bill to continue."
 
     def has_permission(self, request, view) -> bool:
-        """Check if the user is authenticated."""
+        """Check if the user is authenticated and, in views that list a bill's data
+        without loading the bill, a member of the bill.
 
-        if request.user.is_authenticated:
+        Such views name the URL keyword argument holding the bill's UUID in a
+        bill_uuid_kwarg attribute.
+        """
+
+        if not request.user.is_authenticated:
+            return False
+
+        bill_uuid_kwarg = getattr(view, "bill_uuid_kwarg", None)
+
+        if bill_uuid_kwarg is None:
             return True
 
-        return False
+        return is_bill_member_by_uuid(request, view.kwargs[bill_uuid_kwarg])
 
     def has_object_permission(self, request, view, obj) -> bool:
         """Check if the user is a participant or the creditor of the bill."""
 
-        return request.user in obj.participants.all() or request.user == obj.creditor
+        return is_bill_member(request, obj)
 
 
 # -------------------------------------
@@ -134,10 +152,10 @@ class IsOwningParticipant(BasePermission):
         instance via the 'participant' attribute.
         """
 
-        if not obj.participant:
+        if obj.participant_id is None:
             return False
 
-        return request.user == obj.participant
+        return obj.participant_id == request.user.id
 
 
 class ParticipantHasDefaultCard(BasePermission):
@@ -200,10 +218,12 @@ class IsOwningParticipantOrCreditor(BasePermission):
         instance via the 'participant' attribute.
         """
 
-        if not obj.participant:
+        if obj.participant_id is None:
             return False
 
-        return (request.user == obj.participant) or (request.user == obj.bill.creditor)
+        return obj.participant_id == request.user.id or is_bill_creditor(
+            request, obj.bill
+        )
 
 
 class IsOwningParticipantOrCreditorOrCreator(BasePermission):
@@ -237,11 +257,11 @@ class IsOwningParticipantOrCreditorOrCreator(BasePermission):
         instance via the 'participant' attribute.
         """
 
-        if not obj.participant:
+        if obj.participant_id is None:
             return False
 
         return (
-            (request.user == obj.participant)
-            or (request.user == obj.bill.creditor)
-            or (request.user == obj.bill.creator)
+            obj.participant_id == request.user.id
+            or is_bill_creditor(request, obj.bill)
+            or is_bill_creator(request, obj.bill)
         )
@@ -21,6 +21,9 @@ from bills.utils.validation import (
 )
 from core.serializers import RoundingDecimalField
 
+# Upper bound on the contributions priced by one fee quote.
+FEE_QUOTE_MAX_CONTRIBUTIONS = 1000
+
 
 class BillUnregisteredParticipantListSerializer(serializers.ModelSerializer):
     phone = PhoneNumberField(required=True)
@@ -137,6 +140,7 @@ class BillCreateSerializer(serializers.ModelSerializer):
             "name",
             "notes",
             "participants_contribution_index",
+            "settlement_mode",
             "total_amount_due",
             "total_amount_including_creditor",
             "unregistered_participants",
@@ -360,6 +364,7 @@ class BillDetailSerializer(serializers.ModelSerializer):
             "modified",
             "name",
             "notes",
+            "settlement_mode",
             "status",
             "total_amount_due",
             "total_amount_paid",
@@ -372,13 +377,21 @@ class BillDetailSerializer(serializers.ModelSerializer):
 class BillDetailsUpdateSerializer(serializers.ModelSerializer):
     class Meta:
         model = Bill
-        fields = ("name", "notes", "evidence", "is_discreet", "deadline")
+        fields = (
+            "name",
+            "notes",
+            "evidence",
+            "is_discreet",
+            "deadline",
+            "settlement_mode",
+        )
         extra_kwargs = {
             "name": {"required": False},
             "notes": {"required": False},
             "evidence": {"required": False},
             "is_discreet": {"required": False},
             "deadline": {"required": False},
+            "settlement_mode": {"required": False},
         }
 
 
@@ -493,6 +506,144 @@ class BillTransactionSerializer(serializers.ModelSerializer):
         read_only_fields = fields
 
 
+# --------------------------------------------------------------
+# Read-only projection serializers start.
+#
+# They render rows of values querysets exactly like the model serializers above
+# render instances, without building models or running their field machinery.
+# --------------------------------------------------------------
+
+# Formats values like the fields ModelSerializer maps their model fields to.
+PROJECTION_DATETIME_FIELD = serializers.DateTimeField()
+PROJECTION_MONEY_FIELD = serializers.DecimalField(max_digits=19, decimal_places=4)
+
+
+class BillListProjectionListSerializer(serializers.ListSerializer):
+    def to_representation(self, data):
+        """Loads the participants of all the bills at once, before rendering each
+        bill."""
+
+        rows = list(data)
+        participants, unregistered_participants = Bill.get_list_participant_rows(
+            [row["id"] for row in rows]
+        )
+
+        participants_by_bill_id = {row["id"]: [] for row in rows}
+        unregistered_participants_by_bill_id = {row["id"]: [] for row in rows}
+
+        for participant in participants:
+            participants_by_bill_id[participant["bill_id"]].append(
+                {
+                    "full_name": (
+                        f"{participant['first_name']} {participant['last_name']}"
+                    ),
+                    "profile_image_url": participant["profile_image_url"],
+                    "profile_image_hash": participant["profile_image_hash"],
+                }
+            )
+
+        for unregistered_participant in unregistered_participants:
+            unregistered_participants_by_bill_id[
+                unregistered_participant["bill_id"]
+            ].append({"name": unregistered_participant["name"]})
+
+        return [
+            self.child.to_representation(
+                {
+                    **row,
+                    "participants": participants_by_bill_id[row["id"]],
+                    "unregistered_participants": unregistered_participants_by_bill_id[
+                        row["id"]
+                    ],
+                }
+            )
+            for row in rows
+        ]
+
+
+class BillListProjectionSerializer(serializers.BaseSerializer):
+    """Renders rows of Bill.get_users_bill_list_rows() like BillListSerializer.
+
+    Must be used with many=True, so the bills' participants are loaded.
+    """
+
+    interval_labels = dict(Bill.IntervalChoices.choices)
+
+    class Meta:
+        list_serializer_class = BillListProjectionListSerializer
+
+    def to_representation(self, row) -> dict:
+        participants = row["participants"]
+        unregistered_participants = row["unregistered_participants"]
+
+        return {
+            "created": PROJECTION_DATETIME_FIELD.to_representation(row["created"]),
+            "interval": self.interval_labels.get(row["interval"], row["interval"]),
+            "is_creator": row["is_creator"],
+            "is_creditor": row["is_creditor"],
+            "is_recurring": row["is_recurring"],
+            "modified": PROJECTION_DATETIME_FIELD.to_representation(row["modified"]),
+            "name": row["name"],
+            "status_info": {
+                "most_common_status": row["most_common_status"],
+                "most_common_status_count": row["most_common_status_count"],
+                "are_all_statuses_same": row["are_all_statuses_same"],
+            },
+            "total_participants": len(participants) + len(unregistered_participants),
+            "participants": participants,
+            "unregistered_participants": unregistered_participants,
+            "uuid": str(row["uuid"]),
+        }
+
+
+class BillTransactionProjectionSerializer(serializers.BaseSerializer):
+    """Renders rows of BillTransaction.get_transaction_list_rows() like
+    BillTransactionSerializer."""
+
+    def get_user_representation(self, row, user_field):
+        if row[f"{user_field}_id"] is None:
+            return None
+
+        date_joined = row[f"{user_field}__date_joined"]
+        first_name = row[f"{user_field}__first_name"]
+        last_name = row[f"{user_field}__last_name"]
+
+        return {
+            "date_joined": PROJECTION_DATETIME_FIELD.to_representation(date_joined),
+            "email": row[f"{user_field}__email"],
+            "first_name": first_name,
+            "full_name": f"{first_name} {last_name}",
+            "last_name": last_name,
+            "profile_image_url": row[f"{user_field}__profile_image_url"],
+            "profile_image_hash": row[f"{user_field}__profile_image_hash"],
+            "username": row[f"{user_field}__username"],
+            "uuid": str(row[f"{user_field}__uuid"]),
+        }
+
+    def to_representation(self, row) -> dict:
+        return {
+            "bill": {"name": row["bill__name"], "uuid": str(row["bill__uuid"])},
+            "contribution": PROJECTION_MONEY_FIELD.to_representation(
+                row["contribution"]
+            ),
+            "created": PROJECTION_DATETIME_FIELD.to_representation(row["created"]),
+            "is_credit": row["is_credit"],
+            "modified": PROJECTION_DATETIME_FIELD.to_representation(row["modified"]),
+            "paying_user": self.get_user_representation(row, "paying_user"),
+            "receiving_user": self.get_user_representation(row, "receiving_user"),
+            "total_payment": PROJECTION_MONEY_FIELD.to_representation(
+                row["total_payment"]
+            ),
+            "transaction_type": row["transaction_type"],
+            "uuid": str(row["uuid"]),
+        }
+
+
+# --------------------------------------------------------------
+# Read-only projection serializers end.
+# --------------------------------------------------------------
+
+
 class BillDailyTransactionSerializer(serializers.Serializer):
     day = serializers.DateField()
     transactions = BillTransactionSerializer(many=True)
@@ -501,3 +652,38 @@ class BillDailyTransactionSerializer(serializers.Serializer):
 class BillDailyContributionSerializer(serializers.Serializer):
     day = serializers.DateField()
     total_contribution = serializers.DecimalField(max_digits=19, decimal_places=4)
+
+
+class BillFeeQuoteSerializer(serializers.Serializer):
+    contributions = serializers.ListField(
+        child=RoundingDecimalField(
+            max_digits=19,
+            decimal_places=4,
+            coerce_to_string=False,
+            allow_null=False,
+            min_value=decimal.Decimal(0),
+            rounding=decimal.ROUND_HALF_EVEN,
+        ),
+        allow_empty=False,
+        max_length=FEE_QUOTE_MAX_CONTRIBUTIONS,
+    )
+
+
+class BillFeeQuoteEntrySerializer(serializers.Serializer):
+    contribution = serializers.DecimalField(max_digits=19, decimal_places=4)
+    paystack_transaction_fee = serializers.DecimalField(max_digits=19, decimal_places=4)
+    paystack_transfer_fee = serializers.DecimalField(max_digits=19, decimal_places=4)
+    halver_fee = serializers.DecimalField(max_digits=19, decimal_places=4)
+    total_fee = serializers.DecimalField(max_digits=19, decimal_places=4)
+    total_payment_due = serializers.DecimalField(max_digits=19, decimal_places=4)
+
+
+class BillFeeQuoteTotalsSerializer(serializers.Serializer):
+    contribution = serializers.DecimalField(max_digits=19, decimal_places=4)
+    total_fee = serializers.DecimalField(max_digits=19, decimal_places=4)
+    total_payment_due = serializers.DecimalField(max_digits=19, decimal_places=4)
+
+
+class BillFeeQuoteResponseSerializer(serializers.Serializer):
+    fees = BillFeeQuoteEntrySerializer(many=True)
+    totals = BillFeeQuoteTotalsSerializer()
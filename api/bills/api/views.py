@@ -1,4 +1,3 @@
-import asyncio
 from datetime import datetime
 from itertools import groupby
 
@@ -32,7 +31,11 @@ from bills.api.serializers import (
     BillDailyTransactionSerializer,
     BillDetailSerializer,
     BillDetailsUpdateSerializer,
+    BillFeeQuoteResponseSerializer,
+    BillFeeQuoteSerializer,
+    BillListProjectionSerializer,
     BillListSerializer,
+    BillTransactionProjectionSerializer,
     BillTransactionSerializer,
     BillUnregisteredParticipantListSerializer,
     BillUnregisteredParticipantsDataTransferSerializer,
@@ -44,8 +47,13 @@ from bills.models import (
     BillTransaction,
     BillUnregisteredParticipant,
 )
+from bills.tasks.participants import (
+    transfer_unregistered_participants_data_in_background,
+)
 from bills.utils.arrears import handle_arrear_contribution
-from bills.utils.participants import transfer_unregistered_participant_data
+from bills.utils.fees import quote_transaction_fees
+from core.pagination import CursorOrPageNumberPagination
+from core.utils.cache import get_or_set_user_cache
 from core.utils.responses import format_exception
 from financials.tasks.plans import create_paystack_plans_for_recurring_bills
 from financials.utils.contributions import handle_bill_contribution
@@ -53,10 +61,36 @@ from financials.utils.subscriptions import (
     format_disable_subscriptions_payloads,
     get_action_ids_to_be_ignored,
 )
+from libraries.paystack.base import run_async_requests
 from libraries.paystack.subscription_requests import SubscriptionRequests
 
 
-class BillListCreateAPIView(ListCreateAPIView):
+class ProjectionListMixin:
+    """Lists the rows of a projected (values) queryset with a read-only projection
+    serializer, rather than model instances with serializer_class, which is kept
+    for the API schema.
+
+    get_queryset() must return the projected rows.
+    """
+
+    projection_serializer_class = None
+
+    def list(self, request, *args, **kwargs):
+        queryset = self.filter_queryset(self.get_queryset())
+        page = self.paginate_queryset(queryset)
+        serializer = self.projection_serializer_class(
+            queryset if page is None else page,
+            many=True,
+            context=self.get_serializer_context(),
+        )
+
+        if page is None:
+            return Response(serializer.data)
+
+        return self.get_paginated_response(serializer.data)
+
+
+class BillListCreateAPIView(ProjectionListMixin, ListCreateAPIView):
     """View for listing Bills or creating new Bills.
 
     Accepts GET and POST requests.
@@ -66,13 +100,15 @@ class BillListCreateAPIView(ListCreateAPIView):
     serializer_class = BillCreateSerializer
     create_response_serializer_class = BillCreateResponseSerializer
     list_serializer_class = BillListSerializer
+    projection_serializer_class = BillListProjectionSerializer
+    pagination_class = CursorOrPageNumberPagination
     filter_backends = (SearchFilter, OrderingFilter)
     search_fields = ("name",)
     ordering_fields = ("created", "name")
     ordering = ("-created",)
 
     def get_queryset(self):
-        return Bill.get_users_bills_with_status_info(user=self.request.user)
+        return Bill.get_users_bill_list_rows(self.request.user)
 
     def get_serializer_class(self):
         if self.request.method == "GET":
@@ -80,6 +116,18 @@ class BillListCreateAPIView(ListCreateAPIView):
 
         return self.serializer_class
 
+    def list(self, request, *args, **kwargs):
+        """Returns the user's bills from the cache, or the database on a miss."""
+
+        data = get_or_set_user_cache(
+            request.user.id,
+            "bill-list",
+            request.query_params,
+            lambda: super(BillListCreateAPIView, self).list(request).data,
+        )
+
+        return Response(data, status=status.HTTP_200_OK)
+
     def perform_create(self, serializer):
         new_bill = Bill.create_bill_from_validated_data(
             serializer.validated_data, creator=self.request.user
@@ -175,9 +223,11 @@ class BillRetrieveUpdateAPIView(APIView):
         serializer = self.update_serializer_class(bill, data=request.data, partial=True)
         serializer.is_valid(raise_exception=True)
 
-        for field, value in request.data.items():
+        # Only set validated fields, so computed fields (e.g. the running payment
+        # totals) cannot be overwritten through the request body.
+        for field, value in serializer.validated_data.items():
             setattr(bill, field, value)
-        bill.save(update_fields=request.data.keys())
+        bill.save(update_fields=serializer.validated_data.keys())
 
         return Response(status=status.HTTP_204_NO_CONTENT)
 
@@ -209,7 +259,9 @@ class BillCancellationAPIView(APIView):
             )
 
         if not bill.is_recurring:
-            bill.actions.update(status=BillAction.StatusChoices.CANCELLED)
+            BillAction.update_statuses(
+                bill.actions.all(), BillAction.StatusChoices.CANCELLED
+            )
             return Response(status=status.HTTP_204_NO_CONTENT)
 
         bill_actions = bill.actions.all()
@@ -218,7 +270,7 @@ class BillCancellationAPIView(APIView):
             bill_actions
         )
 
-        disable_subscriptions_responses = asyncio.run(
+        disable_subscriptions_responses = run_async_requests(
             SubscriptionRequests.disable_multiple(disable_subscriptions_payloads)
         )
 
@@ -228,8 +280,9 @@ class BillCancellationAPIView(APIView):
         )
 
         # Cancel only actions associated with subscriptions that have been disabled.
-        bill_actions.filter(~Q(id__in=action_ids_to_be_ignored)).update(
-            status=BillAction.StatusChoices.CANCELLED
+        BillAction.update_statuses(
+            bill_actions.filter(~Q(id__in=action_ids_to_be_ignored)),
+            BillAction.StatusChoices.CANCELLED,
         )
 
         if action_ids_to_be_ignored:
@@ -276,7 +329,7 @@ class BillUnregisteredParticipantDataTransferAPIView(APIView):
     permission_classes = (IsAuthenticated,)
     serializer_class = BillUnregisteredParticipantsDataTransferSerializer
 
-    @extend_schema(request=None, responses={204: OpenApiResponse()})
+    @extend_schema(request=None, responses={202: OpenApiResponse()})
     def post(self, request):
         """Transfers the following data associated with a particular
         unregistered participant: bills, bill actions, plans and plan failures.
@@ -284,6 +337,8 @@ class BillUnregisteredParticipantDataTransferAPIView(APIView):
         If a phone number is provided, any unregistered participant with that
         number is used. Otherwise, any unregistered participant that shares a
         phone number with the user making the request is used.
+
+        The transfer runs in the background, so the request returns immediately.
         """
 
         registered_user = request.user
@@ -295,11 +350,42 @@ class BillUnregisteredParticipantDataTransferAPIView(APIView):
             "unregistered_participant_phone"
         )
 
-        transfer_unregistered_participant_data(
-            registered_user, unregistered_participant_phone
-        )
+        phone = unregistered_participant_phone or registered_user.phone
+
+        if phone:
+            transfer_unregistered_participants_data_in_background.delay(
+                [(registered_user.id, str(phone))]
+            )
+
+        return Response(status=status.HTTP_202_ACCEPTED)
 
-        return Response(status=status.HTTP_204_NO_CONTENT)
+
+class BillFeeQuoteAPIView(APIView):
+    """View for pricing contributions before a bill is created.
+
+    Accepts POST requests.
+    """
+
+    serializer_class = BillFeeQuoteSerializer
+    response_serializer_class = BillFeeQuoteResponseSerializer
+
+    @extend_schema(responses={200: BillFeeQuoteResponseSerializer})
+    def post(self, request):
+        """Returns the fees and total payment due of each contribution, and their
+        totals, as calculated when the bill's actions are created.
+
+        Nothing is read from the database, so this can be called on every edit of
+        a bill's split.
+        """
+
+        serializer = self.serializer_class(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        quote = quote_transaction_fees(serializer.validated_data["contributions"])
+
+        return Response(
+            self.response_serializer_class(quote).data, status=status.HTTP_200_OK
+        )
 
 
 class BillActionStatusCountAPIView(APIView):
@@ -311,8 +397,13 @@ class BillActionStatusCountAPIView(APIView):
     serializer_class = BillActionStatusCountSerializer
 
     def get(self, request):
-        action_status_counts = BillAction.get_action_status_counts_for_user(
-            user_id=request.user.id
+        action_status_counts = get_or_set_user_cache(
+            request.user.id,
+            "action-status-counts",
+            None,
+            lambda: list(
+                BillAction.get_action_status_counts_for_user(user_id=request.user.id)
+            ),
         )
         return Response(action_status_counts, status=status.HTTP_200_OK)
 
@@ -326,6 +417,7 @@ class BillActionStatusListAPIView(ListAPIView):
 
     permission_classes = (IsAuthenticated,)
     serializer_class = BillActionStatusListSerializer
+    pagination_class = CursorOrPageNumberPagination
     filter_backends = (SearchFilter, OrderingFilter)
     search_fields = ("bill__name",)
     ordering_fields = ("created",)
@@ -553,14 +645,17 @@ class BillSubscriptionCancellationAPIView(APIView):
             )
 
 
-class BillTransactionListAPIView(ListAPIView):
+class BillTransactionListAPIView(ProjectionListMixin, ListAPIView):
     """View for listing complete (Halver) transactions on a bill.
 
     Accepts GET requests.
     """
 
     permission_classes = (IsParticipantOrCreditor,)
+    bill_uuid_kwarg = "uuid"
     serializer_class = BillTransactionSerializer
+    projection_serializer_class = BillTransactionProjectionSerializer
+    pagination_class = CursorOrPageNumberPagination
     filter_backends = (SearchFilter, OrderingFilter)
     search_fields = (
         "paying_user__first_name",
@@ -577,7 +672,9 @@ class BillTransactionListAPIView(ListAPIView):
 
         bill_uuid = self.kwargs.get("uuid")
 
-        return BillTransaction.get_bill_transactions(bill_uuid)
+        return BillTransaction.get_transaction_list_rows(
+            BillTransaction.get_bill_transactions(bill_uuid), self.request.user
+        )
 
 
 class BillDailyTransactionListAPIView(ListAPIView):
@@ -588,43 +685,59 @@ class BillDailyTransactionListAPIView(ListAPIView):
     """
 
     permission_classes = (IsParticipantOrCreditor,)
+    bill_uuid_kwarg = "uuid"
     serializer_class = BillDailyTransactionSerializer
 
     def get_queryset(self):
         bill_uuid = self.kwargs.get("uuid")
-        return BillTransaction.get_daily_transactions(bill_uuid)
+        return BillTransaction.get_bill_transactions(bill_uuid)
 
     def list(self, request, *args, **kwargs):
-        # Get the queryset based on the URL parameters and filters
-        queryset = self.filter_queryset(self.get_queryset())
-
-        self.paginate_queryset(queryset)
+        # Filters apply to the transactions, both when their days are listed and when
+        # the page's transactions are fetched. Days and transactions are always
+        # ordered oldest first.
+        transactions = self.filter_queryset(self.get_queryset())
+
+        # Paginate the bill's transaction days, rather than its transactions, so each
+        # page holds whole days.
+        days = self.paginate_queryset(
+            BillTransaction.get_transaction_days(transactions)
+        )
 
-        # Initialize a list to store grouped transactions
         grouped_transactions = []
 
-        # Group the transactions by transaction day
-        for day, transactions in groupby(queryset, key=lambda x: x.day):
-            grouped_transactions.append(
-                {
-                    "day": day,
-                    "transactions": list(transactions),
-                }
+        if days:
+            # Fetch the transactions in the page's days only, in one query.
+            page_transactions = BillTransaction.get_transactions_between_days(
+                transactions, days[0], days[-1]
             )
 
+            # Group the transactions by transaction day
+            for day, day_transactions in groupby(
+                page_transactions.iterator(chunk_size=500), key=lambda x: x.day
+            ):
+                grouped_transactions.append(
+                    {
+                        "day": day,
+                        "transactions": list(day_transactions),
+                    }
+                )
+
         # Serialize the grouped transactions with pagination metadata
         serializer = self.get_serializer(grouped_transactions, many=True)
         return self.get_paginated_response(serializer.data)
 
 
-class BillTransactionsOnDayAPIView(ListAPIView):
+class BillTransactionsOnDayAPIView(ProjectionListMixin, ListAPIView):
     """View for listing transactions on a specific day for a bill.
 
     Accepts GET requests with a 'day' parameter in the format 'YYYY-MM-DD'.
     """
 
     permission_classes = (IsParticipantOrCreditor,)
+    bill_uuid_kwarg = "uuid"
     serializer_class = BillTransactionSerializer
+    projection_serializer_class = BillTransactionProjectionSerializer
 
     def get_queryset(self):
         bill_uuid = self.kwargs.get("uuid")
@@ -641,7 +754,7 @@ class BillTransactionsOnDayAPIView(ListAPIView):
         # Retrieve transactions for the specified day (ignoring time component)
         queryset = BillTransaction.get_bill_transactions_on_day(bill_uuid, day_date)
 
-        return queryset
+        return BillTransaction.get_transaction_list_rows(queryset, self.request.user)
 
 
 class BillDailyContributionListAPIView(ListAPIView):
@@ -651,6 +764,7 @@ class BillDailyContributionListAPIView(ListAPIView):
     """
 
     permission_classes = (IsParticipantOrCreditor,)
+    bill_uuid_kwarg = "uuid"
     serializer_class = BillDailyContributionSerializer
 
     def get_queryset(self):
@@ -661,13 +775,15 @@ class BillDailyContributionListAPIView(ListAPIView):
         return queryset
 
 
-class UserBillTransactionListAPIView(ListAPIView):
+class UserBillTransactionListAPIView(ProjectionListMixin, ListAPIView):
     """View for listing (Halver) transactions completed (or received) by a user.
 
     Accepts GET requests.
     """
 
     serializer_class = BillTransactionSerializer
+    projection_serializer_class = BillTransactionProjectionSerializer
+    pagination_class = CursorOrPageNumberPagination
     filter_backends = (SearchFilter, OrderingFilter)
     search_fields = (
         "bill__name",
@@ -685,7 +801,23 @@ class UserBillTransactionListAPIView(ListAPIView):
         """Returns a queryset containing all transactions completed (or received) by
         a user"""
 
-        return BillTransaction.get_bill_transactions_for_user(self.request.user)
+        return BillTransaction.get_transaction_list_rows(
+            BillTransaction.get_bill_transactions_for_user(self.request.user),
+            self.request.user,
+        )
+
+    def list(self, request, *args, **kwargs):
+        """Returns the user's transactions from the cache, or the database on a
+        miss."""
+
+        data = get_or_set_user_cache(
+            request.user.id,
+            "user-transaction-list",
+            request.query_params,
+            lambda: super(UserBillTransactionListAPIView, self).list(request).data,
+        )
+
+        return Response(data, status=status.HTTP_200_OK)
 
 
 class BillArrearListAPIView(ListAPIView):
@@ -695,6 +827,7 @@ class BillArrearListAPIView(ListAPIView):
     """
 
     permission_classes = (IsParticipantOrCreditor,)
+    bill_uuid_kwarg = "uuid"
     serializer_class = BillArrearListSerializer
     filter_backends = (SearchFilter, OrderingFilter)
     search_fields = (
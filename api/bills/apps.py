@@ -5,3 +5,6 @@ class BillsConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "bills"
     verbose_name = "Management of bills, actions and transactions"
+
+    def ready(self):
+        import bills.signals  # noqa: F401
@@ -0,0 +1,71 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from bills.models import Bill, BillStatusSummary
+
+
+class Command(BaseCommand):
+    help = (
+        "Check that the status summaries of bills match the statuses of their"
+        " actions."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Number of bills to check per query.",
+        )
+        parser.add_argument(
+            "--fix",
+            action="store_true",
+            help="Rebuild the summaries that are missing or out of date.",
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+        bill_ids = list(Bill.objects.order_by("id").values_list("id", flat=True))
+        inconsistent_bill_ids = []
+
+        for start in range(0, len(bill_ids), batch_size):
+            bill_ids_batch = bill_ids[start : start + batch_size]  # noqa E203
+
+            status_counts_index = BillStatusSummary.get_status_counts(bill_ids_batch)
+            summaries = {
+                summary.bill_id: summary
+                for summary in BillStatusSummary.objects.filter(
+                    bill_id__in=bill_ids_batch
+                )
+            }
+
+            for bill_id in bill_ids_batch:
+                summary = summaries.get(bill_id)
+
+                if summary is None or not summary.has_status_counts(
+                    status_counts_index[bill_id]
+                ):
+                    inconsistent_bill_ids.append(bill_id)
+
+        if not inconsistent_bill_ids:
+            self.stdout.write(
+                self.style.SUCCESS(
+                    f"All {len(bill_ids)} bill status summaries are consistent."
+                )
+            )
+            return
+
+        if options["fix"]:
+            BillStatusSummary.refresh_for_bills(inconsistent_bill_ids)
+            self.stdout.write(
+                self.style.SUCCESS(
+                    f"Rebuilt {len(inconsistent_bill_ids)} inconsistent bill status"
+                    " summaries."
+                )
+            )
+            return
+
+        raise CommandError(
+            f"{len(inconsistent_bill_ids)} bill status summaries are missing or out of"
+            f" date (bill ids: {inconsistent_bill_ids[:20]}). Run with --fix or use"
+            " rebuild_bill_status_summaries."
+        )
@@ -0,0 +1,40 @@
+from django.core.management.base import BaseCommand
+
+from bills.models import Bill, BillStatusSummary
+
+
+class Command(BaseCommand):
+    help = "Recount the action statuses of bills and rebuild their status summaries."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Number of bills to rebuild per transaction.",
+        )
+        parser.add_argument(
+            "--bill",
+            action="append",
+            dest="bill_uuids",
+            default=[],
+            help="UUID of a bill to rebuild. Can be repeated. Defaults to all bills.",
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+        bills = Bill.objects.order_by("id")
+
+        if options["bill_uuids"]:
+            bills = bills.filter(uuid__in=options["bill_uuids"])
+
+        bill_ids = list(bills.values_list("id", flat=True))
+
+        for start in range(0, len(bill_ids), batch_size):
+            BillStatusSummary.refresh_for_bills(
+                bill_ids[start : start + batch_size]  # noqa E203
+            )
+
+        self.stdout.write(
+            self.style.SUCCESS(f"Rebuilt status summaries for {len(bill_ids)} bills.")
+        )
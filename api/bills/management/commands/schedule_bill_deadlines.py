@@ -0,0 +1,61 @@
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from bills.models import Bill
+from bills.tasks.actions import (
+    DEADLINE_SCHEDULING_HORIZON,
+    mark_pending_actions_as_overdue,
+    schedule_bill_deadline,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Schedule the deadline tasks of bills whose deadline is within the scheduling"
+        " horizon (later ones are scheduled periodically), and mark the"
+        " pending actions of bills whose deadline has passed as overdue. Run once"
+        " after deploying deadline scheduling, or after losing queued tasks."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=500,
+            help="Number of bills whose actions are updated per transaction.",
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+        now = timezone.now()
+
+        scheduled_bills_count = 0
+
+        for bill in (
+            Bill.objects.filter(
+                deadline__gte=now, deadline__lte=now + DEADLINE_SCHEDULING_HORIZON
+            )
+            .only("id", "deadline")
+            .iterator(chunk_size=1000)
+        ):
+            schedule_bill_deadline(bill)
+            scheduled_bills_count += 1
+
+        passed_bill_ids = list(
+            Bill.objects.filter(deadline__lt=now)
+            .order_by("id")
+            .values_list("id", flat=True)
+        )
+        overdue_actions_count = 0
+
+        for start in range(0, len(passed_bill_ids), batch_size):
+            overdue_actions_count += mark_pending_actions_as_overdue(
+                passed_bill_ids[start : start + batch_size]  # noqa E203
+            )
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Scheduled the deadlines of {scheduled_bills_count} bills and"
+                f" marked {overdue_actions_count} actions as overdue."
+            )
+        )
@@ -0,0 +1,69 @@
+# Generated by Django 4.1.7 on 2026-10-18 06:40
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ("bills", "0011_alter_billaction_status"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="BillNotificationEvent",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "event",
+                    models.CharField(
+                        choices=[
+                            ("contribution", "Contribution"),
+                            ("arrear_contribution", "Arrear contribution"),
+                            ("subscription", "Subscription"),
+                        ],
+                        max_length=50,
+                    ),
+                ),
+                (
+                    "actor_name",
+                    models.CharField(
+                        help_text="Full name of the user whose activity triggered the event",
+                        max_length=300,
+                    ),
+                ),
+                ("created", models.DateTimeField(auto_now_add=True, db_index=True)),
+                (
+                    "bill",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="notification_events",
+                        to="bills.bill",
+                    ),
+                ),
+                (
+                    "recipient",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="bill_notification_events",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Bill notification event",
+                "verbose_name_plural": "Bill notification events",
+            },
+        ),
+    ]
@@ -0,0 +1,116 @@
+# Generated by Django 4.1.7 on 2026-10-18 06:42
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def build_bill_status_summaries(apps, schema_editor):
+    """Build the status summaries of existing bills."""
+
+    Bill = apps.get_model("bills", "Bill")
+    BillAction = apps.get_model("bills", "BillAction")
+    BillStatusSummary = apps.get_model("bills", "BillStatusSummary")
+
+    status_counts_index = {
+        bill_id: {} for bill_id in Bill.objects.values_list("id", flat=True)
+    }
+
+    counts = (
+        BillAction.objects.values("bill_id", "status")
+        .annotate(count=Count("id"))
+        .order_by()
+    )
+
+    for item in counts:
+        status_counts_index[item["bill_id"]][item["status"]] = item["count"]
+
+    summaries = []
+
+    for bill_id, status_counts in status_counts_index.items():
+        most_common_status = (
+            min(status_counts, key=lambda status: (-status_counts[status], status))
+            if status_counts
+            else None
+        )
+
+        summaries.append(
+            BillStatusSummary(
+                bill_id=bill_id,
+                status_counts=status_counts,
+                most_common_status=most_common_status,
+                most_common_status_count=status_counts.get(most_common_status, 0),
+                are_all_statuses_same=len(status_counts) <= 1,
+            )
+        )
+
+    BillStatusSummary.objects.bulk_create(summaries, batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("bills", "0012_billnotificationevent"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="BillStatusSummary",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "status_counts",
+                    models.JSONField(
+                        default=dict,
+                        help_text="Number of the bill's actions in each status",
+                    ),
+                ),
+                (
+                    "most_common_status",
+                    models.CharField(
+                        blank=True,
+                        choices=[
+                            ("unregistered", "Unregistered"),
+                            ("pending", "Pending"),
+                            ("overdue", "Overdue"),
+                            ("opted_out", "Opted out"),
+                            ("pending_transfer", "Pending transfer"),
+                            ("failed_transfer", "Failed transfer"),
+                            ("reversed_transfer", "Reversed transfer"),
+                            ("cancelled", "Cancelled"),
+                            ("payment_initialized", "Payment initialized"),
+                            ("completed", "Completed"),
+                            ("ongoing", "Ongoing"),
+                            ("last_payment_failed", "Last payment failed"),
+                        ],
+                        max_length=50,
+                        null=True,
+                    ),
+                ),
+                ("most_common_status_count", models.PositiveIntegerField(default=0)),
+                ("are_all_statuses_same", models.BooleanField(default=True)),
+                ("modified", models.DateTimeField(auto_now=True)),
+                (
+                    "bill",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="status_summary",
+                        to="bills.bill",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Bill status summary",
+                "verbose_name_plural": "Bill status summaries",
+            },
+        ),
+        migrations.RunPython(build_bill_status_summaries, migrations.RunPython.noop),
+    ]
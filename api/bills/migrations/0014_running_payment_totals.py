@@ -0,0 +1,80 @@
+# Generated by Django 4.1.7 on 2026-10-18 06:43
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery, Sum, Value
+from django.db.models.functions import Coalesce
+
+
+def build_running_payment_totals(apps, schema_editor):
+    """Compute the running payment totals of existing bills and actions."""
+
+    Bill = apps.get_model("bills", "Bill")
+    BillAction = apps.get_model("bills", "BillAction")
+    BillTransaction = apps.get_model("bills", "BillTransaction")
+
+    for model, field_name in ((Bill, "bill"), (BillAction, "action")):
+        transactions = (
+            BillTransaction.objects.filter(**{field_name: OuterRef("pk")})
+            .values(field_name)
+            .order_by()
+        )
+
+        model.objects.update(
+            total_amount_paid=Coalesce(
+                Subquery(
+                    transactions.annotate(total=Sum("contribution")).values("total")
+                ),
+                Value(0),
+                output_field=models.DecimalField(max_digits=19, decimal_places=4),
+            ),
+            payments_count=Coalesce(
+                Subquery(transactions.annotate(count=Count("id")).values("count")),
+                Value(0),
+            ),
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("bills", "0013_billstatussummary"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="bill",
+            name="payments_count",
+            field=models.PositiveIntegerField(
+                default=0, help_text="Running count of the bill's transactions"
+            ),
+        ),
+        migrations.AddField(
+            model_name="bill",
+            name="total_amount_paid",
+            field=models.DecimalField(
+                decimal_places=4,
+                default=0,
+                help_text="Running total of contributions paid in the bill's transactions",
+                max_digits=19,
+            ),
+        ),
+        migrations.AddField(
+            model_name="billaction",
+            name="payments_count",
+            field=models.PositiveIntegerField(
+                default=0,
+                help_text="Running count of the action's transactions (includes arrears)",
+            ),
+        ),
+        migrations.AddField(
+            model_name="billaction",
+            name="total_amount_paid",
+            field=models.DecimalField(
+                decimal_places=4,
+                default=0,
+                help_text="Running total of contributions paid in the action's transactions (includes arrears)",
+                max_digits=19,
+            ),
+        ),
+        migrations.RunPython(build_running_payment_totals, migrations.RunPython.noop),
+    ]
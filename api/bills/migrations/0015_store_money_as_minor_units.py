@@ -0,0 +1,325 @@
+# Generated by Django 4.1.7 on 2026-10-18 06:57
+
+from decimal import Decimal
+
+import core.fields
+import django.core.validators
+from django.db import migrations, models
+from django.db.models import F
+from django.db.models.functions import Round
+
+# The money fields of each model, whose values are converted to minor units of 0.0001.
+MONEY_FIELDS = {
+    "bill": (
+        "total_amount_due",
+        "total_amount_paid",
+    ),
+    "billaction": (
+        "contribution",
+        "halver_fee",
+        "paystack_transaction_fee",
+        "paystack_transfer_fee",
+        "total_amount_paid",
+        "total_fee",
+        "total_payment_due",
+    ),
+    "billarrear": (
+        "contribution",
+        "halver_fee",
+        "paystack_transaction_fee",
+        "paystack_transfer_fee",
+        "total_fee",
+        "total_payment_due",
+    ),
+    "billtransaction": (
+        "contribution",
+        "total_payment",
+    ),
+}
+
+# Every money field has 4 decimal places, i.e. is a whole number of minor units.
+MINOR_UNIT = Decimal("0.0001")
+
+
+def update_money_fields(apps, get_value):
+    for model_name, field_names in MONEY_FIELDS.items():
+        model = apps.get_model("bills", model_name)
+        model.objects.update(
+            **{field_name: get_value(F(field_name)) for field_name in field_names}
+        )
+
+
+def convert_to_minor_units(apps, schema_editor):
+    # Rounding only matters on backends that store decimals as floats (SQLite).
+    update_money_fields(apps, lambda amount: Round(amount / MINOR_UNIT))
+
+
+def convert_from_minor_units(apps, schema_editor):
+    update_money_fields(apps, lambda units: Round(units * MINOR_UNIT, 4))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("bills", "0014_running_payment_totals"),
+    ]
+
+    operations = [
+        # Widen the columns first, so that every amount still fits once it is
+        # multiplied into minor units (19 integer digits, like a BIGINT).
+        migrations.AlterField(
+            model_name="bill",
+            name="total_amount_due",
+            field=models.DecimalField(
+                decimal_places=4, help_text="Total amount to be paid", max_digits=23
+            ),
+        ),
+        migrations.AlterField(
+            model_name="bill",
+            name="total_amount_paid",
+            field=models.DecimalField(
+                decimal_places=4,
+                default=0,
+                help_text="Running total of contributions paid in the bill's transactions",
+                max_digits=23,
+            ),
+        ),
+        migrations.AlterField(
+            model_name="billaction",
+            name="contribution",
+            field=models.DecimalField(
+                decimal_places=4,
+                help_text="Bill contribution of participant (excludes fees)",
+                max_digits=23,
+                null=True,
+            ),
+        ),
+        migrations.AlterField(
+            model_name="billaction",
+            name="halver_fee",
+            field=models.DecimalField(decimal_places=4, max_digits=23, null=True),
+        ),
+        migrations.AlterField(
+            model_name="billaction",
+            name="paystack_transaction_fee",
+            field=models.DecimalField(decimal_places=4, max_digits=23, null=True),
+        ),
+        migrations.AlterField(
+            model_name="billaction",
+            name="paystack_transfer_fee",
+            field=models.DecimalField(decimal_places=4, max_digits=23, null=True),
+        ),
+        migrations.AlterField(
+            model_name="billaction",
+            name="total_amount_paid",
+            field=models.DecimalField(
+                decimal_places=4,
+                default=0,
+                help_text="Running total of contributions paid in the action's transactions (includes arrears)",
+                max_digits=23,
+            ),
+        ),
+        migrations.AlterField(
+            model_name="billaction",
+            name="total_fee",
+            field=models.DecimalField(decimal_places=4, max_digits=23, null=True),
+        ),
+        migrations.AlterField(
+            model_name="billaction",
+            name="total_payment_due",
+            field=models.DecimalField(
+                decimal_places=4,
+                help_text="Summation of contribution and total fees. Actual amount to be paid",
+                max_digits=23,
+                null=True,
+            ),
+        ),
+        migrations.AlterField(
+            model_name="billarrear",
+            name="contribution",
+            field=models.DecimalField(
+                decimal_places=4,
+                help_text="Bill contribution of participant (excludes fees)",
+                max_digits=23,
+                null=True,
+            ),
+        ),
+        migrations.AlterField(
+            model_name="billarrear",
+            name="halver_fee",
+            field=models.DecimalField(decimal_places=4, max_digits=23, null=True),
+        ),
+        migrations.AlterField(
+            model_name="billarrear",
+            name="paystack_transaction_fee",
+            field=models.DecimalField(decimal_places=4, max_digits=23, null=True),
+        ),
+        migrations.AlterField(
+            model_name="billarrear",
+            name="paystack_transfer_fee",
+            field=models.DecimalField(decimal_places=4, max_digits=23, null=True),
+        ),
+        migrations.AlterField(
+            model_name="billarrear",
+            name="total_fee",
+            field=models.DecimalField(decimal_places=4, max_digits=23, null=True),
+        ),
+        migrations.AlterField(
+            model_name="billarrear",
+            name="total_payment_due",
+            field=models.DecimalField(
+                decimal_places=4,
+                help_text="Summation of contribution and total fees. Actual amount to be paid",
+                max_digits=23,
+                null=True,
+            ),
+        ),
+        migrations.AlterField(
+            model_name="billtransaction",
+            name="contribution",
+            field=models.DecimalField(
+                decimal_places=4,
+                help_text="Bill contribution of the participant (excludes fees).",
+                max_digits=23,
+                validators=[django.core.validators.MinValueValidator(100)],
+            ),
+        ),
+        migrations.AlterField(
+            model_name="billtransaction",
+            name="total_payment",
+            field=models.DecimalField(
+                decimal_places=4,
+                help_text="Total amount paid (includes fees)",
+                max_digits=23,
+            ),
+        ),
+        migrations.RunPython(convert_to_minor_units, convert_from_minor_units),
+        # The amounts are now whole numbers, so converting the columns to BIGINT
+        # is exact.
+        migrations.AlterField(
+            model_name="bill",
+            name="total_amount_due",
+            field=core.fields.MoneyField(
+                decimal_places=4, help_text="Total amount to be paid", max_digits=19
+            ),
+        ),
+        migrations.AlterField(
+            model_name="bill",
+            name="total_amount_paid",
+            field=core.fields.MoneyField(
+                decimal_places=4,
+                default=0,
+                help_text="Running total of contributions paid in the bill's transactions",
+                max_digits=19,
+            ),
+        ),
+        migrations.AlterField(
+            model_name="billaction",
+            name="contribution",
+            field=core.fields.MoneyField(
+                decimal_places=4,
+                help_text="Bill contribution of participant (excludes fees)",
+                max_digits=19,
+                null=True,
+            ),
+        ),
+        migrations.AlterField(
+            model_name="billaction",
+            name="halver_fee",
+            field=core.fields.MoneyField(decimal_places=4, max_digits=19, null=True),
+        ),
+        migrations.AlterField(
+            model_name="billaction",
+            name="paystack_transaction_fee",
+            field=core.fields.MoneyField(decimal_places=4, max_digits=19, null=True),
+        ),
+        migrations.AlterField(
+            model_name="billaction",
+            name="paystack_transfer_fee",
+            field=core.fields.MoneyField(decimal_places=4, max_digits=19, null=True),
+        ),
+        migrations.AlterField(
+            model_name="billaction",
+            name="total_amount_paid",
+            field=core.fields.MoneyField(
+                decimal_places=4,
+                default=0,
+                help_text="Running total of contributions paid in the action's transactions (includes arrears)",
+                max_digits=19,
+            ),
+        ),
+        migrations.AlterField(
+            model_name="billaction",
+            name="total_fee",
+            field=core.fields.MoneyField(decimal_places=4, max_digits=19, null=True),
+        ),
+        migrations.AlterField(
+            model_name="billaction",
+            name="total_payment_due",
+            field=core.fields.MoneyField(
+                decimal_places=4,
+                help_text="Summation of contribution and total fees. Actual amount to be paid",
+                max_digits=19,
+                null=True,
+            ),
+        ),
+        migrations.AlterField(
+            model_name="billarrear",
+            name="contribution",
+            field=core.fields.MoneyField(
+                decimal_places=4,
+                help_text="Bill contribution of participant (excludes fees)",
+                max_digits=19,
+                null=True,
+            ),
+        ),
+        migrations.AlterField(
+            model_name="billarrear",
+            name="halver_fee",
+            field=core.fields.MoneyField(decimal_places=4, max_digits=19, null=True),
+        ),
+        migrations.AlterField(
+            model_name="billarrear",
+            name="paystack_transaction_fee",
+            field=core.fields.MoneyField(decimal_places=4, max_digits=19, null=True),
+        ),
+        migrations.AlterField(
+            model_name="billarrear",
+            name="paystack_transfer_fee",
+            field=core.fields.MoneyField(decimal_places=4, max_digits=19, null=True),
+        ),
+        migrations.AlterField(
+            model_name="billarrear",
+            name="total_fee",
+            field=core.fields.MoneyField(decimal_places=4, max_digits=19, null=True),
+        ),
+        migrations.AlterField(
+            model_name="billarrear",
+            name="total_payment_due",
+            field=core.fields.MoneyField(
+                decimal_places=4,
+                help_text="Summation of contribution and total fees. Actual amount to be paid",
+                max_digits=19,
+                null=True,
+            ),
+        ),
+        migrations.AlterField(
+            model_name="billtransaction",
+            name="contribution",
+            field=core.fields.MoneyField(
+                decimal_places=4,
+                help_text="Bill contribution of the participant (excludes fees).",
+                max_digits=19,
+                validators=[django.core.validators.MinValueValidator(100)],
+            ),
+        ),
+        migrations.AlterField(
+            model_name="billtransaction",
+            name="total_payment",
+            field=core.fields.MoneyField(
+                decimal_places=4,
+                help_text="Total amount paid (includes fees)",
+                max_digits=19,
+            ),
+        ),
+    ]
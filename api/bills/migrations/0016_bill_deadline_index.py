@@ -0,0 +1,19 @@
+# Generated by Django 4.1.7 on 2026-10-18 07:02
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("bills", "0015_store_money_as_minor_units"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="bill",
+            index=models.Index(
+                fields=["deadline"], name="bills_bill_deadlin_1ca744_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 4.1.7 on 2026-10-18 07:06
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("bills", "0016_bill_deadline_index"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="bill",
+            name="settlement_mode",
+            field=models.CharField(
+                choices=[("instant", "Instant"), ("batched", "Batched")],
+                default="instant",
+                help_text="Whether contributions are transferred to the creditor as soon as they are paid, or queued and transferred in bulk every SETTLEMENT_WINDOW seconds",
+                max_length=50,
+            ),
+        ),
+    ]
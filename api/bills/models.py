@@ -1,26 +1,52 @@
+from datetime import datetime, time, timedelta
+
 from django.conf import settings
 from django.core.exceptions import ValidationError
 from django.core.validators import MinValueValidator
-from django.db import models
+from django.db import models, transaction
 from django.db.models import (
+    BooleanField,
+    Case,
     Count,
     DateField,
-    Exists,
-    OuterRef,
+    F,
     Prefetch,
     Q,
-    Subquery,
     Sum,
+    Value,
+    When,
 )
 from django.db.models.functions import TruncDate
+from django.utils import timezone
 from phonenumber_field.modelfields import PhoneNumberField
 
 from accounts.models import CustomUser
 from bills.utils.bills import create_bill, generate_long_status_index
+from bills.utils.cache import invalidate_bill_members_caches
+from core.fields import MoneyField
 from core.models import AbstractCurrencyModel, AbstractTimeStampedUUIDModel
 from core.utils.dates_and_time import validate_date_not_in_past
 
 
+def is_equal_to(field_name, value):
+    """Build a boolean expression that is True where a field equals a value, and
+    False otherwise, including where the field is NULL.
+
+    Args:
+        field_name (str): The field, e.g. "creator_id".
+        value: The value, e.g. the id of the user making a request.
+
+    Returns:
+        Case: The expression.
+    """
+
+    return Case(
+        When(**{field_name: value}, then=Value(True)),
+        default=Value(False),
+        output_field=BooleanField(),
+    )
+
+
 class Bill(AbstractTimeStampedUUIDModel, AbstractCurrencyModel, models.Model):
     """Stores a particular user's bill.
 
@@ -41,6 +67,10 @@ class Bill(AbstractTimeStampedUUIDModel, AbstractCurrencyModel, models.Model):
         ANNUALLY = "annually", "Annually"
         NONE = "none", "None"
 
+    class SettlementChoices(models.TextChoices):
+        INSTANT = "instant", "Instant"
+        BATCHED = "batched", "Batched"
+
     creator = models.ForeignKey(
         settings.AUTH_USER_MODEL,
         on_delete=models.PROTECT,
@@ -83,10 +113,8 @@ class Bill(AbstractTimeStampedUUIDModel, AbstractCurrencyModel, models.Model):
         blank=True,
         null=True,
     )
-    total_amount_due = models.DecimalField(
+    total_amount_due = MoneyField(
         help_text="Total amount to be paid",
-        max_digits=19,
-        decimal_places=4,
     )
     is_discreet = models.BooleanField(
         help_text=(
@@ -95,11 +123,29 @@ class Bill(AbstractTimeStampedUUIDModel, AbstractCurrencyModel, models.Model):
         ),
         default=False,
     )
+    total_amount_paid = MoneyField(
+        help_text="Running total of contributions paid in the bill's transactions",
+        default=0,
+    )
+    payments_count = models.PositiveIntegerField(
+        help_text="Running count of the bill's transactions",
+        default=0,
+    )
+    settlement_mode = models.CharField(
+        help_text=(
+            "Whether contributions are transferred to the creditor as soon as they are"
+            " paid, or queued and transferred in bulk every SETTLEMENT_WINDOW seconds"
+        ),
+        max_length=50,
+        choices=SettlementChoices.choices,
+        default=SettlementChoices.INSTANT,
+    )
 
     class Meta:
         indexes = [
             models.Index(fields=["uuid"]),
             models.Index(fields=["name"]),
+            models.Index(fields=["deadline"]),
         ]
         verbose_name = "Bill"
         verbose_name_plural = "Bills"
@@ -127,32 +173,17 @@ class Bill(AbstractTimeStampedUUIDModel, AbstractCurrencyModel, models.Model):
     def is_recurring(self) -> bool:
         return self.interval != "none"
 
-    @property
-    def total_amount_paid(self):
-        """Return the total amount paid by all transactions.
-
-        This method uses the aggregate function to sum up the contribution field of each
-        completed transaction associated with a bill instance. If there are no
-        transactions, it returns zero.
-
-        For recurring bills, it should return total amount of money that has been paid
-        towards a bill
-
-        Returns:
-            Decimal: The total amount paid in contribution towards bill.
-        """
-
-        result = self.transactions.aggregate(
-            total_contribution=models.Sum("contribution")
-        )["total_contribution"]
-        return result if result else 0
-
     @property
     def total_participants(self):
         return self.participants.count() + self.unregistered_participants.count()
 
     @property
     def status(self):
+        """Return the bill's short (most common action status) and long status.
+
+        Read from the bill's BillStatusSummary, so no aggregation is performed.
+        """
+
         (
             most_common_status,
             most_common_status_count,
@@ -218,7 +249,7 @@ class Bill(AbstractTimeStampedUUIDModel, AbstractCurrencyModel, models.Model):
         try:
             # Obtain the specific bill with all relevant data joined to it
             return (
-                cls.objects.select_related("creditor", "creator")
+                cls.objects.select_related("creditor", "creator", "status_summary")
                 .prefetch_related("transactions", "participants", actions_prefetch)
                 .get(uuid=uuid)
             )
@@ -236,6 +267,9 @@ class Bill(AbstractTimeStampedUUIDModel, AbstractCurrencyModel, models.Model):
         get_most_common_status_details in the bill list serializer. The status info
         returned would be used to determine the long status on the client.
 
+        The status info is read from each bill's BillStatusSummary (a join), rather
+        than aggregated from the bill's actions.
+
         Args:
             user: The user making the request. Usually provided by view consuming method.
 
@@ -250,8 +284,7 @@ class Bill(AbstractTimeStampedUUIDModel, AbstractCurrencyModel, models.Model):
         """
 
         bills = (
-            Bill.objects.select_related("creditor", "creator")
-            .prefetch_related(
+            Bill.objects.select_related("creditor", "creator").prefetch_related(
                 Prefetch(
                     "unregistered_participants",
                     queryset=BillUnregisteredParticipant.objects.only(
@@ -269,26 +302,112 @@ class Bill(AbstractTimeStampedUUIDModel, AbstractCurrencyModel, models.Model):
                     ),
                 ),
             )
-            .filter(Q(participants=user) | Q(creditor=user))
-        )
-
-        status_count_subquery = (
-            BillAction.objects.filter(bill=OuterRef("pk"))
-            .values("status")
-            .annotate(count=Count("status"))
-            .order_by("-count")
+            # Evaluated first, as MySQL cannot run an IN (... UNION ...) subquery as a
+            # semijoin. The bills themselves are then looked up by primary key.
+            .filter(id__in=list(cls.get_users_bill_ids(user)))
         )
 
         bills_with_status_info = bills.annotate(
-            most_common_status=Subquery(status_count_subquery.values("status")[:1]),
-            most_common_status_count=Subquery(
-                status_count_subquery.values("count")[:1]
-            ),
-            are_all_statuses_same=~Exists(status_count_subquery[1:]),
+            most_common_status=F("status_summary__most_common_status"),
+            most_common_status_count=F("status_summary__most_common_status_count"),
+            are_all_statuses_same=F("status_summary__are_all_statuses_same"),
         )
 
         return bills_with_status_info
 
+    @classmethod
+    def get_users_bill_ids(cls, user):
+        """Returns a queryset of the ids of bills the user participates in or is the
+        creditor of.
+
+        Written as a UNION of a participants branch and a creditor branch, which can
+        each be served from an index (the participants table's user column and the
+        creditor foreign key). Filtering with Q(participants=user) | Q(creditor=user)
+        instead joins the participants table under an OR that cannot use either
+        index, and repeats a bill once per matching participant row. UNION also
+        removes duplicate ids, e.g. when a creditor is also a participant.
+
+        Args:
+            user: The user whose bills should be returned.
+
+        Returns:
+            QuerySet: A values_list queryset of bill ids.
+        """
+
+        participant_bill_ids = cls.participants.through.objects.filter(
+            customuser_id=user.id
+        ).values_list("bill_id", flat=True)
+        creditor_bill_ids = cls.objects.filter(creditor_id=user.id).values_list(
+            "id", flat=True
+        )
+
+        return participant_bill_ids.union(creditor_bill_ids)
+
+    @classmethod
+    def get_users_bill_list_rows(cls, user):
+        """Returns the bills related to the user as dicts of exactly the columns
+        shown by BillListSerializer, for BillListProjectionSerializer.
+
+        No model instances are built. The fields that depend on the user are
+        computed in SQL, and the participants are loaded by the serializer, for the
+        bills of one page only.
+
+        Args:
+            user: The user making the request.
+
+        Returns:
+            QuerySet: A values queryset of bill rows.
+        """
+
+        return (
+            Bill.objects.filter(id__in=list(cls.get_users_bill_ids(user)))
+            .values("id", "created", "interval", "modified", "name", "uuid")
+            .annotate(
+                is_creator=is_equal_to("creator_id", user.id),
+                is_creditor=is_equal_to("creditor_id", user.id),
+                is_recurring=Case(
+                    When(interval=cls.IntervalChoices.NONE, then=Value(False)),
+                    default=Value(True),
+                    output_field=BooleanField(),
+                ),
+                most_common_status=F("status_summary__most_common_status"),
+                most_common_status_count=F("status_summary__most_common_status_count"),
+                are_all_statuses_same=F("status_summary__are_all_statuses_same"),
+            )
+        )
+
+    @classmethod
+    def get_list_participant_rows(cls, bill_ids):
+        """Returns the registered and unregistered participants of some bills, with
+        the columns shown by BillListSerializer, in two queries.
+
+        Args:
+            bill_ids (list[int]): The ids of the bills.
+
+        Returns:
+            tuple: Values querysets of the bills' participants and unregistered
+                participants, each with a bill_id.
+        """
+
+        participants = (
+            cls.participants.through.objects.filter(bill_id__in=bill_ids)
+            .values(
+                "bill_id",
+                first_name=F("customuser__first_name"),
+                last_name=F("customuser__last_name"),
+                profile_image_url=F("customuser__profile_image_url"),
+                profile_image_hash=F("customuser__profile_image_hash"),
+            )
+            .order_by("customuser_id")
+        )
+        unregistered_participants = (
+            cls.unregistered_participants.through.objects.filter(bill_id__in=bill_ids)
+            .values("bill_id", name=F("billunregisteredparticipant__name"))
+            .order_by("billunregisteredparticipant_id")
+        )
+
+        return participants, unregistered_participants
+
     def get_most_common_status_details(self):
         """Returns the most common status and its frequency, as well as a flag
         indicating whether all actions are of the same status.
@@ -304,25 +423,16 @@ class Bill(AbstractTimeStampedUUIDModel, AbstractCurrencyModel, models.Model):
                 have the same status code.
         """
 
-        actions = self.actions.all()
-        counts = (
-            actions.values("status")
-            .annotate(count=models.Count("status"))
-            .order_by("-count")
-        )
-
-        action_counts_index = {item["status"]: item["count"] for item in counts}
-        total_statuses_count = sum(action_counts_index.values())
-
-        most_common_status = max(action_counts_index, key=action_counts_index.get)
-        most_common_status_count = action_counts_index[most_common_status]
-
-        all_actions_are_one_type = most_common_status_count == total_statuses_count
+        try:
+            status_summary = self.status_summary
+        except BillStatusSummary.DoesNotExist:
+            # Only bills whose summary has not been built yet get here.
+            status_summary = BillStatusSummary.refresh_for_bills([self.id])[0]
 
         return (
-            most_common_status,
-            most_common_status_count,
-            all_actions_are_one_type,
+            status_summary.most_common_status,
+            status_summary.most_common_status_count,
+            status_summary.are_all_statuses_same,
         )
 
     def change_first_charge_date(self, new_first_charge_date):
@@ -392,43 +502,42 @@ class BillAction(AbstractTimeStampedUUIDModel, models.Model):
         null=True,
         related_name="actions",
     )
-    contribution = models.DecimalField(
+    contribution = MoneyField(
         help_text="Bill contribution of participant (excludes fees)",
-        max_digits=19,
         null=True,
-        decimal_places=4,
     )
     status = models.CharField(
         max_length=50,
         choices=StatusChoices.choices,
         default=StatusChoices.PENDING,
     )
-    paystack_transaction_fee = models.DecimalField(
-        max_digits=19,
-        decimal_places=4,
+    paystack_transaction_fee = MoneyField(
         null=True,
     )
-    paystack_transfer_fee = models.DecimalField(
-        max_digits=19,
-        decimal_places=4,
+    paystack_transfer_fee = MoneyField(
         null=True,
     )
-    halver_fee = models.DecimalField(
-        max_digits=19,
-        decimal_places=4,
+    halver_fee = MoneyField(
         null=True,
     )
-    total_fee = models.DecimalField(
-        max_digits=19,
-        decimal_places=4,
+    total_fee = MoneyField(
         null=True,
     )
-    total_payment_due = models.DecimalField(
+    total_payment_due = MoneyField(
         help_text="Summation of contribution and total fees. Actual amount to be paid",
-        max_digits=19,
-        decimal_places=4,
         null=True,
     )
+    total_amount_paid = MoneyField(
+        help_text=(
+            "Running total of contributions paid in the action's transactions"
+            " (includes arrears)"
+        ),
+        default=0,
+    )
+    payments_count = models.PositiveIntegerField(
+        help_text="Running count of the action's transactions (includes arrears)",
+        default=0,
+    )
 
     class Meta:
         indexes = [models.Index(fields=["status"])]
@@ -449,10 +558,17 @@ class BillAction(AbstractTimeStampedUUIDModel, models.Model):
         if not self.contribution or self.contribution <= 0:
             raise ValidationError("Actions must have a positive, nonzero contribution.")
 
+    @transaction.atomic
     def _update_status(self, status):
+        # Lock the bill's summary first so concurrent status changes on the same bill
+        # are applied to it one after the other.
+        BillStatusSummary.lock_for_bills([self.bill_id])
+
         self.status = status
         self.save(update_fields=["status"])
 
+        BillStatusSummary.refresh_for_bills([self.bill_id])
+
     def opt_out_of_bill(self):
         """Signifies that a participant refused to participate in a bill."""
 
@@ -479,6 +595,32 @@ class BillAction(AbstractTimeStampedUUIDModel, models.Model):
     def mark_as_last_failed(self):
         self._update_status(self.StatusChoices.LAST_PAYMENT_FAILED)
 
+    @classmethod
+    @transaction.atomic
+    def update_statuses(cls, actions, status, **fields):
+        """Bulk update the status of actions and refresh their bills' summaries.
+
+        Should be used instead of calling actions.update(status=...) directly, which
+        would leave the BillStatusSummary of the affected bills out of date.
+
+        Args:
+            actions (QuerySet): The actions to update.
+            status (str): The new status of the actions.
+            **fields: Other fields to update on the actions.
+
+        Returns:
+            int: The number of actions updated.
+        """
+
+        bill_ids = set(actions.values_list("bill_id", flat=True))
+        BillStatusSummary.lock_for_bills(bill_ids)
+
+        updated_actions_count = actions.update(status=status, **fields)
+
+        BillStatusSummary.refresh_for_bills(bill_ids)
+
+        return updated_actions_count
+
     @classmethod
     def get_action_status_counts_for_user(cls, user_id):
         relevant_statuses = (
@@ -517,6 +659,198 @@ class BillAction(AbstractTimeStampedUUIDModel, models.Model):
         )
 
 
+class BillStatusSummary(models.Model):
+    """Stores the number of a bill's actions in each status.
+
+    The bill's status (its most common action status) is derived from these counts.
+    Storing it means bill lists and details do not need to aggregate each bill's
+    actions when they are read. The summary is refreshed in the same transaction as
+    every change to the bill's action statuses, through BillAction._update_status
+    and BillAction.update_statuses.
+
+    The rebuild_bill_status_summaries and check_bill_status_summaries management
+    commands can be used to rebuild or verify all summaries.
+    """
+
+    bill = models.OneToOneField(
+        Bill,
+        on_delete=models.CASCADE,
+        related_name="status_summary",
+    )
+    status_counts = models.JSONField(
+        help_text="Number of the bill's actions in each status",
+        default=dict,
+    )
+    most_common_status = models.CharField(
+        max_length=50,
+        choices=BillAction.StatusChoices.choices,
+        blank=True,
+        null=True,
+    )
+    most_common_status_count = models.PositiveIntegerField(
+        default=0,
+    )
+    are_all_statuses_same = models.BooleanField(
+        default=True,
+    )
+    modified = models.DateTimeField(
+        auto_now=True,
+    )
+
+    class Meta:
+        verbose_name = "Bill status summary"
+        verbose_name_plural = "Bill status summaries"
+
+    def __str__(self) -> str:
+        return f"bill: {self.bill_id}, most common status: {self.most_common_status}"
+
+    def apply_status_counts(self, status_counts):
+        """Set the status counts and the status details derived from them.
+
+        Ties for the most common status are broken by the status' name, so the
+        result does not depend on the order of the counts.
+
+        Args:
+            status_counts (dict): A dictionary mapping statuses to action counts.
+        """
+
+        self.status_counts = status_counts
+
+        if not status_counts:
+            self.most_common_status = None
+            self.most_common_status_count = 0
+            self.are_all_statuses_same = True
+            return
+
+        self.most_common_status = min(
+            status_counts, key=lambda status: (-status_counts[status], status)
+        )
+        self.most_common_status_count = status_counts[self.most_common_status]
+        self.are_all_statuses_same = len(status_counts) == 1
+
+    def has_status_counts(self, status_counts):
+        """Check that the stored summary matches the given status counts."""
+
+        expected_summary = BillStatusSummary(bill_id=self.bill_id)
+        expected_summary.apply_status_counts(status_counts)
+
+        return (
+            self.status_counts == expected_summary.status_counts
+            and self.most_common_status == expected_summary.most_common_status
+            and self.most_common_status_count
+            == expected_summary.most_common_status_count
+            and self.are_all_statuses_same == expected_summary.are_all_statuses_same
+        )
+
+    @staticmethod
+    def get_status_counts(bill_ids):
+        """Count the actions in each status for the given bills.
+
+        Args:
+            bill_ids (Iterable[int]): The ids of the bills.
+
+        Returns:
+            dict: A dictionary mapping each bill id to a dictionary of status counts.
+                Bills without actions are mapped to an empty dictionary.
+        """
+
+        bill_ids = list(bill_ids)
+        status_counts_index = {bill_id: {} for bill_id in bill_ids}
+
+        counts = (
+            BillAction.objects.filter(bill_id__in=bill_ids)
+            .values("bill_id", "status")
+            .annotate(count=Count("id"))
+            .order_by()
+        )
+
+        for item in counts:
+            status_counts_index[item["bill_id"]][item["status"]] = item["count"]
+
+        return status_counts_index
+
+    @classmethod
+    def lock_for_bills(cls, bill_ids):
+        """Lock the summaries of the given bills until the end of the transaction."""
+
+        list(
+            cls.objects.select_for_update()
+            .filter(bill_id__in=bill_ids)
+            .order_by("bill_id")
+            .values_list("id", flat=True)
+        )
+
+    @classmethod
+    @transaction.atomic
+    def refresh_for_bills(cls, bill_ids):
+        """Recount the action statuses of the given bills and store the results.
+
+        Summaries are created for bills that do not have one yet.
+
+        Args:
+            bill_ids (Iterable[int]): The ids of the bills.
+
+        Returns:
+            list[BillStatusSummary]: The refreshed summaries.
+        """
+
+        bill_ids = sorted(set(bill_ids))
+
+        if not bill_ids:
+            return []
+
+        status_counts_index = cls.get_status_counts(bill_ids)
+        existing_summaries = {
+            summary.bill_id: summary
+            for summary in cls.objects.select_for_update().filter(bill_id__in=bill_ids)
+        }
+
+        summaries_to_create = []
+        summaries_to_update = []
+
+        for bill_id in bill_ids:
+            summary = existing_summaries.get(bill_id)
+
+            if summary is None:
+                summary = cls(bill_id=bill_id)
+                summaries_to_create.append(summary)
+            else:
+                summaries_to_update.append(summary)
+
+            summary.apply_status_counts(status_counts_index[bill_id])
+            summary.modified = timezone.now()
+
+        cls.objects.bulk_create(summaries_to_create)
+        cls.objects.bulk_update(
+            summaries_to_update,
+            [
+                "status_counts",
+                "most_common_status",
+                "most_common_status_count",
+                "are_all_statuses_same",
+                "modified",
+            ],
+        )
+
+        # The bills' statuses are shown in their members' cached bill lists.
+        invalidate_bill_members_caches(bill_ids)
+
+        return summaries_to_create + summaries_to_update
+
+
+# Columns of the paying and receiving users shown by BillTransactionSerializer.
+TRANSACTION_USER_FIELDS = (
+    "date_joined",
+    "email",
+    "first_name",
+    "last_name",
+    "profile_image_url",
+    "profile_image_hash",
+    "username",
+    "uuid",
+)
+
+
 class BillTransaction(AbstractTimeStampedUUIDModel, models.Model):
     """Stores a transaction particular completed by a user.
 
@@ -535,9 +869,7 @@ class BillTransaction(AbstractTimeStampedUUIDModel, models.Model):
         on_delete=models.CASCADE,
         related_name="transactions",
     )
-    contribution = models.DecimalField(
-        max_digits=19,
-        decimal_places=4,
+    contribution = MoneyField(
         validators=[
             MinValueValidator(settings.MINIMUM_CONTRIBUTION),
         ],
@@ -562,9 +894,7 @@ class BillTransaction(AbstractTimeStampedUUIDModel, models.Model):
         choices=TypeChoices.choices,
         default=TypeChoices.REGULAR,
     )
-    total_payment = models.DecimalField(
-        max_digits=19,
-        decimal_places=4,
+    total_payment = MoneyField(
         help_text="Total amount paid (includes fees)",
     )
     action = models.ForeignKey(
@@ -600,6 +930,73 @@ class BillTransaction(AbstractTimeStampedUUIDModel, models.Model):
             f"payment: {self.total_payment}, bill: ({self.bill.name})"
         )
 
+    @classmethod
+    @transaction.atomic
+    def record_transaction(cls, **fields):
+        """Create a transaction and add it to the running totals of its bill and
+        action.
+
+        Every BillTransaction should be created through this method, so that
+        Bill.total_amount_paid, BillAction.total_amount_paid and their payments_count
+        stay in step with the transactions. See
+        bills.tasks.transactions.reconcile_payment_totals.
+
+        Args:
+            **fields: The fields of the new transaction.
+
+        Returns:
+            BillTransaction: The created transaction.
+        """
+
+        bill_transaction = cls.objects.create(**fields)
+
+        running_totals = {
+            "total_amount_paid": F("total_amount_paid")
+            + Value(bill_transaction.contribution, output_field=MoneyField()),
+            "payments_count": F("payments_count") + 1,
+        }
+        Bill.objects.filter(id=bill_transaction.bill_id).update(**running_totals)
+        BillAction.objects.filter(id=bill_transaction.action_id).update(
+            **running_totals
+        )
+
+        return bill_transaction
+
+    @classmethod
+    def get_transaction_list_rows(cls, transactions, user):
+        """Returns transactions as dicts of exactly the columns shown by
+        BillTransactionSerializer, for BillTransactionProjectionSerializer.
+
+        No model instances are built, and is_credit is computed in SQL.
+
+        Args:
+            transactions (QuerySet): The transactions, e.g. from
+                get_bill_transactions().
+            user: The user making the request.
+
+        Returns:
+            QuerySet: A values queryset of transaction rows.
+        """
+
+        return transactions.values(
+            "id",
+            "contribution",
+            "created",
+            "modified",
+            "total_payment",
+            "transaction_type",
+            "uuid",
+            "bill__name",
+            "bill__uuid",
+            "paying_user_id",
+            "receiving_user_id",
+            *[
+                f"{user_field}__{field_name}"
+                for user_field in ("paying_user", "receiving_user")
+                for field_name in TRANSACTION_USER_FIELDS
+            ],
+        ).annotate(is_credit=is_equal_to("receiving_user_id", user.id))
+
     @classmethod
     def get_bill_transactions_for_user(cls, user):
         """Returns a queryset containing all complete transactions by a user."""
@@ -636,15 +1033,54 @@ class BillTransaction(AbstractTimeStampedUUIDModel, models.Model):
         )
 
     @classmethod
-    def get_daily_transactions(cls, bill_uuid):
-        """Returns a queryset of daily transactions for a specified bill."""
+    def get_transaction_days(cls, transactions):
+        """Returns a queryset of the distinct days (oldest first) on which some
+        transactions were made, e.g. the transactions of a bill.
+
+        Args:
+            transactions (QuerySet): The transactions.
+
+        Returns:
+            QuerySet: A values_list queryset of dates.
+        """
 
         return (
-            cls.get_bill_transactions(bill_uuid)
-            .annotate(day=TruncDate("created", output_field=DateField()))
+            transactions.annotate(day=TruncDate("created", output_field=DateField()))
+            .values_list("day", flat=True)
+            .distinct()
             .order_by("day")
         )
 
+    @classmethod
+    def get_transactions_between_days(cls, transactions, first_day, last_day):
+        """Returns the transactions made from the start of first_day to the end of
+        last_day, oldest first and annotated with their day.
+
+        The days are converted to a range on created (in the current time zone), so
+        the created index can be used.
+
+        Args:
+            transactions (QuerySet): The transactions, e.g. the transactions of a
+                bill.
+            first_day (date): The first day.
+            last_day (date): The last day.
+
+        Returns:
+            QuerySet: The transactions.
+        """
+
+        current_timezone = timezone.get_current_timezone()
+        start = datetime.combine(first_day, time.min, tzinfo=current_timezone)
+        end = datetime.combine(
+            last_day + timedelta(days=1), time.min, tzinfo=current_timezone
+        )
+
+        return (
+            transactions.filter(created__gte=start, created__lt=end)
+            .annotate(day=TruncDate("created", output_field=DateField()))
+            .order_by("created", "id")
+        )
+
     @classmethod
     def get_daily_contributions(cls, bill_uuid):
         """Returns a queryset of daily contributions for a specified bill."""
@@ -695,36 +1131,24 @@ class BillArrear(AbstractTimeStampedUUIDModel, models.Model):
         choices=StatusChoices.choices,
         default=StatusChoices.OVERDUE,
     )
-    contribution = models.DecimalField(
+    contribution = MoneyField(
         help_text="Bill contribution of participant (excludes fees)",
-        max_digits=19,
         null=True,
-        decimal_places=4,
     )
-    paystack_transaction_fee = models.DecimalField(
-        max_digits=19,
-        decimal_places=4,
+    paystack_transaction_fee = MoneyField(
         null=True,
     )
-    paystack_transfer_fee = models.DecimalField(
-        max_digits=19,
-        decimal_places=4,
+    paystack_transfer_fee = MoneyField(
         null=True,
     )
-    halver_fee = models.DecimalField(
-        max_digits=19,
-        decimal_places=4,
+    halver_fee = MoneyField(
         null=True,
     )
-    total_fee = models.DecimalField(
-        max_digits=19,
-        decimal_places=4,
+    total_fee = MoneyField(
         null=True,
     )
-    total_payment_due = models.DecimalField(
+    total_payment_due = MoneyField(
         help_text="Summation of contribution and total fees. Actual amount to be paid",
-        max_digits=19,
-        decimal_places=4,
         null=True,
     )
 
@@ -779,3 +1203,49 @@ class BillArrear(AbstractTimeStampedUUIDModel, models.Model):
             bill__uuid=bill_uuid,
             status__in=unsettled_arrear_statuses,
         )
+
+
+class BillNotificationEvent(models.Model):
+    """Notification outbox entry for activity on a bill that other members should
+    hear about, e.g. a participant's contribution.
+
+    Payment tasks only append rows here. flush_bill_notification_events merges the
+    rows for each recipient, bill and event periodically (e.g. "3 new contributions
+    on Netflix") and sends them in bulk, so busy recurring bills do not send one
+    push per contribution to every member.
+    """
+
+    class EventChoices(models.TextChoices):
+        CONTRIBUTION = "contribution", "Contribution"
+        ARREAR_CONTRIBUTION = "arrear_contribution", "Arrear contribution"
+        SUBSCRIPTION = "subscription", "Subscription"
+
+    bill = models.ForeignKey(
+        Bill,
+        on_delete=models.CASCADE,
+        related_name="notification_events",
+    )
+    recipient = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="bill_notification_events",
+    )
+    event = models.CharField(
+        max_length=50,
+        choices=EventChoices.choices,
+    )
+    actor_name = models.CharField(
+        max_length=300,
+        help_text="Full name of the user whose activity triggered the event",
+    )
+    created = models.DateTimeField(
+        auto_now_add=True,
+        db_index=True,
+    )
+
+    class Meta:
+        verbose_name = "Bill notification event"
+        verbose_name_plural = "Bill notification events"
+
+    def __str__(self) -> str:
+        return f"event: {self.event}, bill: {self.bill_id}, actor: {self.actor_name}"
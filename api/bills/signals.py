@@ -0,0 +1,69 @@
+"""Invalidate users' cached bill lists and summaries when their bill data changes,
+and schedule bills' deadlines.
+
+Action status changes (including bulk updates) are handled where the bill status
+summaries are refreshed, in BillStatusSummary.refresh_for_bills.
+"""
+
+from django.conf import settings
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
+
+from bills.models import Bill, BillArrear, BillTransaction
+from bills.tasks.actions import schedule_bill_deadline
+from bills.utils.cache import (
+    invalidate_bill_members_caches,
+    invalidate_users_bill_members_caches,
+)
+from core.utils.cache import invalidate_user_caches
+
+
+@receiver(post_save, sender=Bill)
+def invalidate_caches_on_bill_change(sender, instance, **kwargs):
+    invalidate_bill_members_caches([instance.id])
+
+
+@receiver(post_save, sender=Bill)
+def schedule_deadline_on_bill_change(
+    sender, instance, created, update_fields, **kwargs
+):
+    # Saves without update_fields (e.g. from the admin) may have changed the deadline.
+    if created or update_fields is None or "deadline" in update_fields:
+        schedule_bill_deadline(instance)
+
+
+@receiver(m2m_changed, sender=Bill.participants.through)
+def invalidate_caches_on_bill_participants_change(
+    sender, instance, action, reverse, pk_set, **kwargs
+):
+    if action not in ("post_add", "post_remove", "pre_clear"):
+        return
+
+    if reverse:
+        # instance is a user whose bills (pk_set) changed.
+        invalidate_user_caches([instance.id])
+        invalidate_bill_members_caches(pk_set or [])
+    else:
+        # instance is a bill whose participants (pk_set) changed.
+        invalidate_user_caches(pk_set or [])
+        invalidate_bill_members_caches([instance.id])
+
+
+@receiver(post_save, sender=settings.AUTH_USER_MODEL)
+def invalidate_caches_on_shared_profile_change(sender, instance, created, **kwargs):
+    # Bill lists show the names and profile images of the bills' participants.
+    # QuerySet.update() bypasses this, so such updates must invalidate explicitly.
+    if not created and instance.has_shared_profile_changed():
+        invalidate_users_bill_members_caches(instance)
+
+
+@receiver(post_save, sender=BillTransaction)
+@receiver(post_delete, sender=BillTransaction)
+def invalidate_caches_on_transaction_change(sender, instance, **kwargs):
+    invalidate_user_caches([instance.paying_user_id, instance.receiving_user_id])
+
+
+@receiver(post_save, sender=BillArrear)
+@receiver(post_delete, sender=BillArrear)
+def invalidate_caches_on_arrear_change(sender, instance, **kwargs):
+    invalidate_bill_members_caches([instance.bill_id])
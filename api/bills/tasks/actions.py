@@ -1,18 +1,144 @@
+from datetime import timedelta
+
 from celery import shared_task
 from celery.utils.log import get_task_logger
+from django.db import transaction
 from django.utils import timezone
 
-from bills.models import BillAction
+from bills.models import Bill, BillAction
 
 logger = get_task_logger(__name__)
 
+# Number of bills whose actions are updated per transaction by the sweep.
+OVERDUE_CATCH_UP_BATCH_SIZE = 500
+
+# Only deadlines this close are given an ETA task. The Redis broker redelivers ETA
+# tasks that are still waiting after its visibility timeout, so a task scheduled
+# weeks ahead would be copied into every worker's memory over and over. This must
+# stay below CELERY_BROKER_TRANSPORT_OPTIONS["visibility_timeout"], and above the
+# interval of schedule_upcoming_bill_deadlines, which schedules later deadlines as
+# they come into range.
+DEADLINE_SCHEDULING_HORIZON = timedelta(minutes=30)
+
+
+def mark_pending_actions_as_overdue(bill_ids):
+    """Mark the pending actions of the given bills as overdue.
+
+    Args:
+        bill_ids (list[int]): Ids of bills whose deadline has passed.
+
+    Returns:
+        int: The number of actions marked as overdue.
+    """
+
+    return BillAction.update_statuses(
+        BillAction.objects.filter(
+            bill_id__in=bill_ids, status=BillAction.StatusChoices.PENDING
+        ),
+        BillAction.StatusChoices.OVERDUE,
+    )
+
+
+def schedule_bill_deadline(bill):
+    """Schedule the pending actions of a bill to be marked as overdue at its
+    deadline, if the deadline is within DEADLINE_SCHEDULING_HORIZON.
+
+    Called whenever a bill is created with a deadline or its deadline changes. Later
+    deadlines are scheduled by schedule_upcoming_bill_deadlines. The task is
+    enqueued once the current transaction commits. Tasks for earlier deadlines of
+    the bill do not need to be revoked, as they only act on the bill's current
+    deadline.
+
+    Args:
+        bill (Bill): The bill.
+    """
+
+    if bill.deadline is None or bill.deadline > (
+        timezone.now() + DEADLINE_SCHEDULING_HORIZON
+    ):
+        return
+
+    bill_id = bill.id
+    deadline = bill.deadline
+
+    transaction.on_commit(
+        lambda: mark_bill_actions_as_overdue.apply_async(args=(bill_id,), eta=deadline)
+    )
+
+
+@shared_task
+def schedule_upcoming_bill_deadlines():
+    """Schedule the deadline tasks of bills whose deadline has come within
+    DEADLINE_SCHEDULING_HORIZON.
+
+    Run periodically, more often than the horizon is long, so each deadline is
+    scheduled before it passes. A deadline may be scheduled by more than one run,
+    which is harmless, as the tasks only act on passed deadlines.
+    """
+
+    now = timezone.now()
+
+    for bill in (
+        Bill.objects.filter(
+            deadline__gte=now, deadline__lte=now + DEADLINE_SCHEDULING_HORIZON
+        )
+        .only("id", "deadline")
+        .iterator(chunk_size=1000)
+    ):
+        schedule_bill_deadline(bill)
+
+
+@shared_task
+def mark_bill_actions_as_overdue(bill_id):
+    """Mark the pending actions of a bill as overdue once its deadline has passed.
+
+    Scheduled (with the deadline as its ETA) by schedule_bill_deadline, and possibly
+    more than once for the same deadline. Does nothing
+    if the bill's deadline has since been removed or moved later, in which case
+    another task has been scheduled for the new deadline.
+
+    Args:
+        bill_id (int): The id of the bill.
+    """
+
+    deadline = Bill.objects.filter(id=bill_id).values_list("deadline", flat=True)
+
+    if not deadline or deadline[0] is None or deadline[0] > timezone.now():
+        return
+
+    mark_pending_actions_as_overdue([bill_id])
+
 
 @shared_task
 def update_overdue_statuses():
-    # Get all actions with pending statuses and deadlines in the past
-    overdue_and_incomplete_actions = BillAction.objects.filter(
-        bill__deadline__lt=timezone.now(), status=BillAction.StatusChoices.PENDING
+    """Mark the pending actions of bills whose deadline has passed as overdue.
+
+    Run periodically, to catch up on deadlines whose mark_bill_actions_as_overdue
+    task was lost, and on actions that became pending after their bill's deadline
+    was handled. The bills are found from their pending actions (using the index on
+    BillAction.status), so only actions still awaiting payment are read however
+    old the deadline, and are updated in batches of primary keys.
+    """
+
+    bill_ids = list(
+        BillAction.objects.filter(
+            status=BillAction.StatusChoices.PENDING,
+            bill__deadline__lt=timezone.now(),
+        )
+        .order_by("bill_id")
+        .values_list("bill_id", flat=True)
+        .distinct()
     )
 
-    # Perform bulk update for all overdue actions
-    overdue_and_incomplete_actions.update(status=BillAction.StatusChoices.OVERDUE)
+    overdue_actions_count = 0
+
+    for start in range(0, len(bill_ids), OVERDUE_CATCH_UP_BATCH_SIZE):
+        overdue_actions_count += mark_pending_actions_as_overdue(
+            bill_ids[start : start + OVERDUE_CATCH_UP_BATCH_SIZE]  # noqa E203
+        )
+
+    if overdue_actions_count:
+        logger.info(
+            f"Caught up on {overdue_actions_count} overdue actions across"
+            f" {len(bill_ids)} bills."
+        )
@@ -1,10 +1,11 @@
 from celery import shared_task
 from celery.utils.log import get_task_logger
 
-from bills.models import BillArrear, BillTransaction
+from accounts.tasks.notifications import send_push_messages_in_background
+from bills.models import BillArrear, BillNotificationEvent, BillTransaction
 from bills.utils.arrears import process_arrear_contribution_transfer
-from core.utils.currency import convert_to_naira
-from core.utils.strings import extract_uuidv4s_from_string
+from bills.utils.notifications import record_bill_notification_events
+from core.utils.currency import convert_kobo_to_naira
 from financials.models import (
     PaystackSubscription,
     PaystackTransaction,
@@ -14,8 +15,8 @@ from financials.models import (
 from financials.utils.transfers import (
     create_paystack_transfer_object,
     extract_paystack_transaction_id_from_transfer_reason,
+    get_transfer_owner,
 )
-from libraries.notifications.base import send_push_messages
 
 logger = get_task_logger(__name__)
 
@@ -98,7 +99,7 @@ def record_bill_arrear(request_data):
         params for params in push_parameters_list if params["token"]
     ]
 
-    send_push_messages(filtered_push_parameters_list)
+    send_push_messages_in_background.delay(filtered_push_parameters_list)
 
 
 @shared_task
@@ -146,12 +147,16 @@ def record_arrear_contribution_transfer_object(request_data, transfer_outcome):
 
     reason = data.get("reason")
 
-    arrear_id = extract_uuidv4s_from_string(reason, position=1)
-    arrear = BillArrear.objects.get(uuid=arrear_id).select_related(
-        "action",
-        "participant",
-        "bill",
-        "bill__creditor",
+    arrear = get_transfer_owner(
+        BillArrear.objects.select_related(
+            "action",
+            "participant",
+            "bill",
+            "bill__creditor",
+        ),
+        data,
+        transfers_lookup="paystack_transfer",
+        legacy_uuid_position=1,
     )
 
     action = arrear.action
@@ -181,6 +186,7 @@ def record_arrear_contribution_transfer_object(request_data, transfer_outcome):
         transfer_type=PaystackTransfer.TransferChoices.ARREAR_SETTLEMENT,
         action=action,
         arrear=arrear,
+        reason=reason,
     )
 
     if (
@@ -222,7 +228,7 @@ def record_arrear_contribution_transfer_object(request_data, transfer_outcome):
             params for params in push_parameters_list if params["token"]
         ]
 
-        send_push_messages(filtered_push_parameters_list)
+        send_push_messages_in_background.delay(filtered_push_parameters_list)
 
 
 # TODO This should be carried out in a transaction. With select_for_updates
@@ -251,12 +257,16 @@ def finalize_arrear_contribution(
     # The final contribution is the amount transferred to the creditor.
     amount = data.get("amount")
 
-    arrear_id = extract_uuidv4s_from_string(reason, position=1)
-    arrear = BillArrear.objects.get(uuid=arrear_id).select_related(
-        "action",
-        "participant",
-        "bill",
-        "bill__creditor",
+    arrear = get_transfer_owner(
+        BillArrear.objects.select_related(
+            "action",
+            "participant",
+            "bill",
+            "bill__creditor",
+        ),
+        data,
+        transfers_lookup="paystack_transfer",
+        legacy_uuid_position=1,
     )
     bill = arrear.bill
     action = arrear.action
@@ -296,7 +306,7 @@ def finalize_arrear_contribution(
 
     bill_transaction_object = {
         "bill": bill,
-        "contribution": convert_to_naira(amount),
+        "contribution": convert_kobo_to_naira(amount),
         "paying_user": paying_user,
         "receiving_user": receiving_user,
         "transaction_type": BillTransaction.TypeChoices.ARREAR,
@@ -307,38 +317,15 @@ def finalize_arrear_contribution(
         "paystack_transfer": paystack_transfer_object,
     }
 
-    BillTransaction.objects.create(**bill_transaction_object)
-
-    # Handle notifications after all other operations
-    participants_push_parameters_list = [
-        {
-            "token": participant.expo_push_token,
-            "title": f"New arrear contribution on {bill.name}",
-            "message": f"{paying_user.full_name} has just made a contribution.",
-            "extra": {
-                "action": "open-bill",
-                "bill_name": bill.name,
-                "bill_id": str(bill.uuid),
-            },
-        }
-        for participant in bill.participants.all()
-        if participant.expo_push_token and participant.uuid != paying_user.uuid
-    ]
+    BillTransaction.record_transaction(**bill_transaction_object)
 
-    receiving_user_push_parameters_list = [
-        {
-            "token": receiving_user.expo_push_token,
-            "title": "New arrear contribution",
-            "message": (
-                f"{paying_user.full_name} has just made a contribution on {bill.name}."
-            ),
-            "extra": {
-                "action": "open-bill",
-                "bill_name": bill.name,
-                "bill_id": str(bill.uuid),
-            },
-        },
-    ]
+    # Handle notifications after all other operations. Other members are notified
+    # through the outbox, which merges busy bills' notifications before sending.
+    record_bill_notification_events(
+        bill,
+        paying_user,
+        BillNotificationEvent.EventChoices.ARREAR_CONTRIBUTION,
+    )
 
     paying_user_push_parameters_list = [
         {
@@ -354,13 +341,7 @@ def finalize_arrear_contribution(
     ]
 
     filtered_push_parameters_list = [
-        params
-        for params in [
-            *participants_push_parameters_list,
-            *receiving_user_push_parameters_list,
-            *paying_user_push_parameters_list,
-        ]
-        if params["token"]
+        params for params in paying_user_push_parameters_list if params["token"]
     ]
 
-    send_push_messages(filtered_push_parameters_list)
+    send_push_messages_in_background.delay(filtered_push_parameters_list)
@@ -0,0 +1,59 @@
+from celery import shared_task
+from celery.utils.log import get_task_logger
+from django.db import transaction
+
+from accounts.tasks.notifications import send_push_messages_in_background
+from bills.models import BillNotificationEvent
+from bills.utils.notifications import format_bill_notification_push_parameters
+
+logger = get_task_logger(__name__)
+
+# Upper bound on the outbox rows handled by one flush.
+FLUSH_BATCH_SIZE = 5000
+
+
+@shared_task
+def flush_bill_notification_events():
+    """Merge queued bill notification events and send them as push messages.
+
+    Run periodically (every BILL_NOTIFICATION_COALESCE_WINDOW seconds). Events for
+    the same recipient, bill and event type are merged into a single push, and all
+    pushes are sent in one bulk task. Flushed events are deleted.
+    """
+
+    with transaction.atomic():
+        events = list(
+            BillNotificationEvent.objects.select_for_update(skip_locked=True)
+            .select_related("bill", "recipient")
+            .order_by("created")[:FLUSH_BATCH_SIZE]
+        )
+
+        if not events:
+            return
+
+        BillNotificationEvent.objects.filter(
+            id__in=[event.id for event in events]
+        ).delete()
+
+    # Group actor names by recipient, bill and event, preserving event order.
+    grouped_events = {}
+
+    for event in events:
+        key = (event.recipient_id, event.bill_id, event.event)
+
+        if key not in grouped_events:
+            grouped_events[key] = (event.recipient, event.bill, [])
+
+        grouped_events[key][2].append(event.actor_name)
+
+    push_parameters_list = [
+        format_bill_notification_push_parameters(recipient, bill, event, actor_names)
+        for (_, _, event), (recipient, bill, actor_names) in grouped_events.items()
+        if recipient.expo_push_token
+    ]
+
+    if push_parameters_list:
+        send_push_messages_in_background.delay(push_parameters_list)
+
+    if len(events) == FLUSH_BATCH_SIZE:
+        flush_bill_notification_events.delay()
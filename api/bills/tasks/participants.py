@@ -0,0 +1,55 @@
+from datetime import timedelta
+
+from celery import shared_task
+from celery.utils.log import get_task_logger
+from django.contrib.auth import get_user_model
+from django.utils import timezone
+
+from bills.utils.participants import transfer_unregistered_participants_data
+
+logger = get_task_logger(__name__)
+
+# How far back the catch-up task looks for new users. Transfers are normally
+# enqueued on registration, so it only needs to cover tasks that were lost.
+REGISTRATION_CATCH_UP_WINDOW = timedelta(hours=2)
+
+
+@shared_task
+def transfer_unregistered_participants_data_in_background(user_phones):
+    """Transfer the data of unregistered participants to the registered users
+    sharing their phone numbers.
+
+    Enqueued when a user registers, and by the data transfer endpoint.
+
+    Args:
+        user_phones (list[list]): (registered user id, phone number) pairs.
+    """
+
+    transferred_count = transfer_unregistered_participants_data(user_phones)
+
+    if transferred_count:
+        logger.info(
+            f"Transferred the data of {transferred_count} unregistered participants."
+        )
+
+
+@shared_task
+def transfer_recently_registered_users_data():
+    """Transfer the data of unregistered participants sharing phone numbers with
+    users who registered within REGISTRATION_CATCH_UP_WINDOW.
+
+    Run periodically, to catch up on transfers whose task was lost. Users whose
+    data was transferred on registration have no unregistered participants left,
+    so they are skipped cheaply.
+    """
+
+    user_phones = (
+        get_user_model()
+        .objects.filter(
+            date_joined__gte=timezone.now() - REGISTRATION_CATCH_UP_WINDOW,
+            phone__isnull=False,
+        )
+        .values_list("id", "phone")
+    )
+
+    transfer_unregistered_participants_data_in_background(list(user_phones))
@@ -0,0 +1,110 @@
+from celery import shared_task
+from celery.utils.log import get_task_logger
+from django.db import transaction
+from django.db.models import Count, Sum
+
+from bills.models import Bill, BillAction, BillTransaction
+
+logger = get_task_logger(__name__)
+
+# Number of bills (or actions) whose totals are compared per query.
+RECONCILIATION_BATCH_SIZE = 1000
+
+
+def get_payment_totals_drift(model, transaction_field, ids):
+    """Compare the stored running payment totals of bills or actions with their
+    transactions.
+
+    Args:
+        model (Model): Bill or BillAction.
+        transaction_field (str): The BillTransaction field pointing to the model,
+            "bill" or "action".
+        ids (list[int]): Ids of the bills or actions to compare.
+
+    Returns:
+        dict: A dictionary mapping the id of each object whose totals have drifted to
+            a (total_amount_paid, payments_count) tuple computed from its
+            transactions.
+    """
+
+    computed_totals = {
+        item[transaction_field]: (item["total_amount_paid"], item["payments_count"])
+        for item in BillTransaction.objects.filter(**{f"{transaction_field}__in": ids})
+        .values(transaction_field)
+        .annotate(
+            total_amount_paid=Sum("contribution"),
+            payments_count=Count("id"),
+        )
+        .order_by()
+    }
+
+    drift = {}
+
+    for pk, total_amount_paid, payments_count in model.objects.filter(
+        id__in=ids
+    ).values_list("id", "total_amount_paid", "payments_count"):
+        expected_totals = computed_totals.get(pk, (0, 0))
+
+        if (total_amount_paid, payments_count) != expected_totals:
+            drift[pk] = expected_totals
+
+    return drift
+
+
+@shared_task
+def reconcile_payment_totals(fix=True):
+    """Recompute the running payment totals of bills and actions from their
+    transactions, and report (and by default correct) any drift.
+
+    Run periodically. The totals are normally kept up to date by
+    BillTransaction.record_transaction.
+
+    Args:
+        fix (bool): Whether totals that have drifted should be corrected.
+
+    Returns:
+        dict: The number of bills and actions whose totals had drifted.
+    """
+
+    drift_counts = {}
+
+    for model, transaction_field in ((Bill, "bill"), (BillAction, "action")):
+        ids = list(model.objects.order_by("id").values_list("id", flat=True))
+        drift_counts[transaction_field] = 0
+
+        for start in range(0, len(ids), RECONCILIATION_BATCH_SIZE):
+            ids_batch = ids[start : start + RECONCILIATION_BATCH_SIZE]  # noqa E203
+
+            with transaction.atomic():
+                # Block new transactions on these objects while they are compared.
+                list(
+                    model.objects.select_for_update()
+                    .filter(id__in=ids_batch)
+                    .values_list("id", flat=True)
+                )
+
+                drift = get_payment_totals_drift(model, transaction_field, ids_batch)
+
+                if not drift:
+                    continue
+
+                drift_counts[transaction_field] += len(drift)
+                logger.warning(
+                    f"Running payment totals of {len(drift)} {model._meta.verbose_name}"
+                    f" objects have drifted: {list(drift)[:20]}"
+                )
+
+                if fix:
+                    model.objects.bulk_update(
+                        [
+                            model(
+                                id=pk,
+                                total_amount_paid=total_amount_paid,
+                                payments_count=payments_count,
+                            )
+                            for pk, (total_amount_paid, payments_count) in drift.items()
+                        ],
+                        ["total_amount_paid", "payments_count"],
+                    )
+
+    return drift_counts
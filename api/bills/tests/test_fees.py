@@ -0,0 +1,121 @@
+import random
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+from django.test import SimpleTestCase, TestCase
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from bills.utils.fees import (
+    calculate_all_transaction_fees,
+    calculate_all_transaction_fees_in_batch,
+)
+
+
+class BatchTransactionFeesTests(SimpleTestCase):
+    # Amounts at and around each threshold of the fee calculation.
+    BOUNDARY_AMOUNTS = (
+        "0.0001",
+        "1",
+        "100",
+        "2499.9999",
+        "2500",
+        "2500.0001",
+        "5000",
+        "5000.0001",
+        "50000",
+        "50000.0001",
+        "126666.6666",
+        "126666.6667",
+        "133333.3333",
+        "133333.3334",
+        "1000000000",
+    )
+
+    def assert_matches_single_calculations(self, amounts) -> None:
+        batch_fees = calculate_all_transaction_fees_in_batch(amounts)
+
+        for index, amount in enumerate(amounts):
+            fees = calculate_all_transaction_fees(amount)
+            fees["total_payment_due"] = amount + fees["total_fee"]
+            # Refunds only apply to single card additions.
+            del fees["card_addition_refund"]
+
+            for name, fee in fees.items():
+                with self.subTest(amount=amount, fee=name):
+                    batch_fee = batch_fees[name][index]
+
+                    # Compare representations as well, e.g. 10.0000 and not 10.
+                    self.assertEqual(batch_fee, fee)
+                    self.assertEqual(str(batch_fee), str(round(fee, 4)))
+
+    def test_boundary_amounts(self) -> None:
+        self.assert_matches_single_calculations(
+            [Decimal(amount) for amount in self.BOUNDARY_AMOUNTS]
+        )
+
+    def test_random_amounts(self) -> None:
+        generator = random.Random(20230601)
+
+        amounts = [
+            Decimal(generator.randint(1, 10**11)).scaleb(-4) for _ in range(5000)
+        ]
+        amounts += [Decimal(generator.randint(1, 10**6)) for _ in range(500)]
+
+        self.assert_matches_single_calculations(amounts)
+
+    def test_empty_batch(self) -> None:
+        batch_fees = calculate_all_transaction_fees_in_batch([])
+
+        self.assertTrue(all(fees == [] for fees in batch_fees.values()))
+
+
+class BillFeeQuoteAPITests(TestCase):
+    def setUp(self) -> None:
+        self.user = get_user_model().objects.create_user(
+            phone="08010191010",
+            email="user@email.com",
+            username="user",
+            password="testpass123",
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+        self.url = reverse("bills:fee-quote")
+
+    def test_quote_matches_bill_action_fees(self) -> None:
+        contributions = ["2500", "4999.9999", "2500"]
+
+        response = self.client.post(
+            self.url, {"contributions": contributions}, format="json"
+        )
+
+        self.assertEqual(response.status_code, 200)
+
+        fees = response.json()["fees"]
+        self.assertEqual(len(fees), len(contributions))
+
+        total_fee = Decimal(0)
+        for contribution, quoted_fees in zip(contributions, fees):
+            expected_fees = calculate_all_transaction_fees(Decimal(contribution))
+            total_fee += expected_fees["total_fee"]
+
+            self.assertEqual(
+                Decimal(quoted_fees["totalFee"]), expected_fees["total_fee"]
+            )
+            self.assertEqual(
+                Decimal(quoted_fees["totalPaymentDue"]),
+                Decimal(contribution) + expected_fees["total_fee"],
+            )
+
+        totals = response.json()["totals"]
+        self.assertEqual(Decimal(totals["contribution"]), Decimal("9999.9999"))
+        self.assertEqual(Decimal(totals["totalFee"]), total_fee)
+
+    def test_invalid_contributions(self) -> None:
+        for contributions in ([], ["-1"], ["abc"]):
+            with self.subTest(contributions=contributions):
+                response = self.client.post(
+                    self.url, {"contributions": contributions}, format="json"
+                )
+
+                self.assertEqual(response.status_code, 400)
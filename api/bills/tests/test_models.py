@@ -1,3 +1,235 @@
-# from django.test import TestCase
+from decimal import Decimal
 
-# Create your tests here.
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.db.models import F, Sum, Value
+from django.test import TestCase
+
+from bills.models import Bill, BillAction
+from bills.utils.bills import create_actions_for_bill
+from core.fields import MoneyField
+from core.utils.cache import get_user_cache_version
+
+User = get_user_model()
+
+
+class BillMembershipQueryTests(TestCase):
+    def setUp(self) -> None:
+        self.user = User.objects.create_user(
+            phone="08010191010",
+            email="user@email.com",
+            username="user",
+            password="testpass123",
+        )
+        self.other_user = User.objects.create_user(
+            phone="08010191011",
+            email="other@email.com",
+            username="other",
+            password="testpass123",
+        )
+
+    def create_bill(self, name, creditor) -> Bill:
+        return Bill.objects.create(
+            name=name,
+            creator=creditor,
+            creditor=creditor,
+            total_amount_due=1000,
+        )
+
+    def test_get_users_bill_ids(self) -> None:
+        participated_bill = self.create_bill("Participated", self.other_user)
+        participated_bill.participants.add(self.user, self.other_user)
+
+        collected_bill = self.create_bill("Collected", self.user)
+        collected_bill.participants.add(self.other_user)
+
+        # The creditor is also a participant, and should not be repeated.
+        shared_bill = self.create_bill("Shared", self.user)
+        shared_bill.participants.add(self.user, self.other_user)
+
+        unrelated_bill = self.create_bill("Unrelated", self.other_user)
+        unrelated_bill.participants.add(self.other_user)
+
+        bill_ids = list(Bill.get_users_bill_ids(self.user))
+
+        self.assertCountEqual(
+            bill_ids, [participated_bill.id, collected_bill.id, shared_bill.id]
+        )
+        self.assertCountEqual(
+            Bill.get_users_bills_with_status_info(self.user).values_list(
+                "id", flat=True
+            ),
+            bill_ids,
+        )
+
+    def test_get_users_bill_ids_branches_use_indexes(self) -> None:
+        plan = Bill.get_users_bill_ids(self.user).explain()
+        branch_tables = ("bills_bill_participants", "bills_bill")
+
+        if connection.vendor == "sqlite":
+            # e.g. "SEARCH bills_bill USING COVERING INDEX bills_bill_creditor_id..."
+            for table in branch_tables:
+                self.assertRegex(plan, rf"SEARCH {table} USING (COVERING )?INDEX")
+            self.assertNotRegex(plan, r"SCAN bills_bill")
+
+        elif connection.vendor == "mysql":
+            # Columns: id, select_type, table, partitions, type, possible_keys, key...
+            rows = [line.split() for line in plan.splitlines()]
+            branch_rows = [
+                row for row in rows if len(row) > 6 and row[2] in branch_tables
+            ]
+
+            self.assertEqual(len(branch_rows), 2)
+            for row in branch_rows:
+                self.assertNotEqual(row[4], "ALL")
+                self.assertNotEqual(row[6], "None")
+
+
+class UserCacheInvalidationTests(TestCase):
+    def setUp(self) -> None:
+        self.creditor = User.objects.create_user(
+            phone="08010191010",
+            email="creditor@email.com",
+            username="creditor",
+            password="testpass123",
+        )
+        self.participant = User.objects.create_user(
+            phone="08010191011",
+            email="participant@email.com",
+            username="participant",
+            password="testpass123",
+        )
+        self.outsider = User.objects.create_user(
+            phone="08010191012",
+            email="outsider@email.com",
+            username="outsider",
+            password="testpass123",
+        )
+
+        self.bill = Bill.objects.create(
+            name="Netflix",
+            creator=self.creditor,
+            creditor=self.creditor,
+            total_amount_due=1000,
+        )
+        self.bill.participants.add(self.participant)
+        create_actions_for_bill(self.bill)
+
+    def get_versions(self) -> list:
+        return [
+            get_user_cache_version(user.id)
+            for user in (self.creditor, self.participant, self.outsider)
+        ]
+
+    def test_action_status_change_invalidates_bill_members(self) -> None:
+        creditor_version, participant_version, outsider_version = self.get_versions()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.bill.actions.get().mark_as_completed()
+
+        new_versions = self.get_versions()
+
+        self.assertNotEqual(new_versions[0], creditor_version)
+        self.assertNotEqual(new_versions[1], participant_version)
+        self.assertEqual(new_versions[2], outsider_version)
+
+    def test_bulk_status_update_invalidates_bill_members(self) -> None:
+        _, participant_version, _ = self.get_versions()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            BillAction.update_statuses(
+                self.bill.actions.all(), BillAction.StatusChoices.CANCELLED
+            )
+
+        self.assertNotEqual(
+            get_user_cache_version(self.participant.id), participant_version
+        )
+
+    def test_shared_profile_change_invalidates_bill_members(self) -> None:
+        creditor_version, _, outsider_version = self.get_versions()
+        participant = User.objects.get(id=self.participant.id)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            participant.expo_push_token = "ExponentPushToken[participant]"
+            participant.save()
+
+        self.assertEqual(get_user_cache_version(self.creditor.id), creditor_version)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            participant.first_name = "Renamed"
+            participant.save()
+
+        new_versions = self.get_versions()
+
+        self.assertNotEqual(new_versions[0], creditor_version)
+        self.assertEqual(new_versions[2], outsider_version)
+
+
+class MoneyFieldTests(TestCase):
+    def setUp(self) -> None:
+        self.creditor = User.objects.create_user(
+            phone="08010191010",
+            email="creditor@email.com",
+            username="creditor",
+            password="testpass123",
+        )
+        self.participants = [
+            User.objects.create_user(
+                phone=f"0801019102{index}",
+                email=f"participant{index}@email.com",
+                username=f"participant{index}",
+                password="testpass123",
+            )
+            for index in range(2)
+        ]
+
+        self.bill = Bill.objects.create(
+            name="Netflix",
+            creator=self.creditor,
+            creditor=self.creditor,
+            total_amount_due=Decimal("2500.5050"),
+        )
+        self.bill.participants.add(*self.participants)
+        create_actions_for_bill(self.bill)
+
+    def test_amounts_are_stored_as_minor_units(self) -> None:
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT total_amount_due FROM bills_bill WHERE id = %s", [self.bill.id]
+            )
+            (stored_amount,) = cursor.fetchone()
+
+        self.bill.refresh_from_db()
+
+        self.assertEqual(stored_amount, 25005050)
+        self.assertEqual(str(self.bill.total_amount_due), "2500.5050")
+        self.assertEqual(self.bill.get_total_amount_due_minor_units(), 25005050)
+
+    def test_bulk_updates_aggregates_and_lookups(self) -> None:
+        actions = list(self.bill.actions.order_by("id"))
+        actions[0].contribution = Decimal("1000.0001")
+        actions[1].contribution = Decimal("1500.5049")
+        BillAction.objects.bulk_update(actions, ["contribution"])
+
+        self.assertEqual(
+            self.bill.actions.aggregate(total=Sum("contribution"))["total"],
+            Decimal("2500.5050"),
+        )
+        self.assertEqual(
+            self.bill.actions.filter(contribution__gt=Decimal("1000")).count(), 2
+        )
+        self.assertEqual(
+            self.bill.actions.filter(contribution=Decimal("1000.0001")).get(),
+            actions[0],
+        )
+
+    def test_increments_with_money_values(self) -> None:
+        for _ in range(2):
+            Bill.objects.filter(id=self.bill.id).update(
+                total_amount_paid=F("total_amount_paid")
+                + Value(Decimal("0.0001"), output_field=MoneyField())
+            )
+
+        self.bill.refresh_from_db()
+
+        self.assertEqual(self.bill.total_amount_paid, Decimal("0.0002"))
@@ -0,0 +1,127 @@
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from django.utils import timezone
+
+from bills.models import Bill, BillAction, BillUnregisteredParticipant
+from bills.utils.bills import create_actions_for_bill
+from bills.utils.participants import transfer_unregistered_participants_data
+
+User = get_user_model()
+
+
+class UnregisteredParticipantDataTransferTests(TestCase):
+    def setUp(self) -> None:
+        self.creditor = User.objects.create_user(
+            phone="+2348010191010",
+            email="creditor@email.com",
+            username="creditor",
+            password="testpass123",
+        )
+
+        self.users = []
+        self.unregistered_participants = []
+
+        for index in range(2):
+            phone = f"+234801019102{index}"
+
+            self.users.append(
+                User.objects.create_user(
+                    phone=phone,
+                    email=f"user{index}@email.com",
+                    username=f"user{index}",
+                    password="testpass123",
+                )
+            )
+            self.unregistered_participants.append(
+                BillUnregisteredParticipant.objects.create(
+                    name=f"Unregistered {index}", phone=phone
+                )
+            )
+
+        self.bills = []
+
+        for name in ("Netflix", "Spotify"):
+            bill = Bill.objects.create(
+                name=name,
+                creator=self.creditor,
+                creditor=self.creditor,
+                total_amount_due=1000,
+            )
+            bill.unregistered_participants.add(*self.unregistered_participants)
+            self.bills.append(bill)
+
+        # The first user already takes part in Spotify, so only Netflix is theirs
+        # to take over.
+        self.bills[1].participants.add(self.users[0])
+
+        for bill in self.bills:
+            create_actions_for_bill(bill)
+
+    def test_data_is_transferred_in_bulk(self) -> None:
+        transferred_count = transfer_unregistered_participants_data(
+            [(user.id, user.phone) for user in self.users]
+        )
+
+        self.assertEqual(transferred_count, 2)
+        self.assertFalse(BillUnregisteredParticipant.objects.exists())
+
+        self.assertEqual(set(self.users[0].bills.all()), {self.bills[0], self.bills[1]})
+        self.assertEqual(set(self.users[1].bills.all()), {self.bills[0], self.bills[1]})
+
+        netflix_action = BillAction.objects.get(
+            bill=self.bills[0], participant=self.users[0]
+        )
+        self.assertEqual(netflix_action.status, BillAction.StatusChoices.PENDING)
+        self.assertIsNone(netflix_action.unregistered_participant)
+
+        self.assertEqual(
+            BillAction.objects.filter(participant=self.users[1]).count(), 2
+        )
+        # The action the first user already had on Spotify is kept, and the
+        # unregistered participant's one is deleted with them.
+        self.assertEqual(
+            BillAction.objects.filter(
+                bill=self.bills[1], participant=self.users[0]
+            ).count(),
+            1,
+        )
+
+    def test_transfer_is_skipped_without_unregistered_participants(self) -> None:
+        self.assertEqual(
+            transfer_unregistered_participants_data(
+                [(self.creditor.id, self.creditor.phone)]
+            ),
+            0,
+        )
+
+    def test_actions_on_bills_past_their_deadline_are_overdue(self) -> None:
+        Bill.objects.filter(id=self.bills[0].id).update(
+            deadline=timezone.now() - timedelta(days=30)
+        )
+
+        transfer_unregistered_participants_data(
+            [(user.id, user.phone) for user in self.users]
+        )
+
+        self.assertEqual(
+            set(
+                BillAction.objects.filter(bill=self.bills[0]).values_list(
+                    "status", flat=True
+                )
+            ),
+            {BillAction.StatusChoices.OVERDUE},
+        )
+        self.assertEqual(
+            BillAction.objects.get(
+                bill=self.bills[1], participant=self.users[1]
+            ).status,
+            BillAction.StatusChoices.PENDING,
+        )
+
+        self.bills[0].refresh_from_db()
+        self.assertEqual(
+            self.bills[0].status_summary.most_common_status,
+            BillAction.StatusChoices.OVERDUE,
+        )
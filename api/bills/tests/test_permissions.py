@@ -0,0 +1,83 @@
+from django.contrib.auth import get_user_model
+from django.test import RequestFactory, TestCase, override_settings
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from bills.models import Bill
+from bills.utils.membership import is_bill_member, is_bill_participant
+
+User = get_user_model()
+
+
+class BillMembershipTests(TestCase):
+    def setUp(self) -> None:
+        self.creditor = User.objects.create_user(
+            phone="08010191010",
+            email="creditor@email.com",
+            username="creditor",
+            password="testpass123",
+        )
+        self.participant = User.objects.create_user(
+            phone="08010191011",
+            email="participant@email.com",
+            username="participant",
+            password="testpass123",
+        )
+        self.outsider = User.objects.create_user(
+            phone="08010191012",
+            email="outsider@email.com",
+            username="outsider",
+            password="testpass123",
+        )
+
+        self.bill = Bill.objects.create(
+            name="Netflix",
+            creator=self.creditor,
+            creditor=self.creditor,
+            total_amount_due=1000,
+        )
+        self.bill.participants.add(self.participant)
+
+    def get_request(self, user):
+        request = RequestFactory().get("/")
+        request.user = user
+
+        return request
+
+    def test_membership_is_memoized_per_request(self) -> None:
+        request = self.get_request(self.participant)
+
+        with self.assertNumQueries(1):
+            self.assertTrue(is_bill_participant(request, self.bill))
+            self.assertTrue(is_bill_member(request, self.bill))
+
+        # The creditor is checked without querying.
+        with self.assertNumQueries(0):
+            self.assertTrue(is_bill_member(self.get_request(self.creditor), self.bill))
+
+    @override_settings(BILL_MEMBERSHIP_CACHE_TIMEOUT=60)
+    def test_cached_membership_is_invalidated_on_participant_changes(self) -> None:
+        with self.captureOnCommitCallbacks(execute=True):
+            self.assertFalse(
+                is_bill_participant(self.get_request(self.outsider), self.bill)
+            )
+
+        with self.assertNumQueries(0):
+            self.assertFalse(
+                is_bill_participant(self.get_request(self.outsider), self.bill)
+            )
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.bill.participants.add(self.outsider)
+
+        self.assertTrue(is_bill_participant(self.get_request(self.outsider), self.bill))
+
+    def test_bill_data_is_only_listed_to_members(self) -> None:
+        client = APIClient()
+        url = reverse("bills:bill-transactions", kwargs={"uuid": self.bill.uuid})
+
+        client.force_authenticate(self.outsider)
+        self.assertEqual(client.get(url).status_code, 403)
+
+        client.force_authenticate(self.participant)
+        self.assertEqual(client.get(url).status_code, 200)
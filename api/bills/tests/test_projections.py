@@ -0,0 +1,181 @@
+import json
+import uuid
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework.test import APIClient, APIRequestFactory
+
+from bills.api.serializers import (
+    BillListProjectionSerializer,
+    BillListSerializer,
+    BillTransactionProjectionSerializer,
+    BillTransactionSerializer,
+)
+from bills.models import Bill, BillTransaction, BillUnregisteredParticipant
+from bills.utils.bills import create_actions_for_bill
+from financials.models import PaystackTransaction, PaystackTransfer
+
+User = get_user_model()
+
+
+class ProjectionSerializerTests(TestCase):
+    def setUp(self) -> None:
+        cache.clear()
+
+        self.user = User.objects.create_user(
+            phone="08010191010",
+            email="user@email.com",
+            username="user",
+            password="testpass123",
+            first_name="Ada",
+            last_name="Obi",
+        )
+        self.other_user = User.objects.create_user(
+            phone="08010191011",
+            email="other@email.com",
+            username="other",
+            password="testpass123",
+            first_name="Chidi",
+            last_name="Eze",
+        )
+
+        self.bills = []
+
+        for index, (creditor, interval) in enumerate(
+            [
+                (self.user, Bill.IntervalChoices.NONE),
+                (self.other_user, Bill.IntervalChoices.MONTHLY),
+                (self.other_user, Bill.IntervalChoices.NONE),
+            ]
+        ):
+            bill = Bill.objects.create(
+                name=f"Bill {index}",
+                creator=creditor,
+                creditor=creditor,
+                total_amount_due=1000,
+                interval=interval,
+            )
+            bill.participants.add(self.user, self.other_user)
+            self.bills.append(bill)
+
+        self.bills[0].unregistered_participants.add(
+            BillUnregisteredParticipant.objects.create(
+                name="Unregistered", phone="+2348010191020"
+            )
+        )
+
+        for bill in self.bills:
+            create_actions_for_bill(bill)
+
+        action = self.bills[1].actions.get(participant=self.user)
+        action.contribution = Decimal("1000")
+        action.save(update_fields=["contribution"])
+
+        self.create_transaction(action, self.user, self.other_user, "1000")
+        self.create_transaction(action, self.user, None, "1000.5")
+
+        self.request = APIRequestFactory().get("/")
+        self.request.user = self.user
+
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def create_transaction(self, action, paying_user, receiving_user, contribution):
+        reference = uuid.uuid4()
+
+        paystack_transaction = PaystackTransaction.objects.create(
+            amount=Decimal(contribution) * 100,
+            amount_in_naira=Decimal(contribution),
+            action=action,
+            paying_user=paying_user,
+            transaction_outcome=PaystackTransaction.TransactionOutcomeChoices.SUCCESSFUL,
+            transaction_type=(
+                PaystackTransaction.TransactionChoices.ONE_TIME_CONTRIBUTION
+            ),
+            paystack_transaction_id=BillTransaction.objects.count() + 1,
+            paystack_transaction_reference=str(reference),
+            complete_paystack_response={},
+        )
+        paystack_transfer = PaystackTransfer.objects.create(
+            amount=Decimal(contribution) * 100,
+            amount_in_naira=Decimal(contribution),
+            paystack_transfer_reference=reference,
+            uuid=reference,
+            action=action,
+            paying_user=paying_user,
+            receiving_user=receiving_user,
+            transfer_outcome=PaystackTransfer.TransferOutcomeChoices.SUCCESSFUL,
+            transfer_type=PaystackTransfer.TransferChoices.CREDITOR_SETTLEMENT,
+            complete_paystack_response={},
+        )
+
+        return BillTransaction.objects.create(
+            bill=action.bill,
+            contribution=Decimal(contribution),
+            total_payment=Decimal(contribution) + 25,
+            paying_user=paying_user,
+            receiving_user=receiving_user,
+            action=action,
+            paystack_transaction=paystack_transaction,
+            paystack_transfer=paystack_transfer,
+        )
+
+    def assertSameJSON(self, data, expected_data) -> None:
+        self.assertEqual(json.dumps(data), json.dumps(expected_data))
+
+    def test_bill_list_projection_matches_bill_list_serializer(self) -> None:
+        expected_data = BillListSerializer(
+            Bill.get_users_bills_with_status_info(self.user).order_by("-created"),
+            many=True,
+            context={"request": self.request},
+        ).data
+
+        with self.assertNumQueries(4):
+            data = BillListProjectionSerializer(
+                Bill.get_users_bill_list_rows(self.user).order_by("-created"),
+                many=True,
+            ).data
+
+        self.assertEqual(len(data), 3)
+        self.assertSameJSON(data, expected_data)
+
+    def test_transaction_projection_matches_transaction_serializer(self) -> None:
+        transactions = BillTransaction.get_bill_transactions_for_user(
+            self.user
+        ).order_by("-created")
+
+        expected_data = BillTransactionSerializer(
+            transactions, many=True, context={"request": self.request}
+        ).data
+
+        with self.assertNumQueries(1):
+            data = BillTransactionProjectionSerializer(
+                BillTransaction.get_transaction_list_rows(transactions, self.user),
+                many=True,
+            ).data
+
+        self.assertEqual(len(data), 2)
+        self.assertSameJSON(data, expected_data)
+
+    def test_list_endpoints_paginate_projected_rows(self) -> None:
+        for url in (
+            reverse("bills:bills-list"),
+            reverse("bills:user-transactions"),
+            reverse("bills:bill-transactions", args=[self.bills[1].uuid]),
+        ):
+            response = self.client.get(url, {"pagination": "cursor", "page_size": 1})
+
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(len(response.json()["results"]), 1)
+
+            first_uuid = response.json()["results"][0]["uuid"]
+            response = self.client.get(
+                url, {"cursor": response.json()["next"], "page_size": 1}
+            )
+
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(len(response.json()["results"]), 1)
+            self.assertNotEqual(response.json()["results"][0]["uuid"], first_uuid)
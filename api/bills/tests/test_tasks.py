@@ -0,0 +1,126 @@
+from datetime import timedelta
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from django.utils import timezone
+
+from bills.models import Bill, BillAction
+from bills.tasks.actions import (
+    DEADLINE_SCHEDULING_HORIZON,
+    mark_bill_actions_as_overdue,
+    schedule_upcoming_bill_deadlines,
+    update_overdue_statuses,
+)
+from bills.utils.bills import create_actions_for_bill
+
+User = get_user_model()
+
+
+class BillDeadlineTests(TestCase):
+    def setUp(self) -> None:
+        self.creditor = User.objects.create_user(
+            phone="08010191010",
+            email="creditor@email.com",
+            username="creditor",
+            password="testpass123",
+        )
+        self.participant = User.objects.create_user(
+            phone="08010191011",
+            email="participant@email.com",
+            username="participant",
+            password="testpass123",
+        )
+
+    def create_bill(self, name) -> Bill:
+        bill = Bill.objects.create(
+            name=name,
+            creator=self.creditor,
+            creditor=self.creditor,
+            total_amount_due=1000,
+        )
+        bill.participants.add(self.participant)
+        create_actions_for_bill(bill)
+
+        return bill
+
+    def set_deadline(self, bill, deadline) -> None:
+        # Bypasses save(), so no deadline task is scheduled.
+        Bill.objects.filter(id=bill.id).update(deadline=deadline)
+
+    def get_status(self, bill) -> str:
+        return bill.actions.get().status
+
+    def test_deadline_changes_schedule_a_task(self) -> None:
+        bill = self.create_bill("Netflix")
+        deadline = timezone.now() + timedelta(minutes=10)
+
+        with mock.patch.object(
+            mark_bill_actions_as_overdue, "apply_async"
+        ) as apply_async:
+            with self.captureOnCommitCallbacks(execute=True):
+                bill.name = "Netflix family"
+                bill.save(update_fields=["name"])
+
+            apply_async.assert_not_called()
+
+            with self.captureOnCommitCallbacks(execute=True):
+                bill.deadline = deadline
+                bill.save(update_fields=["deadline"])
+
+            apply_async.assert_called_once_with(args=(bill.id,), eta=deadline)
+
+    def test_distant_deadlines_are_scheduled_as_they_come_into_range(self) -> None:
+        bill = self.create_bill("Netflix")
+        deadline = timezone.now() + timedelta(days=14)
+
+        with mock.patch.object(
+            mark_bill_actions_as_overdue, "apply_async"
+        ) as apply_async:
+            with self.captureOnCommitCallbacks(execute=True):
+                bill.deadline = deadline
+                bill.save(update_fields=["deadline"])
+                schedule_upcoming_bill_deadlines()
+
+            apply_async.assert_not_called()
+
+            with self.captureOnCommitCallbacks(execute=True):
+                self.set_deadline(
+                    bill, timezone.now() + DEADLINE_SCHEDULING_HORIZON / 2
+                )
+                schedule_upcoming_bill_deadlines()
+
+            self.assertEqual(apply_async.call_count, 1)
+
+    def test_task_only_acts_on_passed_deadlines(self) -> None:
+        bill = self.create_bill("Netflix")
+        other_bill = self.create_bill("Spotify")
+
+        self.set_deadline(bill, timezone.now() + timedelta(hours=1))
+        mark_bill_actions_as_overdue(bill.id)
+
+        self.assertEqual(self.get_status(bill), BillAction.StatusChoices.PENDING)
+
+        self.set_deadline(bill, timezone.now() - timedelta(seconds=1))
+        self.set_deadline(other_bill, timezone.now() - timedelta(seconds=1))
+        mark_bill_actions_as_overdue(bill.id)
+
+        self.assertEqual(self.get_status(bill), BillAction.StatusChoices.OVERDUE)
+        self.assertEqual(self.get_status(other_bill), BillAction.StatusChoices.PENDING)
+
+    def test_catch_up_sweep_covers_every_passed_deadline(self) -> None:
+        recent_bill = self.create_bill("Netflix")
+        old_bill = self.create_bill("Spotify")
+        upcoming_bill = self.create_bill("Prime Video")
+
+        self.set_deadline(recent_bill, timezone.now() - timedelta(hours=1))
+        self.set_deadline(old_bill, timezone.now() - timedelta(days=90))
+        self.set_deadline(upcoming_bill, timezone.now() + timedelta(hours=1))
+
+        update_overdue_statuses()
+
+        self.assertEqual(self.get_status(recent_bill), BillAction.StatusChoices.OVERDUE)
+        self.assertEqual(self.get_status(old_bill), BillAction.StatusChoices.OVERDUE)
+        self.assertEqual(
+            self.get_status(upcoming_bill), BillAction.StatusChoices.PENDING
+        )
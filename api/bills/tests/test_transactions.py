@@ -0,0 +1,123 @@
+import uuid
+from datetime import datetime, timedelta
+from datetime import timezone as dt_timezone
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from bills.models import Bill, BillTransaction
+from bills.utils.bills import create_actions_for_bill
+from financials.models import PaystackTransaction, PaystackTransfer
+
+User = get_user_model()
+
+
+class BillDailyTransactionListTests(TestCase):
+    def setUp(self) -> None:
+        self.creditor = User.objects.create_user(
+            phone="08010191010",
+            email="creditor@email.com",
+            username="creditor",
+            password="testpass123",
+        )
+        self.participant = User.objects.create_user(
+            phone="08010191011",
+            email="participant@email.com",
+            username="participant",
+            password="testpass123",
+        )
+
+        self.bill = Bill.objects.create(
+            name="Netflix",
+            creator=self.creditor,
+            creditor=self.creditor,
+            total_amount_due=1000,
+        )
+        self.bill.participants.add(self.participant)
+        create_actions_for_bill(self.bill)
+
+        self.action = self.bill.actions.get()
+        self.action.contribution = Decimal("1000")
+        self.action.save(update_fields=["contribution"])
+
+        self.client = APIClient()
+        self.client.force_authenticate(self.participant)
+
+    def create_transaction(self, created) -> BillTransaction:
+        reference = uuid.uuid4()
+
+        paystack_transaction = PaystackTransaction.objects.create(
+            amount=100000,
+            amount_in_naira=Decimal("1000"),
+            action=self.action,
+            paying_user=self.participant,
+            transaction_outcome=PaystackTransaction.TransactionOutcomeChoices.SUCCESSFUL,
+            transaction_type=(
+                PaystackTransaction.TransactionChoices.ONE_TIME_CONTRIBUTION
+            ),
+            paystack_transaction_id=BillTransaction.objects.count() + 1,
+            paystack_transaction_reference=str(reference),
+            complete_paystack_response={},
+        )
+        paystack_transfer = PaystackTransfer.objects.create(
+            amount=100000,
+            amount_in_naira=Decimal("1000"),
+            paystack_transfer_reference=reference,
+            uuid=reference,
+            action=self.action,
+            paying_user=self.participant,
+            receiving_user=self.creditor,
+            transfer_outcome=PaystackTransfer.TransferOutcomeChoices.SUCCESSFUL,
+            transfer_type=PaystackTransfer.TransferChoices.CREDITOR_SETTLEMENT,
+            complete_paystack_response={},
+        )
+
+        transaction = BillTransaction.objects.create(
+            bill=self.bill,
+            contribution=Decimal("1000"),
+            total_payment=Decimal("1025"),
+            paying_user=self.participant,
+            receiving_user=self.creditor,
+            action=self.action,
+            paystack_transaction=paystack_transaction,
+            paystack_transfer=paystack_transfer,
+        )
+        BillTransaction.objects.filter(id=transaction.id).update(created=created)
+
+        return transaction
+
+    def test_days_are_never_split_across_pages(self) -> None:
+        first_day = datetime(2023, 5, 1, 9, tzinfo=dt_timezone.utc)
+
+        # Three transactions on the first day, more than a page of two would hold
+        # if transactions rather than days were paginated.
+        for day, transaction_count in enumerate((3, 2, 1)):
+            for hour in range(transaction_count):
+                self.create_transaction(first_day + timedelta(days=day, hours=hour))
+
+        url = reverse("bills:bill-grouped-transactions", args=[self.bill.uuid])
+
+        response = self.client.get(url, {"page_size": 2})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["count"], 3)
+        self.assertEqual(
+            [
+                (group["day"], len(group["transactions"]))
+                for group in response.json()["results"]
+            ],
+            [("2023-05-01", 3), ("2023-05-02", 2)],
+        )
+
+        response = self.client.get(url, {"page_size": 2, "page": 2})
+
+        self.assertEqual(
+            [
+                (group["day"], len(group["transactions"]))
+                for group in response.json()["results"]
+            ],
+            [("2023-05-03", 1)],
+        )
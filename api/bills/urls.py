@@ -9,6 +9,7 @@ from bills.api.views import (
     BillCancellationAPIView,
     BillDailyContributionListAPIView,
     BillDailyTransactionListAPIView,
+    BillFeeQuoteAPIView,
     BillListCreateAPIView,
     BillRetrieveUpdateAPIView,
     BillSubscriptionCancellationAPIView,
@@ -37,6 +38,11 @@ urlpatterns = [
         view=BillCancellationAPIView.as_view(),
         name="bill-cancel",
     ),
+    path(
+        route="fees/quote/",
+        view=BillFeeQuoteAPIView.as_view(),
+        name="fee-quote",
+    ),
     path(
         route="user-transactions/",
         view=UserBillTransactionListAPIView.as_view(),
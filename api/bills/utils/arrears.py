@@ -1,13 +1,20 @@
 import json
 import uuid
 
+import requests
 from celery.utils.log import get_task_logger
 
-from bills.models import BillArrear
-from core.utils.currency import convert_to_kobo_integer
+from accounts.tasks.notifications import send_push_messages_in_background
+from bills.models import Bill, BillArrear
+from core.utils.currency import convert_minor_units_to_kobo
 from financials.models import PaystackTransaction, PaystackTransfer
 from financials.utils.contributions import create_contribution_transaction_object
-from libraries.notifications.base import send_push_messages
+from financials.utils.transfers import (
+    describe_transfer_initiation_error,
+    format_contribution_transfer_error_push_parameters,
+    queue_paystack_transfer,
+    record_pending_paystack_transfer,
+)
 from libraries.paystack.transaction_requests import TransactionRequests
 from libraries.paystack.transfer_requests import TransferRequests
 
@@ -31,8 +38,9 @@ def handle_arrear_contribution(arrear):
     bill = arrear.bill
     bill_name = bill.name
 
-    amount = arrear.total_payment_due
-    amount_in_kobo = convert_to_kobo_integer(amount)
+    amount_in_kobo = convert_minor_units_to_kobo(
+        arrear.get_total_payment_due_minor_units()
+    )
 
     creditor = bill.creditor
     creditor_uuid_string = creditor.uuid.__str__()
@@ -101,7 +109,9 @@ def process_arrear_contribution_transfer(arrear_id, request_data):
     ).get(uuid=arrear_id)
 
     contribution_amount = arrear.contribution
-    contribution_amount_in_kobo = convert_to_kobo_integer(contribution_amount)
+    contribution_amount_in_kobo = convert_minor_units_to_kobo(
+        arrear.get_contribution_minor_units()
+    )
 
     participant = arrear.participant
     participant_name = participant.full_name
@@ -157,40 +167,22 @@ def process_arrear_contribution_transfer(arrear_id, request_data):
         "reason": transfer_reason,
     }
 
-    error_push_parameters_list = [
-        {
-            "token": participant.expo_push_token,
-            "title": "Contribution transfer error",
-            "message": (
-                "We could not successfully transfer your contribution on"
-                f" {bill.name}. You can retry the transfer in the Halver app for"
-                " free."
-            ),
-            "extra": {
-                "action": "failed-or-reversed-transfer",
-                "bill_name": bill.name,
-                "bill_id": str(bill.uuid),
-            },
-        },
-        {
-            "token": creditor.expo_push_token,
-            "title": "Contribution transfer error",
-            "message": (
-                f"We could not successfully transfer {participant.full_name}'s"
-                f" contribution on {bill.name}. You can retry the transfer in the"
-                " Halver app for free."
-            ),
-            "extra": {
-                "action": "failed-or-reversed-transfer",
-                "bill_name": bill.name,
-                "bill_id": str(bill.uuid),
-            },
-        },
-    ]
+    filtered_error_push_parameters_list = (
+        format_contribution_transfer_error_push_parameters(participant, creditor, bill)
+    )
 
-    filtered_error_push_parameters_list = [
-        params for params in error_push_parameters_list if params["token"]
-    ]
+    if bill.settlement_mode == Bill.SettlementChoices.BATCHED:
+        # Initiated in bulk with other queued transfers by flush_settlement_transfers.
+        queue_paystack_transfer(
+            transfer_reference, failed_paystack_transfer_object_defaults, request_data
+        )
+
+        return
+
+    # Recorded before initiating so the transfer's webhooks can be routed by reference.
+    record_pending_paystack_transfer(
+        transfer_reference, failed_paystack_transfer_object_defaults, request_data
+    )
 
     try:
         # The custom reference passed here would help with idempotence.
@@ -220,13 +212,15 @@ def process_arrear_contribution_transfer(arrear_id, request_data):
                 },
             )
 
-            send_push_messages(filtered_error_push_parameters_list)
+            send_push_messages_in_background.delay(filtered_error_push_parameters_list)
 
             paystack_error = response["message"]
             logger.error(f"Error intiating Paystack transfer: {paystack_error}")
 
-    # Handle cases when Paystack response is malformed.
-    except json.decoder.JSONDecodeError as json_error:
+    # Handle cases when Paystack response is malformed, or Paystack could not be
+    # reached. The transfer is marked failed, so it can be retried with its
+    # reference, which Paystack rejects if the transfer was initiated after all.
+    except (json.decoder.JSONDecodeError, requests.RequestException) as error:
         arrear.mark_as_failed_transfer()
 
         PaystackTransfer.objects.update_or_create(
@@ -234,11 +228,11 @@ def process_arrear_contribution_transfer(arrear_id, request_data):
             defaults={
                 **failed_paystack_transfer_object_defaults,
                 "complete_paystack_response": {
-                    "detail": "Transfer failed due to malformed data from paystack",
-                    "error": json_error,
+                    "detail": describe_transfer_initiation_error(error),
+                    "error": repr(error),
                     "request_data": request_data,
                 },
             },
         )
 
-        send_push_messages(filtered_error_push_parameters_list)
+        send_push_messages_in_background.delay(filtered_error_push_parameters_list)
@@ -5,7 +5,7 @@ from django.db import transaction
 from rest_framework import serializers
 
 from accounts.tasks.notifications import send_push_messages_in_background
-from bills.utils.fees import calculate_all_transaction_fees
+from bills.utils.fees import calculate_all_transaction_fees_in_batch
 from core.utils.currency import add_commas_to_amount
 from core.utils.users import get_user_by_id_drf, get_users_by_ids_drf
 
@@ -226,7 +226,7 @@ def create_actions_for_bill(bill) -> None:
     Used in the create_bill method.
     """
 
-    from bills.models import Bill, BillAction
+    from bills.models import Bill, BillAction, BillStatusSummary
 
     bill = Bill.objects.prefetch_related(
         "participants", "unregistered_participants"
@@ -247,6 +247,7 @@ def create_actions_for_bill(bill) -> None:
     ]
 
     BillAction.objects.bulk_create(actions + actions_for_unregistered_participants)
+    BillStatusSummary.refresh_for_bills([bill.id])
 
 
 def format_participants_contribution_index(
@@ -330,7 +331,7 @@ def add_participant_contributions_and_fees_to_bill_actions(
     # multiple (N+1) queries in loop below
     actions = actions.select_related("participant", "unregistered_participant")
 
-    actions_to_update = []
+    contributions = []
     for action in actions:
         if action.participant:
             contribution = formatted_participants_contribution_index[
@@ -341,25 +342,39 @@ def add_participant_contributions_and_fees_to_bill_actions(
                 action.unregistered_participant.phone
             ]
 
-        all_transaction_fees = calculate_all_transaction_fees(contribution)
+        contributions.append(contribution)
 
-        total_fee = all_transaction_fees["total_fee"]
+    # Calculate the fees of all actions at once.
+    fees = calculate_all_transaction_fees_in_batch(contributions)
 
-        total_payment_due = contribution + total_fee
-
-        actions_to_update.append(
-            BillAction(
-                id=action.id,
-                contribution=contribution,
-                paystack_transaction_fee=all_transaction_fees[
-                    "paystack_transaction_fee"
-                ],
-                paystack_transfer_fee=all_transaction_fees["paystack_transfer_fee"],
-                halver_fee=all_transaction_fees["halver_fee"],
-                total_fee=total_fee,
-                total_payment_due=total_payment_due,
-            )
+    actions_to_update = [
+        BillAction(
+            id=action.id,
+            contribution=contribution,
+            paystack_transaction_fee=paystack_transaction_fee,
+            paystack_transfer_fee=paystack_transfer_fee,
+            halver_fee=halver_fee,
+            total_fee=total_fee,
+            total_payment_due=total_payment_due,
         )
+        for (
+            action,
+            contribution,
+            paystack_transaction_fee,
+            paystack_transfer_fee,
+            halver_fee,
+            total_fee,
+            total_payment_due,
+        ) in zip(
+            actions,
+            contributions,
+            fees["paystack_transaction_fee"],
+            fees["paystack_transfer_fee"],
+            fees["halver_fee"],
+            fees["total_fee"],
+            fees["total_payment_due"],
+        )
+    ]
 
     # Perform bulk update outside loop for efficiency.
     BillAction.objects.bulk_update(
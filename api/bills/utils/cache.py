@@ -0,0 +1,45 @@
+from core.utils.cache import invalidate_user_caches
+
+
+def get_bill_member_ids(bill_ids) -> set:
+    """Return the ids of the participants and creditors of the given bills.
+
+    Args:
+        bill_ids (Iterable[int]): The ids of the bills.
+
+    Returns:
+        set: The ids of the bills' members.
+    """
+
+    from bills.models import Bill
+
+    bill_ids = list(bill_ids)
+
+    participant_ids = Bill.participants.through.objects.filter(
+        bill_id__in=bill_ids
+    ).values_list("customuser_id", flat=True)
+    creditor_ids = Bill.objects.filter(id__in=bill_ids).values_list(
+        "creditor_id", flat=True
+    )
+
+    return set(participant_ids.union(creditor_ids))
+
+
+def invalidate_bill_members_caches(bill_ids) -> None:
+    """Invalidate the cached bill lists and summaries of every member of the given
+    bills, e.g. after a change to one of the bills' statuses."""
+
+    bill_ids = list(bill_ids)
+
+    if bill_ids:
+        invalidate_user_caches(get_bill_member_ids(bill_ids))
+
+
+def invalidate_users_bill_members_caches(user) -> None:
+    """Invalidate the cached bill lists and summaries of every member of the user's
+    bills, e.g. after the user changes their name or profile image, which the
+    members' bill lists show."""
+
+    from bills.models import Bill
+
+    invalidate_bill_members_caches(Bill.get_users_bill_ids(user))
@@ -1,14 +1,32 @@
 from decimal import Decimal
-from typing import TypedDict, Union
+from functools import lru_cache
+from typing import Iterable, NamedTuple, TypedDict, Union
 
-from core.utils.decimals import round_decimal
+from core.utils.currency import (
+    MINOR_UNITS_PER_NAIRA,
+    convert_from_minor_units,
+    convert_to_minor_units,
+)
+from core.utils.decimals import divide_and_round_half_even, round_decimal
+
+PAYSTACK_DECIMAL_FEE = Decimal("0.015")
+PAYSTACK_FLAT_FEE = 100
+PAYSTACK_FEE_CAP = 2000
+PAYSTACK_FLAT_FEE_WAIVER_BARRIER = 2500
+# (maximum transfer amount, transfer fee) pairs, and the fee for larger transfers.
+PAYSTACK_TRANSFER_FEE_TIERS = ((5000, 10), (50000, 25))
+PAYSTACK_MAXIMUM_TRANSFER_FEE = 50
+
+# Number of distinct amounts whose fees are kept in memory. Bills are often split
+# evenly and fee quotes are requested for the same few amounts repeatedly.
+FEE_CACHE_SIZE = 4096
 
 
 def calculate_paystack_transaction_fee(
     price: Union[int, Decimal],
-    decimal_fee=Decimal("0.015"),
-    flat_fee=100,
-    fee_cap=2000,
+    decimal_fee=PAYSTACK_DECIMAL_FEE,
+    flat_fee=PAYSTACK_FLAT_FEE,
+    fee_cap=PAYSTACK_FEE_CAP,
 ) -> Decimal:
     """Calculate the final amount for Paystack's transaction fee based on the
     given price, decimal fee, flat fee, and fee cap.
@@ -28,9 +46,7 @@ def calculate_paystack_transaction_fee(
         and the original price.
     """
 
-    FLAT_FEE_WAIVER_BARRIER = 2500
-
-    if price >= FLAT_FEE_WAIVER_BARRIER:
+    if price >= PAYSTACK_FLAT_FEE_WAIVER_BARRIER:
         applicable_fees = (decimal_fee * price) + flat_fee
 
         if applicable_fees > fee_cap:
@@ -62,14 +78,12 @@ def calculate_paystack_transfer_fee(transfer_amount: Union[int, Decimal]) -> Dec
     Returns:
         Decimal: The transfer fee.
     """
-    if transfer_amount <= 5000:
-        transfer_fee = 10
-    elif transfer_amount <= 50000:
-        transfer_fee = 25
-    else:
-        transfer_fee = 50
 
-    return Decimal(transfer_fee)
+    for maximum_transfer_amount, transfer_fee in PAYSTACK_TRANSFER_FEE_TIERS:
+        if transfer_amount <= maximum_transfer_amount:
+            return Decimal(transfer_fee)
+
+    return Decimal(PAYSTACK_MAXIMUM_TRANSFER_FEE)
 
 
 class AllTransactionFees(TypedDict):
@@ -111,3 +125,220 @@ def calculate_all_transaction_fees(amount: Union[int, Decimal]):
     }
 
     return all_transaction_fees
+
+
+class BatchTransactionFees(TypedDict):
+    paystack_transaction_fee: list[Decimal]
+    paystack_transfer_fee: list[Decimal]
+    halver_fee: list[Decimal]
+    total_fee: list[Decimal]
+    total_payment_due: list[Decimal]
+
+
+class FeeSchedule(NamedTuple):
+    """Paystack's fee schedule in minor units of 0.0001, precomputed for the batch fee
+    calculations.
+
+    With the decimal fee written as a fraction (rate_numerator / rate_denominator),
+    every unrounded fee is a numerator over the same denominator.
+    """
+
+    rate_numerator: int
+    rate_denominator: int
+    denominator: int
+    flat_fee: int
+    fee_cap: int
+    flat_fee_waiver_barrier: int
+    # Largest prices whose transaction fee is not capped, with and without the flat
+    # fee (prices below the waiver barrier are not charged the flat fee).
+    maximum_uncapped_price_with_flat_fee: int
+    maximum_uncapped_price: int
+    # The 0.01 added to the final amount.
+    extra_fee: int
+    transfer_fee_tiers: tuple[tuple[int, int], ...]
+    maximum_transfer_fee: int
+
+
+def build_fee_schedule() -> FeeSchedule:
+    """Convert Paystack's fees and thresholds to units of 0.0001."""
+
+    rate_numerator, rate_denominator = PAYSTACK_DECIMAL_FEE.as_integer_ratio()
+    flat_fee = PAYSTACK_FLAT_FEE * MINOR_UNITS_PER_NAIRA
+    fee_cap = PAYSTACK_FEE_CAP * MINOR_UNITS_PER_NAIRA
+
+    return FeeSchedule(
+        rate_numerator=rate_numerator,
+        rate_denominator=rate_denominator,
+        denominator=rate_denominator - rate_numerator,
+        flat_fee=flat_fee,
+        fee_cap=fee_cap,
+        flat_fee_waiver_barrier=PAYSTACK_FLAT_FEE_WAIVER_BARRIER
+        * MINOR_UNITS_PER_NAIRA,
+        # The fee is capped when decimal fee * price + flat fee > fee cap.
+        maximum_uncapped_price_with_flat_fee=(
+            (fee_cap - flat_fee) * rate_denominator // rate_numerator
+        ),
+        maximum_uncapped_price=fee_cap * rate_denominator // rate_numerator,
+        extra_fee=MINOR_UNITS_PER_NAIRA // 100,
+        transfer_fee_tiers=tuple(
+            (
+                maximum_transfer_amount * MINOR_UNITS_PER_NAIRA,
+                fee * MINOR_UNITS_PER_NAIRA,
+            )
+            for maximum_transfer_amount, fee in PAYSTACK_TRANSFER_FEE_TIERS
+        ),
+        maximum_transfer_fee=PAYSTACK_MAXIMUM_TRANSFER_FEE * MINOR_UNITS_PER_NAIRA,
+    )
+
+
+FEE_SCHEDULE = build_fee_schedule()
+
+
+@lru_cache(maxsize=FEE_CACHE_SIZE)
+def calculate_all_transaction_fees_in_minor_units(
+    price: int,
+) -> tuple[Decimal, Decimal, Decimal, Decimal, Decimal]:
+    """Calculate the fees (and total payment due) of a price in minor units of 0.0001.
+
+    Paystack's uncapped transaction fee,
+    (price + flat fee) / (1 - decimal fee) + 0.01 - price, is an exact fraction of
+    integers in minor units of 0.0001, and so are the other fees. Each fee is rounded
+    (half to even) from its exact value, as calculate_all_transaction_fees rounds
+    each fee from its unrounded value.
+
+    Parameters:
+        price (int): The transaction amount in minor units of 0.0001.
+
+    Returns:
+        tuple[Decimal, ...]: The Paystack transaction fee, Paystack transfer fee,
+        Halver fee, total fee and total payment due.
+    """
+
+    schedule = FEE_SCHEDULE
+    denominator = schedule.denominator
+
+    if price >= schedule.flat_fee_waiver_barrier:
+        applicable_flat_fee = schedule.flat_fee
+        maximum_uncapped_price = schedule.maximum_uncapped_price_with_flat_fee
+    else:
+        applicable_flat_fee = 0
+        maximum_uncapped_price = schedule.maximum_uncapped_price
+
+    if price > maximum_uncapped_price:
+        transaction_fee_numerator = schedule.fee_cap * denominator
+    else:
+        transaction_fee_numerator = (
+            price + applicable_flat_fee
+        ) * schedule.rate_denominator + (schedule.extra_fee - price) * denominator
+
+    transfer_fee = schedule.maximum_transfer_fee
+    for maximum_transfer_amount, tier_transfer_fee in schedule.transfer_fee_tiers:
+        if price <= maximum_transfer_amount:
+            transfer_fee = tier_transfer_fee
+            break
+
+    total_paystack_fee_numerator = (
+        transaction_fee_numerator + transfer_fee * denominator
+    )
+    total_fee = divide_and_round_half_even(
+        2 * total_paystack_fee_numerator, denominator
+    )
+
+    return (
+        convert_from_minor_units(
+            divide_and_round_half_even(transaction_fee_numerator, denominator)
+        ),
+        convert_from_minor_units(transfer_fee),
+        convert_from_minor_units(
+            divide_and_round_half_even(total_paystack_fee_numerator, denominator)
+        ),
+        convert_from_minor_units(total_fee),
+        convert_from_minor_units(price + total_fee),
+    )
+
+
+def calculate_all_transaction_fees_in_batch(
+    amounts: Iterable[Union[int, Decimal]],
+) -> BatchTransactionFees:
+    """Calculate the fees (and total payment due) of many transaction amounts at
+    once, e.g. the contributions of all of a bill's actions.
+
+    Gives the same results as calling calculate_all_transaction_fees on each amount
+    and adding its total fee to it, without Decimal arithmetic (see
+    calculate_all_transaction_fees_in_minor_units). The fees of recently seen amounts
+    are reused from memory.
+
+    Parameters:
+        amounts (Iterable[int | Decimal]): The original transaction amounts.
+
+    Returns:
+        dict[str, list[Decimal]]: Lists of each fee and of the total payments due,
+        in the order of the amounts.
+    """
+
+    fees: BatchTransactionFees = {
+        "paystack_transaction_fee": [],
+        "paystack_transfer_fee": [],
+        "halver_fee": [],
+        "total_fee": [],
+        "total_payment_due": [],
+    }
+
+    for price in map(convert_to_minor_units, amounts):
+        price_fees = calculate_all_transaction_fees_in_minor_units(price)
+
+        fees["paystack_transaction_fee"].append(price_fees[0])
+        fees["paystack_transfer_fee"].append(price_fees[1])
+        fees["halver_fee"].append(price_fees[2])
+        fees["total_fee"].append(price_fees[3])
+        fees["total_payment_due"].append(price_fees[4])
+
+    return fees
+
+
+def quote_transaction_fees(contributions: list[Decimal]) -> dict:
+    """Price a list of contributions, e.g. while a bill's split is being edited.
+
+    Parameters:
+        contributions (list[Decimal]): The contributions to price.
+
+    Returns:
+        dict: The fees of each contribution (in order) under "fees", and the sums
+        of the contributions, total fees and total payments due under "totals".
+    """
+
+    batch_fees = calculate_all_transaction_fees_in_batch(contributions)
+
+    fees = [
+        {
+            "contribution": contribution,
+            "paystack_transaction_fee": paystack_transaction_fee,
+            "paystack_transfer_fee": paystack_transfer_fee,
+            "halver_fee": halver_fee,
+            "total_fee": total_fee,
+            "total_payment_due": total_payment_due,
+        }
+        for (
+            contribution,
+            paystack_transaction_fee,
+            paystack_transfer_fee,
+            halver_fee,
+            total_fee,
+            total_payment_due,
+        ) in zip(
+            contributions,
+            batch_fees["paystack_transaction_fee"],
+            batch_fees["paystack_transfer_fee"],
+            batch_fees["halver_fee"],
+            batch_fees["total_fee"],
+            batch_fees["total_payment_due"],
+        )
+    ]
+
+    totals = {
+        "contribution": sum(contributions, Decimal(0)),
+        "total_fee": sum(batch_fees["total_fee"], Decimal(0)),
+        "total_payment_due": sum(batch_fees["total_payment_due"], Decimal(0)),
+    }
+
+    return {"fees": fees, "totals": totals}
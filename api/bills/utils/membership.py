@@ -0,0 +1,123 @@
+from django.conf import settings
+from django.core.cache import cache
+
+from bills.models import Bill
+from core.utils.cache import get_user_cache_key
+
+# Memoized results are stored on the request under this attribute, keyed by the
+# kind of check and the bill's id or UUID.
+REQUEST_MEMO_ATTRIBUTE = "_bill_memberships"
+
+
+def get_request_memo(request) -> dict:
+    memo = getattr(request, REQUEST_MEMO_ATTRIBUTE, None)
+
+    if memo is None:
+        memo = {}
+        setattr(request, REQUEST_MEMO_ATTRIBUTE, memo)
+
+    return memo
+
+
+def check_bill_participation(user_id, bill_id) -> bool:
+    """Check if a user is a participant of a bill, with an EXISTS query on the
+    unique (bill, user) index of the participants table, so no participants are
+    loaded.
+
+    The result is cached for BILL_MEMBERSHIP_CACHE_TIMEOUT seconds, if set, under
+    the user's cache version, which changes whenever the bill's participants do.
+
+    Args:
+        user_id (int): The id of the user.
+        bill_id (int): The id of the bill.
+
+    Returns:
+        bool: Whether the user is a participant of the bill.
+    """
+
+    def query_participation():
+        return Bill.participants.through.objects.filter(
+            bill_id=bill_id, customuser_id=user_id
+        ).exists()
+
+    if not settings.BILL_MEMBERSHIP_CACHE_TIMEOUT:
+        return query_participation()
+
+    cache_key = get_user_cache_key(user_id, f"bill-participation:{bill_id}")
+    is_participant = cache.get(cache_key)
+
+    if is_participant is None:
+        is_participant = query_participation()
+        cache.set(
+            cache_key,
+            is_participant,
+            timeout=settings.BILL_MEMBERSHIP_CACHE_TIMEOUT,
+        )
+
+    return is_participant
+
+
+def is_bill_participant(request, bill) -> bool:
+    """Check if the user making a request is a participant of a bill. Memoized per
+    request.
+
+    Args:
+        request (Request): The request.
+        bill (Bill): The bill.
+
+    Returns:
+        bool: Whether the user is a participant of the bill.
+    """
+
+    memo = get_request_memo(request)
+    memo_key = ("participant", bill.id)
+
+    if memo_key not in memo:
+        memo[memo_key] = check_bill_participation(request.user.id, bill.id)
+
+    return memo[memo_key]
+
+
+def is_bill_creditor(request, bill) -> bool:
+    """Check if the user making a request is the creditor of a bill, without
+    loading the creditor."""
+
+    return bill.creditor_id == request.user.id
+
+
+def is_bill_creator(request, bill) -> bool:
+    """Check if the user making a request is the creator of a bill, without
+    loading the creator."""
+
+    return bill.creator_id == request.user.id
+
+
+def is_bill_member(request, bill) -> bool:
+    """Check if the user making a request is the creditor or a participant of a
+    bill."""
+
+    return is_bill_creditor(request, bill) or is_bill_participant(request, bill)
+
+
+def is_bill_member_by_uuid(request, bill_uuid) -> bool:
+    """Check if the user making a request is the creditor or a participant of the
+    bill with the given UUID, e.g. in views that list a bill's transactions without
+    loading the bill. Memoized per request.
+
+    Args:
+        request (Request): The request.
+        bill_uuid (UUID | str): The UUID of the bill.
+
+    Returns:
+        bool: Whether the user is a member of the bill. False if there is no such
+            bill.
+    """
+
+    memo = get_request_memo(request)
+    memo_key = ("member", str(bill_uuid))
+
+    if memo_key not in memo:
+        bill = Bill.objects.filter(uuid=bill_uuid).only("id", "creditor_id").first()
+        memo[memo_key] = bill is not None and is_bill_member(request, bill)
+
+    return memo[memo_key]
@@ -0,0 +1,105 @@
+from bills.models import BillNotificationEvent
+
+EventChoices = BillNotificationEvent.EventChoices
+
+# (title, message) templates for a single event, and for several coalesced events
+# of the same kind on the same bill.
+SINGLE_EVENT_TEMPLATES = {
+    EventChoices.CONTRIBUTION: (
+        "New contribution",
+        "{actor_name} has just made a contribution on {bill_name}.",
+    ),
+    EventChoices.ARREAR_CONTRIBUTION: (
+        "New arrear contribution on {bill_name}",
+        "{actor_name} has just made a contribution.",
+    ),
+    EventChoices.SUBSCRIPTION: (
+        "New subscription on {bill_name}",
+        "{actor_name} has just subscribed to {bill_name}.",
+    ),
+}
+COALESCED_EVENT_TEMPLATES = {
+    EventChoices.CONTRIBUTION: (
+        "New contributions",
+        "{count} new contributions on {bill_name}.",
+    ),
+    EventChoices.ARREAR_CONTRIBUTION: (
+        "New arrear contributions on {bill_name}",
+        "{count} new arrear contributions on {bill_name}.",
+    ),
+    EventChoices.SUBSCRIPTION: (
+        "New subscriptions on {bill_name}",
+        "{count} new subscriptions to {bill_name}.",
+    ),
+}
+
+
+def record_bill_notification_events(bill, actor, event):
+    """Queue a notification about a user's activity for the other members of a bill.
+
+    The bill's participants (and creditor) are each sent a notification when the
+    outbox is next flushed. The bill's participants should have been prefetched.
+
+    Args:
+        bill (Bill): The bill the activity happened on.
+        actor (CustomUser): The user whose activity should be announced. They are
+            not notified.
+        event (str): A BillNotificationEvent.EventChoices value.
+
+    Returns:
+        None
+    """
+
+    recipients = {
+        participant.id: participant for participant in bill.participants.all()
+    }
+    recipients[bill.creditor.id] = bill.creditor
+
+    BillNotificationEvent.objects.bulk_create(
+        [
+            BillNotificationEvent(
+                bill=bill,
+                recipient=recipient,
+                event=event,
+                actor_name=actor.full_name,
+            )
+            for recipient in recipients.values()
+            if recipient.expo_push_token and recipient.id != actor.id
+        ]
+    )
+
+
+def format_bill_notification_push_parameters(recipient, bill, event, actor_names):
+    """Create the push parameters for one or more coalesced events.
+
+    Args:
+        recipient (CustomUser): The user being notified.
+        bill (Bill): The bill the events happened on.
+        event (str): A BillNotificationEvent.EventChoices value.
+        actor_names (list[str]): Names of the users behind each event, oldest first.
+
+    Returns:
+        dict: Push parameters for send_push_messages.
+    """
+
+    if len(actor_names) == 1:
+        title, message = SINGLE_EVENT_TEMPLATES[event]
+    else:
+        title, message = COALESCED_EVENT_TEMPLATES[event]
+
+    context = {
+        "actor_name": actor_names[-1],
+        "bill_name": bill.name,
+        "count": len(actor_names),
+    }
+
+    return {
+        "token": recipient.expo_push_token,
+        "title": title.format(**context),
+        "message": message.format(**context),
+        "extra": {
+            "action": "open-bill",
+            "bill_name": bill.name,
+            "bill_id": str(bill.uuid),
+        },
+    }
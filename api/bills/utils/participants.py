@@ -1,160 +1,215 @@
-from django.db import transaction
+from django.db import models, transaction
+from django.db.models import Case, Exists, OuterRef, Value, When
+from django.utils import timezone
 
 from bills.models import Bill, BillAction, BillUnregisteredParticipant
+from bills.utils.cache import invalidate_bill_members_caches
 from financials.models import PaystackPlan, PaystackPlanFailure
 
+# Number of (user, phone) pairs whose data is transferred per transaction.
+UNREGISTERED_PARTICIPANT_TRANSFER_CHUNK_SIZE = 500
 
-@transaction.atomic
-def transfer_unregistered_participant_data(
-    registered_user, unregistered_participant_phone=None
-):
-    """
-    Transfer data from an unregistered participant to a registered participant/user and
-    delete the unregistered participant object.
 
-    If `unregistered_participant_phone` is provided, transfer data only for the
-    unregistered participant with the given phone number.
-    If `unregistered_participant_phone` is not provided, transfer data for all
-    unregistered participants who share a phone number with `registered_user`.
+def get_registered_user_id_case(field_name, user_ids_by_unregistered_id):
+    """Build a CASE expression mapping the unregistered participant in field_name to
+    the id of the registered user taking over their data.
 
     Args:
-        registered_user (User): The registered user object to transfer the data to.
-        unregistered_participant_phone (str, optional): The phone number of the
-            unregistered participant to transfer. If not provided, data for all
-            unregistered participants sharing a phone number with `registered_user`
-            will be transferred.
-
-    Raises:
-        BillUnregisteredParticipant.DoesNotExist: If the unregistered participant object
-            does not exist.
+        field_name (str): The field holding the unregistered participant's id.
+        user_ids_by_unregistered_id (dict): The id of the registered user taking
+            over each unregistered participant's data, keyed by the unregistered
+            participant's id.
 
     Returns:
-        bool: True if the data transfer occured, False otherwise.
+        Case: The expression.
     """
 
-    participant = registered_user
+    return Case(
+        *[
+            When(**{field_name: unregistered_id}, then=Value(user_id))
+            for unregistered_id, user_id in user_ids_by_unregistered_id.items()
+        ],
+        output_field=models.BigIntegerField(),
+    )
+
 
-    # In this case, search for unregistered users that have the same phone number as the
-    # registered user/participant.
-    if unregistered_participant_phone is None:
-        unregistered_participant_phone = participant.phone
+def exclude_bills_with_registered_user(queryset, bill_field_name):
+    """Exclude rows of bills the registered user taking over their unregistered
+    participant is already a participant of.
 
-    unregistered_participant_to_transfer = None
+    Args:
+        queryset (QuerySet): Rows annotated with registered_user_id.
+        bill_field_name (str): The path from the rows to their bill's id.
+
+    Returns:
+        QuerySet: The remaining rows.
+    """
 
-    try:
-        unregistered_participant_to_transfer = (
-            BillUnregisteredParticipant.objects.get(
-                phone=unregistered_participant_phone
+    return queryset.exclude(
+        Exists(
+            Bill.participants.through.objects.filter(
+                bill_id=OuterRef(bill_field_name),
+                customuser_id=OuterRef("registered_user_id"),
             )
-            if unregistered_participant_phone
-            else None
         )
-    except BillUnregisteredParticipant.DoesNotExist:
-        unregistered_participant_to_transfer = None
-
-    if unregistered_participant_to_transfer:
-        # Get the bills that contain the unregistered participant and exclude those
-        # that already have the participant
-        bills_to_transfer = Bill.objects.filter(
-            unregistered_participants=unregistered_participant_to_transfer
-        ).exclude(participants=participant)
-
-        actions_to_transfer = BillAction.objects.filter(
-            unregistered_participant=unregistered_participant_to_transfer,
-            participant=None,
-        ).exclude(bill__participants=participant)
-
-        plans_to_transfer = PaystackPlan.objects.filter(
-            unregistered_participant=unregistered_participant_to_transfer,
-            participant=None,
-        ).exclude(action__bill__participants=participant)
-
-        failures_to_transfer = PaystackPlanFailure.objects.filter(
-            unregistered_participant=unregistered_participant_to_transfer,
-            participant=None,
-        ).exclude(action__bill__participants=participant)
-
-        # Ensure both bills and actions exist before transferring any data.
-        if bills_to_transfer and actions_to_transfer:
-            # Update each model with the newly registered participant and remove the
-            # association with the unregistered participant object.
-
-            # -------------------------------------
-            # Transfer actions
-            # -------------------------------------
-
-            actions_to_transfer.update(
-                participant=participant,
-                unregistered_participant=None,
-                status=BillAction.StatusChoices.PENDING,
-            )
+    )
 
-            # -------------------------------------
-            # Transfer plans
-            # -------------------------------------
 
-            plans_to_transfer.update(
-                participant=participant,
-                unregistered_participant=None,
-            )
+@transaction.atomic
+def transfer_unregistered_participants_data_chunk(user_phones):
+    """Transfer the data of the unregistered participants with the given phone
+    numbers to the registered users sharing them, with a fixed number of set-based
+    queries however many users, bills and actions are involved.
+
+    For each unregistered participant, the bills (and their actions, plans and plan
+    failures) that do not already include the registered user are transferred, and
+    the unregistered participant is deleted.
+
+    Args:
+        user_phones (list[tuple[int, str]]): (registered user id, phone number)
+            pairs.
 
-            # -------------------------------------
-            # Transfer plan failures
-            # -------------------------------------
+    Returns:
+        int: The number of unregistered participants whose data was transferred.
+    """
 
-            failures_to_transfer.update(
-                participant=participant,
-                unregistered_participant=None,
+    user_ids_by_phone = {phone: user_id for user_id, phone in user_phones}
+
+    # Locked so a concurrent transfer of the same participants waits for this one.
+    unregistered_participants = (
+        BillUnregisteredParticipant.objects.select_for_update()
+        .filter(phone__in=user_ids_by_phone)
+        .values_list("id", "phone")
+    )
+    user_ids_by_unregistered_id = {
+        unregistered_id: user_ids_by_phone[str(phone)]
+        for unregistered_id, phone in unregistered_participants
+    }
+
+    if not user_ids_by_unregistered_id:
+        return 0
+
+    # Everything to transfer is selected before any participant is added to a bill,
+    # as adding them changes which bills are excluded.
+    bill_memberships_to_transfer = list(
+        exclude_bills_with_registered_user(
+            Bill.unregistered_participants.through.objects.filter(
+                billunregisteredparticipant_id__in=user_ids_by_unregistered_id
+            ).annotate(
+                registered_user_id=get_registered_user_id_case(
+                    "billunregisteredparticipant_id", user_ids_by_unregistered_id
+                )
+            ),
+            "bill_id",
+        ).values_list("id", "bill_id", "billunregisteredparticipant_id")
+    )
+
+    user_ids_by_unregistered_id = {
+        unregistered_id: user_ids_by_unregistered_id[unregistered_id]
+        for _, _, unregistered_id in bill_memberships_to_transfer
+    }
+
+    if not user_ids_by_unregistered_id:
+        return 0
+
+    action_ids, plan_ids, failure_ids = (
+        list(
+            exclude_bills_with_registered_user(
+                model.objects.filter(
+                    unregistered_participant_id__in=user_ids_by_unregistered_id,
+                    participant=None,
+                ).annotate(
+                    registered_user_id=get_registered_user_id_case(
+                        "unregistered_participant_id", user_ids_by_unregistered_id
+                    )
+                ),
+                bill_field_name,
+            ).values_list("id", flat=True)
+        )
+        for model, bill_field_name in (
+            (BillAction, "bill_id"),
+            (PaystackPlan, "action__bill_id"),
+            (PaystackPlanFailure, "action__bill_id"),
+        )
+    )
+
+    # participant is set before unregistered_participant is cleared, as MySQL
+    # evaluates single-table UPDATE assignments from left to right.
+    transferred_fields = {
+        "participant_id": get_registered_user_id_case(
+            "unregistered_participant_id", user_ids_by_unregistered_id
+        ),
+        "unregistered_participant": None,
+    }
+
+    # Actions on bills whose deadline has passed are overdue straight away, as
+    # their deadline will not be handled again.
+    actions = BillAction.objects.filter(id__in=action_ids)
+    now = timezone.now()
+
+    BillAction.update_statuses(
+        actions.filter(bill__deadline__lt=now),
+        BillAction.StatusChoices.OVERDUE,
+        **transferred_fields,
+    )
+    BillAction.update_statuses(
+        actions.exclude(bill__deadline__lt=now),
+        BillAction.StatusChoices.PENDING,
+        **transferred_fields,
+    )
+    PaystackPlan.objects.filter(id__in=plan_ids).update(**transferred_fields)
+    PaystackPlanFailure.objects.filter(id__in=failure_ids).update(**transferred_fields)
+
+    # Unregistered participants are removed from the bills before the registered
+    # users are added.
+    Bill.unregistered_participants.through.objects.filter(
+        id__in=[membership_id for membership_id, _, _ in bill_memberships_to_transfer]
+    ).delete()
+    Bill.participants.through.objects.bulk_create(
+        [
+            Bill.participants.through(
+                bill_id=bill_id,
+                customuser_id=user_ids_by_unregistered_id[unregistered_id],
             )
+            for _, bill_id, unregistered_id in bill_memberships_to_transfer
+        ],
+        ignore_conflicts=True,
+    )
 
-            # -------------------------------------
-            # Transfer bills
-            # -------------------------------------
+    BillUnregisteredParticipant.objects.filter(
+        id__in=user_ids_by_unregistered_id
+    ).delete()
 
-            # The transfer of the bills is more complex than it is for the other models.
-            # This is due to the fact that participants and unregistered participants
-            # have a many-to-many-relationship with the bill model.
+    # bulk_create() does not send m2m_changed, so the members' cached bill lists
+    # are invalidated here.
+    invalidate_bill_members_caches(
+        {bill_id for _, bill_id, _ in bill_memberships_to_transfer}
+    )
 
-            # Adding and removing in a loop has been avoided due to n+1.
+    return len(user_ids_by_unregistered_id)
 
-            # The approach was inspired by: https://stackoverflow.com/a/36823156/15063835
-            # More details available:
-            # https://www.notion.so/inisoye/Transfer-of-unregistered-participant-s-data-to-a-registered-user-f376b19d172c4de69e60170a979d5675?pvs=4
 
-            # ! The order should be kept this way (bulk delete before bulk create).
-            # ! This apparently prevents data integrity issues.
+def transfer_unregistered_participants_data(user_phones):
+    """Transfer the data of unregistered participants to the registered users
+    sharing their phone numbers, in chunks of
+    UNREGISTERED_PARTICIPANT_TRANSFER_CHUNK_SIZE pairs, each in one transaction.
 
-            # Use bulk_delete() to remove the unregistered participants from the bills.
-            Bill.unregistered_participants.through.objects.filter(
-                bill__in=bills_to_transfer,
-                billunregisteredparticipant_id=unregistered_participant_to_transfer.id,
-            ).delete()
-
-            # Create a list of new participant IDs to be added to the bills.
-            # The same participant is added to each bill so it is repeated.
-            new_participant_ids = [participant.id] * bills_to_transfer.count()
-
-            # Use bulk_create() to add the new participants to the bills.
-            Bill.participants.through.objects.bulk_create(
-                [
-                    Bill.participants.through(
-                        bill_id=bill.id, customuser_id=participant_id
-                    )
-                    for bill, participant_id in zip(
-                        bills_to_transfer, new_participant_ids
-                    )
-                ]
-            )
+    Args:
+        user_phones (Iterable[tuple[int, str]]): (registered user id, phone number)
+            pairs, e.g. of every user who registered in the last hour. Pairs without
+            a phone number are skipped.
 
-            # Delete the unregistered participant object.
-            unregistered_participant_to_transfer.delete()
+    Returns:
+        int: The number of unregistered participants whose data was transferred.
+    """
 
-            # Return true to confirm a successful data transfer.
-            return True
+    user_phones = [(user_id, str(phone)) for user_id, phone in user_phones if phone]
+    chunk_size = UNREGISTERED_PARTICIPANT_TRANSFER_CHUNK_SIZE
+    transferred_count = 0
 
-        else:
-            # Return false if there was no data to be transferred.
-            return False
+    for start in range(0, len(user_phones), chunk_size):
+        transferred_count += transfer_unregistered_participants_data_chunk(
+            user_phones[start : start + chunk_size]  # noqa E203
+        )
 
-    # Return false if no unregistered partipant was found.
-    return False
+    return transferred_count
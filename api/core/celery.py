@@ -1,6 +1,9 @@
 import os
 
 from celery import Celery
+from celery.signals import worker_process_shutdown, worker_shutdown
+
+from libraries.paystack.base import close_paystack_transport
 
 # Set the default Django settings module for the 'celery' program.
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "core.settings")
@@ -21,3 +24,11 @@ app.autodiscover_tasks()
 @app.task(bind=True)
 def debug_task(self) -> None:
     print(f"Request: {self.request!r}")
+
+
+@worker_process_shutdown.connect
+@worker_shutdown.connect
+def close_pooled_connections(**kwargs) -> None:
+    """Release pooled HTTP connections when a worker (or pool process) exits."""
+
+    close_paystack_transport()
@@ -0,0 +1,82 @@
+from decimal import Decimal
+from functools import partialmethod
+
+from django.core import checks
+from django.db import models
+
+from core.utils.currency import convert_from_minor_units, convert_to_minor_units
+
+
+class MoneyField(models.DecimalField):
+    """
+    A Decimal field stored as a whole number of minor units (0.0001) in a BIGINT
+    column.
+
+    Values are read and written as Decimals with 4 decimal places, exactly like a
+    DecimalField(max_digits=19, decimal_places=4), so model code, forms and
+    serializers are unaffected. The database only ever sees integers, which are
+    cheaper to store, sum and compare than DECIMAL values.
+
+    Each MoneyField adds a get_FOO_minor_units() method to its model, which returns
+    the value as an integer (e.g. for convert_minor_units_to_kobo).
+
+    Expressions that combine a MoneyField with a plain value must wrap the value as
+    Value(amount, output_field=MoneyField()), so that it is converted to minor units
+    too.
+    """
+
+    def __init__(self, *args, max_digits=19, decimal_places=4, **kwargs):
+        super().__init__(
+            *args, max_digits=max_digits, decimal_places=decimal_places, **kwargs
+        )
+
+    def _check_decimal_places(self):
+        if self.decimal_places != 4:
+            return [
+                checks.Error(
+                    "MoneyField only supports 4 decimal places (minor units of 0.0001).",
+                    obj=self,
+                )
+            ]
+
+        return super()._check_decimal_places()
+
+    def get_internal_type(self):
+        return "BigIntegerField"
+
+    def contribute_to_class(self, cls, name, *args, **kwargs):
+        super().contribute_to_class(cls, name, *args, **kwargs)
+
+        if "get_%s_minor_units" % self.name not in cls.__dict__:
+            setattr(
+                cls,
+                "get_%s_minor_units" % self.name,
+                partialmethod(_get_FIELD_minor_units, field=self),
+            )
+
+    def from_db_value(self, value, expression, connection):
+        if value is None:
+            return value
+
+        return convert_from_minor_units(value)
+
+    def get_db_prep_value(self, value, connection, prepared=False):
+        if not prepared:
+            value = self.get_prep_value(value)
+
+        if value is None or hasattr(value, "resolve_expression"):
+            return value
+
+        return convert_to_minor_units(value)
+
+    def get_db_prep_save(self, value, connection):
+        return self.get_db_prep_value(value, connection)
+
+
+def _get_FIELD_minor_units(instance, field):
+    value = getattr(instance, field.attname)
+
+    if value is None:
+        return value
+
+    return convert_to_minor_units(Decimal(value))
@@ -1,4 +1,15 @@
-from rest_framework.pagination import PageNumberPagination
+import json
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+
+from django.core.exceptions import ValidationError
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.filters import OrderingFilter
+from rest_framework.pagination import (
+    BasePagination,
+    PageNumberPagination,
+    _positive_int,
+)
 from rest_framework.response import Response
 
 
@@ -30,10 +41,212 @@ class CustomPageNumberPagination(PageNumberPagination):
         return Response(
             {
                 "next": self.page.next_page_number() if self.page.has_next() else None,
-                "previous": self.page.previous_page_number()
-                if self.page.has_previous()
-                else None,
+                "previous": (
+                    self.page.previous_page_number()
+                    if self.page.has_previous()
+                    else None
+                ),
                 "count": self.page.paginator.count,
                 "results": data,
             }
         )
+
+
+class KeysetCursorPagination(BasePagination):
+    """
+    Keyset (cursor) pagination on the view's ordering field and the primary key,
+    e.g. (created, id).
+
+    Pages are found by filtering on the position of the last (or first) item of the
+    previous page instead of using OFFSET, and the total count is not queried, so
+    deep pages cost as much as the first one. The next and previous cursors returned
+    are opaque tokens to be passed back in the cursor query parameter.
+
+    Attributes:
+        page_size (int): Default items per page.
+        page_size_query_param (str): Query parameter for items per page.
+        max_page_size (int): Maximum items per page.
+        cursor_query_param (str): Query parameter for the cursor.
+        ordering (tuple): Ordering used when the view does not provide one.
+    """
+
+    page_size = 10
+    page_size_query_param = "page_size"
+    max_page_size = 100
+    cursor_query_param = "cursor"
+    ordering = ("-created",)
+    invalid_cursor_message = "Invalid cursor"
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.page_size = self.get_page_size(request)
+        ordering_field = self.get_ordering(request, queryset, view)[0]
+        self.field_name = ordering_field.lstrip("-")
+        is_descending = ordering_field.startswith("-")
+
+        cursor = self.decode_cursor(request)
+        is_reversed = cursor is not None and cursor["direction"] == "previous"
+
+        # Previous pages are read in the opposite order, then reversed back.
+        is_query_descending = is_descending != is_reversed
+
+        if cursor is not None:
+            lookup = "lt" if is_query_descending else "gt"
+
+            # The cursor's values are checked against the fields as the filter is
+            # built, e.g. a tampered date is rejected here.
+            try:
+                queryset = queryset.filter(
+                    Q(**{f"{self.field_name}__{lookup}": cursor["value"]})
+                    | Q(
+                        **{
+                            self.field_name: cursor["value"],
+                            f"pk__{lookup}": cursor["pk"],
+                        }
+                    )
+                )
+            except (TypeError, ValidationError, ValueError):
+                raise NotFound(self.invalid_cursor_message)
+
+        if is_query_descending:
+            queryset = queryset.order_by(f"-{self.field_name}", "-pk")
+        else:
+            queryset = queryset.order_by(self.field_name, "pk")
+
+        # Fetch one extra item to know whether there is another page after this one.
+        results = list(queryset[: self.page_size + 1])
+        has_more = len(results) > self.page_size
+        self.page = results[: self.page_size]
+
+        if is_reversed:
+            self.page.reverse()
+            self.has_next = True
+            self.has_previous = has_more
+        else:
+            self.has_next = has_more
+            self.has_previous = cursor is not None
+
+        return self.page
+
+    def get_paginated_response(self, data):
+        """
+        Generate Response object with next and previous cursors and paginated data.
+
+        Args:
+            data (list): List of items for the paginated response.
+        """
+
+        return Response(
+            {
+                "next": (
+                    self.encode_cursor(self.page[-1], "next")
+                    if self.has_next and self.page
+                    else None
+                ),
+                "previous": (
+                    self.encode_cursor(self.page[0], "previous")
+                    if self.has_previous and self.page
+                    else None
+                ),
+                "results": data,
+            }
+        )
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            "type": "object",
+            "properties": {
+                "next": {"type": "string", "nullable": True},
+                "previous": {"type": "string", "nullable": True},
+                "results": schema,
+            },
+        }
+
+    def get_page_size(self, request):
+        try:
+            return _positive_int(
+                request.query_params[self.page_size_query_param],
+                strict=True,
+                cutoff=self.max_page_size,
+            )
+        except (KeyError, ValueError):
+            return self.page_size
+
+    def get_ordering(self, request, queryset, view):
+        """Return the ordering requested through the view's OrderingFilter, falling
+        back to the view's (or this class') default ordering."""
+
+        for backend in getattr(view, "filter_backends", ()):
+            if issubclass(backend, OrderingFilter):
+                ordering = backend().get_ordering(request, queryset, view)
+
+                if ordering:
+                    return ordering
+
+        return getattr(view, "ordering", None) or self.ordering
+
+    def encode_cursor(self, item, direction):
+        # Items are model instances, or rows of projected (values) querysets.
+        if isinstance(item, dict):
+            value, pk = item[self.field_name], item["id"]
+        else:
+            value, pk = getattr(item, self.field_name), item.pk
+
+        if hasattr(value, "isoformat"):
+            value = value.isoformat()
+
+        payload = json.dumps({"value": value, "pk": pk, "direction": direction})
+
+        return urlsafe_b64encode(payload.encode("utf-8")).decode("ascii")
+
+    def decode_cursor(self, request):
+        encoded_cursor = request.query_params.get(self.cursor_query_param)
+
+        if not encoded_cursor:
+            return None
+
+        try:
+            cursor = json.loads(urlsafe_b64decode(encoded_cursor.encode("ascii")))
+            assert cursor["direction"] in ("next", "previous")
+            assert "value" in cursor and "pk" in cursor
+
+        except (AssertionError, KeyError, TypeError, ValueError):
+            raise NotFound(self.invalid_cursor_message)
+
+        return cursor
+
+
+class CursorOrPageNumberPagination(CustomPageNumberPagination):
+    """
+    CustomPageNumberPagination with opt-in keyset cursor pagination.
+
+    Responses are page-number paginated unless the client requests cursor pagination
+    with ?pagination=cursor (or passes a cursor), in which case
+    KeysetCursorPagination is used.
+
+    Attributes:
+        pagination_mode_query_param (str): Query parameter for the pagination mode.
+    """
+
+    pagination_mode_query_param = "pagination"
+    cursor_pagination_class = KeysetCursorPagination
+    cursor_paginator = None
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.cursor_paginator = None
+
+        is_cursor_requested = (
+            request.query_params.get(self.pagination_mode_query_param) == "cursor"
+            or self.cursor_pagination_class.cursor_query_param in request.query_params
+        )
+
+        if is_cursor_requested:
+            self.cursor_paginator = self.cursor_pagination_class()
+            return self.cursor_paginator.paginate_queryset(queryset, request, view)
+
+        return super().paginate_queryset(queryset, request, view)
+
+    def get_paginated_response(self, data):
+        if self.cursor_paginator is not None:
+            return self.cursor_paginator.get_paginated_response(data)
+
+        return super().get_paginated_response(data)
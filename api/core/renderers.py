@@ -0,0 +1,125 @@
+import functools
+
+import orjson
+from django.utils.encoding import force_str
+from django.utils.functional import Promise
+from djangorestframework_camel_case.settings import api_settings
+from djangorestframework_camel_case.util import camelize_re, underscore_to_camel
+from rest_framework.renderers import JSONRenderer
+
+# Most distinct keys whose camelCase translation is memoized. API responses repeat
+# a few hundred field names, so the table rarely evicts anything.
+CAMELIZED_KEYS_CACHE_SIZE = 4096
+
+# Dates and dataclasses are left to DRF's encoder, as they are by JSONRenderer.
+ORJSON_OPTIONS = (
+    orjson.OPT_NON_STR_KEYS
+    | orjson.OPT_PASSTHROUGH_DATACLASS
+    | orjson.OPT_PASSTHROUGH_DATETIME
+)
+
+
+@functools.lru_cache(maxsize=CAMELIZED_KEYS_CACHE_SIZE)
+def camelize_key(key: str) -> str:
+    """Translate a snake_case key to camelCase exactly as
+    djangorestframework_camel_case does, memoized."""
+
+    return camelize_re.sub(underscore_to_camel, key) if "_" in key else key
+
+
+def camelize(data, ignore_fields=frozenset(), ignore_keys=frozenset()):
+    """
+    Convert the keys of some data to camelCase, like djangorestframework_camel_case's
+    camelize(), with memoized key translations and plain dicts.
+
+    Args:
+        data: The data, e.g. a serializer's data.
+        ignore_fields (frozenset[str]): Keys whose values are left as they are.
+        ignore_keys (frozenset[str]): Keys that are left as they are.
+
+    Returns:
+        The data, with camelCase keys.
+    """
+
+    if data is None or isinstance(data, (str, bytes, int, float)):
+        return data
+
+    if isinstance(data, dict):
+        camelized_data = {}
+
+        for key, value in data.items():
+            if isinstance(key, Promise):
+                key = force_str(key)
+
+            new_key = camelize_key(key) if isinstance(key, str) else key
+
+            if key not in ignore_fields and new_key not in ignore_fields:
+                value = camelize(value, ignore_fields, ignore_keys)
+
+            if key in ignore_keys or new_key in ignore_keys:
+                camelized_data[key] = value
+            else:
+                camelized_data[new_key] = value
+
+        return camelized_data
+
+    if isinstance(data, (list, tuple)):
+        return [camelize(item, ignore_fields, ignore_keys) for item in data]
+
+    if isinstance(data, Promise):
+        return force_str(data)
+
+    # Other iterables, e.g. querysets, are listed. Scalars like Decimals and UUIDs
+    # are left to the encoder.
+    try:
+        items = iter(data)
+    except TypeError:
+        return data
+
+    return [camelize(item, ignore_fields, ignore_keys) for item in items]
+
+
+class CamelCaseJSONRenderer(JSONRenderer):
+    """
+    Drop-in replacement for djangorestframework_camel_case's CamelCaseJSONRenderer.
+
+    Keys are camelized with memoized translations, honouring the ignore_fields and
+    ignore_keys of the JSON_UNDERSCOREIZE setting. Data is then encoded with orjson,
+    which encodes UUIDs natively and falls back to DRF's encoder for Decimals, dates
+    and other types, so the output matches JSONRenderer's. Indented or ASCII-only
+    responses, e.g. for the browsable API, and data orjson cannot encode (such as
+    integers wider than 64 bits) are still encoded by JSONRenderer.
+    """
+
+    json_underscoreize = api_settings.JSON_UNDERSCOREIZE
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        data = camelize(
+            data,
+            frozenset(self.json_underscoreize.get("ignore_fields") or ()),
+            frozenset(self.json_underscoreize.get("ignore_keys") or ()),
+        )
+
+        if (
+            self.ensure_ascii
+            or not self.compact
+            or self.get_indent(accepted_media_type, renderer_context or {})
+        ):
+            return super().render(data, accepted_media_type, renderer_context)
+
+        if data is None:
+            return b""
+
+        try:
+            rendered_data = orjson.dumps(
+                data,
+                default=self.encoder_class().default,
+                option=ORJSON_OPTIONS,
+            )
+        except orjson.JSONEncodeError:
+            return super().render(data, accepted_media_type, renderer_context)
+
+        # Escaped like JSONRenderer does, as they are invalid in JavaScript strings.
+        return rendered_data.replace(b"\xe2\x80\xa8", b"\\u2028").replace(
+            b"\xe2\x80\xa9", b"\\u2029"
+        )
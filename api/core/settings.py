@@ -9,6 +9,7 @@ For the full list of settings and their values, see
 https://docs.djangoproject.com/en/4.1/ref/settings/
 """
 
+import sys
 from datetime import timedelta
 from pathlib import Path
 
@@ -132,6 +133,55 @@ DATABASES = {
 # }
 
 
+# Cache
+# https://docs.djangoproject.com/en/4.1/topics/cache/
+
+# Redis is used in every environment except the test runner, where each test process
+# gets its own in-memory cache.
+if len(sys.argv) > 1 and sys.argv[1] == "test":
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        }
+    }
+else:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": env.str(
+                "CACHE_URL",
+                default=env.str("REDIS_URL", default="redis://localhost:6379"),
+            ),
+        }
+    }
+
+# Seconds for which a user's cached bill lists and summaries are kept. They are
+# invalidated earlier whenever the user's bills, actions or transactions change.
+USER_CACHE_TIMEOUT = env.int("USER_CACHE_TIMEOUT", default=60 * 60)
+# Seconds for which a user's membership of a bill is cached, for permission checks.
+# 0 disables the cache, leaving an indexed query per bill per request. Invalidated
+# with the user's other cached data, e.g. when the bill's participants change.
+BILL_MEMBERSHIP_CACHE_TIMEOUT = env.int("BILL_MEMBERSHIP_CACHE_TIMEOUT", default=0)
+# Seconds for which the registered contacts in an address book are cached, keyed by
+# a hash of its phone numbers. Invalidated whenever a user's phone number changes.
+# 0 disables the cache.
+CONTACT_MATCH_CACHE_TIMEOUT = env.int("CONTACT_MATCH_CACHE_TIMEOUT", default=60 * 60)
+# Whether each process keeps the hashes of every registered phone number in memory,
+# so numbers that are not registered are dropped before querying. Worth its memory
+# (tens of bytes per user) once address books are much larger than their matches.
+CONTACT_MATCH_PREFILTER = env.bool("CONTACT_MATCH_PREFILTER", default=False)
+# Most phone numbers matched per request.
+CONTACT_MATCH_MAX_PHONE_NUMBERS = env.int(
+    "CONTACT_MATCH_MAX_PHONE_NUMBERS", default=10000
+)
+# Largest profile image, in bytes, that can be uploaded. Uploads are staged in the
+# cache until a worker processes them, so this bounds the memory each one takes.
+PROFILE_IMAGE_MAX_SIZE = env.int("PROFILE_IMAGE_MAX_SIZE", default=5 * 1024 * 1024)
+# Seconds for which an uploaded profile image is staged in the cache. Long enough
+# for a worker to get through every retry of the processing task.
+STAGED_PROFILE_IMAGE_TIMEOUT = env.int("STAGED_PROFILE_IMAGE_TIMEOUT", default=60 * 60)
+
+
 # Password validation
 # https://docs.djangoproject.com/en/4.1/ref/settings/#auth-password-validators
 
@@ -230,7 +280,7 @@ REST_FRAMEWORK = {
         "rest_framework.authentication.TokenAuthentication",
     ],
     "DEFAULT_RENDERER_CLASSES": (
-        "djangorestframework_camel_case.render.CamelCaseJSONRenderer",
+        "core.renderers.CamelCaseJSONRenderer",
         "djangorestframework_camel_case.render.CamelCaseBrowsableAPIRenderer",
     ),
     "DEFAULT_PARSER_CLASSES": (
@@ -348,18 +398,85 @@ REST_AUTH = {
 
 CELERY_BROKER_URL = env.str("REDIS_URL", default="redis://localhost:6379")
 CELERY_RESULT_BACKEND = env.str("REDIS_URL", default="redis://localhost:6379")
+# Seconds before Redis redelivers a task that has not been acknowledged, including
+# tasks waiting for their ETA. Tasks are only scheduled with ETAs (or countdowns)
+# shorter than this, e.g. see bills.tasks.actions.DEADLINE_SCHEDULING_HORIZON.
+CELERY_BROKER_TRANSPORT_OPTIONS = {"visibility_timeout": 3600}
 CELERY_ACCEPT_CONTENT = ["application/json"]
 CELERY_TASK_SERIALIZER = "json"
 CELERY_RESULT_SERIALIZER = "json"
 CELERY_TIMEZONE = TIME_ZONE
 CELERY_LOADER = "core.celery.app"
 CELERY_IMPORTS = (
+    "accounts.tasks.notifications",
+    "accounts.tasks.profile_images",
     "bills.tasks.actions",
+    "bills.tasks.notifications",
+    "bills.tasks.participants",
+    "bills.tasks.transactions",
+    "financials.tasks.banks",
+    "financials.tasks.settlements",
+    "financials.tasks.webhooks",
 )  # Manually added as Celery is not "autodetecting" it
+# Seconds over which notifications about activity on a bill are merged before
+# being sent to the bill's members.
+BILL_NOTIFICATION_COALESCE_WINDOW = env.int(
+    "BILL_NOTIFICATION_COALESCE_WINDOW",
+    default=60,
+)
+# Seconds between bulk transfers of the queued contributions of bills with batched
+# settlement.
+SETTLEMENT_WINDOW = env.int(
+    "SETTLEMENT_WINDOW",
+    default=300,
+)
 CELERY_BEAT_SCHEDULE = {
+    # Deadlines are handled by per-bill tasks, scheduled as each deadline comes
+    # within DEADLINE_SCHEDULING_HORIZON (30 minutes).
+    "schedule_upcoming_bill_deadlines": {
+        "task": "bills.tasks.actions.schedule_upcoming_bill_deadlines",
+        "schedule": timedelta(minutes=15),
+    },
+    # Catches up on passed deadlines whose task was lost, and on actions that became
+    # pending after their deadline.
     "update_overdue_statuses": {
         "task": "bills.tasks.actions.update_overdue_statuses",
-        "schedule": timedelta(hours=12),
+        "schedule": timedelta(hours=1),
+    },
+    "flush_bill_notification_events": {
+        "task": "bills.tasks.notifications.flush_bill_notification_events",
+        "schedule": timedelta(seconds=BILL_NOTIFICATION_COALESCE_WINDOW),
+    },
+    "flush_settlement_transfers": {
+        "task": "financials.tasks.settlements.flush_settlement_transfers",
+        "schedule": timedelta(seconds=SETTLEMENT_WINDOW),
+    },
+    # Fails settlement transfers left pending without being initiated on Paystack.
+    "verify_stale_pending_transfers": {
+        "task": "financials.tasks.settlements.verify_stale_pending_transfers",
+        "schedule": timedelta(minutes=30),
+    },
+    "reconcile_payment_totals": {
+        "task": "bills.tasks.transactions.reconcile_payment_totals",
+        "schedule": timedelta(days=1),
+    },
+    # Transfers are enqueued on registration. This catches up on lost ones.
+    "transfer_recently_registered_users_data": {
+        "task": "bills.tasks.participants.transfer_recently_registered_users_data",
+        "schedule": timedelta(hours=1),
+    },
+    "check_push_receipts": {
+        "task": "accounts.tasks.notifications.check_push_receipts",
+        "schedule": timedelta(minutes=15),
+    },
+    "refresh_bank_directory": {
+        "task": "financials.tasks.banks.refresh_bank_directory",
+        "schedule": timedelta(days=1),
+    },
+    # Picks up webhook events whose dispatch was never enqueued (or was lost).
+    "dispatch_paystack_webhook_events": {
+        "task": "financials.tasks.webhooks.dispatch_paystack_webhook_events",
+        "schedule": timedelta(minutes=5),
     },
 }
 
@@ -0,0 +1,110 @@
+import json
+from base64 import urlsafe_b64encode
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.exceptions import NotFound
+from rest_framework.request import Request
+from rest_framework.test import APIClient, APIRequestFactory
+
+from bills.models import Bill
+from core.pagination import CursorOrPageNumberPagination
+
+User = get_user_model()
+
+
+def encode_cursor_payload(payload) -> str:
+    return urlsafe_b64encode(json.dumps(payload).encode("utf-8")).decode("ascii")
+
+
+class CursorOrPageNumberPaginationTests(TestCase):
+    def setUp(self) -> None:
+        self.user = User.objects.create_user(
+            phone="08010191010",
+            email="user@email.com",
+            username="user",
+            password="testpass123",
+        )
+
+        self.bills = [
+            Bill.objects.create(
+                name=f"Bill {index}",
+                creator=self.user,
+                creditor=self.user,
+                total_amount_due=1000,
+            )
+            for index in range(5)
+        ]
+
+        # Three bills share a creation time, so pages must break ties on the id.
+        created = timezone.now()
+        Bill.objects.filter(id__in=[bill.id for bill in self.bills[1:4]]).update(
+            created=created
+        )
+
+    def paginate(self, **query_params):
+        paginator = CursorOrPageNumberPagination()
+        request = Request(APIRequestFactory().get("/", query_params))
+        page = paginator.paginate_queryset(Bill.objects.order_by("-created"), request)
+
+        return [bill.id for bill in page], paginator.get_paginated_response([]).data
+
+    def test_next_and_previous_cursors_walk_every_bill_once(self) -> None:
+        expected_ids = [bill.id for bill in Bill.objects.order_by("-created", "-id")]
+
+        ids, data = self.paginate(pagination="cursor", page_size=2)
+        pages = [ids]
+        self.assertIsNone(data["previous"])
+
+        while data["next"]:
+            ids, data = self.paginate(cursor=data["next"], page_size=2)
+            pages.append(ids)
+
+        self.assertEqual([bill_id for ids in pages for bill_id in ids], expected_ids)
+        self.assertEqual([len(ids) for ids in pages], [2, 2, 1])
+
+        # Walking back from the last page returns the same pages.
+        ids, data = self.paginate(cursor=data["previous"], page_size=2)
+        self.assertEqual(ids, pages[1])
+
+        ids, data = self.paginate(cursor=data["previous"], page_size=2)
+        self.assertEqual(ids, pages[0])
+        self.assertIsNone(data["previous"])
+
+    def test_invalid_cursors_are_not_found(self) -> None:
+        for cursor in (
+            "not-a-cursor",
+            encode_cursor_payload(["next"]),
+            encode_cursor_payload({"value": "x", "pk": 1, "direction": "sideways"}),
+            encode_cursor_payload(
+                {"value": "not-a-date", "pk": 1, "direction": "next"}
+            ),
+            encode_cursor_payload(
+                {
+                    "value": timezone.now().isoformat(),
+                    "pk": "not-a-pk",
+                    "direction": "next",
+                }
+            ),
+        ):
+            with self.subTest(cursor=cursor), self.assertRaises(NotFound):
+                self.paginate(cursor=cursor)
+
+        client = APIClient()
+        client.force_authenticate(self.user)
+        response = client.get(
+            reverse("bills:user-transactions"),
+            {"cursor": encode_cursor_payload({"value": "x", "pk": 1})},
+        )
+
+        self.assertEqual(response.status_code, 404)
+
+    def test_page_numbers_are_used_by_default(self) -> None:
+        ids, data = self.paginate(page=2, page_size=2)
+
+        self.assertEqual(len(ids), 2)
+        self.assertEqual(data["count"], 5)
+        self.assertEqual(data["next"], 3)
+        self.assertEqual(data["previous"], 1)
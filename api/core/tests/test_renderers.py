@@ -0,0 +1,79 @@
+import uuid
+from datetime import date, datetime, time, timedelta, timezone
+from decimal import Decimal
+from unittest import mock
+
+import orjson
+from django.test import SimpleTestCase
+from django.utils.translation import gettext_lazy as _
+from djangorestframework_camel_case.render import (
+    CamelCaseJSONRenderer as LibraryCamelCaseJSONRenderer,
+)
+
+from core.renderers import CamelCaseJSONRenderer
+
+
+class CamelCaseJSONRendererTests(SimpleTestCase):
+    def test_renders_like_the_library_renderer(self) -> None:
+        participant_uuid = str(uuid.uuid4())
+        data = {
+            "bill_name": _("Netflix"),
+            "total_amount_due": Decimal("1000.50"),
+            "created": datetime(2023, 5, 1, 12, 30, 15, 123456, tzinfo=timezone.utc),
+            "uuid": uuid.uuid4(),
+            "status_info": {"most_common_status": "pending", "count_2": 2},
+            "actions": ({"paystack_plan": None, "line break": "a b"},),
+            # The keys of this field are UUIDs, and must be left as they are.
+            "participants_contribution_index": {
+                participant_uuid: {"contribution_amount": "10"}
+            },
+        }
+
+        rendered_data = CamelCaseJSONRenderer().render(data)
+
+        self.assertEqual(rendered_data, LibraryCamelCaseJSONRenderer().render(data))
+        self.assertIn(b'"participantsContributionIndex"', rendered_data)
+        self.assertIn(b'"contribution_amount"', rendered_data)
+        self.assertIn(b'"totalAmountDue"', rendered_data)
+
+    def test_orjson_encodes_like_json_renderer(self) -> None:
+        data = {
+            "amounts": [Decimal("1000.50"), Decimal("0.1"), Decimal("12")],
+            "created": datetime(2023, 5, 1, 12, 30, 15, 123456, tzinfo=timezone.utc),
+            "modified": datetime(2023, 5, 1, 12, 30, 15),
+            "deadline": date(2023, 5, 31),
+            "reminder_time": time(9, 15, 30, 500000),
+            "interval": timedelta(days=30),
+            "uuid": uuid.uuid4(),
+            # U+2028 and U+2029 are escaped, as they are invalid in JavaScript.
+            "separators": "line\u2028paragraph\u2029end",
+            "non_ascii": "Naira ₦ é",
+            "counts": {1: "one", 2.5: "two and a half"},
+            "flags": [True, False, None],
+            "ratio": 0.1,
+        }
+
+        with mock.patch.object(orjson, "dumps", wraps=orjson.dumps) as dumps:
+            rendered_data = CamelCaseJSONRenderer().render(data)
+
+        dumps.assert_called_once()
+        self.assertEqual(rendered_data, LibraryCamelCaseJSONRenderer().render(data))
+        self.assertIn(b"\\u2028", rendered_data)
+        self.assertIn(b"\\u2029", rendered_data)
+
+    def test_falls_back_to_json_renderer(self) -> None:
+        # Integers wider than 64 bits are not supported by orjson.
+        data = {"big_number": 2**70, "uuid": uuid.uuid4()}
+
+        self.assertEqual(
+            CamelCaseJSONRenderer().render(data),
+            LibraryCamelCaseJSONRenderer().render(data),
+        )
+
+        # Indented responses, e.g. for the browsable API.
+        self.assertEqual(
+            CamelCaseJSONRenderer().render(data, "application/json; indent=2"),
+            LibraryCamelCaseJSONRenderer().render(data, "application/json; indent=2"),
+        )
+
+        self.assertEqual(CamelCaseJSONRenderer().render(None), b"")
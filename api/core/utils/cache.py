@@ -0,0 +1,105 @@
+import hashlib
+import time
+from urllib.parse import urlencode
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+
+def get_user_cache_version_key(user_id) -> str:
+    return f"user-cache-version:{user_id}"
+
+
+def get_user_cache_version(user_id) -> int:
+    """
+    Get the current version of a user's cached data, creating it if necessary.
+
+    Versions are created from the current time (in nanoseconds) rather than counted
+    up from 1, so a version that has been deleted or evicted is never reused and
+    data cached under it can never be served again.
+
+    Args:
+        user_id (int): The ID of the user.
+
+    Returns:
+        int: The current version of the user's cached data.
+    """
+
+    version_key = get_user_cache_version_key(user_id)
+    version = cache.get(version_key)
+
+    if version is None:
+        # add() only sets the version if no other request has set it meanwhile.
+        cache.add(version_key, time.time_ns(), timeout=None)
+        version = cache.get(version_key)
+
+    return version
+
+
+def get_user_cache_key(user_id, name, query_params=None) -> str:
+    """
+    Build the key under which some of a user's data is cached.
+
+    The key includes the user's current cache version, so all of a user's cached
+    data is invalidated at once when the version changes.
+
+    Args:
+        user_id (int): The ID of the user.
+        name (str): The name of the cached data, e.g. "bill-list".
+        query_params (QueryDict, optional): Request query parameters the data
+            depends on, e.g. page and ordering.
+
+    Returns:
+        str: The cache key.
+    """
+
+    params = urlencode(sorted(query_params.lists()), doseq=True) if query_params else ""
+    params_hash = hashlib.md5(params.encode("utf-8")).hexdigest()
+
+    return f"user:{user_id}:{get_user_cache_version(user_id)}:{name}:{params_hash}"
+
+
+def get_or_set_user_cache(user_id, name, query_params, get_data):
+    """
+    Return some of a user's data from the cache, computing and caching it on a miss.
+
+    Args:
+        user_id (int): The ID of the user.
+        name (str): The name of the cached data.
+        query_params (QueryDict): Request query parameters the data depends on.
+        get_data (Callable): Returns the data when it is not cached.
+
+    Returns:
+        The cached or computed data.
+    """
+
+    cache_key = get_user_cache_key(user_id, name, query_params)
+    data = cache.get(cache_key)
+
+    if data is None:
+        data = get_data()
+        cache.set(cache_key, data, timeout=settings.USER_CACHE_TIMEOUT)
+
+    return data
+
+
+def invalidate_user_caches(user_ids) -> None:
+    """
+    Invalidate all cached data of the given users.
+
+    The users' cache versions are deleted once the current transaction commits (or
+    immediately, outside a transaction), so a new version is created on their next
+    request. Waiting for the commit prevents a concurrent request from caching data
+    read before the change under the new version.
+
+    Args:
+        user_ids (Iterable[int]): The IDs of the users.
+    """
+
+    version_keys = [
+        get_user_cache_version_key(user_id) for user_id in set(user_ids) if user_id
+    ]
+
+    if version_keys:
+        transaction.on_commit(lambda: cache.delete_many(version_keys))
@@ -1,7 +1,16 @@
-from decimal import ROUND_HALF_EVEN, Decimal
+from decimal import MAX_PREC, ROUND_HALF_EVEN, Context, Decimal
 from typing import Union
 
-from core.utils.decimals import round_decimal
+from core.utils.decimals import divide_and_round_half_even, round_decimal
+
+# Amounts are stored with 4 decimal places, i.e. as whole numbers of minor units of
+# 0.0001 (Naira), and Paystack works in whole numbers of Kobo (0.01 Naira).
+MINOR_UNITS_PER_NAIRA = 10_000
+MINOR_UNITS_PER_KOBO = 100
+
+# Scaling by a power of ten is exact in this context, whatever the precision of the
+# current context (see round_decimal).
+EXACT_CONTEXT = Context(prec=MAX_PREC)
 
 
 def convert_to_kobo_integer(value: Union[int, float, Decimal, str]) -> int:
@@ -46,6 +55,79 @@ def convert_to_naira(value: Union[int, float, Decimal, str]) -> Decimal:
     return naira_rounded
 
 
+def convert_to_minor_units(value: Union[int, Decimal, str]) -> int:
+    """Converts an amount to whole minor units of 0.0001, rounding half to even.
+
+    Amounts with at most 4 decimal places (every stored amount) convert exactly.
+
+    Args:
+        value (int, Decimal, str): The amount to convert.
+
+    Returns:
+        int: The amount in minor units.
+    """
+
+    units = Decimal(value).scaleb(4, context=EXACT_CONTEXT)
+
+    return int(units.to_integral_value(rounding=ROUND_HALF_EVEN))
+
+
+def convert_from_minor_units(units: Union[int, Decimal]) -> Decimal:
+    """Converts whole minor units of 0.0001 to an amount with 4 decimal places.
+
+    Args:
+        units (int, Decimal): The amount in minor units.
+
+    Returns:
+        Decimal: The amount.
+    """
+
+    return Decimal(units).scaleb(-4, context=EXACT_CONTEXT)
+
+
+def convert_minor_units_to_kobo(units: int) -> int:
+    """Converts whole minor units of 0.0001 to whole Kobo, rounding half to even.
+
+    Gives the same result as convert_to_kobo_integer on the equivalent amount,
+    without Decimal arithmetic.
+
+    Args:
+        units (int): The amount in minor units.
+
+    Returns:
+        int: The amount in Kobo.
+    """
+
+    return divide_and_round_half_even(units, MINOR_UNITS_PER_KOBO)
+
+
+def convert_kobo_to_minor_units(kobo: Union[int, str]) -> int:
+    """Converts whole Kobo (e.g. an amount returned by Paystack) to minor units.
+
+    Args:
+        kobo (int, str): The amount in Kobo.
+
+    Returns:
+        int: The amount in minor units.
+    """
+
+    return int(kobo) * MINOR_UNITS_PER_KOBO
+
+
+def convert_kobo_to_naira(kobo: Union[int, str]) -> Decimal:
+    """Converts whole Kobo (e.g. an amount returned by Paystack) to a Naira amount
+    with 4 decimal places, exactly.
+
+    Args:
+        kobo (int, str): The amount in Kobo.
+
+    Returns:
+        Decimal: The amount in Naira.
+    """
+
+    return convert_from_minor_units(convert_kobo_to_minor_units(kobo))
+
+
 def add_commas_to_amount(
     value: Union[int, float, Decimal, str], decimal_places: int = 4
 ):
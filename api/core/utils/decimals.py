@@ -39,3 +39,14 @@ def round_decimal(value: Decimal, decimal_places: Union[int, None] = None):
         raise InvalidOperation(
             f"Invalid operation: {invalid_operation}. Check your input: {value}"
         )
+
+
+def divide_and_round_half_even(numerator: int, denominator: int) -> int:
+    """Divide two integers (with a positive denominator), rounding half to even."""
+
+    quotient, remainder = divmod(numerator, denominator)
+
+    if 2 * remainder > denominator or (2 * remainder == denominator and quotient % 2):
+        quotient += 1
+
+    return quotient
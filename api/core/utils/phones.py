@@ -0,0 +1,77 @@
+import hashlib
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from phonenumber_field.phonenumber import PhoneNumber, to_python
+
+REGISTERED_PHONES_VERSION_KEY = "registered-phones-version"
+
+
+def normalize_phone_number(value):
+    """
+    Normalize a phone number to E.164, with the same rules as PhoneNumberField.
+
+    Numbers without a country code are parsed in PHONENUMBER_DEFAULT_REGION, so
+    "08031234567" and "+2348031234567" normalize to the same number.
+
+    Args:
+        value (str | PhoneNumber): The phone number.
+
+    Returns:
+        str | None: The phone number in E.164, or None if it is not a valid number.
+    """
+
+    phone_number = to_python(value, region=settings.PHONENUMBER_DEFAULT_REGION)
+
+    if not isinstance(phone_number, PhoneNumber) or not phone_number.is_valid():
+        return None
+
+    return phone_number.as_e164
+
+
+def hash_phone_number(phone_number) -> int:
+    """
+    Hash an E.164 phone number to a signed 64-bit integer, e.g. for the indexed
+    phone_hash column of users.
+
+    Hashes may collide, so matches on them must be confirmed against the phone
+    numbers themselves.
+
+    Args:
+        phone_number (str | PhoneNumber): The phone number, in E.164.
+
+    Returns:
+        int: The hash.
+    """
+
+    digest = hashlib.sha256(str(phone_number).encode("utf-8")).digest()
+
+    return int.from_bytes(digest[:8], "big", signed=True)
+
+
+def get_registered_phones_version() -> int:
+    """
+    Get the current version of the registered phone numbers, creating it if
+    necessary. It changes whenever a user's phone number does, so contact matches
+    cached under it are never stale.
+
+    Returns:
+        int: The current version.
+    """
+
+    version = cache.get(REGISTERED_PHONES_VERSION_KEY)
+
+    if version is None:
+        cache.add(REGISTERED_PHONES_VERSION_KEY, time.time_ns(), timeout=None)
+        version = cache.get(REGISTERED_PHONES_VERSION_KEY)
+
+    return version
+
+
+def invalidate_registered_phones() -> None:
+    """Change the version of the registered phone numbers once the current
+    transaction commits."""
+
+    transaction.on_commit(lambda: cache.delete(REGISTERED_PHONES_VERSION_KEY))
@@ -1,11 +1,15 @@
 from django.contrib import admin
 
 from financials.models import (
+    BankDirectorySnapshot,
+    LedgerAccount,
+    LedgerEntry,
     PaystackPlan,
     PaystackPlanFailure,
     PaystackSubscription,
     PaystackTransaction,
     PaystackTransfer,
+    PaystackWebhookEvent,
     TransferRecipient,
     UserCard,
 )
@@ -20,6 +24,10 @@ admin.site.register(PaystackPlanFailure)
 admin.site.register(PaystackSubscription)
 admin.site.register(PaystackTransaction)
 admin.site.register(PaystackTransfer)
+admin.site.register(PaystackWebhookEvent)
+admin.site.register(LedgerAccount)
+admin.site.register(LedgerEntry)
+admin.site.register(BankDirectorySnapshot)
 
 
 # class PaystackPlanResource(resources.ModelResource):
@@ -3,7 +3,12 @@ from rest_framework import serializers
 from bills.api.serializers import NestedCustomUserSerializer
 from bills.models import BillAction
 from financials.data.logos import bank_logo_index
-from financials.models import PaystackTransfer, TransferRecipient, UserCard
+from financials.models import (
+    LedgerAccount,
+    PaystackTransfer,
+    TransferRecipient,
+    UserCard,
+)
 from financials.utils.validation import validate_new_recipient_data
 
 
@@ -247,3 +252,40 @@ class PaystackTransferRetrySerializer(serializers.ModelSerializer):
             "reason",
             "paystack_transfer_reference",
         )
+
+
+class UserLedgerBalanceSerializer(serializers.ModelSerializer):
+    total_paid = serializers.DecimalField(
+        max_digits=19, decimal_places=4, source="credits", read_only=True
+    )
+    total_received = serializers.DecimalField(
+        max_digits=19, decimal_places=4, source="debits", read_only=True
+    )
+    total_owed = serializers.DecimalField(
+        max_digits=19, decimal_places=4, source="owed", read_only=True
+    )
+
+    class Meta:
+        model = LedgerAccount
+        fields = ("total_paid", "total_received", "total_owed")
+
+
+class BillLedgerBalanceSerializer(serializers.ModelSerializer):
+    total_collected = serializers.DecimalField(
+        max_digits=19, decimal_places=4, source="debits", read_only=True
+    )
+    total_transferred = serializers.DecimalField(
+        max_digits=19, decimal_places=4, source="credits", read_only=True
+    )
+    total_held = serializers.DecimalField(
+        max_digits=19, decimal_places=4, source="balance", read_only=True
+    )
+
+    class Meta:
+        model = LedgerAccount
+        fields = ("total_collected", "total_transferred", "total_held")
+
+
+class LedgerBalancesSerializer(serializers.Serializer):
+    user = UserLedgerBalanceSerializer()
+    bill = BillLedgerBalanceSerializer(required=False)
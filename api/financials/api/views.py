@@ -1,7 +1,19 @@
-import asyncio
+import gzip
+import re
+import uuid
 
+from django.http import Http404, HttpResponse
 from django.shortcuts import get_object_or_404
-from drf_spectacular.utils import OpenApiResponse, extend_schema, inline_serializer
+from django.utils.cache import patch_vary_headers
+from django.utils.decorators import method_decorator
+from django.utils.http import quote_etag
+from django.views.decorators.http import condition
+from drf_spectacular.utils import (
+    OpenApiParameter,
+    OpenApiResponse,
+    extend_schema,
+    inline_serializer,
+)
 from rest_framework import serializers, status
 from rest_framework.filters import OrderingFilter
 from rest_framework.generics import (
@@ -15,11 +27,14 @@ from rest_framework.permissions import IsAdminUser
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from bills.models import Bill
+from bills.utils.membership import is_bill_member
 from core.utils.responses import format_exception
 from core.utils.users import get_user_by_id_drf
 from financials.api.permissions import IsOwner, IsPaystack
 from financials.api.serializers import (
     FailedAndReversedPaystackTransfersSerializer,
+    LedgerBalancesSerializer,
     PaystackAccountNumberCheckSerializer,
     PaystackBankListSerializer,
     PaystackTransferRecipientListSerializer,
@@ -30,23 +45,35 @@ from financials.api.serializers import (
     UserCardListSerializer,
     UserCardSerializer,
 )
-from financials.data.banks import all_banks
-from financials.models import PaystackTransfer, TransferRecipient, UserCard
+from financials.models import (
+    LedgerAccount,
+    PaystackTransfer,
+    PaystackWebhookEvent,
+    TransferRecipient,
+    UserCard,
+)
+from financials.tasks.webhooks import dispatch_paystack_webhook_events
+from financials.utils.banks import get_bank_directory, get_bank_directory_version
 from financials.utils.cards import generate_add_card_paystack_payload
-from financials.utils.paystack_webhook import handle_paystack_webhook_response
 from financials.utils.transfer_recipients import (
     create_local_and_remote_transfer_recipient,
     generate_paystack_transfer_recipient_payload,
 )
 from libraries.paystack.bank_requests import BankRequests
+from libraries.paystack.base import run_async_requests
 from libraries.paystack.transaction_requests import TransactionRequests
 from libraries.paystack.transfer_recipient_requests import TransferRecipientRequests
 from libraries.paystack.transfer_requests import TransferRequests
 
+ACCEPTS_GZIP_RE = re.compile(r"\bgzip\b")
+
 
 class PaystackWebhookHandlerAPIView(APIView):
     """View for handling Paystack webhooks.
 
+    Deliveries are stored in the webhook inbox and processed by a Celery task, so
+    Paystack is acknowledged without waiting on any of the work they trigger.
+
     Accepts POST requests.
     """
 
@@ -56,9 +83,11 @@ class PaystackWebhookHandlerAPIView(APIView):
     def post(self, request):
         """Method to handle webhook requests made by Paystack."""
 
-        request_data = request.data
+        webhook_event = PaystackWebhookEvent.record(request.data, request.body)
 
-        handle_paystack_webhook_response(request_data)
+        # Duplicate deliveries are acknowledged but not processed again.
+        if webhook_event is not None:
+            dispatch_paystack_webhook_events.delay()
 
         return Response(status=status.HTTP_200_OK)
 
@@ -98,22 +127,37 @@ class PaystackAccountNumberCheckAPIView(APIView):
 
 class PaystackBanksListAPIView(APIView):
     """View for obtaining a list of all banks supported by Paystack and their logos.
-    The data returned is static and should be updated periodically with helper functions.
+    The list is refreshed from Paystack daily and served pre-rendered, with an ETag
+    so clients holding the current version get a 304.
 
     Accepts GET requests.
     """
 
     serializer_class = PaystackBankListSerializer
 
-    def get(self, request) -> Response:
+    @extend_schema(responses=PaystackBankListSerializer(many=True))
+    @method_decorator(condition(etag_func=lambda request: get_bank_directory_version()))
+    def get(self, request) -> HttpResponse:
         """Handles GET requests to retrieve a list of banks.
 
         Returns:
-            A list of bank objects.
+            A list of bank objects, compressed with gzip if the client accepts it.
         """
 
-        # Serializer validation not added as data is static.
-        return Response(all_banks, status=status.HTTP_200_OK)
+        directory = get_bank_directory()
+
+        if ACCEPTS_GZIP_RE.search(request.META.get("HTTP_ACCEPT_ENCODING", "")):
+            response = HttpResponse(directory.content, content_type="application/json")
+            response.headers["Content-Encoding"] = "gzip"
+        else:
+            response = HttpResponse(
+                gzip.decompress(directory.content), content_type="application/json"
+            )
+
+        response.headers["ETag"] = quote_etag(directory.version)
+        patch_vary_headers(response, ("Accept-Encoding",))
+
+        return response
 
 
 class DefaultCardRetrieveAPIView(RetrieveAPIView):
@@ -268,7 +312,7 @@ class PaystackTransferRecipientListAPIView(APIView):
         user = get_user_by_id_drf(user_id)
 
         recipient_codes = user.get_recipient_codes()
-        recipients = asyncio.run(
+        recipients = run_async_requests(
             TransferRecipientRequests.fetch_multiple(recipient_codes)
         )
         return Response(recipients, status=status.HTTP_200_OK)
@@ -464,3 +508,64 @@ class PaystackTransferRetryAPIView(APIView):
                 message=response["message"],
                 status=status.HTTP_400_BAD_REQUEST,
             )
+
+
+@extend_schema(
+    parameters=[
+        OpenApiParameter(
+            name="bill",
+            description="UUID of a bill of the user, to include its balance.",
+            required=False,
+            type=str,
+        )
+    ],
+    responses={200: LedgerBalancesSerializer},
+)
+class LedgerBalancesAPIView(APIView):
+    """View for retrieving what a user has paid, received and is owed, and
+    optionally the balance of one of their bills, from the ledger.
+
+    Accepts GET requests.
+    """
+
+    serializer_class = LedgerBalancesSerializer
+
+    def get(self, request) -> Response:
+        """Returns the materialized ledger balances of the current user.
+
+        Returns:
+            The user's balance, and that of the bill in the `bill` query
+            parameter, if given.
+        """
+
+        user = request.user
+        # Accounts are only created by their first entry. Read without one, the
+        # balances are all zero.
+        balances = {
+            "user": LedgerAccount.objects.filter(key=f"user:{user.id}").first()
+            or LedgerAccount()
+        }
+
+        bill_uuid = request.query_params.get("bill")
+
+        if bill_uuid:
+            try:
+                bill_uuid = uuid.UUID(bill_uuid)
+            except ValueError:
+                raise Http404
+
+            bill = get_object_or_404(
+                Bill.objects.only("id", "creditor_id"), uuid=bill_uuid
+            )
+
+            if not is_bill_member(request, bill):
+                raise Http404
+
+            balances["bill"] = (
+                LedgerAccount.objects.filter(key=f"bill:{bill.id}").first()
+                or LedgerAccount()
+            )
+
+        serializer = self.serializer_class(balances)
+
+        return Response(serializer.data, status=status.HTTP_200_OK)
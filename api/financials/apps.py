@@ -5,3 +5,6 @@ class FinancialsConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "financials"
     verbose_name = "Financial details and Paystack data handling"
+
+    def ready(self):
+        import financials.signals  # noqa: F401
@@ -0,0 +1,59 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from financials.models import (
+    LedgerAccount,
+    LedgerEntry,
+    PaystackTransaction,
+    PaystackTransfer,
+)
+from financials.utils.ledger import (
+    record_paystack_transaction_entries,
+    record_paystack_transfer_entries,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Clear the ledger and replay it from successful Paystack transactions and"
+        " transfers, recomputing every account balance. Reversed transfers cancel"
+        " out, so they are left out of the replay."
+    )
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            LedgerEntry.objects.all().delete()
+            LedgerAccount.objects.update(debits=0, credits=0, owed=0)
+
+            paystack_transactions = (
+                PaystackTransaction.objects.select_related("action", "arrear")
+                .filter(
+                    transaction_outcome=(
+                        PaystackTransaction.TransactionOutcomeChoices.SUCCESSFUL
+                    )
+                )
+                .defer("complete_paystack_response")
+                .order_by("created")
+            )
+
+            for paystack_transaction in paystack_transactions.iterator(chunk_size=1000):
+                record_paystack_transaction_entries(paystack_transaction)
+
+            paystack_transfers = (
+                PaystackTransfer.objects.select_related("action")
+                .filter(
+                    transfer_outcome=PaystackTransfer.TransferOutcomeChoices.SUCCESSFUL
+                )
+                .defer("complete_paystack_response")
+                .order_by("created")
+            )
+
+            for paystack_transfer in paystack_transfers.iterator(chunk_size=1000):
+                record_paystack_transfer_entries(paystack_transfer)
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Replayed {LedgerEntry.objects.count()} ledger entries across"
+                f" {LedgerAccount.objects.count()} accounts."
+            )
+        )
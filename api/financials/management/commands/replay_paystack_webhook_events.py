@@ -0,0 +1,51 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from financials.models import PaystackWebhookEvent
+from financials.tasks.webhooks import dispatch_paystack_webhook_events
+
+
+class Command(BaseCommand):
+    help = (
+        "Return failed Paystack webhook events to the inbox, so the dispatcher"
+        " processes them again."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "event_ids",
+            nargs="*",
+            type=int,
+            help="IDs of the failed events to replay.",
+        )
+        parser.add_argument(
+            "--all",
+            action="store_true",
+            help="Replay every failed event.",
+        )
+
+    def handle(self, *args, **options):
+        if not options["event_ids"] and not options["all"]:
+            raise CommandError("Pass the IDs of the events to replay, or --all.")
+
+        # Failed events are not retried automatically, as their handlers may have
+        # partly run (e.g. initiated a transfer) before failing. Check what a
+        # failed event did before replaying it.
+        events = PaystackWebhookEvent.objects.filter(
+            processing_state=PaystackWebhookEvent.ProcessingStateChoices.FAILED
+        )
+
+        if not options["all"]:
+            events = events.filter(id__in=options["event_ids"])
+
+        replayed_count = events.update(
+            processing_state=PaystackWebhookEvent.ProcessingStateChoices.PENDING,
+            claimed_at=None,
+        )
+
+        if replayed_count:
+            transaction.on_commit(lambda: dispatch_paystack_webhook_events.delay())
+
+        self.stdout.write(
+            self.style.SUCCESS(f"Replayed {replayed_count} failed webhook events.")
+        )
@@ -0,0 +1,65 @@
+# Generated by Django 4.1.7 on 2026-10-18 06:34
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("financials", "0010_alter_transferrecipient_authorization_code_and_more"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="PaystackWebhookEvent",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("event", models.CharField(max_length=100)),
+                (
+                    "delivery_key",
+                    models.CharField(
+                        help_text="The event type combined with the Paystack ID (or reference) of the object it concerns. A hash of the body is used if neither is sent.",
+                        max_length=255,
+                        unique=True,
+                    ),
+                ),
+                ("raw_body", models.TextField(editable=False)),
+                ("received_at", models.DateTimeField(auto_now_add=True)),
+                (
+                    "processing_state",
+                    models.CharField(
+                        choices=[
+                            ("pending", "Pending"),
+                            ("processing", "Processing"),
+                            ("processed", "Processed"),
+                            ("failed", "Failed"),
+                        ],
+                        default="pending",
+                        max_length=50,
+                    ),
+                ),
+                ("processed_at", models.DateTimeField(blank=True, null=True)),
+                ("attempts", models.PositiveSmallIntegerField(default=0)),
+                ("last_error", models.TextField(blank=True, null=True)),
+            ],
+            options={
+                "verbose_name": "Paystack webhook event",
+                "verbose_name_plural": "Paystack webhook events",
+            },
+        ),
+        migrations.AddIndex(
+            model_name="paystackwebhookevent",
+            index=models.Index(
+                fields=["processing_state", "received_at"],
+                name="financials__process_cbe47d_idx",
+            ),
+        ),
+    ]
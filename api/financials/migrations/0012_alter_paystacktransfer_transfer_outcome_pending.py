@@ -0,0 +1,27 @@
+# Generated by Django 4.1.7 on 2026-10-18 06:36
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("financials", "0011_paystackwebhookevent"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="paystacktransfer",
+            name="transfer_outcome",
+            field=models.CharField(
+                choices=[
+                    ("pending", "Pending"),
+                    ("successful", "Successful"),
+                    ("failed", "Failed"),
+                    ("reversed", "Reversed"),
+                    ("retried", "Retried"),
+                ],
+                max_length=50,
+            ),
+        ),
+    ]
@@ -0,0 +1,176 @@
+# Generated by Django 4.1.7 on 2026-10-18 06:57
+
+from decimal import Decimal
+
+import core.fields
+from django.db import migrations, models
+from django.db.models import F
+from django.db.models.functions import Round
+
+# The money fields of each model, whose values are converted to minor units of 0.0001.
+MONEY_FIELDS = {
+    "paystackplan": (
+        "amount",
+        "amount_in_naira",
+    ),
+    "paystacktransaction": (
+        "amount",
+        "amount_in_naira",
+        "refundable_amount",
+    ),
+    "paystacktransfer": (
+        "amount",
+        "amount_in_naira",
+    ),
+}
+
+# Every money field has 4 decimal places, i.e. is a whole number of minor units.
+MINOR_UNIT = Decimal("0.0001")
+
+
+def update_money_fields(apps, get_value):
+    for model_name, field_names in MONEY_FIELDS.items():
+        model = apps.get_model("financials", model_name)
+        model.objects.update(
+            **{field_name: get_value(F(field_name)) for field_name in field_names}
+        )
+
+
+def convert_to_minor_units(apps, schema_editor):
+    # Rounding only matters on backends that store decimals as floats (SQLite).
+    update_money_fields(apps, lambda amount: Round(amount / MINOR_UNIT))
+
+
+def convert_from_minor_units(apps, schema_editor):
+    update_money_fields(apps, lambda units: Round(units * MINOR_UNIT, 4))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("financials", "0012_alter_paystacktransfer_transfer_outcome_pending"),
+    ]
+
+    operations = [
+        # Widen the columns first, so that every amount still fits once it is
+        # multiplied into minor units (19 integer digits, like a BIGINT).
+        migrations.AlterField(
+            model_name="paystackplan",
+            name="amount",
+            field=models.DecimalField(
+                decimal_places=4,
+                help_text="Amount to be paid within each interval, in kobo (or other subunit), according to Paystack's standard approach.",
+                max_digits=23,
+                verbose_name="Amount in Kobo or other subunit",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="paystackplan",
+            name="amount_in_naira",
+            field=models.DecimalField(
+                blank=True, decimal_places=4, max_digits=23, null=True
+            ),
+        ),
+        migrations.AlterField(
+            model_name="paystacktransaction",
+            name="amount",
+            field=models.DecimalField(
+                decimal_places=4,
+                help_text="Amount returned by Paystack, in Kobo (or other subunit)",
+                max_digits=23,
+                verbose_name="Amount in Kobo or other subunit",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="paystacktransaction",
+            name="amount_in_naira",
+            field=models.DecimalField(
+                blank=True, decimal_places=4, max_digits=23, null=True
+            ),
+        ),
+        migrations.AlterField(
+            model_name="paystacktransaction",
+            name="refundable_amount",
+            field=models.DecimalField(
+                blank=True, decimal_places=4, max_digits=23, null=True
+            ),
+        ),
+        migrations.AlterField(
+            model_name="paystacktransfer",
+            name="amount",
+            field=models.DecimalField(
+                decimal_places=4,
+                help_text="Amount returned by Paystack, in Kobo (or other subunit)",
+                max_digits=23,
+                verbose_name="Amount in Kobo or other subunit",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="paystacktransfer",
+            name="amount_in_naira",
+            field=models.DecimalField(
+                blank=True, decimal_places=4, max_digits=23, null=True
+            ),
+        ),
+        migrations.RunPython(convert_to_minor_units, convert_from_minor_units),
+        # The amounts are now whole numbers, so converting the columns to BIGINT
+        # is exact.
+        migrations.AlterField(
+            model_name="paystackplan",
+            name="amount",
+            field=core.fields.MoneyField(
+                decimal_places=4,
+                help_text="Amount to be paid within each interval, in kobo (or other subunit), according to Paystack's standard approach.",
+                max_digits=19,
+                verbose_name="Amount in Kobo or other subunit",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="paystackplan",
+            name="amount_in_naira",
+            field=core.fields.MoneyField(
+                blank=True, decimal_places=4, max_digits=19, null=True
+            ),
+        ),
+        migrations.AlterField(
+            model_name="paystacktransaction",
+            name="amount",
+            field=core.fields.MoneyField(
+                decimal_places=4,
+                help_text="Amount returned by Paystack, in Kobo (or other subunit)",
+                max_digits=19,
+                verbose_name="Amount in Kobo or other subunit",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="paystacktransaction",
+            name="amount_in_naira",
+            field=core.fields.MoneyField(
+                blank=True, decimal_places=4, max_digits=19, null=True
+            ),
+        ),
+        migrations.AlterField(
+            model_name="paystacktransaction",
+            name="refundable_amount",
+            field=core.fields.MoneyField(
+                blank=True, decimal_places=4, max_digits=19, null=True
+            ),
+        ),
+        migrations.AlterField(
+            model_name="paystacktransfer",
+            name="amount",
+            field=core.fields.MoneyField(
+                decimal_places=4,
+                help_text="Amount returned by Paystack, in Kobo (or other subunit)",
+                max_digits=19,
+                verbose_name="Amount in Kobo or other subunit",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="paystacktransfer",
+            name="amount_in_naira",
+            field=core.fields.MoneyField(
+                blank=True, decimal_places=4, max_digits=19, null=True
+            ),
+        ),
+    ]
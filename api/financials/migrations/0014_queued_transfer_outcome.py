@@ -0,0 +1,28 @@
+# Generated by Django 4.1.7 on 2026-10-18 07:06
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("financials", "0013_store_money_as_minor_units"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="paystacktransfer",
+            name="transfer_outcome",
+            field=models.CharField(
+                choices=[
+                    ("queued", "Queued"),
+                    ("pending", "Pending"),
+                    ("successful", "Successful"),
+                    ("failed", "Failed"),
+                    ("reversed", "Reversed"),
+                    ("retried", "Retried"),
+                ],
+                max_length=50,
+            ),
+        ),
+    ]
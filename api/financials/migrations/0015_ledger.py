@@ -0,0 +1,152 @@
+# Generated by Django 4.1.7 on 2026-10-18 07:11
+
+import core.fields
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ("bills", "0017_bill_settlement_mode"),
+        ("financials", "0014_queued_transfer_outcome"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="LedgerAccount",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "kind",
+                    models.CharField(
+                        choices=[
+                            ("user", "User"),
+                            ("bill", "Bill"),
+                            ("platform", "Platform"),
+                        ],
+                        max_length=50,
+                    ),
+                ),
+                (
+                    "key",
+                    models.CharField(
+                        help_text="The kind of the account and the id of its owner, e.g. user:1. Keeps accounts unique on databases without conditional unique constraints",
+                        max_length=100,
+                        unique=True,
+                    ),
+                ),
+                (
+                    "debits",
+                    core.fields.MoneyField(decimal_places=4, default=0, max_digits=19),
+                ),
+                (
+                    "credits",
+                    core.fields.MoneyField(decimal_places=4, default=0, max_digits=19),
+                ),
+                (
+                    "owed",
+                    core.fields.MoneyField(
+                        decimal_places=4,
+                        default=0,
+                        help_text="For user accounts, contributions collected on the user's bills as creditor that have not been transferred to them yet",
+                        max_digits=19,
+                    ),
+                ),
+                (
+                    "bill",
+                    models.ForeignKey(
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        related_name="ledger_accounts",
+                        to="bills.bill",
+                    ),
+                ),
+                (
+                    "user",
+                    models.ForeignKey(
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        related_name="ledger_accounts",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Ledger account",
+                "verbose_name_plural": "Ledger accounts",
+            },
+        ),
+        migrations.CreateModel(
+            name="LedgerEntry",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "entry_type",
+                    models.CharField(
+                        choices=[
+                            ("charge", "Charge"),
+                            ("fee", "Fee"),
+                            ("transfer", "Transfer"),
+                            ("reversal", "Reversal"),
+                            ("refund", "Refund"),
+                        ],
+                        max_length=50,
+                    ),
+                ),
+                (
+                    "reference",
+                    models.CharField(
+                        help_text="UUID of the Paystack transaction or transfer the entry records",
+                        max_length=100,
+                    ),
+                ),
+                ("amount", core.fields.MoneyField(decimal_places=4, max_digits=19)),
+                ("created", models.DateTimeField(auto_now_add=True, db_index=True)),
+                (
+                    "credit_account",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.PROTECT,
+                        related_name="credit_entries",
+                        to="financials.ledgeraccount",
+                    ),
+                ),
+                (
+                    "debit_account",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.PROTECT,
+                        related_name="debit_entries",
+                        to="financials.ledgeraccount",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Ledger entry",
+                "verbose_name_plural": "Ledger entries",
+            },
+        ),
+        migrations.AddConstraint(
+            model_name="ledgerentry",
+            constraint=models.UniqueConstraint(
+                fields=("entry_type", "reference"), name="unique_ledger_entry_reference"
+            ),
+        ),
+    ]
@@ -0,0 +1,48 @@
+# Generated by Django 4.1.7 on 2026-10-18 07:22
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("financials", "0015_ledger"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="BankDirectorySnapshot",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "version",
+                    models.CharField(
+                        help_text="SHA-256 of the rendered list",
+                        max_length=64,
+                        unique=True,
+                    ),
+                ),
+                (
+                    "content",
+                    models.BinaryField(
+                        help_text="The list rendered as camelCase JSON and compressed with gzip"
+                    ),
+                ),
+                ("bank_count", models.PositiveIntegerField()),
+                ("created", models.DateTimeField(auto_now_add=True, db_index=True)),
+            ],
+            options={
+                "verbose_name": "Bank directory snapshot",
+                "verbose_name_plural": "Bank directory snapshots",
+                "get_latest_by": "created",
+            },
+        ),
+    ]
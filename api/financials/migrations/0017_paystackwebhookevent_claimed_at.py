@@ -0,0 +1,34 @@
+# Generated by Django 4.1.7 on 2026-10-18 07:41
+
+from django.db import migrations, models
+from django.db.models import F
+
+
+def set_claimed_at_of_processing_events(apps, schema_editor):
+    # Events claimed before the field existed become stale as they did before.
+    PaystackWebhookEvent = apps.get_model("financials", "PaystackWebhookEvent")
+    PaystackWebhookEvent.objects.filter(processing_state="processing").update(
+        claimed_at=F("received_at")
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("financials", "0016_bankdirectorysnapshot"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="paystackwebhookevent",
+            name="claimed_at",
+            field=models.DateTimeField(
+                blank=True,
+                help_text="When a dispatcher last claimed the event for processing.",
+                null=True,
+            ),
+        ),
+        migrations.RunPython(
+            set_claimed_at_of_processing_events, migrations.RunPython.noop
+        ),
+    ]
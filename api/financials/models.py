@@ -1,8 +1,12 @@
+import hashlib
+
 from django.conf import settings
 from django.core.exceptions import ValidationError
-from django.db import models
+from django.db import IntegrityError, models, transaction
+from django.db.models import F, Value
 
-from bills.models import BillAction, BillArrear, BillUnregisteredParticipant
+from bills.models import Bill, BillAction, BillArrear, BillUnregisteredParticipant
+from core.fields import MoneyField
 from core.models import AbstractTimeStampedUUIDModel
 from financials.utils.common import delete_and_set_newest_as_default, set_as_default
 
@@ -219,18 +223,14 @@ class PaystackPlan(AbstractTimeStampedUUIDModel, models.Model):
     plan_code = models.CharField(
         max_length=100,
     )
-    amount = models.DecimalField(
+    amount = MoneyField(
         verbose_name="Amount in Kobo or other subunit",
         help_text=(
             "Amount to be paid within each interval, in kobo (or other subunit),"
             " according to Paystack's standard approach."
         ),
-        max_digits=19,
-        decimal_places=4,
     )
-    amount_in_naira = models.DecimalField(
-        max_digits=19,
-        decimal_places=4,
+    amount_in_naira = MoneyField(
         blank=True,
         null=True,
     )
@@ -410,21 +410,15 @@ class PaystackTransaction(AbstractTimeStampedUUIDModel, models.Model):
         SUCCESSFUL = "successful", "Successful"
         FAILED = "failed", "Failed"
 
-    amount = models.DecimalField(
+    amount = MoneyField(
         verbose_name="Amount in Kobo or other subunit",
-        max_digits=19,
-        decimal_places=4,
         help_text="Amount returned by Paystack, in Kobo (or other subunit)",
     )
-    amount_in_naira = models.DecimalField(
-        max_digits=19,
-        decimal_places=4,
+    amount_in_naira = MoneyField(
         blank=True,
         null=True,
     )
-    refundable_amount = models.DecimalField(
-        max_digits=19,
-        decimal_places=4,
+    refundable_amount = MoneyField(
         blank=True,
         null=True,
     )
@@ -493,20 +487,19 @@ class PaystackTransfer(AbstractTimeStampedUUIDModel, models.Model):
         CARD_ADDITION_REFUND = "card_addition_refund", "Card addition refund"
 
     class TransferOutcomeChoices(models.TextChoices):
+        # Waiting to be initiated with other transfers (see Bill.settlement_mode).
+        QUEUED = "queued", "Queued"
+        PENDING = "pending", "Pending"
         SUCCESSFUL = "successful", "Successful"
         FAILED = "failed", "Failed"
         REVERSED = "reversed", "Reversed"
         RETRIED = "retried", "Retried"
 
-    amount = models.DecimalField(
+    amount = MoneyField(
         verbose_name="Amount in Kobo or other subunit",
-        max_digits=19,
-        decimal_places=4,
         help_text="Amount returned by Paystack, in Kobo (or other subunit)",
     )
-    amount_in_naira = models.DecimalField(
-        max_digits=19,
-        decimal_places=4,
+    amount_in_naira = MoneyField(
         blank=True,
         null=True,
     )
@@ -605,3 +598,360 @@ class PaystackTransfer(AbstractTimeStampedUUIDModel, models.Model):
             )
             .defer("complete_paystack_response")
         )
+
+
+class PaystackWebhookEvent(models.Model):
+    """A raw Paystack webhook delivery, stored before it is processed.
+
+    The webhook view only inserts a row and enqueues the dispatcher, so Paystack is
+    acknowledged in constant time. The dispatcher task drains pending rows in
+    batches. Paystack retries deliveries it considers unacknowledged, so rows are
+    unique on delivery_key and duplicate deliveries are dropped on insert.
+
+    Deliberately not based on AbstractTimeStampedUUIDModel: rows are never exposed
+    publicly, and skipping the extra uuid index keeps the insert cheap.
+    """
+
+    class ProcessingStateChoices(models.TextChoices):
+        PENDING = "pending", "Pending"
+        PROCESSING = "processing", "Processing"
+        PROCESSED = "processed", "Processed"
+        FAILED = "failed", "Failed"
+
+    event = models.CharField(
+        max_length=100,
+    )
+    delivery_key = models.CharField(
+        max_length=255,
+        unique=True,
+        help_text=(
+            "The event type combined with the Paystack ID (or reference) of the"
+            " object it concerns. A hash of the body is used if neither is sent."
+        ),
+    )
+    raw_body = models.TextField(
+        editable=False,
+    )
+    received_at = models.DateTimeField(
+        auto_now_add=True,
+    )
+    processing_state = models.CharField(
+        max_length=50,
+        choices=ProcessingStateChoices.choices,
+        default=ProcessingStateChoices.PENDING,
+    )
+    claimed_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        help_text="When a dispatcher last claimed the event for processing.",
+    )
+    processed_at = models.DateTimeField(
+        null=True,
+        blank=True,
+    )
+    attempts = models.PositiveSmallIntegerField(
+        default=0,
+    )
+    last_error = models.TextField(
+        null=True,
+        blank=True,
+    )
+
+    class Meta:
+        indexes = [models.Index(fields=["processing_state", "received_at"])]
+        verbose_name = "Paystack webhook event"
+        verbose_name_plural = "Paystack webhook events"
+
+    def __str__(self) -> str:
+        return f"event: {self.event}, state: {self.processing_state}"
+
+    @staticmethod
+    def get_delivery_key(request_data, raw_body):
+        """Build the key used to detect duplicate deliveries of the same event.
+
+        Args:
+            request_data (dict): The parsed webhook body.
+            raw_body (bytes): The webhook body, exactly as sent by Paystack.
+
+        Returns:
+            str: The delivery key.
+        """
+
+        event = request_data.get("event")
+        data = request_data.get("data") or {}
+
+        identifier = data.get("id") or data.get("reference")
+
+        if identifier is None:
+            identifier = hashlib.sha256(raw_body).hexdigest()
+
+        return f"{event}:{identifier}"
+
+    @classmethod
+    def record(cls, request_data, raw_body):
+        """Store a webhook delivery, ignoring it if it has been stored before.
+
+        Args:
+            request_data (dict): The parsed webhook body.
+            raw_body (bytes): The webhook body, exactly as sent by Paystack.
+
+        Returns:
+            PaystackWebhookEvent | None: The new event, or None for a duplicate.
+        """
+
+        try:
+            with transaction.atomic():
+                return cls.objects.create(
+                    event=request_data.get("event") or "",
+                    delivery_key=cls.get_delivery_key(request_data, raw_body),
+                    raw_body=raw_body.decode("utf-8"),
+                )
+        except IntegrityError:
+            return None
+
+
+class LedgerAccount(models.Model):
+    """An account of the ledger, with its balance materialized from its entries.
+
+    Money flows into an account's debits and out of its credits:
+        * User accounts (one per user): credits are what the user has paid
+          (contributions, fees and card addition charges), and debits what has been
+          paid out to them (contribution transfers and refunds). owed is the balance
+          of the accounts of bills the user is the creditor of.
+        * Bill accounts (one per bill): debits are the contributions collected for
+          the bill, and credits the contributions transferred to its creditor.
+        * The platform account: fees and card addition charges, and their refunds.
+
+    Counters are only ever changed by LedgerEntry.post, so balances can be read
+    without aggregating entries. Accounts outlive their user or bill, so that the
+    ledger always balances.
+    """
+
+    class KindChoices(models.TextChoices):
+        USER = "user", "User"
+        BILL = "bill", "Bill"
+        PLATFORM = "platform", "Platform"
+
+    kind = models.CharField(
+        max_length=50,
+        choices=KindChoices.choices,
+    )
+    key = models.CharField(
+        max_length=100,
+        unique=True,
+        help_text=(
+            "The kind of the account and the id of its owner, e.g. user:1. Keeps"
+            " accounts unique on databases without conditional unique constraints"
+        ),
+    )
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.SET_NULL,
+        null=True,
+        related_name="ledger_accounts",
+    )
+    bill = models.ForeignKey(
+        Bill,
+        on_delete=models.SET_NULL,
+        null=True,
+        related_name="ledger_accounts",
+    )
+    debits = MoneyField(
+        default=0,
+    )
+    credits = MoneyField(
+        default=0,
+    )
+    owed = MoneyField(
+        default=0,
+        help_text=(
+            "For user accounts, contributions collected on the user's bills as"
+            " creditor that have not been transferred to them yet"
+        ),
+    )
+
+    class Meta:
+        verbose_name = "Ledger account"
+        verbose_name_plural = "Ledger accounts"
+
+    def __str__(self) -> str:
+        return f"kind: {self.kind}, balance: {self.balance}"
+
+    @property
+    def balance(self):
+        return self.debits - self.credits
+
+    @classmethod
+    def get_for_user(cls, user_id):
+        account, created = cls.objects.get_or_create(
+            key=f"user:{user_id}",
+            defaults={"kind": cls.KindChoices.USER, "user_id": user_id},
+        )
+        return account
+
+    @classmethod
+    def get_for_bill(cls, bill_id):
+        account, created = cls.objects.get_or_create(
+            key=f"bill:{bill_id}",
+            defaults={"kind": cls.KindChoices.BILL, "bill_id": bill_id},
+        )
+        return account
+
+    @classmethod
+    def get_for_platform(cls):
+        account, created = cls.objects.get_or_create(
+            key="platform",
+            defaults={"kind": cls.KindChoices.PLATFORM},
+        )
+        return account
+
+
+class LedgerEntry(models.Model):
+    """An append-only record of money moving from one ledger account (credited) to
+    another (debited).
+
+    Entries are unique on their type and reference (the Paystack transaction or
+    transfer they record), so recording the same event twice posts it once.
+    Reversals are posted with the accounts of the reversed entry and a negative
+    amount, so that account counters stay net of reversed transfers.
+    """
+
+    class EntryChoices(models.TextChoices):
+        CHARGE = "charge", "Charge"
+        FEE = "fee", "Fee"
+        TRANSFER = "transfer", "Transfer"
+        REVERSAL = "reversal", "Reversal"
+        REFUND = "refund", "Refund"
+
+    entry_type = models.CharField(
+        max_length=50,
+        choices=EntryChoices.choices,
+    )
+    reference = models.CharField(
+        max_length=100,
+        help_text="UUID of the Paystack transaction or transfer the entry records",
+    )
+    amount = MoneyField()
+    debit_account = models.ForeignKey(
+        LedgerAccount,
+        on_delete=models.PROTECT,
+        related_name="debit_entries",
+    )
+    credit_account = models.ForeignKey(
+        LedgerAccount,
+        on_delete=models.PROTECT,
+        related_name="credit_entries",
+    )
+    created = models.DateTimeField(
+        auto_now_add=True,
+        db_index=True,
+    )
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["entry_type", "reference"],
+                name="unique_ledger_entry_reference",
+            )
+        ]
+        verbose_name = "Ledger entry"
+        verbose_name_plural = "Ledger entries"
+
+    def __str__(self) -> str:
+        return f"type: {self.entry_type}, amount: {self.amount}"
+
+    def save(self, *args, **kwargs):
+        if self.pk is not None:
+            raise ValidationError("Ledger entries cannot be changed.")
+
+        super().save(*args, **kwargs)
+
+    def delete(self, *args, **kwargs):
+        raise ValidationError("Ledger entries cannot be deleted.")
+
+    @classmethod
+    def post(cls, entry_type, reference, amount, debit_account, credit_account):
+        """Post an entry and update the balances of its accounts, atomically.
+
+        Args:
+            entry_type (str): A LedgerEntry.EntryChoices option.
+            reference (str): The reference of the recorded transaction or transfer.
+            amount (Decimal): The amount, in naira.
+            debit_account (LedgerAccount): The account money flows into.
+            credit_account (LedgerAccount): The account money flows out of.
+
+        Returns:
+            LedgerEntry | None: The new entry, or None if it was posted before.
+        """
+
+        amount_value = Value(amount, output_field=MoneyField())
+
+        with transaction.atomic():
+            entry, created = cls.objects.get_or_create(
+                entry_type=entry_type,
+                reference=reference,
+                defaults={
+                    "amount": amount,
+                    "debit_account": debit_account,
+                    "credit_account": credit_account,
+                },
+            )
+
+            if not created:
+                return None
+
+            LedgerAccount.objects.filter(id=debit_account.id).update(
+                debits=F("debits") + amount_value
+            )
+            LedgerAccount.objects.filter(id=credit_account.id).update(
+                credits=F("credits") + amount_value
+            )
+
+            # Roll changes to bill balances up to the accounts of their creditors.
+            for account, owed_change in (
+                (debit_account, amount),
+                (credit_account, -amount),
+            ):
+                if account.kind != LedgerAccount.KindChoices.BILL:
+                    continue
+
+                creditor_id = Bill.objects.values_list("creditor_id", flat=True).get(
+                    id=account.bill_id
+                )
+                LedgerAccount.objects.filter(
+                    id=LedgerAccount.get_for_user(creditor_id).id
+                ).update(owed=F("owed") + Value(owed_change, output_field=MoneyField()))
+
+        return entry
+
+
+class BankDirectorySnapshot(models.Model):
+    """A version of the list of banks supported by Paystack, merged with their logos.
+
+    The list is stored pre-rendered as gzip-compressed camelCase JSON, so the banks
+    endpoint serves it without serializing anything, and versioned by a hash of the
+    rendered JSON, which is also the endpoint's ETag.
+    """
+
+    version = models.CharField(
+        max_length=64,
+        unique=True,
+        help_text="SHA-256 of the rendered list",
+    )
+    content = models.BinaryField(
+        editable=False,
+        help_text="The list rendered as camelCase JSON and compressed with gzip",
+    )
+    bank_count = models.PositiveIntegerField()
+    created = models.DateTimeField(
+        auto_now_add=True,
+        db_index=True,
+    )
+
+    class Meta:
+        get_latest_by = "created"
+        verbose_name = "Bank directory snapshot"
+        verbose_name_plural = "Bank directory snapshots"
+
+    def __str__(self) -> str:
+        return f"version: {self.version}"
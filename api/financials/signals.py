@@ -0,0 +1,24 @@
+"""Post ledger entries for charges and transfers as their outcomes are recorded."""
+
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+
+from financials.models import PaystackTransaction, PaystackTransfer
+from financials.utils.ledger import (
+    record_paystack_transaction_entries,
+    record_paystack_transfer_entries,
+)
+
+
+@receiver(post_save, sender=PaystackTransaction)
+def record_ledger_entries_on_transaction_creation(sender, instance, created, **kwargs):
+    if created:
+        record_paystack_transaction_entries(instance)
+
+
+@receiver(post_save, sender=PaystackTransfer)
+def record_ledger_entries_on_transfer_outcome_change(
+    sender, instance, update_fields, **kwargs
+):
+    if update_fields is None or "transfer_outcome" in update_fields:
+        record_paystack_transfer_entries(instance)
@@ -0,0 +1,28 @@
+from celery import shared_task
+from celery.utils.log import get_task_logger
+
+from financials.utils.banks import fetch_bank_directory
+
+logger = get_task_logger(__name__)
+
+
+@shared_task
+def refresh_bank_directory():
+    """
+    Celery task for refreshing the bank directory from Paystack.
+
+    The current version is kept if Paystack cannot be reached, and the list is
+    fetched again on the next run.
+    """
+
+    try:
+        snapshot = fetch_bank_directory()
+
+    except Exception:
+        logger.exception("Failed to refresh the bank directory.")
+
+    else:
+        logger.info(
+            f"Bank directory is at version {snapshot.version}"
+            f" ({snapshot.bank_count} banks)."
+        )
@@ -1,12 +1,13 @@
 import json
 import uuid
 
+import requests
 from celery import shared_task
 from celery.utils.log import get_task_logger
 
 from accounts.models import CustomUser
-from core.utils.currency import convert_to_kobo_integer
-from core.utils.strings import extract_uuidv4s_from_string
+from accounts.tasks.notifications import send_push_messages_in_background
+from core.utils.currency import convert_minor_units_to_kobo
 from core.utils.users import get_user_by_id
 from financials.models import PaystackTransfer, TransferRecipient
 from financials.utils.cards import (
@@ -14,8 +15,12 @@ from financials.utils.cards import (
     create_card_object_from_webhook,
 )
 from financials.utils.transfer_recipients import create_card_recipient_from_webhook
-from financials.utils.transfers import create_paystack_transfer_object
-from libraries.notifications.base import send_push_messages
+from financials.utils.transfers import (
+    create_paystack_transfer_object,
+    describe_transfer_initiation_error,
+    get_transfer_owner,
+    record_pending_paystack_transfer,
+)
 from libraries.paystack.transfer_requests import TransferRequests
 
 logger = get_task_logger(__name__)
@@ -66,8 +71,8 @@ def process_card_creation_and_refund(request_data):
         new_card,
     )
 
-    refundable_amount_in_kobo = convert_to_kobo_integer(
-        new_card_addition_transaction.refundable_amount
+    refundable_amount_in_kobo = convert_minor_units_to_kobo(
+        new_card_addition_transaction.get_refundable_amount_minor_units()
     )
     refund_recipient_code = new_card_recipient.recipient_code
 
@@ -104,6 +109,11 @@ def process_card_creation_and_refund(request_data):
         else []
     )
 
+    # Recorded before initiating so the transfer's webhooks can be routed by reference.
+    record_pending_paystack_transfer(
+        reference, failed_paystack_transfer_object_defaults, request_data
+    )
+
     try:
         paystack_transfer_payload = {
             "source": "balance",
@@ -127,26 +137,28 @@ def process_card_creation_and_refund(request_data):
                 },
             )
 
-            send_push_messages(error_push_parameters_list)
+            send_push_messages_in_background.delay(error_push_parameters_list)
 
             paystack_error = response["message"]
             logger.error(f"Error intiating Paystack transfer: {paystack_error}")
 
-    # Handle cases when Paystack response is malformed.
-    except json.decoder.JSONDecodeError as json_error:
+    # Handle cases when Paystack response is malformed, or Paystack could not be
+    # reached. The transfer is marked failed, so it can be retried with its
+    # reference, which Paystack rejects if the transfer was initiated after all.
+    except (json.decoder.JSONDecodeError, requests.RequestException) as error:
         PaystackTransfer.objects.update_or_create(
             paystack_transfer_reference=reference,
             defaults={
                 **failed_paystack_transfer_object_defaults,
                 "complete_paystack_response": {
-                    "detail": "Transfer failed due to malformed data from paystack",
-                    "error": json_error,
+                    "detail": describe_transfer_initiation_error(error),
+                    "error": repr(error),
                     "request_data": request_data,
                 },
             },
         )
 
-        send_push_messages(error_push_parameters_list)
+        send_push_messages_in_background.delay(error_push_parameters_list)
 
 
 @shared_task
@@ -171,8 +183,12 @@ def record_card_addition_transfer_object(request_data, transfer_outcome):
     data = request_data.get("data")
 
     reason = data.get("reason")
-    user_id = extract_uuidv4s_from_string(reason, position=0)
-    receiving_user = CustomUser.objects.get(uuid=user_id)
+    receiving_user = get_transfer_owner(
+        CustomUser.objects.all(),
+        data,
+        transfers_lookup="paystack_transfers_received",
+        legacy_uuid_position=0,
+    )
 
     recipient_code = data.get("recipient").get("recipient_code")
     recipient = TransferRecipient.objects.get(
@@ -212,4 +228,4 @@ def record_card_addition_transfer_object(request_data, transfer_outcome):
             else []
         )
 
-        send_push_messages(push_parameters_list)
+        send_push_messages_in_background.delay(push_parameters_list)
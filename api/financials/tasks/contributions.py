@@ -1,15 +1,17 @@
 from celery import shared_task
 from celery.utils.log import get_task_logger
 
+from accounts.tasks.notifications import send_push_messages_in_background
 from bills.models import BillAction
-from core.utils.strings import extract_uuidv4s_from_string
 from financials.models import PaystackTransaction, PaystackTransfer, TransferRecipient
 from financials.utils.contributions import (
     finalize_contribution,
     process_contribution_transfer,
 )
-from financials.utils.transfers import create_paystack_transfer_object
-from libraries.notifications.base import send_push_messages
+from financials.utils.transfers import (
+    create_paystack_transfer_object,
+    get_transfer_owner,
+)
 
 logger = get_task_logger(__name__)
 
@@ -62,10 +64,12 @@ def record_contribution_transfer_object(request_data, transfer_outcome):
 
     reason = data.get("reason")
 
-    action_id = extract_uuidv4s_from_string(reason, position=1)
-    action = BillAction.objects.select_related(
-        "participant", "bill", "bill__creditor"
-    ).get(uuid=action_id)
+    action = get_transfer_owner(
+        BillAction.objects.select_related("participant", "bill", "bill__creditor"),
+        data,
+        transfers_lookup="paystack_transfers",
+        legacy_uuid_position=1,
+    )
 
     bill = action.bill
 
@@ -134,7 +138,7 @@ def record_contribution_transfer_object(request_data, transfer_outcome):
             params for params in push_parameters_list if params["token"]
         ]
 
-        send_push_messages(filtered_push_parameters_list)
+        send_push_messages_in_background.delay(filtered_push_parameters_list)
 
 
 @shared_task
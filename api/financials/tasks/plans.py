@@ -1,5 +1,3 @@
-import asyncio
-
 from celery import shared_task
 from celery.utils.log import get_task_logger
 
@@ -8,6 +6,8 @@ from financials.utils.plans import (
     create_paystack_plan_objects,
     format_paystack_plan_payloads,
 )
+from libraries.paystack.base import run_async_requests
+from libraries.paystack.batch import BatchItemError
 from libraries.paystack.plan_requests import PlanRequests
 
 logger = get_task_logger(__name__)
@@ -35,10 +35,19 @@ def create_paystack_plans_for_recurring_bills(new_bill_id):
 
     paystack_plan_payloads = format_paystack_plan_payloads(bill_actions)
 
-    paystack_plan_responses = asyncio.run(
+    # Responses come back in payload order. Plans that could not be created (even
+    # after retries) are BatchItemErrors, which are recorded as plan failures below.
+    paystack_plan_responses = run_async_requests(
         PlanRequests.create_multiple(paystack_plan_payloads)
     )
 
+    for response in paystack_plan_responses:
+        if isinstance(response, BatchItemError):
+            logger.warning(
+                f"Paystack plan creation failed for bill {new_bill_id} after"
+                f" {response.attempts} attempt(s): {response.exception!r}"
+            )
+
     create_paystack_plan_objects(
         bill_actions, paystack_plan_responses, paystack_plan_payloads
     )
@@ -0,0 +1,295 @@
+import json
+from datetime import timedelta
+
+import requests
+from celery import shared_task
+from celery.utils.log import get_task_logger
+from django.db import transaction
+from django.utils import timezone
+
+from accounts.tasks.notifications import send_push_messages_in_background
+from financials.models import PaystackTransfer
+from financials.utils.transfers import (
+    describe_transfer_initiation_error,
+    format_contribution_transfer_error_push_parameters,
+)
+from libraries.paystack.transfer_requests import TransferRequests
+
+logger = get_task_logger(__name__)
+
+# Maximum number of queued transfers initiated per run of the task.
+SETTLEMENT_FLUSH_BATCH_SIZE = 1000
+
+# Maximum number of transfers Paystack accepts in a single bulk transfer request.
+BULK_TRANSFER_CHUNK_SIZE = 100
+
+SETTLEMENT_CURRENCY = "NGN"
+
+# Settlement transfers still pending this long after they were claimed (or
+# recorded) are checked with Paystack, in case they were never initiated, e.g. as
+# the worker initiating them died.
+STALE_PENDING_TRANSFER_TIMEOUT = timedelta(hours=1)
+
+# Maximum number of stale pending transfers verified per run of the sweep.
+PENDING_TRANSFER_VERIFICATION_BATCH_SIZE = 100
+
+
+def claim_queued_transfers(batch_size):
+    """Mark a batch of queued transfers as pending and return them.
+
+    Rows are locked with SKIP LOCKED so concurrent flushes never initiate the same
+    transfers. Transfers are ordered by creditor and recipient, so that transfers
+    to the same account are initiated together.
+
+    Args:
+        batch_size (int): Maximum number of transfers to claim.
+
+    Returns:
+        list[PaystackTransfer]: The claimed transfers.
+    """
+
+    with transaction.atomic():
+        transfers = list(
+            PaystackTransfer.objects.select_for_update(skip_locked=True)
+            .select_related(
+                "recipient",
+                "action__bill",
+                "arrear",
+                "paying_user",
+                "receiving_user",
+            )
+            .filter(transfer_outcome=PaystackTransfer.TransferOutcomeChoices.QUEUED)
+            .order_by("receiving_user_id", "recipient_id", "created")[:batch_size]
+        )
+
+        # modified is set as update() does not, so verify_stale_pending_transfers
+        # can tell how long the transfers have been pending.
+        PaystackTransfer.objects.filter(
+            id__in=[transfer.id for transfer in transfers]
+        ).update(
+            transfer_outcome=PaystackTransfer.TransferOutcomeChoices.PENDING,
+            modified=timezone.now(),
+        )
+
+    return transfers
+
+
+def fail_settlement_transfer(transfer, paystack_response):
+    """Mark a transfer that could not be initiated, and its action or arrear, as
+    failed.
+
+    Args:
+        transfer (PaystackTransfer): The transfer.
+        paystack_response (dict): The part of Paystack's response (or the error)
+            concerning the transfer, stored alongside its request data.
+
+    Returns:
+        list[dict]: Push parameters notifying the participant and creditor.
+    """
+
+    transfer_owner = transfer.arrear or transfer.action
+    transfer_owner.mark_as_failed_transfer()
+
+    transfer.transfer_outcome = PaystackTransfer.TransferOutcomeChoices.FAILED
+    transfer.complete_paystack_response = {
+        **transfer.complete_paystack_response,
+        "response": paystack_response,
+    }
+    transfer.save(update_fields=["transfer_outcome", "complete_paystack_response"])
+
+    return format_contribution_transfer_error_push_parameters(
+        transfer.paying_user, transfer.receiving_user, transfer.action.bill
+    )
+
+
+def initiate_bulk_settlement_transfers(transfers):
+    """Initiate a chunk of claimed transfers with a single Paystack bulk transfer.
+
+    Each transfer keeps its own reference, so its webhooks are handled exactly like
+    those of a transfer initiated on its own. Transfers Paystack rejects, or leaves
+    out of its response, are failed.
+
+    Args:
+        transfers (list[PaystackTransfer]): At most BULK_TRANSFER_CHUNK_SIZE
+            transfers, each with a recipient.
+
+    Returns:
+        dict[PaystackTransfer, dict]: The transfers that failed, mapped to the
+            Paystack response (or error) to record for them.
+    """
+
+    bulk_transfer_payload = {
+        "currency": SETTLEMENT_CURRENCY,
+        "source": "balance",
+        "transfers": [
+            {
+                "amount": int(transfer.amount),
+                "recipient": transfer.recipient.recipient_code,
+                "reference": str(transfer.paystack_transfer_reference),
+                "reason": transfer.reason,
+            }
+            for transfer in transfers
+        ],
+    }
+
+    try:
+        response = TransferRequests.initiate_bulk_transfer(**bulk_transfer_payload)
+
+    # Handle cases when Paystack response is malformed, or Paystack could not be
+    # reached. Transfers Paystack initiated after all keep their references, so
+    # retrying them is rejected as a duplicate.
+    except (json.decoder.JSONDecodeError, requests.RequestException) as error:
+        paystack_response = {
+            "detail": describe_transfer_initiation_error(error),
+            "error": repr(error),
+        }
+
+        return {transfer: paystack_response for transfer in transfers}
+
+    if not response["status"]:
+        paystack_error = response["message"]
+        logger.error(f"Error intiating Paystack bulk transfer: {paystack_error}")
+
+        return {transfer: response for transfer in transfers}
+
+    transfer_responses = {
+        transfer_response.get("reference"): transfer_response
+        for transfer_response in response.get("data") or []
+    }
+
+    failed_transfers = {}
+
+    for transfer in transfers:
+        transfer_response = transfer_responses.get(
+            str(transfer.paystack_transfer_reference)
+        )
+
+        if transfer_response is None:
+            failed_transfers[transfer] = {
+                "detail": "Transfer missing from Paystack's bulk transfer response",
+                "response": response,
+            }
+        elif transfer_response.get("status") == "failed":
+            failed_transfers[transfer] = transfer_response
+
+    return failed_transfers
+
+
+@shared_task
+def flush_settlement_transfers():
+    """Initiate the queued contribution transfers of bills with batched settlement,
+    with Paystack bulk transfers.
+
+    Run every SETTLEMENT_WINDOW seconds. Enqueues itself again after claiming a full
+    batch, so that a backlog is drained without waiting for the next run.
+    """
+
+    transfers = claim_queued_transfers(SETTLEMENT_FLUSH_BATCH_SIZE)
+
+    failed_transfers = {
+        transfer: {"detail": "Transfer recipient has been deleted"}
+        for transfer in transfers
+        if transfer.recipient is None
+    }
+    transfers_to_initiate = [
+        transfer for transfer in transfers if transfer.recipient is not None
+    ]
+
+    for start in range(0, len(transfers_to_initiate), BULK_TRANSFER_CHUNK_SIZE):
+        failed_transfers.update(
+            initiate_bulk_settlement_transfers(
+                transfers_to_initiate[
+                    start : start + BULK_TRANSFER_CHUNK_SIZE  # noqa E203
+                ]
+            )
+        )
+
+    error_push_parameters_list = []
+
+    for transfer, paystack_response in failed_transfers.items():
+        error_push_parameters_list += fail_settlement_transfer(
+            transfer, paystack_response
+        )
+
+    if error_push_parameters_list:
+        send_push_messages_in_background.delay(error_push_parameters_list)
+
+    if transfers:
+        logger.info(
+            f"Initiated {len(transfers) - len(failed_transfers)} of"
+            f" {len(transfers)} queued transfers."
+        )
+
+    if len(transfers) == SETTLEMENT_FLUSH_BATCH_SIZE:
+        flush_settlement_transfers.delay()
+
+
+@shared_task
+def verify_stale_pending_transfers(batch_size=PENDING_TRANSFER_VERIFICATION_BATCH_SIZE):
+    """Fail the settlement transfers, of actions and arrears, that stayed pending
+    without ever being initiated on Paystack, e.g. as the worker initiating them died.
+
+    Transfers pending for longer than STALE_PENDING_TRANSFER_TIMEOUT are verified by
+    reference, oldest first. Those Paystack does not know are failed, so they can be
+    retried. Those it knows are settled by their webhooks, and are checked again
+    after another timeout.
+
+    Args:
+        batch_size (int): Maximum number of transfers verified per run.
+    """
+
+    now = timezone.now()
+
+    transfers = list(
+        PaystackTransfer.objects.select_related(
+            "action__bill", "arrear", "paying_user", "receiving_user"
+        )
+        .filter(
+            transfer_outcome=PaystackTransfer.TransferOutcomeChoices.PENDING,
+            transfer_type__in=(
+                PaystackTransfer.TransferChoices.CREDITOR_SETTLEMENT,
+                PaystackTransfer.TransferChoices.ARREAR_SETTLEMENT,
+            ),
+            modified__lt=now - STALE_PENDING_TRANSFER_TIMEOUT,
+        )
+        .order_by("modified")[:batch_size]
+    )
+
+    unknown_transfers = []
+    checked_transfer_ids = []
+
+    for transfer in transfers:
+        try:
+            response = TransferRequests.verify(transfer.paystack_transfer_reference)
+        except (json.decoder.JSONDecodeError, requests.RequestException) as error:
+            logger.error(f"Error verifying Paystack transfer {transfer.id}: {error!r}")
+            checked_transfer_ids.append(transfer.id)
+            continue
+
+        if not response["status"] and "not found" in response["message"].lower():
+            unknown_transfers.append((transfer, response))
+        else:
+            checked_transfer_ids.append(transfer.id)
+
+    error_push_parameters_list = []
+
+    for transfer, response in unknown_transfers:
+        error_push_parameters_list += fail_settlement_transfer(
+            transfer,
+            {
+                "detail": "Transfer was never initiated on Paystack",
+                "response": response,
+            },
+        )
+
+    # Moved to the back of the queue, so other stale transfers are checked first.
+    PaystackTransfer.objects.filter(id__in=checked_transfer_ids).update(modified=now)
+
+    if error_push_parameters_list:
+        send_push_messages_in_background.delay(error_push_parameters_list)
+
+    if unknown_transfers:
+        logger.info(
+            f"Failed {len(unknown_transfers)} pending transfers that were never"
+            " initiated on Paystack."
+        )
@@ -1,7 +1,9 @@
 from celery import shared_task
 from celery.utils.log import get_task_logger
 
-from bills.models import BillAction
+from accounts.tasks.notifications import send_push_messages_in_background
+from bills.models import BillAction, BillNotificationEvent
+from bills.utils.notifications import record_bill_notification_events
 from financials.models import (
     PaystackSubscription,
     PaystackTransaction,
@@ -13,7 +15,6 @@ from financials.utils.contributions import (
     process_contribution_transfer,
 )
 from financials.utils.plans import extract_uuids_from_plan_description
-from libraries.notifications.base import send_push_messages
 
 logger = get_task_logger(__name__)
 
@@ -77,37 +78,14 @@ def process_subscription_creation(request_data):
     )
 
     bill = action.bill
-    creditor = action.bill.creditor
 
-    # Handle notifications after all other operations
-    participants_push_parameters_list = [
-        {
-            "token": participant.expo_push_token,
-            "title": f"New subscription on {bill.name}",
-            "message": f"{participant.full_name} has just subscribed to {bill.name}.",
-            "extra": {
-                "action": "open-bill",
-                "bill_name": bill.name,
-                "bill_id": str(bill.uuid),
-            },
-        }
-        for participant_object in action.bill.participants.all()
-        if participant_object.expo_push_token
-        and participant_object.uuid != participant.uuid
-    ]
-
-    receiving_user_push_parameters_list = [
-        {
-            "token": creditor.expo_push_token,
-            "title": f"New subscription on {bill.name}",
-            "message": f"{participant.full_name} has just subscribed to {bill.name}.",
-            "extra": {
-                "action": "open-bill",
-                "bill_name": bill.name,
-                "bill_id": str(bill.uuid),
-            },
-        },
-    ]
+    # Handle notifications after all other operations. Other members are notified
+    # through the outbox, which merges busy bills' notifications before sending.
+    record_bill_notification_events(
+        bill,
+        participant,
+        BillNotificationEvent.EventChoices.SUBSCRIPTION,
+    )
 
     paying_user_push_parameters_list = [
         {
@@ -123,16 +101,10 @@ def process_subscription_creation(request_data):
     ]
 
     filtered_push_parameters_list = [
-        params
-        for params in [
-            *participants_push_parameters_list,
-            *receiving_user_push_parameters_list,
-            *paying_user_push_parameters_list,
-        ]
-        if params["token"]
+        params for params in paying_user_push_parameters_list if params["token"]
     ]
 
-    send_push_messages(filtered_push_parameters_list)
+    send_push_messages_in_background.delay(filtered_push_parameters_list)
 
 
 @shared_task
@@ -0,0 +1,124 @@
+import io
+from datetime import timedelta
+
+from celery import shared_task
+from celery.utils.log import get_task_logger
+from django.db import transaction
+from django.utils import timezone
+from djangorestframework_camel_case.parser import CamelCaseJSONParser
+
+from financials.models import PaystackWebhookEvent
+from financials.utils.paystack_webhook import handle_paystack_webhook_response
+
+logger = get_task_logger(__name__)
+
+WEBHOOK_DISPATCH_BATCH_SIZE = 100
+
+# Events left in the processing state for this long after being claimed are assumed
+# to belong to a worker that died mid-batch and are handed out again.
+STALE_PROCESSING_TIMEOUT = timedelta(minutes=10)
+
+
+def parse_webhook_body(raw_body):
+    """Parse a stored webhook body exactly as DRF parsed it in the webhook view.
+
+    Args:
+        raw_body (str): The webhook body, as stored on the inbox.
+
+    Returns:
+        dict: The parsed request data.
+    """
+
+    return CamelCaseJSONParser().parse(io.BytesIO(raw_body.encode("utf-8")))
+
+
+def claim_pending_webhook_events(batch_size):
+    """Mark a batch of pending events as processing and return them.
+
+    Rows are locked with SKIP LOCKED so concurrent dispatchers never claim the same
+    events. Events already processing are only claimed again once
+    STALE_PROCESSING_TIMEOUT has passed since they were claimed (not received), so
+    old events are not processed twice.
+
+    Args:
+        batch_size (int): Maximum number of events to claim.
+
+    Returns:
+        list[PaystackWebhookEvent]: The claimed events, oldest first.
+    """
+
+    now = timezone.now()
+    stale_before = now - STALE_PROCESSING_TIMEOUT
+
+    with transaction.atomic():
+        events = list(
+            PaystackWebhookEvent.objects.select_for_update(skip_locked=True)
+            .filter(
+                processing_state=PaystackWebhookEvent.ProcessingStateChoices.PENDING
+            )
+            .order_by("received_at")[:batch_size]
+        )
+
+        if len(events) < batch_size:
+            events += list(
+                PaystackWebhookEvent.objects.select_for_update(skip_locked=True)
+                .filter(
+                    processing_state=(
+                        PaystackWebhookEvent.ProcessingStateChoices.PROCESSING
+                    ),
+                    claimed_at__lt=stale_before,
+                )
+                .order_by("received_at")[: batch_size - len(events)]
+            )
+
+        PaystackWebhookEvent.objects.filter(
+            id__in=[event.id for event in events]
+        ).update(
+            processing_state=PaystackWebhookEvent.ProcessingStateChoices.PROCESSING,
+            claimed_at=now,
+        )
+
+    return events
+
+
+@shared_task
+def dispatch_paystack_webhook_events(batch_size=WEBHOOK_DISPATCH_BATCH_SIZE):
+    """Drain the Paystack webhook inbox, routing each event to its handler.
+
+    Enqueued by the webhook view after every new delivery and also run
+    periodically, so events are still processed if an enqueue is lost. Each call
+    processes one batch and re-enqueues itself while a full batch was found.
+
+    Args:
+        batch_size (int): Maximum number of events processed per run.
+
+    Returns:
+        None
+    """
+
+    events = claim_pending_webhook_events(batch_size)
+
+    for event in events:
+        event.attempts += 1
+
+        try:
+            handle_paystack_webhook_response(parse_webhook_body(event.raw_body))
+        except Exception as error:
+            logger.error(f"Error processing Paystack webhook event {event.id}: {error}")
+
+            event.processing_state = PaystackWebhookEvent.ProcessingStateChoices.FAILED
+            event.last_error = repr(error)
+        else:
+            event.processing_state = (
+                PaystackWebhookEvent.ProcessingStateChoices.PROCESSED
+            )
+            event.processed_at = timezone.now()
+
+    if events:
+        PaystackWebhookEvent.objects.bulk_update(
+            events,
+            ["processing_state", "processed_at", "attempts", "last_error"],
+        )
+
+    if len(events) == batch_size:
+        dispatch_paystack_webhook_events.delay(batch_size)
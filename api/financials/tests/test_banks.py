@@ -0,0 +1,81 @@
+import gzip
+import json
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from financials.models import BankDirectorySnapshot
+from financials.tasks.banks import refresh_bank_directory
+from libraries.paystack.bank_requests import BankRequests
+
+User = get_user_model()
+
+
+class BankDirectoryTests(TestCase):
+    def setUp(self) -> None:
+        cache.clear()
+
+        self.user = User.objects.create_user(
+            phone="08010191010",
+            email="user@email.com",
+            username="user",
+            password="testpass123",
+        )
+
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def get_banks(self, **headers):
+        return self.client.get(reverse("financials:banks-list"), **headers)
+
+    def test_banks_are_served_with_an_etag(self) -> None:
+        response = self.get_banks()
+
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("payWithBank", json.loads(response.content)[0])
+        self.assertEqual(BankDirectorySnapshot.objects.count(), 1)
+
+        etag = response.headers["ETag"]
+
+        with self.assertNumQueries(0):
+            response = self.get_banks(HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, 304)
+
+        response = self.get_banks(HTTP_ACCEPT_ENCODING="gzip, deflate")
+        self.assertEqual(response.headers["Content-Encoding"], "gzip")
+        self.assertTrue(json.loads(gzip.decompress(response.content)))
+
+    def test_refresh_creates_a_new_version(self) -> None:
+        etag = self.get_banks().headers["ETag"]
+        banks = [
+            {"id": 9, "name": "Access Bank", "code": "044", "pay_with_bank": False}
+        ]
+
+        with mock.patch.object(
+            BankRequests, "list", return_value={"status": True, "data": banks}
+        ):
+            refresh_bank_directory()
+            refresh_bank_directory()
+
+        self.assertEqual(BankDirectorySnapshot.objects.count(), 2)
+
+        response = self.get_banks(HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            json.loads(response.content),
+            [
+                {
+                    "id": 9,
+                    "name": "Access Bank",
+                    "code": "044",
+                    "payWithBank": False,
+                    "logo": "https://nigerianbanks.xyz/logo/access-bank.png",
+                }
+            ],
+        )
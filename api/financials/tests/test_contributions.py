@@ -0,0 +1,108 @@
+from decimal import Decimal
+from unittest import mock
+
+import requests
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+
+from bills.models import Bill, BillAction
+from bills.utils.bills import create_actions_for_bill
+from financials.models import (
+    PaystackTransaction,
+    PaystackTransfer,
+    TransferRecipient,
+    UserCard,
+)
+from financials.utils.contributions import process_contribution_transfer
+from libraries.paystack.transfer_requests import TransferRequests
+
+User = get_user_model()
+
+
+class ContributionTransferTests(TestCase):
+    def setUp(self) -> None:
+        self.creditor = User.objects.create_user(
+            phone="08010191010",
+            email="creditor@email.com",
+            username="creditor",
+            password="testpass123",
+        )
+        self.participant = User.objects.create_user(
+            phone="08010191011",
+            email="participant@email.com",
+            username="participant",
+            password="testpass123",
+        )
+
+        TransferRecipient.objects.create(
+            is_default=True,
+            recipient_code="RCP_creditor",
+            recipient_type=TransferRecipient.RecipientChoices.ACCOUNT,
+            user=self.creditor,
+            name="Creditor",
+            complete_paystack_response={},
+        )
+        UserCard.objects.create(
+            authorization_code="AUTH_participant",
+            first_6="408408",
+            last_4="4081",
+            exp_month="12",
+            exp_year="2030",
+            channel="card",
+            card_type="visa",
+            bank="Test Bank",
+            country_code="NG",
+            brand="visa",
+            reusable=True,
+            signature="SIG_participant",
+            user=self.participant,
+            complete_paystack_response={},
+        )
+
+        bill = Bill.objects.create(
+            name="Netflix",
+            creator=self.creditor,
+            creditor=self.creditor,
+            total_amount_due=1000,
+        )
+        bill.participants.add(self.participant)
+        create_actions_for_bill(bill)
+
+        self.action = bill.actions.get()
+        self.action.contribution = Decimal("1000")
+        self.action.save(update_fields=["contribution"])
+
+    def test_unreachable_paystack_fails_the_transfer(self) -> None:
+        request_data = {
+            "event": "charge.success",
+            "data": {
+                "id": 1,
+                "amount": 102500,
+                "reference": "charge",
+                "authorization": {"signature": "SIG_participant"},
+            },
+        }
+
+        with mock.patch.object(
+            TransferRequests, "initiate", side_effect=requests.ConnectionError
+        ), mock.patch(
+            "financials.utils.contributions.send_push_messages_in_background"
+        ) as send_push_messages:
+            process_contribution_transfer(
+                str(self.action.uuid),
+                request_data,
+                PaystackTransaction.TransactionChoices.ONE_TIME_CONTRIBUTION,
+            )
+
+        self.action.refresh_from_db()
+        self.assertEqual(self.action.status, BillAction.StatusChoices.FAILED_TRANSFER)
+
+        transfer = PaystackTransfer.objects.get(action=self.action)
+        self.assertEqual(
+            transfer.transfer_outcome, PaystackTransfer.TransferOutcomeChoices.FAILED
+        )
+        self.assertEqual(
+            transfer.complete_paystack_response["detail"],
+            "Transfer failed as Paystack could not be reached",
+        )
+        self.assertEqual(send_push_messages.delay.call_count, 1)
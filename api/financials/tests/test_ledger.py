@@ -0,0 +1,159 @@
+import io
+import uuid
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from bills.models import Bill
+from bills.utils.bills import create_actions_for_bill
+from financials.models import LedgerAccount, PaystackTransaction, PaystackTransfer
+
+User = get_user_model()
+
+
+class LedgerTests(TestCase):
+    def setUp(self) -> None:
+        self.creditor = User.objects.create_user(
+            phone="08010191010",
+            email="creditor@email.com",
+            username="creditor",
+            password="testpass123",
+        )
+        self.participant = User.objects.create_user(
+            phone="08010191011",
+            email="participant@email.com",
+            username="participant",
+            password="testpass123",
+        )
+
+        self.bill = Bill.objects.create(
+            name="Netflix",
+            creator=self.creditor,
+            creditor=self.creditor,
+            total_amount_due=1000,
+        )
+        self.bill.participants.add(self.participant)
+        create_actions_for_bill(self.bill)
+
+        self.action = self.bill.actions.get()
+        self.action.contribution = Decimal("1000")
+        self.action.save(update_fields=["contribution"])
+
+    def charge_participant(self) -> None:
+        PaystackTransaction.objects.create(
+            amount=102500,
+            amount_in_naira=Decimal("1025"),
+            action=self.action,
+            paying_user=self.participant,
+            transaction_outcome=PaystackTransaction.TransactionOutcomeChoices.SUCCESSFUL,
+            transaction_type=(
+                PaystackTransaction.TransactionChoices.ONE_TIME_CONTRIBUTION
+            ),
+            paystack_transaction_id=1,
+            paystack_transaction_reference="charge",
+            complete_paystack_response={},
+        )
+
+    def transfer_to_creditor(self) -> PaystackTransfer:
+        reference = uuid.uuid4()
+
+        return PaystackTransfer.objects.create(
+            amount=100000,
+            amount_in_naira=Decimal("1000"),
+            paystack_transfer_reference=reference,
+            uuid=reference,
+            action=self.action,
+            paying_user=self.participant,
+            receiving_user=self.creditor,
+            transfer_outcome=PaystackTransfer.TransferOutcomeChoices.SUCCESSFUL,
+            transfer_type=PaystackTransfer.TransferChoices.CREDITOR_SETTLEMENT,
+            complete_paystack_response={},
+        )
+
+    def get_balances(self, user, bill=None) -> dict:
+        client = APIClient()
+        client.force_authenticate(user)
+
+        return client.get(
+            reverse("financials:balances"),
+            {"bill": str(bill.uuid)} if bill else {},
+        ).json()
+
+    def get_account(self, key) -> LedgerAccount:
+        return LedgerAccount.objects.get(key=key)
+
+    def test_entries_update_balances(self) -> None:
+        self.charge_participant()
+
+        self.assertEqual(
+            self.get_balances(self.participant)["user"]["totalPaid"], "1025.0000"
+        )
+        self.assertEqual(
+            self.get_balances(self.creditor)["user"]["totalOwed"], "1000.0000"
+        )
+        self.assertEqual(self.get_account("platform").balance, Decimal("25.0000"))
+
+        transfer = self.transfer_to_creditor()
+        # Webhooks may record the same outcome more than once.
+        transfer.save()
+
+        balances = self.get_balances(self.creditor, bill=self.bill)
+        self.assertEqual(balances["user"]["totalReceived"], "1000.0000")
+        self.assertEqual(balances["user"]["totalOwed"], "0.0000")
+        self.assertEqual(balances["bill"]["totalCollected"], "1000.0000")
+        self.assertEqual(balances["bill"]["totalHeld"], "0.0000")
+
+        transfer.transfer_outcome = PaystackTransfer.TransferOutcomeChoices.REVERSED
+        transfer.save(update_fields=["transfer_outcome"])
+
+        balances = self.get_balances(self.creditor)
+        self.assertEqual(balances["user"]["totalReceived"], "0.0000")
+        self.assertEqual(balances["user"]["totalOwed"], "1000.0000")
+
+    def test_bill_balances_are_only_shown_to_its_members(self) -> None:
+        outsider = User.objects.create_user(
+            phone="08010191012",
+            email="outsider@email.com",
+            username="outsider",
+            password="testpass123",
+        )
+        client = APIClient()
+        url = reverse("financials:balances")
+
+        for user, status_code in (
+            (self.participant, 200),
+            (self.creditor, 200),
+            (outsider, 404),
+        ):
+            client.force_authenticate(user)
+
+            with self.subTest(user=user.username):
+                response = client.get(url, {"bill": str(self.bill.uuid)})
+                self.assertEqual(response.status_code, status_code)
+
+        self.assertEqual(client.get(url, {"bill": str(uuid.uuid4())}).status_code, 404)
+        self.assertEqual(client.get(url, {"bill": "not-a-uuid"}).status_code, 404)
+
+    def test_rebuild_replays_the_ledger(self) -> None:
+        self.charge_participant()
+        self.transfer_to_creditor()
+
+        expected_balances = {
+            account.key: (account.debits, account.credits, account.owed)
+            for account in LedgerAccount.objects.all()
+        }
+
+        LedgerAccount.objects.update(debits=0, credits=0, owed=0)
+        call_command("rebuild_ledger", stdout=io.StringIO())
+
+        self.assertEqual(
+            {
+                account.key: (account.debits, account.credits, account.owed)
+                for account in LedgerAccount.objects.all()
+            },
+            expected_balances,
+        )
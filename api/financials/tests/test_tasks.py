@@ -0,0 +1,293 @@
+import uuid
+from unittest import mock
+
+import requests
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from django.utils import timezone
+
+from bills.models import Bill, BillAction, BillArrear
+from bills.utils.bills import create_actions_for_bill
+from financials.models import PaystackTransfer, TransferRecipient
+from financials.tasks.settlements import (
+    STALE_PENDING_TRANSFER_TIMEOUT,
+    claim_queued_transfers,
+    flush_settlement_transfers,
+    verify_stale_pending_transfers,
+)
+from financials.utils.transfers import queue_paystack_transfer
+from libraries.paystack.transfer_requests import TransferRequests
+
+User = get_user_model()
+
+
+class FlushSettlementTransfersTests(TestCase):
+    def setUp(self) -> None:
+        self.creditor = User.objects.create_user(
+            phone="08010191010",
+            email="creditor@email.com",
+            username="creditor",
+            password="testpass123",
+        )
+        self.recipient = TransferRecipient.objects.create(
+            is_default=True,
+            recipient_code="RCP_creditor",
+            recipient_type=TransferRecipient.RecipientChoices.ACCOUNT,
+            user=self.creditor,
+            name="Creditor",
+            complete_paystack_response={},
+        )
+
+        self.bill = Bill.objects.create(
+            name="Netflix",
+            creator=self.creditor,
+            creditor=self.creditor,
+            total_amount_due=2000,
+            settlement_mode=Bill.SettlementChoices.BATCHED,
+        )
+
+        for index in range(2):
+            participant = User.objects.create_user(
+                phone=f"0801019102{index}",
+                email=f"participant{index}@email.com",
+                username=f"participant{index}",
+                password="testpass123",
+            )
+            self.bill.participants.add(participant)
+
+        create_actions_for_bill(self.bill)
+
+    def queue_transfer(self, action) -> PaystackTransfer:
+        transfer_reference = str(uuid.uuid4())
+
+        return queue_paystack_transfer(
+            transfer_reference,
+            {
+                "amount": 100000,
+                "amount_in_naira": 1000,
+                "uuid": transfer_reference,
+                "recipient": self.recipient,
+                "action": action,
+                "paying_user": action.participant,
+                "receiving_user": self.creditor,
+                "transfer_type": PaystackTransfer.TransferChoices.CREDITOR_SETTLEMENT,
+                "reason": "Contribution",
+            },
+            {},
+        )
+
+    def queue_arrear_transfer(self, action) -> PaystackTransfer:
+        arrear = BillArrear.objects.create(
+            bill=self.bill,
+            participant=action.participant,
+            action=action,
+            contribution=1000,
+            status=BillArrear.StatusChoices.PENDING_TRANSFER,
+        )
+        transfer_reference = str(uuid.uuid4())
+
+        return queue_paystack_transfer(
+            transfer_reference,
+            {
+                "amount": 100000,
+                "amount_in_naira": 1000,
+                "uuid": transfer_reference,
+                "recipient": self.recipient,
+                "action": action,
+                "arrear": arrear,
+                "paying_user": action.participant,
+                "receiving_user": self.creditor,
+                "transfer_type": PaystackTransfer.TransferChoices.ARREAR_SETTLEMENT,
+                "reason": "Arrear",
+            },
+            {},
+        )
+
+    def test_queued_transfers_are_initiated_in_bulk(self) -> None:
+        successful_action, failed_action = self.bill.actions.order_by("id")
+
+        successful_transfer = self.queue_transfer(successful_action)
+        failed_transfer = self.queue_transfer(failed_action)
+
+        response = {
+            "status": True,
+            "message": "2 transfers queued.",
+            "data": [
+                {
+                    "reference": str(successful_transfer.paystack_transfer_reference),
+                    "status": "pending",
+                },
+                {
+                    "reference": str(failed_transfer.paystack_transfer_reference),
+                    "status": "failed",
+                },
+            ],
+        }
+
+        with mock.patch.object(
+            TransferRequests, "initiate_bulk_transfer", return_value=response
+        ) as initiate_bulk_transfer:
+            flush_settlement_transfers()
+
+        initiate_bulk_transfer.assert_called_once()
+        self.assertEqual(
+            [
+                transfer["amount"]
+                for transfer in initiate_bulk_transfer.call_args.kwargs["transfers"]
+            ],
+            [100000, 100000],
+        )
+
+        successful_transfer.refresh_from_db()
+        failed_transfer.refresh_from_db()
+        failed_action.refresh_from_db()
+
+        self.assertEqual(
+            successful_transfer.transfer_outcome,
+            PaystackTransfer.TransferOutcomeChoices.PENDING,
+        )
+        self.assertEqual(
+            failed_transfer.transfer_outcome,
+            PaystackTransfer.TransferOutcomeChoices.FAILED,
+        )
+        self.assertEqual(failed_action.status, BillAction.StatusChoices.FAILED_TRANSFER)
+
+        # Flushing again finds nothing left in the queue.
+        with mock.patch.object(
+            TransferRequests, "initiate_bulk_transfer"
+        ) as initiate_bulk_transfer:
+            flush_settlement_transfers()
+
+        initiate_bulk_transfer.assert_not_called()
+
+    def test_unreachable_paystack_fails_the_bulk_transfer(self) -> None:
+        action = self.bill.actions.order_by("id").first()
+        transfer = self.queue_transfer(action)
+
+        with mock.patch.object(
+            TransferRequests, "initiate_bulk_transfer", side_effect=requests.Timeout
+        ):
+            flush_settlement_transfers()
+
+        transfer.refresh_from_db()
+        action.refresh_from_db()
+
+        self.assertEqual(
+            transfer.transfer_outcome, PaystackTransfer.TransferOutcomeChoices.FAILED
+        )
+        self.assertEqual(action.status, BillAction.StatusChoices.FAILED_TRANSFER)
+
+    def test_stale_pending_transfers_unknown_to_paystack_are_failed(self) -> None:
+        unknown_action, known_action = self.bill.actions.order_by("id")
+        unknown_transfer = self.queue_transfer(unknown_action)
+        known_transfer = self.queue_transfer(known_action)
+
+        # The worker initiating the claimed transfers died before calling Paystack.
+        claim_queued_transfers(10)
+
+        with mock.patch.object(TransferRequests, "verify") as verify:
+            verify_stale_pending_transfers()
+
+        verify.assert_not_called()
+
+        PaystackTransfer.objects.update(
+            modified=timezone.now() - STALE_PENDING_TRANSFER_TIMEOUT * 2
+        )
+
+        def verify_transfer(reference):
+            if str(reference) == str(known_transfer.paystack_transfer_reference):
+                return {"status": True, "data": {"status": "pending"}}
+
+            return {"status": False, "message": "Transfer not found"}
+
+        with mock.patch.object(
+            TransferRequests, "verify", side_effect=verify_transfer
+        ) as verify:
+            verify_stale_pending_transfers()
+
+        self.assertEqual(verify.call_count, 2)
+
+        unknown_transfer.refresh_from_db()
+        known_transfer.refresh_from_db()
+        unknown_action.refresh_from_db()
+
+        self.assertEqual(
+            unknown_transfer.transfer_outcome,
+            PaystackTransfer.TransferOutcomeChoices.FAILED,
+        )
+        self.assertEqual(
+            unknown_action.status, BillAction.StatusChoices.FAILED_TRANSFER
+        )
+        self.assertEqual(
+            known_transfer.transfer_outcome,
+            PaystackTransfer.TransferOutcomeChoices.PENDING,
+        )
+
+        # The known transfer is not checked again until it is stale again.
+        with mock.patch.object(TransferRequests, "verify") as verify:
+            verify_stale_pending_transfers()
+
+        verify.assert_not_called()
+
+    def test_queued_arrear_transfers_are_flushed_and_swept(self) -> None:
+        initiated_action, lost_action = self.bill.actions.order_by("id")
+        initiated_transfer = self.queue_arrear_transfer(initiated_action)
+        lost_transfer = self.queue_arrear_transfer(lost_action)
+
+        response = {
+            "status": True,
+            "message": "1 transfer queued.",
+            "data": [
+                {
+                    "reference": str(initiated_transfer.paystack_transfer_reference),
+                    "status": "pending",
+                },
+            ],
+        }
+
+        with mock.patch.object(
+            TransferRequests, "initiate_bulk_transfer", return_value=response
+        ) as initiate_bulk_transfer:
+            flush_settlement_transfers()
+
+        self.assertEqual(len(initiate_bulk_transfer.call_args.kwargs["transfers"]), 2)
+
+        lost_transfer.refresh_from_db()
+        self.assertEqual(
+            lost_transfer.transfer_outcome,
+            PaystackTransfer.TransferOutcomeChoices.FAILED,
+        )
+        self.assertEqual(
+            lost_transfer.arrear.status, BillArrear.StatusChoices.FAILED_TRANSFER
+        )
+
+        # The initiated transfer's bulk request was lost after all, so Paystack
+        # does not know it.
+        PaystackTransfer.objects.filter(id=initiated_transfer.id).update(
+            modified=timezone.now() - STALE_PENDING_TRANSFER_TIMEOUT * 2
+        )
+
+        with mock.patch.object(
+            TransferRequests,
+            "verify",
+            return_value={"status": False, "message": "Transfer not found"},
+        ) as verify:
+            verify_stale_pending_transfers()
+
+        verify.assert_called_once()
+        self.assertEqual(
+            str(verify.call_args.args[0]),
+            str(initiated_transfer.paystack_transfer_reference),
+        )
+
+        initiated_transfer.refresh_from_db()
+        self.assertEqual(
+            initiated_transfer.transfer_outcome,
+            PaystackTransfer.TransferOutcomeChoices.FAILED,
+        )
+        self.assertEqual(
+            initiated_transfer.arrear.status, BillArrear.StatusChoices.FAILED_TRANSFER
+        )
+        self.assertEqual(
+            initiated_transfer.action.status, BillAction.StatusChoices.PENDING
+        )
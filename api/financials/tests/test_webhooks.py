@@ -0,0 +1,63 @@
+import io
+from datetime import timedelta
+from unittest import mock
+
+from django.core.management import call_command
+from django.test import TestCase
+from django.utils import timezone
+
+from financials.models import PaystackWebhookEvent
+from financials.tasks.webhooks import (
+    STALE_PROCESSING_TIMEOUT,
+    claim_pending_webhook_events,
+    dispatch_paystack_webhook_events,
+)
+
+
+class WebhookEventClaimTests(TestCase):
+    def setUp(self) -> None:
+        self.event = PaystackWebhookEvent.objects.create(
+            event="charge.success",
+            delivery_key="charge.success:1",
+            raw_body='{"event": "charge.success", "data": {"id": 1}}',
+        )
+
+        # The event sat in the inbox for longer than the stale timeout.
+        PaystackWebhookEvent.objects.filter(id=self.event.id).update(
+            received_at=timezone.now() - STALE_PROCESSING_TIMEOUT * 3
+        )
+
+    def test_old_event_is_claimed_once(self) -> None:
+        self.assertEqual(claim_pending_webhook_events(10), [self.event])
+        self.assertEqual(claim_pending_webhook_events(10), [])
+
+        self.event.refresh_from_db()
+        self.assertEqual(
+            self.event.processing_state,
+            PaystackWebhookEvent.ProcessingStateChoices.PROCESSING,
+        )
+
+    def test_stale_claim_is_handed_out_again(self) -> None:
+        claim_pending_webhook_events(10)
+
+        PaystackWebhookEvent.objects.filter(id=self.event.id).update(
+            claimed_at=timezone.now() - STALE_PROCESSING_TIMEOUT - timedelta(seconds=1)
+        )
+
+        self.assertEqual(claim_pending_webhook_events(10), [self.event])
+
+    def test_failed_event_is_replayed(self) -> None:
+        PaystackWebhookEvent.objects.filter(id=self.event.id).update(
+            processing_state=PaystackWebhookEvent.ProcessingStateChoices.FAILED
+        )
+
+        with mock.patch.object(dispatch_paystack_webhook_events, "delay") as delay:
+            with self.captureOnCommitCallbacks(execute=True):
+                call_command(
+                    "replay_paystack_webhook_events",
+                    str(self.event.id),
+                    stdout=io.StringIO(),
+                )
+
+        self.assertEqual(delay.call_count, 1)
+        self.assertEqual(claim_pending_webhook_events(10), [self.event])
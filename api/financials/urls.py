@@ -6,6 +6,7 @@ from financials.api.views import (
     DefaultTransferRecipientRetrieveAPIView,
     DefaultTransferRecipientUpdateAPIView,
     FailedAndReversedPaystackTransfersListAPIView,
+    LedgerBalancesAPIView,
     PaystackAccountNumberCheckAPIView,
     PaystackBanksListAPIView,
     PaystackTransferRecipientListAPIView,
@@ -90,4 +91,9 @@ urlpatterns = [
         view=FailedAndReversedPaystackTransfersListAPIView.as_view(),
         name="failed-reversed-transfers",
     ),
+    path(
+        route="balances/",
+        view=LedgerBalancesAPIView.as_view(),
+        name="balances",
+    ),
 ]
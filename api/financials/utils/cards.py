@@ -1,7 +1,7 @@
 from celery.utils.log import get_task_logger
 
 from bills.utils.fees import calculate_all_transaction_fees
-from core.utils.currency import convert_to_naira
+from core.utils.currency import convert_kobo_to_naira
 from financials.models import PaystackTransaction, UserCard
 
 logger = get_task_logger(__name__)
@@ -128,7 +128,7 @@ def create_card_addition_paystack_transaction_object(
     """
 
     amount = data.get("amount")
-    amount_in_naira = convert_to_naira(amount)
+    amount_in_naira = convert_kobo_to_naira(amount)
 
     paystack_transaction_object = {
         "amount": amount,
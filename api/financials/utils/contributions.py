@@ -1,12 +1,14 @@
 import json
 import uuid
 
+import requests
 from celery.utils.log import get_task_logger
 
-from bills.models import BillAction, BillTransaction
-from core.utils.currency import convert_to_kobo_integer, convert_to_naira
+from accounts.tasks.notifications import send_push_messages_in_background
+from bills.models import Bill, BillAction, BillNotificationEvent, BillTransaction
+from bills.utils.notifications import record_bill_notification_events
+from core.utils.currency import convert_kobo_to_naira, convert_minor_units_to_kobo
 from core.utils.dates_and_time import check_date_is_in_past, get_one_day_from_now
-from core.utils.strings import extract_uuidv4s_from_string
 from financials.models import (
     PaystackTransaction,
     PaystackTransfer,
@@ -15,9 +17,13 @@ from financials.models import (
 )
 from financials.utils.transfers import (
     create_paystack_transfer_object,
+    describe_transfer_initiation_error,
     extract_paystack_transaction_id_from_transfer_reason,
+    format_contribution_transfer_error_push_parameters,
+    get_transfer_owner,
+    queue_paystack_transfer,
+    record_pending_paystack_transfer,
 )
-from libraries.notifications.base import send_push_messages
 from libraries.paystack.subscription_requests import SubscriptionRequests
 from libraries.paystack.transaction_requests import TransactionRequests
 from libraries.paystack.transfer_requests import TransferRequests
@@ -175,8 +181,9 @@ def handle_bill_contribution(action):
     bill_name = bill.name
     is_bill_recurring = bill.is_recurring
 
-    amount = action.total_payment_due
-    amount_in_kobo = convert_to_kobo_integer(amount)
+    amount_in_kobo = convert_minor_units_to_kobo(
+        action.get_total_payment_due_minor_units()
+    )
 
     creditor = bill.creditor
     creditor_uuid_string = creditor.uuid.__str__()
@@ -249,7 +256,7 @@ def create_contribution_transaction_object(
     """
 
     amount = data.get("amount")
-    amount_in_naira = convert_to_naira(amount)
+    amount_in_naira = convert_kobo_to_naira(amount)
 
     authorization_signature = data.get("authorization").get("signature")
     card = UserCard.objects.get(
@@ -298,7 +305,9 @@ def process_contribution_transfer(action_id, request_data, transaction_type):
     action.mark_as_pending_transfer()
 
     contribution_amount = action.contribution
-    contribution_amount_in_kobo = convert_to_kobo_integer(contribution_amount)
+    contribution_amount_in_kobo = convert_minor_units_to_kobo(
+        action.get_contribution_minor_units()
+    )
 
     participant = action.participant
     participant_name = participant.full_name
@@ -362,40 +371,22 @@ def process_contribution_transfer(action_id, request_data, transaction_type):
         "reason": transfer_reason,
     }
 
-    error_push_parameters_list = [
-        {
-            "token": participant.expo_push_token,
-            "title": "Contribution transfer error",
-            "message": (
-                "We could not successfully transfer your contribution on"
-                f" {bill.name}. You can retry the transfer in the Halver app for"
-                " free."
-            ),
-            "extra": {
-                "action": "failed-or-reversed-transfer",
-                "bill_name": bill.name,
-                "bill_id": str(bill.uuid),
-            },
-        },
-        {
-            "token": creditor.expo_push_token,
-            "title": "Contribution transfer error",
-            "message": (
-                f"We could not successfully transfer {participant.full_name}'s"
-                f" contribution on {bill.name}. You can retry the transfer in the"
-                " Halver app for free."
-            ),
-            "extra": {
-                "action": "failed-or-reversed-transfer",
-                "bill_name": bill.name,
-                "bill_id": str(bill.uuid),
-            },
-        },
-    ]
+    filtered_error_push_parameters_list = (
+        format_contribution_transfer_error_push_parameters(participant, creditor, bill)
+    )
 
-    filtered_error_push_parameters_list = [
-        params for params in error_push_parameters_list if params["token"]
-    ]
+    if bill.settlement_mode == Bill.SettlementChoices.BATCHED:
+        # Initiated in bulk with other queued transfers by flush_settlement_transfers.
+        queue_paystack_transfer(
+            transfer_reference, failed_paystack_transfer_object_defaults, request_data
+        )
+
+        return
+
+    # Recorded before initiating so the transfer's webhooks can be routed by reference.
+    record_pending_paystack_transfer(
+        transfer_reference, failed_paystack_transfer_object_defaults, request_data
+    )
 
     try:
         # The custom reference passed here would help with idempotence.
@@ -425,13 +416,15 @@ def process_contribution_transfer(action_id, request_data, transaction_type):
                 },
             )
 
-            send_push_messages(filtered_error_push_parameters_list)
+            send_push_messages_in_background.delay(filtered_error_push_parameters_list)
 
             paystack_error = response["message"]
             logger.error(f"Error intiating Paystack transfer: {paystack_error}")
 
-    # Handle cases when Paystack response is malformed.
-    except json.decoder.JSONDecodeError as json_error:
+    # Handle cases when Paystack response is malformed, or Paystack could not be
+    # reached. The transfer is marked failed, so it can be retried with its
+    # reference, which Paystack rejects if the transfer was initiated after all.
+    except (json.decoder.JSONDecodeError, requests.RequestException) as error:
         action.mark_as_failed_transfer()
 
         PaystackTransfer.objects.update_or_create(
@@ -439,14 +432,14 @@ def process_contribution_transfer(action_id, request_data, transaction_type):
             defaults={
                 **failed_paystack_transfer_object_defaults,
                 "complete_paystack_response": {
-                    "detail": "Transfer failed due to malformed data from paystack",
-                    "error": json_error,
+                    "detail": describe_transfer_initiation_error(error),
+                    "error": repr(error),
                     "request_data": request_data,
                 },
             },
         )
 
-        send_push_messages(filtered_error_push_parameters_list)
+        send_push_messages_in_background.delay(filtered_error_push_parameters_list)
 
 
 def finalize_contribution(request_data, transfer_outcome, final_action_status):
@@ -473,17 +466,17 @@ def finalize_contribution(request_data, transfer_outcome, final_action_status):
     # The final contribution is the amount transferred to the creditor.
     amount = data.get("amount")
 
-    action_id = extract_uuidv4s_from_string(reason, position=1)
-    action = (
+    action = get_transfer_owner(
         BillAction.objects.select_related(
             "participant",
             "bill",
             "bill__creditor",
-        )
-        .prefetch_related(
+        ).prefetch_related(
             "bill__participants",
-        )
-        .get(uuid=action_id)
+        ),
+        data,
+        transfers_lookup="paystack_transfers",
+        legacy_uuid_position=1,
     )
     bill = action.bill
     receiving_user = action.bill.creditor
@@ -525,7 +518,7 @@ def finalize_contribution(request_data, transfer_outcome, final_action_status):
 
     bill_transaction_object = {
         "bill": bill,
-        "contribution": convert_to_naira(amount),
+        "contribution": convert_kobo_to_naira(amount),
         "paying_user": paying_user,
         "receiving_user": receiving_user,
         "total_payment": paystack_transaction_object.amount_in_naira,
@@ -534,40 +527,15 @@ def finalize_contribution(request_data, transfer_outcome, final_action_status):
         "paystack_transfer": paystack_transfer_object,
     }
 
-    BillTransaction.objects.create(**bill_transaction_object)
-
-    # Handle notifications after all other operations
-    participants_push_parameters_list = [
-        {
-            "token": participant.expo_push_token,
-            "title": "New contribution",
-            "message": (
-                f"{paying_user.full_name} has just made a contribution on {bill.name}."
-            ),
-            "extra": {
-                "action": "open-bill",
-                "bill_name": bill.name,
-                "bill_id": str(bill.uuid),
-            },
-        }
-        for participant in action.bill.participants.all()
-        if participant.expo_push_token and participant.uuid != paying_user.uuid
-    ]
+    BillTransaction.record_transaction(**bill_transaction_object)
 
-    receiving_user_push_parameters_list = [
-        {
-            "token": receiving_user.expo_push_token,
-            "title": "New contribution",
-            "message": (
-                f"{paying_user.full_name} has just made a contribution on {bill.name}."
-            ),
-            "extra": {
-                "action": "open-bill",
-                "bill_name": bill.name,
-                "bill_id": str(bill.uuid),
-            },
-        },
-    ]
+    # Handle notifications after all other operations. Other members are notified
+    # through the outbox, which merges busy bills' notifications before sending.
+    record_bill_notification_events(
+        bill,
+        paying_user,
+        BillNotificationEvent.EventChoices.CONTRIBUTION,
+    )
 
     paying_user_push_parameters_list = [
         {
@@ -583,13 +551,7 @@ def finalize_contribution(request_data, transfer_outcome, final_action_status):
     ]
 
     filtered_push_parameters_list = [
-        params
-        for params in [
-            *participants_push_parameters_list,
-            *receiving_user_push_parameters_list,
-            *paying_user_push_parameters_list,
-        ]
-        if params["token"]
+        params for params in paying_user_push_parameters_list if params["token"]
     ]
 
-    send_push_messages(filtered_push_parameters_list)
+    send_push_messages_in_background.delay(filtered_push_parameters_list)
@@ -0,0 +1,135 @@
+from core.utils.currency import convert_kobo_to_naira
+from financials.models import (
+    LedgerAccount,
+    LedgerEntry,
+    PaystackTransaction,
+    PaystackTransfer,
+)
+
+EntryChoices = LedgerEntry.EntryChoices
+
+
+def get_amount_in_naira(paystack_object):
+    """Get the amount of a PaystackTransaction or PaystackTransfer in naira."""
+
+    if paystack_object.amount_in_naira is not None:
+        return paystack_object.amount_in_naira
+
+    return convert_kobo_to_naira(paystack_object.amount)
+
+
+def record_paystack_transaction_entries(paystack_transaction):
+    """Post the ledger entries of a successful charge.
+
+    A contribution charge is split into the contribution, which moves from the
+    participant to the bill, and the fees on top of it, which move to the platform.
+    A card addition charge moves to the platform, until it is refunded.
+
+    Args:
+        paystack_transaction (PaystackTransaction): The transaction. Unsuccessful
+            transactions, or those whose user has been deleted, are ignored.
+    """
+
+    if (
+        paystack_transaction.transaction_outcome
+        != PaystackTransaction.TransactionOutcomeChoices.SUCCESSFUL
+        or paystack_transaction.paying_user_id is None
+    ):
+        return
+
+    reference = str(paystack_transaction.uuid)
+    amount = get_amount_in_naira(paystack_transaction)
+    user_account = LedgerAccount.get_for_user(paystack_transaction.paying_user_id)
+
+    if paystack_transaction.action_id is None:
+        LedgerEntry.post(
+            EntryChoices.CHARGE,
+            reference,
+            amount,
+            LedgerAccount.get_for_platform(),
+            user_account,
+        )
+        return
+
+    action = paystack_transaction.action
+    contribution = (
+        paystack_transaction.arrear.contribution
+        if paystack_transaction.arrear_id is not None
+        else action.contribution
+    )
+
+    LedgerEntry.post(
+        EntryChoices.CHARGE,
+        reference,
+        contribution,
+        LedgerAccount.get_for_bill(action.bill_id),
+        user_account,
+    )
+
+    if amount > contribution:
+        LedgerEntry.post(
+            EntryChoices.FEE,
+            reference,
+            amount - contribution,
+            LedgerAccount.get_for_platform(),
+            user_account,
+        )
+
+
+def record_paystack_transfer_entries(paystack_transfer):
+    """Post the ledger entry of a successful or reversed transfer.
+
+    Contribution transfers move money from the bill to its creditor, and card
+    addition refunds from the platform back to the user. A reversal undoes the
+    transfer's entry, if it was posted.
+
+    Args:
+        paystack_transfer (PaystackTransfer): The transfer. Transfers with other
+            outcomes, or whose receiving user has been deleted, are ignored.
+    """
+
+    TransferOutcomeChoices = PaystackTransfer.TransferOutcomeChoices
+
+    if paystack_transfer.receiving_user_id is None:
+        return
+
+    reference = str(paystack_transfer.paystack_transfer_reference)
+
+    if paystack_transfer.transfer_outcome == TransferOutcomeChoices.SUCCESSFUL:
+        if paystack_transfer.action_id is None:
+            entry_type = EntryChoices.REFUND
+            credit_account = LedgerAccount.get_for_platform()
+        else:
+            entry_type = EntryChoices.TRANSFER
+            credit_account = LedgerAccount.get_for_bill(
+                paystack_transfer.action.bill_id
+            )
+
+        LedgerEntry.post(
+            entry_type,
+            reference,
+            get_amount_in_naira(paystack_transfer),
+            LedgerAccount.get_for_user(paystack_transfer.receiving_user_id),
+            credit_account,
+        )
+
+    elif paystack_transfer.transfer_outcome == TransferOutcomeChoices.REVERSED:
+        reversed_entry = (
+            LedgerEntry.objects.select_related("debit_account", "credit_account")
+            .filter(
+                entry_type__in=(EntryChoices.TRANSFER, EntryChoices.REFUND),
+                reference=reference,
+            )
+            .first()
+        )
+
+        if reversed_entry is None:
+            return
+
+        LedgerEntry.post(
+            EntryChoices.REVERSAL,
+            reference,
+            -reversed_entry.amount,
+            reversed_entry.debit_account,
+            reversed_entry.credit_account,
+        )
@@ -1,5 +1,9 @@
 import json
+import uuid
 
+from celery.utils.log import get_task_logger
+
+from bills.models import Bill
 from bills.tasks.arrears import (
     finalize_arrear_contribution,
     process_arrear_updates_and_arrear_contribution_transfer,
@@ -22,9 +26,159 @@ from financials.tasks.subscriptions import (
     process_subscription_creation,
 )
 
+logger = get_task_logger(__name__)
+
 # TODO Ensure all Celery tasks are idempotent to prevent duplicate payouts.
 # TODO Strongly consider changing broker from Redis to RabbitMQ
 
+TransactionChoices = PaystackTransaction.TransactionChoices
+TransferChoices = PaystackTransfer.TransferChoices
+TransferOutcomeChoices = PaystackTransfer.TransferOutcomeChoices
+
+TRANSFER_EVENT_OUTCOMES = {
+    "transfer.success": TransferOutcomeChoices.SUCCESSFUL,
+    "transfer.failed": TransferOutcomeChoices.FAILED,
+    "transfer.reversed": TransferOutcomeChoices.REVERSED,
+}
+
+# The Celery task that handles each transfer event, keyed by the event and the
+# kind of payment the transfer settles. Every task is called with
+# (request_data, transfer_outcome).
+TRANSFER_EVENT_HANDLERS = {
+    ("transfer.success", TransactionChoices.CARD_ADDITION): (
+        record_card_addition_transfer_object
+    ),
+    ("transfer.success", TransactionChoices.ONE_TIME_CONTRIBUTION): (
+        finalize_one_time_contribution
+    ),
+    ("transfer.success", TransactionChoices.SUBSCRIPTION_CONTRIBUTION): (
+        finalize_subscription_contribution
+    ),
+    ("transfer.success", TransactionChoices.ARREAR_CONTRIBUTION): (
+        finalize_arrear_contribution
+    ),
+    ("transfer.failed", TransactionChoices.CARD_ADDITION): (
+        record_card_addition_transfer_object
+    ),
+    ("transfer.failed", TransactionChoices.ONE_TIME_CONTRIBUTION): (
+        record_contribution_transfer_object
+    ),
+    ("transfer.failed", TransactionChoices.SUBSCRIPTION_CONTRIBUTION): (
+        record_contribution_transfer_object
+    ),
+    ("transfer.failed", TransactionChoices.ARREAR_CONTRIBUTION): (
+        record_arrear_contribution_transfer_object
+    ),
+    ("transfer.reversed", TransactionChoices.CARD_ADDITION): (
+        record_card_addition_transfer_object
+    ),
+    ("transfer.reversed", TransactionChoices.ONE_TIME_CONTRIBUTION): (
+        record_contribution_transfer_object
+    ),
+    ("transfer.reversed", TransactionChoices.SUBSCRIPTION_CONTRIBUTION): (
+        record_contribution_transfer_object
+    ),
+    ("transfer.reversed", TransactionChoices.ARREAR_CONTRIBUTION): (
+        record_arrear_contribution_transfer_object
+    ),
+}
+
+# Creditor settlements settle one-time or subscription contributions, depending on
+# whether the bill is recurring, so they are resolved separately.
+TRANSFER_TYPE_PAYMENTS = {
+    TransferChoices.CARD_ADDITION_REFUND: TransactionChoices.CARD_ADDITION,
+    TransferChoices.ARREAR_SETTLEMENT: TransactionChoices.ARREAR_CONTRIBUTION,
+}
+
+# Used only for transfers initiated before transfers were recorded ahead of being
+# initiated, which have no PaystackTransfer object to look up.
+LEGACY_TRANSFER_REASON_PREFIXES = (
+    ("Refund for card creation", TransactionChoices.CARD_ADDITION),
+    (
+        f"{TransactionChoices.ONE_TIME_CONTRIBUTION.label} transfer for action",
+        TransactionChoices.ONE_TIME_CONTRIBUTION,
+    ),
+    (
+        f"{TransactionChoices.SUBSCRIPTION_CONTRIBUTION.label} transfer for action",
+        TransactionChoices.SUBSCRIPTION_CONTRIBUTION,
+    ),
+    (
+        f"{TransactionChoices.ARREAR_CONTRIBUTION.label} transfer for arrear",
+        TransactionChoices.ARREAR_CONTRIBUTION,
+    ),
+)
+
+
+def get_transfer_payment_type(data):
+    """Work out what kind of payment a Paystack transfer settles.
+
+    Found with a single indexed lookup of the transfer's reference. Transfers
+    without a PaystackTransfer object fall back to matching their reason.
+
+    Args:
+        data (dict): The `data` object of a Paystack transfer webhook.
+
+    Returns:
+        PaystackTransaction.TransactionChoices | None: The payment type, or None if
+            the transfer was not made by Halver.
+    """
+
+    try:
+        reference = uuid.UUID(str(data.get("reference")))
+    except ValueError:
+        reference = None
+
+    transfer = None
+
+    if reference is not None:
+        transfer = (
+            PaystackTransfer.objects.filter(paystack_transfer_reference=reference)
+            .values_list("transfer_type", "action__bill__interval")
+            .first()
+        )
+
+    if transfer is not None:
+        transfer_type, bill_interval = transfer
+
+        if transfer_type == TransferChoices.CREDITOR_SETTLEMENT:
+            return (
+                TransactionChoices.ONE_TIME_CONTRIBUTION
+                if bill_interval == Bill.IntervalChoices.NONE
+                else TransactionChoices.SUBSCRIPTION_CONTRIBUTION
+            )
+
+        return TRANSFER_TYPE_PAYMENTS.get(transfer_type)
+
+    reason = data.get("reason") or ""
+
+    for prefix, payment_type in LEGACY_TRANSFER_REASON_PREFIXES:
+        if reason.startswith(prefix):
+            return payment_type
+
+    return None
+
+
+def handle_paystack_transfer_event(request_data):
+    """Route a transfer.* webhook event to the task that handles it.
+
+    Args:
+        request_data (dict): The data received from the Paystack webhook.
+
+    Returns:
+        None
+    """
+
+    event = request_data.get("event")
+    payment_type = get_transfer_payment_type(request_data.get("data"))
+
+    handler = TRANSFER_EVENT_HANDLERS.get((event, payment_type))
+
+    if handler is None:
+        logger.warning(f"No handler for Paystack {event} event ({payment_type}).")
+        return
+
+    handler.delay(request_data, TRANSFER_EVENT_OUTCOMES[event])
+
 
 def handle_paystack_webhook_response(request_data):
     """Handle Paystack webhook response.
@@ -47,16 +201,6 @@ def handle_paystack_webhook_response(request_data):
     event = request_data.get("event")
     data = request_data.get("data")
 
-    one_time_contribution_label = (
-        PaystackTransaction.TransactionChoices.ONE_TIME_CONTRIBUTION.label
-    )
-    subscription_contribution_label = (
-        PaystackTransaction.TransactionChoices.SUBSCRIPTION_CONTRIBUTION.label
-    )
-    arrear_contribution_label = (
-        PaystackTransaction.TransactionChoices.ARREAR_CONTRIBUTION.label
-    )
-
     if event == "charge.success":
         metadata = data.get("metadata")
         plan = data.get("plan")
@@ -87,110 +231,8 @@ def handle_paystack_webhook_response(request_data):
     if event == "subscription.create":
         process_subscription_creation.delay(request_data)
 
-    if event == "transfer.success":
-        reason = data.get("reason")
-
-        is_card_addition_refund = reason.startswith("Refund for card creation")
-        is_one_time_contribution_transfer = reason.startswith(
-            f"{one_time_contribution_label} transfer for action"
-        )
-        is_subscription_contribution_transfer = reason.startswith(
-            f"{subscription_contribution_label} transfer for action"
-        )
-        is_arrear_contribution_transfer = reason.startswith(
-            f"{arrear_contribution_label} transfer for arrear"
-        )
-
-        if is_card_addition_refund:
-            record_card_addition_transfer_object.delay(
-                request_data,
-                PaystackTransfer.TransferOutcomeChoices.SUCCESSFUL,
-            )
-
-        if is_one_time_contribution_transfer:
-            finalize_one_time_contribution.delay(request_data)
-
-        if is_subscription_contribution_transfer:
-            finalize_subscription_contribution.delay(request_data)
-
-        if is_arrear_contribution_transfer:
-            finalize_arrear_contribution.delay(request_data)
-
-    if event == "transfer.failed":
-        reason = data.get("reason")
-
-        is_card_addition_refund = reason.startswith("Refund for card creation")
-        is_one_time_contribution_transfer = reason.startswith(
-            f"{one_time_contribution_label} transfer for action"
-        )
-        is_subscription_contribution_transfer = reason.startswith(
-            f"{subscription_contribution_label} transfer for action"
-        )
-        is_arrear_contribution_transfer = reason.startswith(
-            f"{arrear_contribution_label} transfer for arrear"
-        )
-
-        if is_card_addition_refund:
-            record_card_addition_transfer_object.delay(
-                request_data,
-                PaystackTransfer.TransferOutcomeChoices.FAILED,
-            )
-
-        if is_one_time_contribution_transfer:
-            record_contribution_transfer_object.delay(
-                request_data,
-                PaystackTransfer.TransferOutcomeChoices.FAILED,
-            )
-
-        if is_subscription_contribution_transfer:
-            record_contribution_transfer_object.delay(
-                request_data,
-                PaystackTransfer.TransferOutcomeChoices.FAILED,
-            )
-
-        if is_arrear_contribution_transfer:
-            record_arrear_contribution_transfer_object.delay(
-                request_data,
-                PaystackTransfer.TransferOutcomeChoices.FAILED,
-            )
-
-    if event == "transfer.reversed":
-        reason = data.get("reason")
-
-        is_card_addition_refund = reason.startswith("Refund for card creation")
-        is_one_time_contribution_transfer = reason.startswith(
-            f"{one_time_contribution_label} transfer for action"
-        )
-        is_subscription_contribution_transfer = reason.startswith(
-            f"{subscription_contribution_label} transfer for action"
-        )
-        is_arrear_contribution_transfer = reason.startswith(
-            f"{arrear_contribution_label} transfer for arrear"
-        )
-
-        if is_card_addition_refund:
-            record_card_addition_transfer_object.delay(
-                request_data,
-                PaystackTransfer.TransferOutcomeChoices.REVERSED,
-            )
-
-        if is_one_time_contribution_transfer:
-            record_contribution_transfer_object.delay(
-                request_data,
-                PaystackTransfer.TransferOutcomeChoices.REVERSED,
-            )
-
-        if is_subscription_contribution_transfer:
-            record_contribution_transfer_object.delay(
-                request_data,
-                PaystackTransfer.TransferOutcomeChoices.REVERSED,
-            )
-
-        if is_arrear_contribution_transfer:
-            record_arrear_contribution_transfer_object.delay(
-                request_data,
-                PaystackTransfer.TransferOutcomeChoices.REVERSED,
-            )
+    if event in TRANSFER_EVENT_OUTCOMES:
+        handle_paystack_transfer_event(request_data)
 
     if event == "invoice.create":
         print("INVOICE CREATED", json.dumps(request_data))
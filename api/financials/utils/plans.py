@@ -1,7 +1,7 @@
 from celery.utils.log import get_task_logger
 from django.db import transaction
 
-from core.utils.currency import convert_to_kobo_integer, convert_to_naira
+from core.utils.currency import convert_kobo_to_naira, convert_minor_units_to_kobo
 from financials.models import PaystackPlan, PaystackPlanFailure
 
 logger = get_task_logger(__name__)
@@ -42,7 +42,9 @@ def format_paystack_plan_payloads(bill_actions):
         # ! The subscription flow is heavily dependent on the uuids in it.
 
         name = f"Plan for {user_name} on the '{action.bill.name}' bill."
-        amount_in_kobo = convert_to_kobo_integer(action.total_payment_due)
+        amount_in_kobo = convert_minor_units_to_kobo(
+            action.get_total_payment_due_minor_units()
+        )
         interval = action.bill.interval
         description = (
             f"{user_uuid_string}. Action id: {action.uuid}. Bill id:"
@@ -206,7 +208,7 @@ def create_paystack_plan_objects(
             plan_code = plan_response["data"]["plan_code"]
             amount = plan_response["data"]["amount"]
 
-            amount_in_naira = convert_to_naira(amount)
+            amount_in_naira = convert_kobo_to_naira(amount)
 
             paystack_plan_object = PaystackPlan(
                 name=name,
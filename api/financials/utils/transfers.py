@@ -1,4 +1,7 @@
-from core.utils.currency import convert_to_naira
+import json
+
+from core.utils.currency import convert_kobo_to_naira
+from core.utils.strings import extract_uuidv4s_from_string
 from financials.models import PaystackTransfer
 
 
@@ -33,7 +36,7 @@ def create_paystack_transfer_object(
     data = request_data.get("data")
 
     amount = data.get("amount")
-    amount_in_naira = convert_to_naira(amount)
+    amount_in_naira = convert_kobo_to_naira(amount)
 
     paystack_transfer_reference = data.get("reference")
 
@@ -100,3 +103,159 @@ def extract_paystack_transaction_id_from_transfer_reason(reason: str):
     # return None
     else:
         return None
+
+
+def record_pending_paystack_transfer(
+    transfer_reference, paystack_transfer_object_defaults, request_data
+) -> PaystackTransfer:
+    """Record a transfer as pending just before it is initiated on Paystack.
+
+    Webhooks for the transfer are routed (and their owning action, arrear or user
+    found) by looking this object up on its reference, so it must exist before
+    Paystack can send one.
+
+    Args:
+        transfer_reference (str): The reference the transfer will be initiated with.
+        paystack_transfer_object_defaults (dict): Field values for the transfer
+            object. Any transfer_outcome in it is overridden.
+        request_data (dict): The JSON request data that triggered the transfer.
+
+    Returns:
+        PaystackTransfer: The pending PaystackTransfer object.
+    """
+
+    transfer, created = PaystackTransfer.objects.update_or_create(
+        paystack_transfer_reference=transfer_reference,
+        defaults={
+            **paystack_transfer_object_defaults,
+            "transfer_outcome": PaystackTransfer.TransferOutcomeChoices.PENDING,
+            "complete_paystack_response": {"request_data": request_data},
+        },
+    )
+
+    return transfer
+
+
+def describe_transfer_initiation_error(error) -> str:
+    """Describe why a transfer could not be initiated, for the transfer's record.
+
+    Args:
+        error (Exception): The error raised while initiating the transfer.
+
+    Returns:
+        str: The description.
+    """
+
+    if isinstance(error, json.decoder.JSONDecodeError):
+        return "Transfer failed due to malformed data from paystack"
+
+    return "Transfer failed as Paystack could not be reached"
+
+
+def get_transfer_owner(queryset, data, transfers_lookup, legacy_uuid_position):
+    """Get the object (action, arrear or user) a Paystack transfer was made for.
+
+    The owner is found with an indexed lookup on the transfer reference, which is
+    recorded with the transfer before it is initiated. Transfers initiated before
+    that was the case are matched by the UUID in their reason instead.
+
+    Args:
+        queryset (QuerySet): The queryset to get the owner from, e.g.
+            BillAction.objects.select_related("bill").
+        data (dict): The `data` object of a Paystack transfer webhook.
+        transfers_lookup (str): The name of the reverse relation from the owner's
+            model to PaystackTransfer, e.g. "paystack_transfers".
+        legacy_uuid_position (int): Position of the owner's UUID in the transfer
+            reason. Passed to extract_uuidv4s_from_string.
+
+    Returns:
+        Model: The owner of the transfer.
+    """
+
+    reference_lookup = f"{transfers_lookup}__paystack_transfer_reference"
+
+    try:
+        return queryset.get(**{reference_lookup: data.get("reference")})
+    except queryset.model.DoesNotExist:
+        owner_uuid = extract_uuidv4s_from_string(
+            data.get("reason"), position=legacy_uuid_position
+        )
+        return queryset.get(uuid=owner_uuid)
+
+
+def queue_paystack_transfer(
+    transfer_reference, paystack_transfer_object_defaults, request_data
+) -> PaystackTransfer:
+    """Record a transfer as queued, to be initiated in bulk with other queued
+    transfers by the flush_settlement_transfers task.
+
+    Used instead of record_pending_paystack_transfer (and initiating the transfer)
+    for bills whose settlement mode is batched.
+
+    Args:
+        transfer_reference (str): The reference the transfer will be initiated with.
+        paystack_transfer_object_defaults (dict): Field values for the transfer
+            object. Any transfer_outcome in it is overridden.
+        request_data (dict): The JSON request data that triggered the transfer.
+
+    Returns:
+        PaystackTransfer: The queued PaystackTransfer object.
+    """
+
+    transfer, created = PaystackTransfer.objects.update_or_create(
+        paystack_transfer_reference=transfer_reference,
+        defaults={
+            **paystack_transfer_object_defaults,
+            "transfer_outcome": PaystackTransfer.TransferOutcomeChoices.QUEUED,
+            "complete_paystack_response": {"request_data": request_data},
+        },
+    )
+
+    return transfer
+
+
+def format_contribution_transfer_error_push_parameters(participant, creditor, bill):
+    """Format the push notifications sent to a participant and a bill's creditor
+    when the transfer of the participant's contribution could not be initiated.
+
+    Args:
+        participant (CustomUser): The participant who made the contribution.
+        creditor (CustomUser): The creditor of the bill.
+        bill (Bill): The bill contributed to.
+
+    Returns:
+        list[dict]: The push parameters, leaving out users without a push token.
+    """
+
+    error_push_parameters_list = [
+        {
+            "token": participant.expo_push_token,
+            "title": "Contribution transfer error",
+            "message": (
+                "We could not successfully transfer your contribution on"
+                f" {bill.name}. You can retry the transfer in the Halver app for"
+                " free."
+            ),
+            "extra": {
+                "action": "failed-or-reversed-transfer",
+                "bill_name": bill.name,
+                "bill_id": str(bill.uuid),
+            },
+        },
+        {
+            "token": creditor.expo_push_token,
+            "title": "Contribution transfer error",
+            "message": (
+                f"We could not successfully transfer {participant.full_name}'s"
+                f" contribution on {bill.name}. You can retry the transfer in the"
+                " Halver app for free."
+            ),
+            "extra": {
+                "action": "failed-or-reversed-transfer",
+                "bill_name": bill.name,
+                "bill_id": str(bill.uuid),
+            },
+        },
+    ]
+
+    return [params for params in error_push_parameters_list if params["token"]]
@@ -1,15 +1,38 @@
-import time
+"""Expo push notification delivery.
+
+Messages are split into chunks of at most EXPO_PUSH_CHUNK_SIZE (Expo's per-request
+limit) and the chunks are sent concurrently over one pooled requests.Session.
+Nothing here sleeps or retries: failures that are worth retrying are handed back
+to the caller (see accounts.tasks.notifications) so they can be rescheduled.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 
 import requests
 import sentry_sdk
+from environs import Env
 from exponent_server_sdk import (
     DeviceNotRegisteredError,
+    MessageRateExceededError,
     PushClient,
     PushMessage,
     PushServerError,
+    PushTicket,
     PushTicketError,
 )
-from requests.exceptions import ConnectionError, HTTPError
+from requests.adapters import HTTPAdapter
+from requests.exceptions import ConnectionError, HTTPError, Timeout
+
+env = Env()
+env.read_env()
+
+# Expo's limits on the number of messages (or receipt ids) per request.
+EXPO_PUSH_CHUNK_SIZE = 100
+EXPO_RECEIPT_CHUNK_SIZE = 1000
+
+# Maximum number of chunks sent to Expo at the same time (and pooled connections).
+EXPO_PUSH_CONCURRENCY = env.int("EXPO_PUSH_CONCURRENCY", default=6)
 
 # Optionally providing an access token within a session if you have enabled push security
 session = requests.Session()
@@ -21,127 +44,141 @@ session.headers.update(
         "content-type": "application/json",
     }
 )
+session.mount(
+    "https://",
+    HTTPAdapter(pool_connections=1, pool_maxsize=EXPO_PUSH_CONCURRENCY),
+)
 
-# Constants in seconds
-MAX_RETRIES = 3
-INITIAL_RETRY_DELAY = 30
 
+@dataclass
+class PushDeliveryResult:
+    """The outcome of sending a list of push messages.
 
-# Function to calculate exponential backoff delay
-def calculate_backoff_delay(retry_count):
+    Attributes:
+        tickets: PushTickets for messages Expo accepted. Their ids can be used to
+            check delivery receipts later.
+        retryable_push_parameters: Push parameters of messages that could not be
+            sent because of a transient error, and should be sent again later.
+        unregistered_tokens: Push tokens Expo reported as no longer registered.
     """
-    Calculate the exponential backoff delay for retrying a failed operation.
+
+    tickets: list = field(default_factory=list)
+    retryable_push_parameters: list = field(default_factory=list)
+    unregistered_tokens: set = field(default_factory=set)
+
+    def merge(self, other):
+        self.tickets.extend(other.tickets)
+        self.retryable_push_parameters.extend(other.retryable_push_parameters)
+        self.unregistered_tokens.update(other.unregistered_tokens)
+
+
+def chunk_list(items, chunk_size):
+    """Split a list into consecutive chunks of at most chunk_size items.
 
     Args:
-        retry_count (int): The current retry count.
+        items (list): The list to split.
+        chunk_size (int): Maximum number of items per chunk.
 
     Returns:
-        int: The backoff delay in seconds.
+        list[list]: The chunks.
     """
 
-    return INITIAL_RETRY_DELAY * (2**retry_count)
+    return [
+        items[start : start + chunk_size]  # noqa E203
+        for start in range(0, len(items), chunk_size)
+    ]
 
 
-# Basic arguments. You should extend this function with the push features you
-# want to use, or simply pass in a `PushMessage` object.
-def send_push_message(
-    token, message, extra=None, title=None, subtitle=None, sound="default"
-):
-    """Send a push message to a specific device token.
+def create_push_message(push_parameters):
+    """Create a PushMessage from a dictionary of push parameters.
 
     Args:
-        token (str): The device token to which the message will be sent.
-        message (str): The message to send.
-        extra (dict, optional): Additional data to include with the push message.
-        title (str, optional): The title of the push message.
-        subtitle (str, optional): The subtitle of the push message.
+        push_parameters (dict): A dictionary with 'token', 'message', and optionally
+            'extra', 'title', 'subtitle' and 'sound' keys.
 
     Returns:
-        dict: The response from the push server.
+        PushMessage
+    """
+
+    return PushMessage(
+        to=push_parameters.get("token"),
+        body=push_parameters.get("message"),
+        data=push_parameters.get("extra"),
+        title=push_parameters.get("title"),
+        subtitle=push_parameters.get("subtitle"),
+        sound=push_parameters.get("sound") or "default",
+    )
+
 
-    Raises:
-        PushServerError: If there is an error on the push server side.
-        ConnectionError: If there is a connection error.
-        HTTPError: If there is an HTTP error.
+def publish_push_chunk(push_parameters_chunk):
+    """Send a single chunk of push messages to Expo.
+
+    Args:
+        push_parameters_chunk (list): Up to EXPO_PUSH_CHUNK_SIZE push parameters.
+
+    Returns:
+        PushDeliveryResult: The outcome of the chunk.
     """
 
-    retries = 0
-    successful = False
+    result = PushDeliveryResult()
 
-    while retries < MAX_RETRIES and not successful:
-        try:
-            response = PushClient(session=session).publish(
-                PushMessage(
-                    to=token,
-                    body=message,
-                    data=extra,
-                    title=title,
-                    subtitle=subtitle,
-                    sound=sound,
-                )
-            )
-            successful = True
-            return response
+    try:
+        push_tickets = PushClient(session=session).publish_multiple(
+            [create_push_message(item) for item in push_parameters_chunk]
+        )
 
-        except PushServerError as exc:
-            # Encountered some likely formatting/validation error.
-            with sentry_sdk.push_scope() as scope:
-                scope.set_extra("token", token)
-                scope.set_extra("message", message)
-                scope.set_extra("extra", extra)
-                scope.set_extra("title", title)
-                scope.set_extra("subtitle", subtitle)
-                scope.set_extra("errors", exc.errors)
-                scope.set_extra("response_data", exc.response_data)
-                sentry_sdk.capture_exception(exc)
-                raise
+    except PushServerError as exc:
+        # Encountered some likely formatting/validation error. Retrying won't help.
+        with sentry_sdk.push_scope() as scope:
+            scope.set_extra("push_parameters_list", push_parameters_chunk)
+            scope.set_extra("errors", exc.errors)
+            scope.set_extra("response_data", exc.response_data)
+            sentry_sdk.capture_exception(exc)
 
-        except (ConnectionError, HTTPError) as exc:
-            # Encountered some Connection or HTTP error - retry a few times in
-            # case it is transient.
-            with sentry_sdk.push_scope() as scope:
-                scope.set_extra("token", token)
-                scope.set_extra("message", message)
-                scope.set_extra("extra", extra)
-                scope.set_extra("title", title)
-                scope.set_extra("subtitle", subtitle)
-                sentry_sdk.capture_exception(exc)
+        return result
 
-            backoff_delay = calculate_backoff_delay(retries)
+    except (ConnectionError, HTTPError, Timeout) as exc:
+        # Encountered some Connection or HTTP error - the whole chunk can be sent
+        # again later in case it is transient.
+        with sentry_sdk.push_scope() as scope:
+            scope.set_extra("push_parameters_list", push_parameters_chunk)
+            sentry_sdk.capture_exception(exc)
 
-            time.sleep(backoff_delay)
-            retries += 1
+        result.retryable_push_parameters.extend(push_parameters_chunk)
+        return result
 
+    # Tickets are returned in the same order as the messages sent.
+    for push_parameters, push_ticket in zip(push_parameters_chunk, push_tickets):
         try:
-            # We got a response back, but we don't know whether it's an error yet.
             # This call raises errors so we can handle them with normal exception
             # flows.
-            response.validate_response()
+            push_ticket.validate_response()
+            result.tickets.append(push_ticket)
 
         except DeviceNotRegisteredError:
-            # Mark the push token as inactive
-            break
+            result.unregistered_tokens.add(push_parameters.get("token"))
+
+        except MessageRateExceededError:
+            result.retryable_push_parameters.append(push_parameters)
 
         except PushTicketError as exc:
             # Encountered some other per-notification error.
             with sentry_sdk.push_scope() as scope:
-                scope.set_extra("token", token)
-                scope.set_extra("message", message)
-                scope.set_extra("extra", extra)
-                scope.set_extra("title", title)
-                scope.set_extra("subtitle", subtitle)
+                scope.set_extra("push_parameters", push_parameters)
                 scope.set_extra("push_response", exc.push_response._asdict())
                 sentry_sdk.capture_exception(exc)
 
-            backoff_delay = calculate_backoff_delay(retries)
-
-            time.sleep(backoff_delay)
-            retries += 1
+    return result
 
 
 def send_push_messages(push_parameters_list):
     """Send multiple push messages to different device tokens.
 
+    The messages are sent in chunks of EXPO_PUSH_CHUNK_SIZE, up to
+    EXPO_PUSH_CONCURRENCY chunks at a time. Use
+    accounts.tasks.notifications.send_push_messages_in_background to also retry
+    transient failures and clear unregistered tokens.
+
     Args:
         push_parameters_list (list): A list of dictionaries containing push parameters
                                      for each message. Each dictionary should have
@@ -149,76 +186,63 @@ def send_push_messages(push_parameters_list):
                                      'subtitle' keys.
 
     Returns:
-        dict: The response from the push server.
-
-    Raises:
-        PushServerError: If there is an error on the push server side.
-        ConnectionError: If there is a connection error.
-        HTTPError: If there is an HTTP error.
+        PushDeliveryResult: The combined outcome of all chunks.
     """
 
-    retries = 0
-    successful = False
+    result = PushDeliveryResult()
+    chunks = chunk_list(push_parameters_list, EXPO_PUSH_CHUNK_SIZE)
 
-    while retries < MAX_RETRIES and not successful and push_parameters_list:
-        try:
-            # Create PushMessage objects inside the method
-            push_messages = [
-                PushMessage(
-                    to=item.get("token"),
-                    body=item.get("message"),
-                    data=item.get("extra"),
-                    title=item.get("title"),
-                    subtitle=item.get("subtitle"),
-                    sound=item.get("sound") or "default",
-                )
-                for item in push_parameters_list
-            ]
-            response = PushClient(session=session).publish_multiple(push_messages)
+    if len(chunks) == 1:
+        result.merge(publish_push_chunk(chunks[0]))
 
-            successful = True
-            return response
+    elif chunks:
+        with ThreadPoolExecutor(max_workers=EXPO_PUSH_CONCURRENCY) as executor:
+            for chunk_result in executor.map(publish_push_chunk, chunks):
+                result.merge(chunk_result)
 
-        except PushServerError as exc:
-            # Encountered some likely formatting/validation error.
-            with sentry_sdk.push_scope() as scope:
-                scope.set_extra("push_parameters_list", push_parameters_list)
-                scope.set_extra("errors", exc.errors)
-                scope.set_extra("response_data", exc.response_data)
-                sentry_sdk.capture_exception(exc)
-                raise
+    return result
 
-        except (ConnectionError, HTTPError) as exc:
-            # Encountered some Connection or HTTP error - retry a few times in
-            # case it is transient.
-            with sentry_sdk.push_scope() as scope:
-                scope.set_extra("push_parameters_list", push_parameters_list)
-                sentry_sdk.capture_exception(exc)
 
-            backoff_delay = calculate_backoff_delay(retries)
+def get_unregistered_push_ticket_ids(ticket_ids):
+    """Check the delivery receipts of sent push messages.
 
-            time.sleep(backoff_delay)
-            retries += 1
+    Expo keeps receipts for 24 hours and recommends checking them about 15 minutes
+    after sending.
 
-        try:
-            # We got a response back, but we don't know whether it's an error yet.
-            # This call raises errors so we can handle them with normal exception
-            # flows.
-            for push_ticket in response:
-                push_ticket.validate_response()
+    Args:
+        ticket_ids (list): Ids of PushTickets returned when the messages were sent.
 
-        except DeviceNotRegisteredError:
-            # Mark the push tokens as inactive
-            break
+    Returns:
+        set: Ids of tickets whose device was reported as no longer registered.
+    """
 
-        except PushTicketError as exc:
-            # Encountered some other per-notification error.
-            with sentry_sdk.push_scope() as scope:
-                scope.set_extra("push_parameters_list", push_parameters_list)
-                scope.set_extra("push_response", exc.push_response._asdict())
-                sentry_sdk.capture_exception(exc)
+    unregistered_ticket_ids = set()
+    push_client = PushClient(session=session)
+
+    for ticket_ids_chunk in chunk_list(ticket_ids, EXPO_RECEIPT_CHUNK_SIZE):
+        receipts = push_client.check_receipts(
+            [
+                PushTicket(
+                    push_message=None,
+                    status=None,
+                    message=None,
+                    details=None,
+                    id=ticket_id,
+                )
+                for ticket_id in ticket_ids_chunk
+            ]
+        )
+
+        for receipt in receipts:
+            try:
+                receipt.validate_response()
+
+            except DeviceNotRegisteredError:
+                unregistered_ticket_ids.add(receipt.id)
 
-            backoff_delay = calculate_backoff_delay(retries)
+            except PushTicketError as exc:
+                with sentry_sdk.push_scope() as scope:
+                    scope.set_extra("push_receipt", receipt._asdict())
+                    sentry_sdk.capture_exception(exc)
 
-            time.sleep(backoff_delay)
-            retries += 1
+    return unregistered_ticket_ids
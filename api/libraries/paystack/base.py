@@ -3,13 +3,20 @@
 Initially based on patterns used by the paystackapi package.
 https://github.com/andela-sjames/paystack-python Modified to allow for
 asynchronous requests.
+
+Connections are pooled per process. A single keep-alive requests.Session serves
+all synchronous calls and one aiohttp.ClientSession is kept per event loop for
+asynchronous calls, so repeated calls do not pay for a fresh TCP+TLS handshake.
 """
 
+import asyncio
+import os
 from typing import Any
 
 import aiohttp
 import requests
 from environs import Env
+from requests.adapters import HTTPAdapter
 
 env = Env()
 env.read_env()
@@ -20,6 +27,10 @@ PAYSTACK_SECRET_KEY = env.str(
 )
 PAYSTACK_API_BASE_URL = "https://api.paystack.co/"
 
+# Maximum number of connections kept open to Paystack by each process (sync and
+# async pools are sized separately).
+PAYSTACK_POOL_SIZE = env.int("PAYSTACK_POOL_SIZE", default=20)
+
 
 class Borg:
     """Borg class making class attributes global.
@@ -65,22 +76,116 @@ class PaystackRequest(object):
         self,
         api_base_url="https://api.paystack.co/",
         headers=None,
+        pool_size=PAYSTACK_POOL_SIZE,
     ):
         """Initialize Paystack Request object for browsing resource.
 
         Args:
             api_base_url: str
             headers: dict
+            pool_size: int. Maximum number of pooled connections per process.
         """
 
         self.API_BASE_URL = f"{api_base_url}"
         self.headers = headers
+        self.pool_size = pool_size
+
+        self._pid = None
+        self._session = None
+        self._async_sessions = {}
+
+    def _reset_if_forked(self):
+        """Drop pooled connections inherited from a parent process.
+
+        Celery's prefork pool and gunicorn fork workers after the Borg state may
+        already hold open sockets. Sharing those across processes corrupts
+        responses, so each process builds its own pools.
+        """
+
+        pid = os.getpid()
+
+        if self._pid != pid:
+            self._session = None
+            self._async_sessions = {}
+            self._pid = pid
+
+    @property
+    def session(self):
+        """The keep-alive requests.Session for the current process."""
+
+        self._reset_if_forked()
+
+        if self._session is None:
+            adapter = HTTPAdapter(
+                pool_connections=1,
+                pool_maxsize=self.pool_size,
+            )
+
+            session = requests.Session()
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+
+            self._session = session
+
+        return self._session
+
+    def get_async_session(self):
+        """Return the aiohttp.ClientSession bound to the running event loop.
+
+        aiohttp sessions cannot be shared between event loops, so one session
+        (and connector) is kept per loop. Sessions left behind by loops that have
+        since been closed are discarded.
+
+        Returns:
+            aiohttp.ClientSession
+        """
+
+        self._reset_if_forked()
+
+        loop = asyncio.get_running_loop()
+        session = self._async_sessions.get(loop)
+
+        if session is None or session.closed:
+            self._async_sessions = {
+                session_loop: loop_session
+                for session_loop, loop_session in self._async_sessions.items()
+                if not session_loop.is_closed()
+            }
+
+            connector = aiohttp.TCPConnector(limit=self.pool_size)
+            session = aiohttp.ClientSession(connector=connector)
+
+            self._async_sessions[loop] = session
+
+        return session
+
+    async def close_async(self):
+        """Close the aiohttp.ClientSession bound to the running event loop."""
+
+        loop = asyncio.get_running_loop()
+        session = self._async_sessions.pop(loop, None)
+
+        if session is not None and not session.closed:
+            await session.close()
+
+    def close(self):
+        """Close the pooled requests.Session and forget all async sessions.
+
+        Async sessions belong to event loops that are no longer running by the
+        time this is called, so they are dropped rather than awaited.
+        """
+
+        if self._session is not None:
+            self._session.close()
+
+        self._session = None
+        self._async_sessions = {}
 
     def _request(self, method, endpoint, **kwargs):
         """Perform an HTTP method on a resource.
 
         Args:
-            method: requests.`method`
+            method: requests.Session `method`
             endpoint: resource endpoint
 
         Raises:
@@ -112,7 +217,9 @@ class PaystackRequest(object):
             endpoint: resource endpoint
 
         Raises:
-            aiohttp.ClientError
+            aiohttp.ClientError: aiohttp.ClientResponseError is raised for rate
+                limited (429) and server error (5xx) responses, so they can be
+                retried. Other error responses are returned as Paystack sends them.
 
         Returns:
             JSON response
@@ -127,6 +234,9 @@ class PaystackRequest(object):
             json=data,
             headers=self.headers,
         ) as response:
+            if response.status == 429 or response.status >= 500:
+                response.raise_for_status()
+
             return await response.json()
 
     def get(self, endpoint, **kwargs):
@@ -137,7 +247,7 @@ class PaystackRequest(object):
         """
 
         return self._request(
-            requests.get,
+            self.session.get,
             endpoint,
             **kwargs,
         )
@@ -152,13 +262,14 @@ class PaystackRequest(object):
             JSON response
         """
 
-        async with aiohttp.ClientSession() as session:
-            return await self._request_async(
-                session,
-                session.get,
-                endpoint,
-                **kwargs,
-            )
+        session = self.get_async_session()
+
+        return await self._request_async(
+            session,
+            session.get,
+            endpoint,
+            **kwargs,
+        )
 
     def post(self, endpoint, **kwargs):
         """Create a resource.
@@ -171,7 +282,7 @@ class PaystackRequest(object):
         """
 
         return self._request(
-            requests.post,
+            self.session.post,
             endpoint,
             **kwargs,
         )
@@ -186,13 +297,14 @@ class PaystackRequest(object):
             JSON response
         """
 
-        async with aiohttp.ClientSession() as session:
-            return await self._request_async(
-                session,
-                session.post,
-                endpoint,
-                **kwargs,
-            )
+        session = self.get_async_session()
+
+        return await self._request_async(
+            session,
+            session.post,
+            endpoint,
+            **kwargs,
+        )
 
     def put(self, endpoint, **kwargs):
         """Update a resource.
@@ -205,7 +317,7 @@ class PaystackRequest(object):
         """
 
         return self._request(
-            requests.put,
+            self.session.put,
             endpoint,
             **kwargs,
         )
@@ -220,13 +332,14 @@ class PaystackRequest(object):
             JSON response
         """
 
-        async with aiohttp.ClientSession() as session:
-            return await self._request_async(
-                session,
-                session.put,
-                endpoint,
-                **kwargs,
-            )
+        session = self.get_async_session()
+
+        return await self._request_async(
+            session,
+            session.put,
+            endpoint,
+            **kwargs,
+        )
 
     def delete(self, endpoint, **kwargs):
         """Delete a resource.
@@ -239,7 +352,7 @@ class PaystackRequest(object):
         """
 
         return self._request(
-            requests.delete,
+            self.session.delete,
             endpoint,
             **kwargs,
         )
@@ -254,10 +367,46 @@ class PaystackRequest(object):
             JSON response
         """
 
-        async with aiohttp.ClientSession() as session:
-            return await self._request_async(
-                session,
-                session.delete,
-                endpoint,
-                **kwargs,
-            )
+        session = self.get_async_session()
+
+        return await self._request_async(
+            session,
+            session.delete,
+            endpoint,
+            **kwargs,
+        )
+
+
+def run_async_requests(coroutine):
+    """Run a coroutine of asynchronous Paystack calls from synchronous code.
+
+    A drop-in replacement for asyncio.run that also closes the pooled
+    aiohttp.ClientSession before the event loop is torn down, so connections are
+    released cleanly and no "Unclosed client session" warnings are raised.
+
+    Args:
+        coroutine: A coroutine, e.g. PlanRequests.create_multiple(payloads).
+
+    Returns:
+        Whatever the coroutine returns.
+    """
+
+    async def run_and_close():
+        try:
+            return await coroutine
+        finally:
+            await PaystackBase().requests.close_async()
+
+    return asyncio.run(run_and_close())
+
+
+def close_paystack_transport():
+    """Close the pooled Paystack connections held by the current process.
+
+    Connected to Celery's worker shutdown signals in core.celery.
+    """
+
+    paystack_requests = Borg._shared_state.get("requests")
+
+    if paystack_requests is not None:
+        paystack_requests.close()
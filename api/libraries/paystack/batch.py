@@ -0,0 +1,196 @@
+"""Bounded-concurrency executor for batches of asynchronous Paystack requests.
+
+Used by the *_multiple helpers on the Paystack request classes. Instead of
+gathering an unbounded list of tasks, requests are run through a semaphore, each
+attempt is subject to a timeout, rate limited (429) and server error (5xx)
+responses are retried with jittered exponential backoff, and a failure in one
+request never discards the results of the others.
+
+Timeouts and dropped connections are only retried for idempotent requests, as a
+request that timed out may still have been carried out by Paystack (e.g. a plan
+created), and sending it again would repeat it.
+"""
+
+import asyncio
+import random
+
+import aiohttp
+from environs import Env
+
+env = Env()
+env.read_env()
+
+PAYSTACK_BATCH_CONCURRENCY = env.int("PAYSTACK_BATCH_CONCURRENCY", default=10)
+PAYSTACK_REQUEST_TIMEOUT = env.float("PAYSTACK_REQUEST_TIMEOUT", default=15)
+PAYSTACK_MAX_RETRIES = env.int("PAYSTACK_MAX_RETRIES", default=3)
+
+# Base and ceiling (in seconds) of the exponential backoff between retries.
+RETRY_BACKOFF_BASE = 0.5
+RETRY_BACKOFF_CAP = 8
+
+RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+
+class BatchItemError(dict):
+    """The result of a request in a batch that could not be completed.
+
+    Shaped like an unsuccessful Paystack response ({"status": False, "message":
+    ...}), so callers that already check response["status"] handle it without
+    changes, and it stays JSON serializable. The original exception is kept on the
+    object for logging.
+    """
+
+    def __init__(self, index, exception, attempts):
+        """Initialize the error from the exception raised by the last attempt.
+
+        Args:
+            index (int): Position of the failed request in the batch.
+            exception (Exception): The exception raised by the last attempt.
+            attempts (int): How many times the request was attempted.
+        """
+
+        super().__init__(
+            status=False,
+            message=describe_exception(exception),
+            data=None,
+        )
+
+        self.index = index
+        self.exception = exception
+        self.attempts = attempts
+
+    def __repr__(self):
+        return (
+            f"BatchItemError(index={self.index}, attempts={self.attempts},"
+            f" exception={self.exception!r})"
+        )
+
+
+def describe_exception(exception):
+    """Return a short, user-presentable description of a failed request.
+
+    Args:
+        exception (Exception): The exception raised by the request.
+
+    Returns:
+        str: The description.
+    """
+
+    if isinstance(exception, asyncio.TimeoutError):
+        return "The request to Paystack timed out."
+
+    if isinstance(exception, aiohttp.ClientResponseError):
+        if exception.status == 429:
+            return "Paystack rate limit exceeded."
+
+        return f"Paystack responded with an error (HTTP {exception.status})."
+
+    if isinstance(exception, aiohttp.ClientError):
+        return "Could not connect to Paystack."
+
+    return "The request to Paystack failed unexpectedly."
+
+
+def is_retryable(exception, idempotent=True):
+    """Check whether a failed request is worth sending again.
+
+    Args:
+        exception (Exception): The exception raised by the request.
+        idempotent (bool): Whether sending the request twice has the same effect
+            as sending it once.
+
+    Returns:
+        bool: True for 429 and 5xx responses, and for failures to connect. Also
+            True for timeouts and other connection errors, if the request is
+            idempotent, as Paystack may have received the request before they
+            happened.
+    """
+
+    if isinstance(exception, aiohttp.ClientResponseError):
+        return exception.status in RETRYABLE_STATUS_CODES
+
+    # The connection was never established, so the request was not sent.
+    if isinstance(exception, aiohttp.ClientConnectorError):
+        return True
+
+    return idempotent and isinstance(
+        exception,
+        (asyncio.TimeoutError, aiohttp.ClientConnectionError),
+    )
+
+
+def get_retry_delay(exception, attempt):
+    """Compute how long to wait before retrying a request.
+
+    Uses "full jitter" exponential backoff so that requests throttled together do
+    not retry in lockstep. A Retry-After header sent with a 429 takes precedence.
+
+    Args:
+        exception (Exception): The exception raised by the request.
+        attempt (int): Zero-based number of the attempt that just failed.
+
+    Returns:
+        float: The delay in seconds.
+    """
+
+    headers = getattr(exception, "headers", None) or {}
+    retry_after = headers.get("Retry-After")
+
+    if retry_after is not None:
+        try:
+            return min(float(retry_after), RETRY_BACKOFF_CAP)
+        except ValueError:
+            pass
+
+    return random.uniform(0, min(RETRY_BACKOFF_CAP, RETRY_BACKOFF_BASE * 2**attempt))
+
+
+async def run_batch(
+    request_factories,
+    concurrency=PAYSTACK_BATCH_CONCURRENCY,
+    timeout=PAYSTACK_REQUEST_TIMEOUT,
+    max_retries=PAYSTACK_MAX_RETRIES,
+    idempotent=True,
+):
+    """Run a batch of asynchronous Paystack requests with bounded concurrency.
+
+    Args:
+        request_factories: A list of zero-argument callables, each returning a new
+            awaitable for one request (e.g. functools.partial(cls.create_async,
+            **payload)). A factory rather than a coroutine is needed so a request
+            can be sent again on retry.
+        concurrency (int): Maximum number of requests in flight at once.
+        timeout (float): Seconds allowed for each attempt.
+        max_retries (int): Retries allowed per request after the first attempt.
+        idempotent (bool): Whether the requests can safely be sent again after a
+            timeout or a dropped connection. Pass False for requests that create
+            or change something, e.g. plan creation.
+
+    Returns:
+        list: One result per factory, in the same order. Each is either the JSON
+            response or a BatchItemError.
+    """
+
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def run_one(index, request_factory):
+        attempt = 0
+
+        while True:
+            try:
+                async with semaphore:
+                    return await asyncio.wait_for(request_factory(), timeout)
+            except Exception as exception:
+                if attempt >= max_retries or not is_retryable(exception, idempotent):
+                    return BatchItemError(index, exception, attempts=attempt + 1)
+
+                # Sleep outside the semaphore so waiting does not hold a slot.
+                await asyncio.sleep(get_retry_delay(exception, attempt))
+                attempt += 1
+
+    return await asyncio.gather(
+        *[
+            run_one(index, request_factory)
+            for index, request_factory in enumerate(request_factories)
+        ]
+    )
@@ -1,6 +1,7 @@
-import asyncio
+from functools import partial
 
 from libraries.paystack.base import PaystackBase
+from libraries.paystack.batch import run_batch
 
 
 class PlanRequests(PaystackBase):
@@ -64,27 +65,27 @@ class PlanRequests(PaystackBase):
     @classmethod
     async def create_multiple(cls, plan_creation_payloads):
         """Create multiple paystack plans by running the create method multiple
-        times, concurrently.
+        times, concurrently (bounded by the batch executor).
 
         Args:
             plan_creation_payloads: A list of payloads to be used in the creation
                 of each plan. Each item should contain the params of create_async.
 
+        Creation is not idempotent, so requests that time out are not retried, as
+        the plan may have been created anyway.
+
         Returns:
-            A list of created plans.
+            A list of created plans, in the order of the payloads. Plans that could
+            not be created are returned as BatchItemError objects.
         """
 
-        # Create a list of tasks that will be run concurrently
-        tasks = [
-            asyncio.ensure_future(cls().create_async(**plan_creation_payload))
-            for plan_creation_payload in plan_creation_payloads
-        ]
-
-        # Wait for all tasks to complete
-        plans = await asyncio.gather(*tasks)
-
-        # Return the list of created plans
-        return plans
+        return await run_batch(
+            [
+                partial(cls.create_async, **plan_creation_payload)
+                for plan_creation_payload in plan_creation_payloads
+            ],
+            idempotent=False,
+        )
 
     @classmethod
     def fetch(cls, plan_id_or_code):
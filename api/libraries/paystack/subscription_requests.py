@@ -1,6 +1,7 @@
-import asyncio
+from functools import partial
 
 from libraries.paystack.base import PaystackBase
+from libraries.paystack.batch import run_batch
 
 
 class SubscriptionRequests(PaystackBase):
@@ -100,27 +101,27 @@ class SubscriptionRequests(PaystackBase):
     @classmethod
     async def disable_multiple(cls, disable_subscription_payloads):
         """Disable multiple paystack subscriptions by running the disable method multiple
-        times, concurrently.
+        times, concurrently (bounded by the batch executor).
 
         Args:
             disable_subscription_payloads: A list of payloads to be used in disabling
                 each subscription. Each item should contain the params of disable_async.
 
         Returns:
-            A list of confirmation messages confirming disabled subscription.
+            A list of confirmation messages confirming disabled subscription, in the
+            order of the payloads. Failed requests are returned as BatchItemError
+            objects.
         """
 
-        # Create a list of tasks that will be run concurrently
-        tasks = [
-            asyncio.ensure_future(cls().disable_async(**disable_subscription_payload))
-            for disable_subscription_payload in disable_subscription_payloads
-        ]
-
-        # Wait for all tasks to complete
-        disabled_subscriptions = await asyncio.gather(*tasks)
-
-        # Return the list of disabled confirmations.
-        return disabled_subscriptions
+        return await run_batch(
+            [
+                partial(cls.disable_async, **disable_subscription_payload)
+                for disable_subscription_payload in disable_subscription_payloads
+            ],
+            # A subscription disabled by a request that timed out cannot be
+            # disabled again, so the retry would be reported as a failure.
+            idempotent=False,
+        )
 
     @classmethod
     def enable(cls, **kwargs):
@@ -1,6 +1,7 @@
-import asyncio
+from functools import partial
 
 from libraries.paystack.base import PaystackBase
+from libraries.paystack.batch import run_batch
 
 
 class TransferRecipientRequests(PaystackBase):
@@ -86,27 +87,23 @@ class TransferRecipientRequests(PaystackBase):
     @classmethod
     async def fetch_multiple(cls, recipient_codes):
         """Get multiple, specified transfer recipients by running the fetch
-        method multiple times concurrently.
+        method multiple times concurrently (bounded by the batch executor).
 
         Args:
             recipient_codes: A list of the codes for transfer recipients
             to be obtained.
 
         Returns:
-            A list of transfer recipients.
+            A list of transfer recipients, in the order of the codes. Failed
+            requests are returned as BatchItemError objects.
         """
 
-        # Create a list of tasks that will be run concurrently
-        tasks = [
-            asyncio.ensure_future(cls().fetch_async(recipient_code))
-            for recipient_code in recipient_codes
-        ]
-
-        # Wait for all tasks to complete
-        recipients = await asyncio.gather(*tasks)
-
-        # Return the list of recipients
-        return recipients
+        return await run_batch(
+            [
+                partial(cls.fetch_async, recipient_code)
+                for recipient_code in recipient_codes
+            ]
+        )
 
     @classmethod
     def delete(cls, id_or_code):
@@ -142,25 +139,21 @@ class TransferRecipientRequests(PaystackBase):
 
     @classmethod
     async def delete_multiple(cls, recipient_codes):
-        """Delete multiple, specified transfer recipients by running the get
-        method multiple times concurrently.
+        """Delete multiple, specified transfer recipients by running the delete
+        method multiple times concurrently (bounded by the batch executor).
 
         Args:
             recipient_codes: A list of the codes for transfer recipients
             to be deleted.
 
         Returns:
-            A list of confirmation messages.
+            A list of confirmation messages, in the order of the codes. Failed
+            requests are returned as BatchItemError objects.
         """
 
-        # Create a list of tasks that will be run concurrently
-        tasks = [
-            asyncio.ensure_future(cls().delete_async(recipient_code))
-            for recipient_code in recipient_codes
-        ]
-
-        # Wait for all tasks to complete
-        deleted_recipients = await asyncio.gather(*tasks)
-
-        # Return the list of deletion confirmations
-        return deleted_recipients
+        return await run_batch(
+            [
+                partial(cls.delete_async, recipient_code)
+                for recipient_code in recipient_codes
+            ]
+        )
@@ -119,5 +119,5 @@ class TransferRequests(PaystackBase):
         """
 
         return cls().requests.get(
-            f"verify/{reference}",
+            f"transfer/verify/{reference}",
         )